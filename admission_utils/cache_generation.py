@@ -0,0 +1,60 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import uuid
+from typing import Dict, Iterable
+
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+
+def get_generation(key: str, timeout=DEFAULT_TIMEOUT) -> str:
+    """
+    Return the generation stored in the cache under the key, initialized if it is missing. The generation is part of
+    the keys of the cached entries so that all of them can be invalidated at once by bumping it.
+    """
+    generation = cache.get(key)
+    if generation is None:
+        # Initialize the generation (add does nothing if another process has just done it)
+        cache.add(key, uuid.uuid4().hex, timeout=timeout)
+        generation = cache.get(key)
+    return generation
+
+
+def get_generations(keys: Iterable[str], timeout=DEFAULT_TIMEOUT) -> Dict[str, str]:
+    """Return the generations stored in the cache under the keys, read together and initialized if they are missing."""
+    keys = list(keys)
+    generations = cache.get_many(keys)
+    for key in keys:
+        if key not in generations:
+            # Initialize the missing generation (add does nothing if another process has just done it)
+            cache.add(key, uuid.uuid4().hex, timeout=timeout)
+            generations[key] = cache.get(key)
+    return generations
+
+
+def bump_generation(key: str, timeout=DEFAULT_TIMEOUT):
+    """Replace the generation stored under the key, which invalidates all the cached entries tagged with it."""
+    cache.set(key, uuid.uuid4().hex, timeout=timeout)
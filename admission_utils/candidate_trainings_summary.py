@@ -0,0 +1,250 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import itertools
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+import attr
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from admission.constants import (
+    CANDIDATE_TRAININGS_SUMMARY_CACHE_TIMEOUT,
+    CONTEXT_CONTINUING,
+    CONTEXT_DOCTORATE,
+    CONTEXT_GENERAL,
+)
+from admission.ddd.admission.doctorat.preparation.domain.model.enums import (
+    STATUTS_PROPOSITION_DOCTORALE_NON_SOUMISE,
+    STATUTS_PROPOSITION_DOCTORALE_PEU_AVANCEE,
+)
+from admission.ddd.admission.formation_continue.domain.model.enums import (
+    STATUTS_PROPOSITION_CONTINUE_NON_SOUMISE,
+)
+from admission.ddd.admission.formation_generale.domain.model.enums import (
+    STATUTS_PROPOSITION_GENERALE_NON_SOUMISE,
+    STATUTS_PROPOSITION_GENERALE_NON_SOUMISE_OU_FRAIS_DOSSIER_EN_ATTENTE,
+)
+from admission.infrastructure.admission.shared_kernel.domain.service.annee_inscription_formation import (
+    ADMISSION_CONTEXT_BY_ALL_OSIS_EDUCATION_TYPE,
+)
+from epc.models.enums.etat_inscription import EtatInscriptionFormation
+from epc.models.inscription_programme_annuel import InscriptionProgrammeAnnuel
+
+CANDIDATE_TRAININGS_SUMMARY_CACHE_KEY = 'admission_candidate_trainings_summary_{}'
+
+
+@attr.dataclass(frozen=True, slots=True)
+class AdmissionSummary:
+    id: int
+    training_type: str
+    academic_year_id: Optional[int]
+    # The admission is taken into account as another training of the candidate
+    is_advanced: bool
+    # The admission is taken into account to know if the candidate has several admissions in progress
+    is_in_progress: bool
+
+
+@attr.dataclass(frozen=True, slots=True)
+class CandidateTrainingsSummary:
+    admissions: Tuple[AdmissionSummary, ...] = ()
+    internal_training_types: Tuple[str, ...] = ()
+
+    def get_other_trainings(self, admission_id: int) -> Dict[str, Set[str]]:
+        """Return the types of the trainings of the candidate by context, except the one of the specified admission."""
+        other_trainings = {
+            CONTEXT_GENERAL: set(),
+            CONTEXT_DOCTORATE: set(),
+            CONTEXT_CONTINUING: set(),
+        }
+
+        admission_training_types = (
+            admission.training_type
+            for admission in self.admissions
+            if admission.is_advanced and admission.id != admission_id
+        )
+
+        for training_type in itertools.chain(self.internal_training_types, admission_training_types):
+            other_trainings[ADMISSION_CONTEXT_BY_ALL_OSIS_EDUCATION_TYPE[training_type]].add(training_type)
+
+        return other_trainings
+
+    def has_several_admissions_in_progress(self, academic_year_id: Optional[int]) -> bool:
+        """Return True if the candidate has several admissions in progress for the specified academic year."""
+        if academic_year_id is None:
+            return False
+        return (
+            sum(
+                1
+                for admission in self.admissions
+                if admission.is_in_progress and admission.academic_year_id == academic_year_id
+            )
+            > 1
+        )
+
+
+def get_candidate_trainings_summaries(candidate_ids: Iterable[int]) -> Dict[int, CandidateTrainingsSummary]:
+    """
+    Return the summaries of the trainings (admissions and internal enrolments) of the candidates, by candidate id.
+    The summaries that are not cached are computed together with one query on the admissions and one query on the
+    enrolments.
+    """
+    cache_keys = {
+        CANDIDATE_TRAININGS_SUMMARY_CACHE_KEY.format(candidate_id): candidate_id for candidate_id in candidate_ids
+    }
+    cached_summaries = cache.get_many(cache_keys.keys())
+    summaries = {cache_keys[key]: summary for key, summary in cached_summaries.items()}
+
+    missing_candidate_ids = [candidate_id for key, candidate_id in cache_keys.items() if key not in cached_summaries]
+
+    if missing_candidate_ids:
+        computed_summaries = _compute_candidate_trainings_summaries(missing_candidate_ids)
+        summaries.update(computed_summaries)
+        cache.set_many(
+            {
+                CANDIDATE_TRAININGS_SUMMARY_CACHE_KEY.format(candidate_id): summary
+                for candidate_id, summary in computed_summaries.items()
+            },
+            timeout=CANDIDATE_TRAININGS_SUMMARY_CACHE_TIMEOUT,
+        )
+
+    return summaries
+
+
+def get_candidate_trainings_summary(candidate_id: int) -> CandidateTrainingsSummary:
+    return get_candidate_trainings_summaries([candidate_id])[candidate_id]
+
+
+def prefetch_candidate_trainings_summaries(admissions: Iterable):
+    """Load together the summaries of the trainings of the candidates of the admissions (see BaseAdmission)."""
+    admissions = list(admissions)
+    summaries = get_candidate_trainings_summaries({admission.candidate_id for admission in admissions})
+    for admission in admissions:
+        admission._candidate_trainings_summary = summaries[admission.candidate_id]
+
+
+def _compute_candidate_trainings_summaries(candidate_ids: Iterable[int]) -> Dict[int, CandidateTrainingsSummary]:
+    from admission.models.base import BaseAdmission
+
+    admissions_by_candidate = {candidate_id: [] for candidate_id in candidate_ids}
+    internal_training_types_by_candidate = {candidate_id: [] for candidate_id in candidate_ids}
+
+    admissions = BaseAdmission.objects.filter(candidate_id__in=admissions_by_candidate.keys()).values_list(
+        'candidate_id',
+        'pk',
+        'training__education_group_type__name',
+        'determined_academic_year_id',
+        'generaleducationadmission__status',
+        'continuingeducationadmission__status',
+        'doctorateadmission__status',
+    )
+
+    for (
+        candidate_id,
+        pk,
+        training_type,
+        academic_year_id,
+        general_status,
+        continuing_status,
+        doctorate_status,
+    ) in admissions:
+        admissions_by_candidate[candidate_id].append(
+            AdmissionSummary(
+                id=pk,
+                training_type=training_type,
+                academic_year_id=academic_year_id,
+                is_advanced=not (
+                    general_status in STATUTS_PROPOSITION_GENERALE_NON_SOUMISE
+                    or continuing_status in STATUTS_PROPOSITION_CONTINUE_NON_SOUMISE
+                    or doctorate_status in STATUTS_PROPOSITION_DOCTORALE_PEU_AVANCEE
+                ),
+                is_in_progress=not (
+                    general_status in STATUTS_PROPOSITION_GENERALE_NON_SOUMISE_OU_FRAIS_DOSSIER_EN_ATTENTE
+                    or continuing_status in STATUTS_PROPOSITION_CONTINUE_NON_SOUMISE
+                    or doctorate_status in STATUTS_PROPOSITION_DOCTORALE_NON_SOUMISE
+                ),
+            )
+        )
+
+    internal_trainings = (
+        InscriptionProgrammeAnnuel.objects.filter(
+            programme_cycle__etudiant__person_id__in=internal_training_types_by_candidate.keys(),
+            programme__isnull=False,
+        )
+        .exclude(
+            etat_inscription__in=[
+                EtatInscriptionFormation.ERREUR.name,
+                EtatInscriptionFormation.ERREUR_PROCEDURE.name,
+            ]
+        )
+        .values_list(
+            'programme_cycle__etudiant__person_id',
+            'programme__root_group__education_group_type__name',
+        )
+    )
+
+    for candidate_id, training_type in internal_trainings:
+        internal_training_types_by_candidate[candidate_id].append(training_type)
+
+    return {
+        candidate_id: CandidateTrainingsSummary(
+            admissions=tuple(admissions_by_candidate[candidate_id]),
+            internal_training_types=tuple(internal_training_types_by_candidate[candidate_id]),
+        )
+        for candidate_id in admissions_by_candidate
+    }
+
+
+def invalidate_candidate_trainings_summaries(candidate_ids: Iterable[int]):
+    """Invalidate the cached summaries of the trainings of the candidates (e.g. after an import of enrolments)."""
+    cache.delete_many([CANDIDATE_TRAININGS_SUMMARY_CACHE_KEY.format(candidate_id) for candidate_id in candidate_ids])
+
+
+def _invalidate_admission_candidate_trainings_summary(sender, instance, **kwargs):
+    if instance.candidate_id:
+        invalidate_candidate_trainings_summaries([instance.candidate_id])
+
+
+for admission_model in [
+    'admission.BaseAdmission',
+    'admission.GeneralEducationAdmission',
+    'admission.ContinuingEducationAdmission',
+    'admission.DoctorateAdmission',
+]:
+    post_save.connect(_invalidate_admission_candidate_trainings_summary, sender=admission_model)
+    post_delete.connect(_invalidate_admission_candidate_trainings_summary, sender=admission_model)
+
+
+@receiver(post_save, sender=InscriptionProgrammeAnnuel)
+@receiver(pre_delete, sender=InscriptionProgrammeAnnuel)
+def _invalidate_enrolment_candidate_trainings_summary(sender, instance, **kwargs):
+    person_id = (
+        InscriptionProgrammeAnnuel.objects.filter(pk=instance.pk)
+        .values_list('programme_cycle__etudiant__person_id', flat=True)
+        .first()
+    )
+    if person_id:
+        invalidate_candidate_trainings_summaries([person_id])
@@ -0,0 +1,103 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from functools import lru_cache
+from typing import FrozenSet, Iterable, Optional, Set
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Func, Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from admission.admission_utils.cache_generation import bump_generation, get_generation
+from admission.constants import ENTITY_CLOSURE_CACHE_TIMEOUT, ENTITY_CLOSURE_LOCAL_CACHE_SIZE
+from base.models.entity_version import (
+    PEDAGOGICAL_ENTITY_ADDED_EXCEPTIONS,
+    EntityVersion,
+)
+from base.models.enums.entity_type import PEDAGOGICAL_ENTITY_TYPES
+
+ENTITY_CLOSURE_CACHE_KEY = 'admission_entity_closure_{generation}_{acronym}'
+ENTITY_CLOSURE_GENERATION_CACHE_KEY = 'admission_entity_closure_generation'
+
+
+def _get_entity_closure_generation() -> Optional[str]:
+    return get_generation(ENTITY_CLOSURE_GENERATION_CACHE_KEY, timeout=None)
+
+
+def _compute_entity_descendants_ids(acronym: str) -> FrozenSet[int]:
+    cte = (
+        EntityVersion.objects.filter(acronym=acronym)
+        .filter(Q(entity_type__in=PEDAGOGICAL_ENTITY_TYPES) | Q(acronym__in=PEDAGOGICAL_ENTITY_ADDED_EXCEPTIONS))
+        .with_parents()
+    )
+    qs = cte.queryset().with_cte(cte).annotate(level=Func('parents', function='cardinality'))
+    return frozenset(qs.values_list('entity_id', flat=True))
+
+
+@lru_cache(maxsize=ENTITY_CLOSURE_LOCAL_CACHE_SIZE)
+def _get_entity_descendants_ids(generation: str, acronym: str) -> FrozenSet[int]:
+    # The generation is part of the arguments so that the local entries of the previous generations are never used
+    cache_key = ENTITY_CLOSURE_CACHE_KEY.format(generation=generation, acronym=acronym)
+    descendants_ids = cache.get(cache_key)
+    if descendants_ids is None:
+        descendants_ids = _compute_entity_descendants_ids(acronym)
+        cache.set(cache_key, descendants_ids, timeout=ENTITY_CLOSURE_CACHE_TIMEOUT)
+    return descendants_ids
+
+
+def get_entities_with_descendants_ids(entities_acronyms: Iterable[str]) -> Set[int]:
+    """
+    From a list of pedagogical entities acronyms, get a set of ids of the entities and their descendants.
+    The descendants of each entity are computed once, shared between the processes through the cache and kept in
+    memory by each process. They are invalidated as soon as an entity version is saved or deleted.
+    :param entities_acronyms: A list of acronyms of pedagogical entities
+    :return: A set of entities ids
+    """
+    entities_acronyms = set(entities_acronyms or [])
+
+    if not entities_acronyms:
+        return set()
+
+    generation = _get_entity_closure_generation()
+
+    if generation is None:
+        # The cache is not available so the closure can't be invalidated between the processes
+        return set().union(*(_compute_entity_descendants_ids(acronym) for acronym in entities_acronyms))
+
+    return set().union(*(_get_entity_descendants_ids(generation, acronym) for acronym in entities_acronyms))
+
+
+def invalidate_entity_closure():
+    """Invalidate the cached descendants of the entities."""
+    bump_generation(ENTITY_CLOSURE_GENERATION_CACHE_KEY, timeout=None)
+
+
+@receiver(post_save, sender=EntityVersion)
+@receiver(post_delete, sender=EntityVersion)
+def _invalidate_entity_closure(sender, instance, **kwargs):
+    # The generation is bumped once the change is committed so that no process caches the previous descendants again
+    transaction.on_commit(invalidate_entity_closure)
@@ -0,0 +1,149 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import threading
+from collections import Counter
+from typing import Callable, Dict, Optional, Tuple
+
+from django.core.cache import cache
+
+from admission.admission_utils.cache_generation import bump_generation, get_generations
+from admission.constants import ADMISSION_PERMISSION_CACHE_METRICS_FLUSH_INTERVAL
+
+PERMISSION_OBJECT_CACHE_KEY = 'admission_permission_{}'
+TRAINING_GENERATION_CACHE_KEY = 'admission_permission_training_generation_{}'
+CANDIDATE_GENERATION_CACHE_KEY = 'admission_permission_candidate_generation_{}'
+METRIC_CACHE_KEY = 'admission_permission_cache_{}'
+
+HITS = 'hits'
+MISSES = 'misses'
+
+_local_metrics = Counter()
+_local_metrics_lock = threading.Lock()
+
+
+def get_cached_permission_object(admission_uuid, load_object: Callable, load_ids: Callable[[], Optional[Tuple]]):
+    """
+    Return the permission object of an admission, loaded with the load_object function if it is not cached yet.
+
+    The cached entries are tagged with the generations of the training and of the candidate of the admission, so
+    that all the entries related to a training or to a candidate can be invalidated at once by changing its
+    generation. The generations are read before the loading of the object (with the ids of the cached entry or the
+    ones returned by load_ids) so that an invalidation happening during the loading is never missed.
+    """
+    cache_key = PERMISSION_OBJECT_CACHE_KEY.format(admission_uuid)
+    entry = cache.get(cache_key)
+
+    if entry is not None:
+        ids = entry['training_id'], entry['candidate_id']
+        generations = _get_generations(*ids)
+        if entry['generations'] == generations:
+            _record_metric(HITS)
+            return entry['object']
+    else:
+        ids = load_ids()
+        generations = _get_generations(*ids) if ids is not None else None
+
+    _record_metric(MISSES)
+    permission_object = load_object()
+    if ids == (permission_object.training_id, permission_object.candidate_id):
+        # The object is not cached if its training or its candidate has changed since the reading of the generations
+        cache.set(
+            cache_key,
+            {
+                'object': permission_object,
+                'training_id': permission_object.training_id,
+                'candidate_id': permission_object.candidate_id,
+                'generations': generations,
+            },
+        )
+    else:
+        cache.delete(cache_key)
+    return permission_object
+
+
+def _get_generations(training_id, candidate_id) -> Tuple[str, str]:
+    keys = (
+        TRAINING_GENERATION_CACHE_KEY.format(training_id),
+        CANDIDATE_GENERATION_CACHE_KEY.format(candidate_id),
+    )
+    generations = get_generations(keys)
+    return generations[keys[0]], generations[keys[1]]
+
+
+def invalidate_admission_permission_cache(admission_uuid):
+    """Invalidate the cached permission object of an admission."""
+    cache.delete(PERMISSION_OBJECT_CACHE_KEY.format(admission_uuid))
+
+
+def invalidate_training_permission_cache(training_id):
+    """Invalidate the cached permission objects of all the admissions of a training."""
+    bump_generation(TRAINING_GENERATION_CACHE_KEY.format(training_id))
+
+
+def invalidate_candidate_permission_cache(candidate_id):
+    """Invalidate the cached permission objects of all the admissions of a candidate."""
+    bump_generation(CANDIDATE_GENERATION_CACHE_KEY.format(candidate_id))
+
+
+def _record_metric(name: str):
+    with _local_metrics_lock:
+        _local_metrics[name] += 1
+        if sum(_local_metrics.values()) < ADMISSION_PERMISSION_CACHE_METRICS_FLUSH_INTERVAL:
+            return
+        metrics_to_flush = dict(_local_metrics)
+        _local_metrics.clear()
+    _flush_metrics(metrics_to_flush)
+
+
+def _flush_metrics(metrics: Dict[str, int]):
+    # The metrics are shared between the processes through the cache
+    for name, value in metrics.items():
+        key = METRIC_CACHE_KEY.format(name)
+        if not cache.add(key, value, timeout=None):
+            try:
+                cache.incr(key, value)
+            except ValueError:
+                cache.set(key, value, timeout=None)
+
+
+def get_permission_cache_metrics() -> Dict[str, float]:
+    """Return the hits and misses of the permission cache, including the ones not flushed by this process."""
+    with _local_metrics_lock:
+        local_metrics = dict(_local_metrics)
+    shared_metrics = cache.get_many([METRIC_CACHE_KEY.format(HITS), METRIC_CACHE_KEY.format(MISSES)])
+    hits = shared_metrics.get(METRIC_CACHE_KEY.format(HITS), 0) + local_metrics.get(HITS, 0)
+    misses = shared_metrics.get(METRIC_CACHE_KEY.format(MISSES), 0) + local_metrics.get(MISSES, 0)
+    return {
+        HITS: hits,
+        MISSES: misses,
+        'hit_ratio': hits / (hits + misses) if hits + misses else 0.0,
+    }
+
+
+def reset_permission_cache_metrics():
+    with _local_metrics_lock:
+        _local_metrics.clear()
+    cache.delete_many([METRIC_CACHE_KEY.format(HITS), METRIC_CACHE_KEY.format(MISSES)])
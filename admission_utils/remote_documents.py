@@ -0,0 +1,141 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from itertools import product
+from typing import Dict, Iterable, List, Optional
+
+from django.core.cache import cache
+from osis_document_components.enums import PostProcessingWanted
+
+from admission.constants import REMOTE_DOCUMENT_METADATA_CACHE_TIMEOUT, REMOTE_DOCUMENT_TOKEN_CACHE_TIMEOUT
+
+REMOTE_TOKEN_CACHE_KEY = 'admission_remote_document_token_{}_{}_{}'
+REMOTE_METADATA_CACHE_KEY = 'admission_remote_document_metadata_{}_{}_{}'
+
+
+def _get_cache_keys(key_pattern: str, uuids: Iterable[str], for_modified_upload: bool, wanted_post_process) -> Dict:
+    return {
+        key_pattern.format(document_uuid, int(for_modified_upload), wanted_post_process or ''): document_uuid
+        for document_uuid in uuids
+    }
+
+
+def get_cached_remote_tokens(
+    uuids: List[str],
+    for_modified_upload: bool = False,
+    wanted_post_process: Optional[str] = None,
+) -> Dict[str, str]:
+    """
+    Return the read tokens of the remote documents, by document uuid. The tokens are kept in the cache much less
+    long than they are valid, so only the tokens of the documents not requested recently are generated remotely.
+    As a cached token can expire a few minutes after being returned, it must be used right away (e.g. to retrieve
+    metadata) and not for long downloads.
+    """
+    from osis_document_components.services import get_remote_tokens
+
+    if not uuids:
+        return {}
+
+    cache_keys = _get_cache_keys(REMOTE_TOKEN_CACHE_KEY, uuids, for_modified_upload, wanted_post_process)
+    cached_tokens = cache.get_many(cache_keys.keys())
+    tokens = {cache_keys[key]: token for key, token in cached_tokens.items()}
+
+    missing_uuids = [document_uuid for key, document_uuid in cache_keys.items() if key not in cached_tokens]
+
+    if missing_uuids:
+        remote_tokens = get_remote_tokens(
+            missing_uuids,
+            for_modified_upload=for_modified_upload,
+            wanted_post_process=wanted_post_process,
+        )
+        tokens.update(remote_tokens)
+        cache.set_many(
+            {
+                key: remote_tokens[document_uuid]
+                for key, document_uuid in cache_keys.items()
+                if document_uuid in remote_tokens
+            },
+            timeout=REMOTE_DOCUMENT_TOKEN_CACHE_TIMEOUT,
+        )
+
+    return tokens
+
+
+def get_cached_remote_metadata(
+    uuids: List[str],
+    for_modified_upload: bool = False,
+    wanted_post_process: Optional[str] = None,
+    tokens: Optional[Dict[str, str]] = None,
+) -> Dict[str, Dict]:
+    """
+    Return the metadata of the remote documents, by document uuid. Only the metadata that are not cached are
+    retrieved remotely, with the specified tokens or with the cached ones. The documents whose metadata cannot be
+    retrieved are not returned.
+    """
+    from osis_document_components.services import get_several_remote_metadata
+
+    if not uuids:
+        return {}
+
+    cache_keys = _get_cache_keys(REMOTE_METADATA_CACHE_KEY, uuids, for_modified_upload, wanted_post_process)
+    cached_metadata = cache.get_many(cache_keys.keys())
+    metadata = {cache_keys[key]: document_metadata for key, document_metadata in cached_metadata.items()}
+
+    missing_uuids = [document_uuid for key, document_uuid in cache_keys.items() if key not in cached_metadata]
+
+    if missing_uuids:
+        if tokens is None:
+            tokens = get_cached_remote_tokens(
+                missing_uuids,
+                for_modified_upload=for_modified_upload,
+                wanted_post_process=wanted_post_process,
+            )
+        missing_tokens = {
+            document_uuid: tokens[document_uuid] for document_uuid in missing_uuids if document_uuid in tokens
+        }
+        remote_metadata = get_several_remote_metadata(list(missing_tokens.values())) if missing_tokens else {}
+        metadata_to_cache = {}
+        for key, document_uuid in cache_keys.items():
+            document_metadata = remote_metadata.get(missing_tokens.get(document_uuid))
+            if document_metadata:
+                metadata[document_uuid] = document_metadata
+                metadata_to_cache[key] = document_metadata
+        cache.set_many(metadata_to_cache, timeout=REMOTE_DOCUMENT_METADATA_CACHE_TIMEOUT)
+
+    return metadata
+
+
+def invalidate_remote_documents_cache(uuids: Iterable):
+    """Invalidate the cached tokens and metadata of the remote documents, e.g. when they have been post-processed."""
+    uuids = [str(document_uuid) for document_uuid in uuids]
+    wanted_post_processes = [None] + [post_process.name for post_process in PostProcessingWanted]
+    keys = []
+    for key_pattern, for_modified_upload, wanted_post_process in product(
+        [REMOTE_TOKEN_CACHE_KEY, REMOTE_METADATA_CACHE_KEY],
+        [False, True],
+        wanted_post_processes,
+    ):
+        keys.extend(_get_cache_keys(key_pattern, uuids, for_modified_upload, wanted_post_process))
+    cache.delete_many(keys)
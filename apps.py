@@ -1,5 +1,40 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+
 from django.apps import AppConfig
 
 
 class AdmissionConfig(AppConfig):
     name = "admission"
+
+    def ready(self):
+        # Register the signal receivers invalidating the cached descendants of the entities, the open pools and the
+        # data computed from the roles
+        from admission.admission_utils import entity_closure  # noqa: F401
+        from admission.auth.role_cache import connect_role_snapshots_invalidation
+        from admission.infrastructure.admission.shared_kernel.domain.service import calendrier_inscription  # noqa: F401
+
+        connect_role_snapshots_invalidation()
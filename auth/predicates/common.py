@@ -34,6 +34,7 @@ from gestion_des_comptes.models import (
 from rules import predicate
 from waffle import switch_is_active
 
+from admission.auth.role_cache import get_role_snapshot
 from admission.auth.scope import Scope
 from admission.constants import CONTEXT_CONTINUING, CONTEXT_DOCTORATE, CONTEXT_GENERAL
 from admission.models import DoctorateAdmission, GeneralEducationAdmission
@@ -93,17 +94,6 @@ def is_debug(*args):
     return switch_is_active("debug")
 
 
-def _build_queryset_cache_key_from_role_qs(role_qs, suffix):
-    """
-    Return a cache key based on the model class of the queryset. This is useful when we want to cache a queryset for a
-    user who has several roles.
-    :param role_qs: The role queryset
-    :param suffix: The suffix of the cache key
-    :return: The cache key
-    """
-    return f'{role_qs.model.__module__}_{role_qs.model.__name__}_{suffix}'.replace('.', '_')
-
-
 def has_scope(*scopes):
     assert len(scopes) > 0, 'You must provide at least one scope name'
 
@@ -111,41 +101,35 @@ def has_scope(*scopes):
 
     @predicate(name, bind=True)
     def fn(self, user):
-        cache_key = _build_queryset_cache_key_from_role_qs(self.context['role_qs'], 'admission_scopes')
-
-        if not hasattr(user, cache_key):
-            setattr(
-                user,
-                cache_key,
-                set(
-                    scope
-                    for scope_list in self.context['role_qs'].values_list('scopes', flat=True)
-                    for scope in scope_list
-                ),
-            )
-        return set([s.name for s in scopes]) <= getattr(user, cache_key)
+        role_qs = self.context['role_qs']
+        user_scopes = get_role_snapshot(
+            user,
+            role_qs.model,
+            'admission_scopes',
+            lambda: set(scope for scope_list in role_qs.values_list('scopes', flat=True) for scope in scope_list),
+        )
+        return set([s.name for s in scopes]) <= user_scopes
 
     return fn
 
 
 @predicate(bind=True)
 def is_part_of_education_group(self, user: User, obj: BaseAdmission):
-    cache_key = _build_queryset_cache_key_from_role_qs(self.context['role_qs'], 'education_groups_affected')
-
-    if not hasattr(user, cache_key):
-        setattr(user, cache_key, self.context['role_qs'].get_education_groups_affected())
-
-    return obj.training.education_group_id in getattr(user, cache_key)
+    role_qs = self.context['role_qs']
+    education_groups_affected = get_role_snapshot(
+        user,
+        role_qs.model,
+        'education_groups_affected',
+        lambda: set(role_qs.get_education_groups_affected()),
+    )
+    return obj.training.education_group_id in education_groups_affected
 
 
 @predicate(bind=True)
 def is_entity_manager(self, user: User, obj: BaseAdmission):
-    cache_key = _build_queryset_cache_key_from_role_qs(self.context['role_qs'], 'entities_ids')
-
-    if not hasattr(user, cache_key):
-        setattr(user, cache_key, self.context['role_qs'].get_entities_ids())
-
-    return obj.training.management_entity_id in getattr(user, cache_key)
+    role_qs = self.context['role_qs']
+    entities_ids = get_role_snapshot(user, role_qs.model, 'entities_ids', lambda: set(role_qs.get_entities_ids()))
+    return obj.training.management_entity_id in entities_ids
 
 
 @predicate(bind=True)
@@ -159,12 +143,14 @@ def is_scoped_entity_manager(self, user: User, obj: BaseAdmission):
         CONTEXT_CONTINUING: Scope.IUFC,
     }[obj.admission_context]
 
-    cache_key = _build_queryset_cache_key_from_role_qs(self.context['role_qs'], f'entities_ids_by_scope_{scope.name}')
-
-    if not hasattr(user, cache_key):
-        setattr(user, cache_key, self.context['role_qs'].filter(scopes__contains=[scope.name]).get_entities_ids())
-
-    return obj.training.management_entity_id in getattr(user, cache_key)
+    role_qs = self.context['role_qs']
+    entities_ids = get_role_snapshot(
+        user,
+        role_qs.model,
+        f'entities_ids_by_scope_{scope.name}',
+        lambda: set(role_qs.filter(scopes__contains=[scope.name]).get_entities_ids()),
+    )
+    return obj.training.management_entity_id in entities_ids
 
 
 def has_education_group_of_types(*education_group_types):
@@ -172,20 +158,16 @@ def has_education_group_of_types(*education_group_types):
 
     @predicate(name, bind=True)
     def fn(self, user: User):
-        cache_key = _build_queryset_cache_key_from_role_qs(self.context['role_qs'], 'education_group_types')
-
-        if not hasattr(user, cache_key):
-            setattr(
-                user,
-                cache_key,
-                set(
-                    self.context['role_qs'].values_list(
-                        'education_group__educationgroupyear__education_group_type__name',
-                        flat=True,
-                    )
-                ),
-            )
-        return set(education_group_types) & getattr(user, cache_key)
+        role_qs = self.context['role_qs']
+        user_education_group_types = get_role_snapshot(
+            user,
+            role_qs.model,
+            'education_group_types',
+            lambda: set(
+                role_qs.values_list('education_group__educationgroupyear__education_group_type__name', flat=True)
+            ),
+        )
+        return set(education_group_types) & user_education_group_types
 
     return fn
 
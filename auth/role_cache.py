@@ -0,0 +1,100 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from typing import Callable, Type
+
+from django.apps import apps
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import models
+from django.db.models.signals import post_delete, post_save
+
+from admission.admission_utils.cache_generation import bump_generation, get_generation
+from admission.constants import ROLE_SNAPSHOT_CACHE_TIMEOUT
+from osis_role.contrib.models import RoleModel
+
+ROLE_SNAPSHOT_CACHE_KEY = 'admission_role_snapshot_{role}_{person_id}_{generation}_{name}'
+ROLE_GENERATION_CACHE_KEY = 'admission_role_generation_{role}_{person_id}'
+
+
+def _get_role_label(role_model: Type[models.Model]) -> str:
+    return f'{role_model.__module__}_{role_model.__name__}'.replace('.', '_')
+
+
+def _get_role_generation(role_model: Type[models.Model], person_id) -> str:
+    return get_generation(
+        ROLE_GENERATION_CACHE_KEY.format(role=_get_role_label(role_model), person_id=person_id),
+        timeout=None,
+    )
+
+
+def get_role_snapshot(user: User, role_model: Type[models.Model], name: str, compute: Callable):
+    """
+    Return a data (scopes, entities, education groups...) computed from the roles of the user. The data are
+    memoized on the user for the current request and shared between the requests through the cache. The shared
+    data of a person are invalidated as soon as one of its roles is saved or deleted.
+    :param user: The user whose roles are used
+    :param role_model: The model of the roles
+    :param name: The name of the data
+    :param compute: The function computing the data if they are not cached (the result must be picklable)
+    :return: The data
+    """
+    memo_key = f'{_get_role_label(role_model)}_{name}'
+
+    if not hasattr(user, memo_key):
+        person_id = user.person.pk
+        cache_key = ROLE_SNAPSHOT_CACHE_KEY.format(
+            role=_get_role_label(role_model),
+            person_id=person_id,
+            generation=_get_role_generation(role_model, person_id),
+            name=name,
+        )
+        value = cache.get(cache_key)
+        if value is None:
+            value = compute()
+            cache.set(cache_key, value, timeout=ROLE_SNAPSHOT_CACHE_TIMEOUT)
+        setattr(user, memo_key, value)
+
+    return getattr(user, memo_key)
+
+
+def invalidate_role_snapshots(role_model: Type[models.Model], person_id):
+    """Invalidate the cached data computed from the roles of a person."""
+    bump_generation(
+        ROLE_GENERATION_CACHE_KEY.format(role=_get_role_label(role_model), person_id=person_id),
+        timeout=None,
+    )
+
+
+def _invalidate_role_snapshots(sender, instance, **kwargs):
+    invalidate_role_snapshots(sender, instance.person_id)
+
+
+def connect_role_snapshots_invalidation():
+    """Connect the invalidation of the cached data of a person to the saving and the deletion of each role model."""
+    for model in apps.get_models():
+        if issubclass(model, RoleModel):
+            post_save.connect(_invalidate_role_snapshots, sender=model)
+            post_delete.connect(_invalidate_role_snapshots, sender=model)
@@ -30,6 +30,25 @@ from base.models.enums.academic_calendar_type import AcademicCalendarTypes
 from osis_profile.constants import IMAGE_MIME_TYPES
 
 DEFAULT_PAGINATOR_SIZE = 500
+LIST_EXACT_COUNT_THRESHOLD = 10000  # Above this estimated number of rows, the list counts are not computed exactly
+ADMISSION_TASKS_WORKERS = 4  # Number of processes handling the admission tasks concurrently
+DOCUMENTS_POST_PROCESSING_WORKERS = 8  # Number of documents post-processed concurrently when merging the documents
+EPC_INJECTION_BATCH_SIZE = 100  # Number of admissions whose data are loaded together when injecting them into EPC
+ADMISSION_PERMISSION_CACHE_METRICS_FLUSH_INTERVAL = 100  # Number of permission cache lookups between metric flushes
+ROLE_SNAPSHOT_CACHE_TIMEOUT = 60 * 60  # Maximum lifetime of the data computed from the roles of a user (entities...)
+PROFILE_SNAPSHOT_CACHE_TIMEOUT = 60 * 60  # Maximum lifetime of the cached profiles of the candidates
+CANDIDATE_TRAININGS_SUMMARY_CACHE_TIMEOUT = 15 * 60  # Maximum lifetime of the summaries of the candidate trainings
+REMOTE_DOCUMENT_METADATA_CACHE_TIMEOUT = 60 * 60  # Maximum lifetime of the cached metadata of the remote documents
+REMOTE_DOCUMENT_TOKEN_CACHE_TIMEOUT = 5 * 60  # Much shorter than the lifetime of the document tokens (15 min)
+ENTITY_CLOSURE_CACHE_TIMEOUT = 24 * 60 * 60  # Maximum lifetime of the cached descendants of the entities
+ENTITY_CLOSURE_LOCAL_CACHE_SIZE = 512  # Number of descendants sets of entities kept in memory by each process
+EXPORT_STREAMING_CHUNK_SIZE = 500  # Number of rows written to the excel exports between two progression updates
+OPEN_POOLS_CACHE_TIMEOUT = 60 * 60  # Maximum lifetime of the cached open pools of the day
+POOLS_REDETERMINATION_BATCH_SIZE = 200  # Number of admissions whose pool is determined together after a calendar change
+POOLS_REDETERMINATION_WORKERS = 4  # Number of admission batches whose pool is determined concurrently
+PERSON_SEARCH_RESULTS_LIMIT = 50  # Maximum number of persons returned by the person autocompletes
+PERSON_SEARCH_SYNCHRONIZATION_BATCH_SIZE = 1000  # Number of missing person search index rows created together
+FORM_ITEMS_RESOLUTION_CACHE_TIMEOUT = 24 * 60 * 60  # Maximum lifetime of the cached applicable specific questions
 SUPPORTED_MIME_TYPES = {PDF_MIME_TYPE} | IMAGE_MIME_TYPES
 DEFAULT_MIME_TYPES = [PDF_MIME_TYPE]
 PDF_EXTENSION = 'pdf'
@@ -75,6 +75,11 @@ class RecupererResumePropositionQuery(interface.QueryRequest):
     pour_candidat: bool = False
 
 
+@attr.dataclass(frozen=True, slots=True)
+class ListerResumesPropositionsQuery(interface.QueryRequest):
+    uuids_propositions: List[str]
+
+
 @attr.dataclass(frozen=True, slots=True)
 class ModifierChoixFormationCommand(interface.CommandRequest):
     uuid_proposition: str
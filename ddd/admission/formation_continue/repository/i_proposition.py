@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -61,6 +61,7 @@ class IPropositionRepository(IGlobalPropositionRepository):
     def search_dto(
         cls,
         matricule_candidat: Optional[str] = '',
+        entity_ids: Optional[List['PropositionIdentity']] = None,
     ) -> List['PropositionDTO']:
         raise NotImplementedError
 
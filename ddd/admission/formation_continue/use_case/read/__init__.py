@@ -28,6 +28,7 @@ from .determiner_annee_academique_et_pot_service import (
 )
 from .lister_demandes_service import lister_demandes
 from .lister_propositions_candidat_service import lister_propositions_candidat
+from .lister_resumes_propositions_service import lister_resumes_propositions
 from .rechercher_formations_service import rechercher_formations
 from .recuperer_documents_proposition_service import recuperer_documents_proposition
 from .recuperer_documents_reclames_proposition_service import (
@@ -0,0 +1,71 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from typing import Dict
+
+from admission.ddd.admission.formation_continue.commands import (
+    ListerResumesPropositionsQuery,
+)
+from admission.ddd.admission.formation_continue.domain.builder.proposition_identity_builder import (
+    PropositionIdentityBuilder,
+)
+from admission.ddd.admission.formation_continue.repository.i_proposition import (
+    IPropositionRepository,
+)
+from admission.ddd.admission.shared_kernel.domain.service.i_inscriptions_translator import (
+    IInscriptionsTranslatorService,
+)
+from admission.ddd.admission.shared_kernel.domain.service.i_profil_candidat import (
+    IProfilCandidatTranslator,
+)
+from admission.ddd.admission.shared_kernel.domain.service.resume_proposition import ResumeProposition
+from admission.ddd.admission.shared_kernel.dtos.resume import ResumePropositionDTO
+from ddd.logic.shared_kernel.academic_year.repository.i_academic_year import (
+    IAcademicYearRepository,
+)
+
+
+def lister_resumes_propositions(
+    cmd: 'ListerResumesPropositionsQuery',
+    proposition_repository: 'IPropositionRepository',
+    i_profil_candidat_translator: 'IProfilCandidatTranslator',
+    academic_year_repository: 'IAcademicYearRepository',
+    inscriptions_translator: 'IInscriptionsTranslatorService',
+) -> Dict[str, 'ResumePropositionDTO']:
+    # GIVEN
+    propositions_dtos = proposition_repository.search_dto(
+        entity_ids=[PropositionIdentityBuilder.build_from_uuid(uuid) for uuid in cmd.uuids_propositions],
+    )
+
+    # WHEN
+    resumes_dtos = ResumeProposition.get_resumes(
+        profil_candidat_translator=i_profil_candidat_translator,
+        academic_year_repository=academic_year_repository,
+        inscriptions_translator=inscriptions_translator,
+        propositions_dtos=propositions_dtos,
+    )
+
+    # THEN
+    return resumes_dtos
@@ -182,6 +182,11 @@ class DeterminerAnneeAcademiqueEtPotQuery(interface.QueryRequest):
     uuid_proposition: str
 
 
+@attr.dataclass(frozen=True, slots=True)
+class DeterminerAnneesAcademiquesEtPotsQuery(interface.QueryRequest):
+    uuids_propositions: List[str]
+
+
 @attr.dataclass(frozen=True, slots=True)
 class GetComptabiliteQuery(interface.QueryRequest):
     uuid_proposition: str
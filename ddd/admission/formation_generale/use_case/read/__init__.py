@@ -26,6 +26,9 @@
 from .determiner_annee_academique_et_pot_service import (
     determiner_annee_academique_et_pot,
 )
+from .determiner_annees_academiques_et_pots_service import (
+    determiner_annees_academiques_et_pots,
+)
 from .lister_propositions_candidat_service import lister_propositions_candidat
 from .rechercher_formations_service import rechercher_formations
 from .recuperer_comptabilite_service import recuperer_comptabilite
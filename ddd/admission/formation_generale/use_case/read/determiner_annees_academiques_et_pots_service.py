@@ -0,0 +1,130 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from typing import Dict, List, Union
+
+from admission.ddd.admission.formation_generale.commands import (
+    DeterminerAnneesAcademiquesEtPotsQuery,
+)
+from admission.ddd.admission.formation_generale.domain.builder.proposition_identity_builder import (
+    PropositionIdentityBuilder,
+)
+from admission.ddd.admission.formation_generale.domain.service.i_formation import (
+    IFormationGeneraleTranslator,
+)
+from admission.ddd.admission.formation_generale.repository.i_proposition import (
+    IPropositionRepository,
+)
+from admission.ddd.admission.shared_kernel.domain.service.i_calendrier_inscription import (
+    DemandeDeterminationPot,
+    ICalendrierInscription,
+)
+from admission.ddd.admission.shared_kernel.domain.service.i_deliberation_translator import IDeliberationTranslator
+from admission.ddd.admission.shared_kernel.domain.service.i_inscriptions_translator import (
+    IInscriptionsTranslatorService,
+)
+from admission.ddd.admission.shared_kernel.domain.service.i_profil_candidat import (
+    IProfilCandidatTranslator,
+)
+from admission.ddd.admission.shared_kernel.domain.service.i_titres_acces import ITitresAcces
+from admission.ddd.admission.shared_kernel.domain.service.inscriptions_ucl_candidat import (
+    InscriptionsUCLCandidatService,
+)
+from admission.ddd.admission.shared_kernel.dtos.conditions import InfosDetermineesDTO
+from admission.ddd.admission.shared_kernel.dtos.inscription_ucl_candidat import InscriptionUCLCandidatDTO
+from osis_common.ddd import interface
+
+
+def determiner_annees_academiques_et_pots(
+    cmd: 'DeterminerAnneesAcademiquesEtPotsQuery',
+    proposition_repository: Union['IPropositionRepository'],
+    formation_translator: Union['IFormationGeneraleTranslator'],
+    titres_acces: 'ITitresAcces',
+    profil_candidat_translator: 'IProfilCandidatTranslator',
+    calendrier_inscription: 'ICalendrierInscription',
+    inscriptions_translator: IInscriptionsTranslatorService,
+    deliberation_translator: IDeliberationTranslator,
+) -> Dict[str, Union['InfosDetermineesDTO', interface.BusinessException]]:
+    # GIVEN
+    resultats: Dict[str, Union['InfosDetermineesDTO', interface.BusinessException]] = {}
+    demandes: List[DemandeDeterminationPot] = []
+    inscriptions_ucl_par_proposition: Dict[str, List[InscriptionUCLCandidatDTO]] = {}
+    formations = {}
+
+    for uuid_proposition in cmd.uuids_propositions:
+        try:
+            proposition = proposition_repository.get(
+                entity_id=PropositionIdentityBuilder.build_from_uuid(uuid_proposition),
+            )
+
+            if proposition.formation_id not in formations:
+                formations[proposition.formation_id] = formation_translator.get(proposition.formation_id)
+            formation = formations[proposition.formation_id]
+
+            inscriptions_ucl_candidat = InscriptionsUCLCandidatService.recuperer(
+                matricule_candidat=proposition.matricule_candidat,
+                inscriptions_translator=inscriptions_translator,
+                formation_translator=formation_translator,
+                deliberation_translator=deliberation_translator,
+            )
+        except interface.BusinessException as exception:
+            resultats[uuid_proposition] = exception
+            continue
+
+        inscriptions_ucl_par_proposition[uuid_proposition] = inscriptions_ucl_candidat
+
+        demandes.append(
+            DemandeDeterminationPot(
+                identifiant=uuid_proposition,
+                formation_id=proposition.formation_id,
+                matricule_candidat=proposition.matricule_candidat,
+                titres_acces=titres_acces.recuperer_titres_access(
+                    matricule_candidat=proposition.matricule_candidat,
+                    type_formation=formation.type,
+                    equivalence_diplome=proposition.equivalence_diplome,
+                    inscriptions_ucl_candidat=inscriptions_ucl_candidat,
+                ),
+                formation=formation,
+                proposition=proposition,
+            )
+        )
+
+    # THEN
+    informations_determinees = calendrier_inscription.determiner_annees_academiques_et_pots(
+        demandes=demandes,
+        profil_candidat_translator=profil_candidat_translator,
+        inscriptions_translator=inscriptions_translator,
+    )
+
+    for demande in demandes:
+        resultat = informations_determinees[demande.identifiant]
+        if isinstance(resultat, InfosDetermineesDTO):
+            resultat.est_en_poursuite = InscriptionsUCLCandidatService.a_suivi_formation(
+                sigle_formation=demande.formation_id.sigle,
+                inscriptions=inscriptions_ucl_par_proposition[demande.identifiant],
+            )
+        resultats[demande.identifiant] = resultat
+
+    return resultats
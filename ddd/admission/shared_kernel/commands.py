@@ -56,6 +56,12 @@ class ListerToutesDemandesQuery(SortedQueryRequest):
     mode_filtres_etats_checklist: Optional[str] = ''
     filtres_etats_checklist: Optional[Dict[str, List[str]]] = ''
     delai_depasse_complements: Optional[bool] = None
+    curseur: Optional[str] = ''
+
+
+@attr.dataclass(frozen=True, slots=True)
+class RecupererDemandesVoisinesQuery(ListerToutesDemandesQuery):
+    uuid_demande: str = ''
 
 
 @attr.dataclass(frozen=True, slots=True)
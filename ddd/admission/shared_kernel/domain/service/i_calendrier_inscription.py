@@ -26,7 +26,7 @@
 import datetime
 import logging
 from pprint import pformat
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 import attr
 from django.utils.formats import date_format
@@ -71,6 +71,7 @@ from admission.ddd.admission.shared_kernel.domain.validator.exceptions import (
 )
 from admission.ddd.admission.shared_kernel.dtos import IdentificationDTO
 from admission.ddd.admission.shared_kernel.dtos.conditions import InfosDetermineesDTO
+from admission.ddd.admission.shared_kernel.dtos.inscription import InscriptionDTO
 from admission.ddd.admission.shared_kernel.dtos.periode import PeriodeDTO
 from base.models.enums.academic_calendar_type import AcademicCalendarTypes
 from base.models.enums.education_group_types import TrainingType
@@ -79,6 +80,16 @@ from osis_common.ddd import interface
 logger = logging.getLogger(__name__)
 
 
+@attr.dataclass(frozen=True, slots=True)
+class DemandeDeterminationPot:
+    identifiant: str
+    formation_id: 'FormationIdentity'
+    matricule_candidat: str
+    titres_acces: 'Titres'
+    formation: 'Union[Formation, DoctoratFormation]'
+    proposition: Optional['Proposition'] = None
+
+
 class ICalendrierInscription(interface.DomainService):
     pools = [
         DoctorateAdmissionCalendar(),
@@ -113,9 +124,19 @@ class ICalendrierInscription(interface.DomainService):
         profil_candidat_translator: 'IProfilCandidatTranslator',
         proposition: Optional['Proposition'] = None,
         inscriptions_translator: IInscriptionsTranslatorService | None = None,
+        pool_ouverts: Optional[List[Tuple[str, int]]] = None,
+        annees_pour_calcul: Optional[Tuple[List[int], List[int]]] = None,
+        dernieres_inscriptions_ucl: Optional[Dict[str, 'InscriptionDTO']] = None,
     ) -> 'InfosDetermineesDTO':
+        """
+        Détermine l'année académique et le pot de la demande.
+        :param pool_ouverts: Les pots ouverts, récupérés si non spécifiés
+        :param annees_pour_calcul: Les années utilisées dans le calcul, récupérées si non spécifiées
+        :param dernieres_inscriptions_ucl: Les dernières inscriptions UCL par matricule, récupérées si non spécifiées
+        """
         type_formation = formation.type
-        pool_ouverts = cls.get_pool_ouverts()
+        if pool_ouverts is None:
+            pool_ouverts = cls.get_pool_ouverts()
         cls.verifier_residence_au_sens_du_decret(formation_id.sigle, proposition, formation)
         cls.verifier_reorientation_renseignee_si_eligible(type_formation, formation_id, proposition, pool_ouverts)
         cls.verifier_modification_renseignee_si_eligible(type_formation, formation_id, proposition, pool_ouverts)
@@ -126,19 +147,27 @@ class ICalendrierInscription(interface.DomainService):
         if identification.pays_nationalite is None:
             raise IdentificationNonCompleteeException()
         ue_plus_5 = cls.est_ue_plus_5(identification)
-        annees_prioritaires, annees = cls.get_annees_academiques_pour_calcul(type_formation=type_formation)
+        annees_prioritaires, annees = annees_pour_calcul or cls.get_annees_academiques_pour_calcul(
+            type_formation=type_formation
+        )
         changements_etablissement = profil_candidat_translator.get_changements_etablissement(matricule_candidat, annees)
 
         annee_derniere_inscription_ucl = identification.annee_derniere_inscription_ucl
 
         if inscriptions_translator:
-            derniere_inscription_ucl = inscriptions_translator.recuperer_derniere_inscription(matricule_candidat)
+            if dernieres_inscriptions_ucl is not None:
+                derniere_inscription_ucl = dernieres_inscriptions_ucl.get(matricule_candidat)
+            else:
+                derniere_inscription_ucl = inscriptions_translator.recuperer_derniere_inscription(matricule_candidat)
 
             if derniere_inscription_ucl:
                 annee_derniere_inscription_ucl = derniere_inscription_ucl.annee
 
-        log_messages = [
-            f"""
+        # Les diagnostics ne sont construits que s'ils sont journalisés
+        log_messages = None
+        if logger.isEnabledFor(logging.DEBUG):
+            log_messages = [
+                f"""
 --------- Pool determination ---------
 annees_calcul={annees},
 formation_id={formation_id},
@@ -151,10 +180,10 @@ matricule_candidat={matricule_candidat},
 changements_etablissement={changements_etablissement},
 proposition={('Proposition(' + pformat(attr.asdict(proposition)) + ')') if proposition else 'None'},
         """,
-        ]
+            ]
         current_kwargs = dict(
             logs=log_messages,
-            pool_ouverts=pool_ouverts,
+            pool_ouverts=set(pool_ouverts),
             sigle=formation_id.sigle,
             ue_plus_5=ue_plus_5,
             access_diplomas=titres_acces.get_valid_conditions(),
@@ -167,47 +196,91 @@ proposition={('Proposition(' + pformat(attr.asdict(proposition)) + ')') if propo
             formation=formation,
         )
 
-        for annee in annees_prioritaires:
-            pool = cls.determiner_pool_pour_annee_academique(
-                pools=cls.priority_pools,
-                annee_academique=annee,
-                **current_kwargs,
-            )
-            if pool:
-                logger.debug('\n'.join(log_messages))
-                return InfosDetermineesDTO(annee, pool)
-            log_messages.append("")
-
-        for annee in annees:
-            pool = cls.determiner_pool_pour_annee_academique(
-                pools=cls.pools,
-                annee_academique=annee,
-                **current_kwargs,
-            )
-            if pool:
-                logger.debug('\n'.join(log_messages))
-                return InfosDetermineesDTO(annee, pool)
-            log_messages.append("")
-        else:  # pragma: no cover
+        for pools, annees_pools in [(cls.priority_pools, annees_prioritaires), (cls.pools, annees)]:
+            for annee in annees_pools:
+                pool = cls.determiner_pool_pour_annee_academique(
+                    pools=pools,
+                    annee_academique=annee,
+                    **current_kwargs,
+                )
+                if pool:
+                    if log_messages is not None:
+                        logger.debug('\n'.join(log_messages))
+                    return InfosDetermineesDTO(annee, pool)
+                if log_messages is not None:
+                    log_messages.append("")
+
+        if log_messages is not None:  # pragma: no cover
             logger.debug('\n'.join(log_messages))
-            raise AucunPoolCorrespondantException()
+        raise AucunPoolCorrespondantException()  # pragma: no cover
+
+    @classmethod
+    def determiner_annees_academiques_et_pots(
+        cls,
+        demandes: List['DemandeDeterminationPot'],
+        profil_candidat_translator: 'IProfilCandidatTranslator',
+        inscriptions_translator: IInscriptionsTranslatorService | None = None,
+    ) -> Dict[str, Union['InfosDetermineesDTO', interface.BusinessException]]:
+        """
+        Détermine l'année académique et le pot de plusieurs demandes. Les pots ouverts et les années utilisées dans
+        le calcul ne sont récupérés qu'une seule fois, et les données des candidats sont préchargées en lot.
+        :return: Pour chaque identifiant de demande, l'année et le pot déterminés ou l'exception levée
+        """
+        pool_ouverts = cls.get_pool_ouverts()
+        matricules = list({demande.matricule_candidat for demande in demandes})
+        profil_candidat_translator = profil_candidat_translator.precharger(matricules)
+        dernieres_inscriptions_ucl = (
+            inscriptions_translator.recuperer_dernieres_inscriptions(matricules) if inscriptions_translator else None
+        )
+        annees_pour_calcul_par_type_formation = {}
+        resultats = {}
+
+        for demande in demandes:
+            type_formation = demande.formation.type
+
+            if type_formation not in annees_pour_calcul_par_type_formation:
+                annees_pour_calcul_par_type_formation[type_formation] = cls.get_annees_academiques_pour_calcul(
+                    type_formation=type_formation,
+                )
+
+            try:
+                resultats[demande.identifiant] = cls.determiner_annee_academique_et_pot(
+                    formation_id=demande.formation_id,
+                    matricule_candidat=demande.matricule_candidat,
+                    titres_acces=demande.titres_acces,
+                    formation=demande.formation,
+                    profil_candidat_translator=profil_candidat_translator,
+                    proposition=demande.proposition,
+                    inscriptions_translator=inscriptions_translator,
+                    pool_ouverts=pool_ouverts,
+                    annees_pour_calcul=annees_pour_calcul_par_type_formation[type_formation],
+                    dernieres_inscriptions_ucl=dernieres_inscriptions_ucl,
+                )
+            except interface.BusinessException as exception:
+                resultats[demande.identifiant] = exception
+
+        return resultats
 
     @classmethod
     def determiner_pool_pour_annee_academique(
         cls,
-        logs: List[str],
-        pool_ouverts: List[Tuple[str, int]],
+        logs: Optional[List[str]],
+        pool_ouverts: Set[Tuple[str, int]],
         pools: List[PoolCalendar],
         **kwargs,
     ) -> Optional['AcademicCalendarTypes']:
+        annee = kwargs['annee_academique']
         for pool in pools:
-            annee = kwargs['annee_academique']
-            logs.append(
-                f"{str(AcademicCalendarTypes.get_value(pool.event_reference)):<74} {annee}"
-                f" pool_est_ouvert: {str((pool.event_reference, annee) in pool_ouverts):<8} "
-                f"matches_criteria: {pool.matches_criteria(**kwargs)}"
-            )
-            if (pool.event_reference, annee) in pool_ouverts and pool.matches_criteria(**kwargs):
+            pool_est_ouvert = (pool.event_reference, annee) in pool_ouverts
+            # Les critères sont évalués même si le pot est fermé car ils peuvent lever une exception métier
+            matches_criteria = pool.matches_criteria(**kwargs)
+            if logs is not None:
+                logs.append(
+                    f"{str(AcademicCalendarTypes.get_value(pool.event_reference)):<74} {annee}"
+                    f" pool_est_ouvert: {str(pool_est_ouvert):<8} "
+                    f"matches_criteria: {matches_criteria}"
+                )
+            if pool_est_ouvert and matches_criteria:
                 return AcademicCalendarTypes[pool.event_reference]
         return None  # pragma: no cover
 
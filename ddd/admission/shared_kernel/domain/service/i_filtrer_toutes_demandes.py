@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -26,7 +26,10 @@
 from abc import abstractmethod
 from typing import Dict, List, Optional
 
-from admission.ddd.admission.shared_kernel.dtos.liste import DemandeRechercheDTO
+from admission.ddd.admission.shared_kernel.dtos.liste import (
+    DemandeRechercheDTO,
+    DemandesVoisinesDTO,
+)
 from admission.views import PaginatedList
 from osis_common.ddd import interface
 
@@ -60,5 +63,12 @@ class IListerToutesDemandes(interface.DomainService):
         filtres_etats_checklist: Optional[Dict[str, List[str]]] = '',
         tardif_modif_reorientation: Optional[str] = '',
         delai_depasse_complements: Optional[bool] = None,
+        curseur: Optional[str] = '',
     ) -> PaginatedList[DemandeRechercheDTO]:
         raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def recuperer_voisins(cls, uuid_demande: str, **filtres) -> DemandesVoisinesDTO:
+        """Retourne les demandes précédant et suivant la demande spécifiée dans la liste filtrée et triée."""
+        raise NotImplementedError
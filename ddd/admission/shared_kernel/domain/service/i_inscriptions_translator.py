@@ -69,6 +69,14 @@ class IInscriptionsTranslatorService(interface.DomainService):
     ) -> InscriptionDTO | None:
         raise NotImplementedError
 
+    @classmethod
+    @abstractmethod
+    def recuperer_dernieres_inscriptions(
+        cls,
+        matricules_candidats: list[str],
+    ) -> dict[str, InscriptionDTO]:
+        raise NotImplementedError
+
     @classmethod
     @abstractmethod
     def est_en_poursuite(
@@ -25,7 +25,7 @@
 # ##############################################################################
 import datetime
 from abc import abstractmethod
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Set, Union
 
 from admission.ddd.admission.doctorat.preparation.dtos import (
     ConditionsComptabiliteDTO,
@@ -74,6 +74,15 @@ class IProfilCandidatTranslator(interface.DomainService):
     def get_coordonnees(cls, matricule: str) -> 'CoordonneesDTO':
         raise NotImplementedError
 
+    @classmethod
+    def precharger(cls, matricules: List[str]) -> 'IProfilCandidatTranslator':
+        """
+        Retourne un traducteur dont les données utilisées pour déterminer le pot des candidats spécifiés
+        (identification, coordonnées, changements d'établissement) sont récupérées en lot. Par défaut, aucune donnée
+        n'est préchargée.
+        """
+        return cls
+
     @classmethod
     @abstractmethod
     def get_langues_connues(cls, matricule: str) -> List[str]:
@@ -225,6 +234,23 @@ class IProfilCandidatTranslator(interface.DomainService):
         """Retourne toutes les données relatives à un candidat nécessaires à son admission."""
         raise NotImplementedError
 
+    @classmethod
+    @abstractmethod
+    def recuperer_toutes_informations_candidats(
+        cls,
+        matricules_par_proposition: Dict[str, str],
+        annee_courante: int,
+        inscriptions_translator: IInscriptionsTranslatorService,
+        propositions_avec_toutes_experiences_cv: Optional[Set[str]] = None,
+    ) -> Dict[str, ResumeCandidatDTO]:
+        """
+        Retourne, pour chaque proposition, les données du candidat nécessaires à son admission, chargées pour toutes
+        les propositions à la fois. Seules les expériences valorisées par chaque proposition sont récupérées, sauf pour
+        les propositions spécifiées dans 'propositions_avec_toutes_experiences_cv'. Les connaissances de langues et
+        l'examen de la formation ne sont pas récupérés.
+        """
+        raise NotImplementedError
+
     @classmethod
     def recuperer_derniers_etablissements_superieurs_communaute_fr_frequentes(
         cls,
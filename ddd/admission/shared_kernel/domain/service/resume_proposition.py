@@ -24,7 +24,7 @@
 #
 # ##############################################################################
 import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from admission.ddd.admission.doctorat.preparation.domain.model.proposition import (
     PropositionIdentity as PropositionDoctoraleIdentity,
@@ -141,6 +141,50 @@ class ResumeProposition(interface.DomainService):
             **parametres_additionnels,
         )
 
+    @classmethod
+    def get_resumes(
+        cls,
+        profil_candidat_translator: IProfilCandidatTranslator,
+        academic_year_repository: 'IAcademicYearRepository',
+        inscriptions_translator: 'IInscriptionsTranslatorService',
+        propositions_dtos: List[AdmissionPropositionDTO],
+    ) -> Dict[str, 'ResumePropositionDTO']:
+        annee_courante = (
+            GetCurrentAcademicYear()
+            .get_starting_academic_year(
+                datetime.date.today(),
+                academic_year_repository,
+            )
+            .year
+        )
+
+        resumes_candidats_dtos = profil_candidat_translator.recuperer_toutes_informations_candidats(
+            matricules_par_proposition={
+                proposition_dto.uuid: proposition_dto.matricule_candidat for proposition_dto in propositions_dtos
+            },
+            annee_courante=annee_courante,
+            inscriptions_translator=inscriptions_translator,
+            propositions_avec_toutes_experiences_cv={
+                proposition_dto.uuid for proposition_dto in propositions_dtos if proposition_dto.est_non_soumise
+            },
+        )
+
+        resumes = {}
+        for proposition_dto in propositions_dtos:
+            resume_candidat_dto = resumes_candidats_dtos[proposition_dto.uuid]
+            resumes[proposition_dto.uuid] = ResumePropositionDTO(
+                proposition=proposition_dto,
+                comptabilite=None,
+                identification=resume_candidat_dto.identification,
+                coordonnees=resume_candidat_dto.coordonnees,
+                curriculum=resume_candidat_dto.curriculum,
+                etudes_secondaires=resume_candidat_dto.etudes_secondaires,
+                connaissances_langues=resume_candidat_dto.connaissances_langues,
+                groupe_supervision=None,
+                examen_formation=resume_candidat_dto.examen_formation,
+            )
+        return resumes
+
     @classmethod
     def get_resume_pour_gestionnaire(
         cls,
@@ -38,6 +38,12 @@ class VisualiseurAdmissionDTO(interface.DTO):
     date: datetime.datetime
 
 
+@attr.dataclass(frozen=True, slots=True)
+class DemandesVoisinesDTO(interface.DTO):
+    uuid_precedente: Optional[str]
+    uuid_suivante: Optional[str]
+
+
 @attr.dataclass(frozen=True, slots=True)
 class DemandeRechercheDTO(interface.DTO):
     uuid: str
@@ -29,6 +29,7 @@ import freezegun
 import mock
 from django.test import TestCase
 
+from admission.calendar.admission_calendar import DoctorateAdmissionCalendar
 from admission.ddd import CODE_BACHELIER_VETERINAIRE
 from admission.ddd.admission.doctorat.preparation.domain.validator.exceptions import (
     AdresseDomicileLegalNonCompleteeException,
@@ -43,6 +44,9 @@ from admission.ddd.admission.formation_continue.test.factory.proposition import
 from admission.ddd.admission.formation_generale.test.factory.proposition import (
     PropositionFactory,
 )
+from admission.ddd.admission.shared_kernel.domain.service.i_calendrier_inscription import (
+    DemandeDeterminationPot,
+)
 from admission.ddd.admission.shared_kernel.domain.service.i_titres_acces import (
     ITitresAcces,
     Titres,
@@ -453,6 +457,27 @@ class CalendrierInscriptionTestCase(TestCase):
                 profil_candidat_translator=self.profil_candidat_translator,
             )
 
+    def test_determination_sans_adresse_avec_pots_fermes(self):
+        proposition = PropositionFactory()
+        profil = ProfilCandidatFactory(matricule=proposition.matricule_candidat)
+        self.profil_candidat_translator.profil_candidats.append(profil.identification)
+        with (
+            mock.patch(
+                'admission.ddd.admission.shared_kernel.domain.service.i_calendrier_inscription.logger.isEnabledFor',
+                return_value=False,
+            ),
+            self.assertRaises(AdresseDomicileLegalNonCompleteeException),
+        ):
+            CalendrierInscriptionInMemory.determiner_annee_academique_et_pot(
+                formation_id=proposition.formation_id,
+                proposition=proposition,
+                matricule_candidat=proposition.matricule_candidat,
+                titres_acces=Titres(AdmissionConditionsDTOFactory()),
+                formation=MagicMock(type=TrainingType.BACHELOR),
+                profil_candidat_translator=self.profil_candidat_translator,
+                pool_ouverts=[],
+            )
+
     def test_determination_sans_nationalite(self):
         proposition = PropositionFactory()
         profil = ProfilCandidatFactory(matricule=proposition.matricule_candidat, identification__pays_nationalite=None)
@@ -769,3 +794,91 @@ class CalendrierInscriptionTestCase(TestCase):
             profil_candidat_translator=self.profil_candidat_translator,
         )
         self.assertEqual(dto.pool, AcademicCalendarTypes.ADMISSION_POOL_HUE5_FOREIGN_RESIDENCY)
+
+    def test_determination_par_lot(self):
+        proposition_doctorale = PropositionAdmissionECGE3DPMinimaleFactory()
+        proposition_sans_nationalite = PropositionFactory()
+        profil = ProfilCandidatFactory(
+            matricule=proposition_sans_nationalite.matricule_candidat,
+            identification__pays_nationalite=None,
+        )
+        self.profil_candidat_translator.profil_candidats.append(profil.identification)
+
+        with mock.patch.object(
+            CalendrierInscriptionInMemory,
+            'get_pool_ouverts',
+            wraps=CalendrierInscriptionInMemory.get_pool_ouverts,
+        ) as get_pool_ouverts_mock:
+            resultats = CalendrierInscriptionInMemory.determiner_annees_academiques_et_pots(
+                demandes=[
+                    DemandeDeterminationPot(
+                        identifiant='doctorat',
+                        formation_id=FormationFactory(type=TrainingType.PHD).entity_id,
+                        proposition=proposition_doctorale,
+                        matricule_candidat=proposition_doctorale.matricule_candidat,
+                        titres_acces=Titres(AdmissionConditionsDTOFactory()),
+                        formation=MagicMock(type=TrainingType.PHD),
+                    ),
+                    DemandeDeterminationPot(
+                        identifiant='sans-nationalite',
+                        formation_id=proposition_sans_nationalite.formation_id,
+                        proposition=proposition_sans_nationalite,
+                        matricule_candidat=proposition_sans_nationalite.matricule_candidat,
+                        titres_acces=Titres(AdmissionConditionsDTOFactory()),
+                        formation=MagicMock(type=TrainingType.BACHELOR),
+                    ),
+                ],
+                profil_candidat_translator=self.profil_candidat_translator,
+            )
+
+        get_pool_ouverts_mock.assert_called_once()
+        self.assertEqual(resultats['doctorat'].pool, AcademicCalendarTypes.DOCTORATE_EDUCATION_ENROLLMENT)
+        self.assertIsInstance(resultats['sans-nationalite'], IdentificationNonCompleteeException)
+
+    def test_determination_sans_journalisation_ne_construit_pas_les_diagnostics(self):
+        proposition = PropositionAdmissionECGE3DPMinimaleFactory()
+
+        with (
+            mock.patch(
+                'admission.ddd.admission.shared_kernel.domain.service.i_calendrier_inscription.pformat'
+            ) as pformat_mock,
+            mock.patch(
+                'admission.ddd.admission.shared_kernel.domain.service.i_calendrier_inscription.logger.isEnabledFor',
+                return_value=False,
+            ),
+            mock.patch.object(
+                DoctorateAdmissionCalendar,
+                'matches_criteria',
+                return_value=True,
+            ) as matches_criteria_mock,
+        ):
+            dto = CalendrierInscriptionInMemory.determiner_annee_academique_et_pot(
+                formation_id=FormationFactory(type=TrainingType.PHD).entity_id,
+                proposition=proposition,
+                matricule_candidat=proposition.matricule_candidat,
+                titres_acces=Titres(AdmissionConditionsDTOFactory()),
+                formation=MagicMock(type=TrainingType.PHD),
+                profil_candidat_translator=self.profil_candidat_translator,
+            )
+
+        self.assertEqual(dto.pool, AcademicCalendarTypes.DOCTORATE_EDUCATION_ENROLLMENT)
+        pformat_mock.assert_not_called()
+        matches_criteria_mock.assert_called_once()
+
+    def test_determination_avec_journalisation_construit_les_diagnostics(self):
+        proposition = PropositionAdmissionECGE3DPMinimaleFactory()
+
+        with self.assertLogs(
+            'admission.ddd.admission.shared_kernel.domain.service.i_calendrier_inscription',
+            level='DEBUG',
+        ) as logs:
+            CalendrierInscriptionInMemory.determiner_annee_academique_et_pot(
+                formation_id=FormationFactory(type=TrainingType.PHD).entity_id,
+                proposition=proposition,
+                matricule_candidat=proposition.matricule_candidat,
+                titres_acces=Titres(AdmissionConditionsDTOFactory()),
+                formation=MagicMock(type=TrainingType.PHD),
+                profil_candidat_translator=self.profil_candidat_translator,
+            )
+
+        self.assertIn('Pool determination', logs.output[0])
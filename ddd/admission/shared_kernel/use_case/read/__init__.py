@@ -27,6 +27,7 @@ from .candidat_est_eligible_a_la_reinscription_service import candidat_est_eligi
 from .candidat_est_inscrit_recemment_ucl_service import candidat_est_inscrit_recemment_ucl
 from .lister_demandes_service import lister_demandes
 from .rechercher_formations_gerees_service import rechercher_formations_gerees
+from .recuperer_demandes_voisines_service import recuperer_demandes_voisines
 from .recuperer_connaissances_langues_service import recuperer_connaissances_langues
 from .recuperer_etudes_secondaires_service import recuperer_etudes_secondaires
 from .recuperer_experience_academique_service import recuperer_experience_academique
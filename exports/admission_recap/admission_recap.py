@@ -23,15 +23,23 @@
 #    see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
+import logging
+import os
+import shutil
+import tempfile
 import unicodedata
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
 from io import BytesIO
-from typing import Optional, Union
+from typing import IO, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+from django.conf import settings
 from django.utils.translation import override
 from osis_document_components.enums import PostProcessingWanted
 from osis_document_components.services import save_raw_content_remotely
 from pikepdf import OutlineItem, PasswordError, Pdf, PdfError
 
+from admission.admission_utils.remote_documents import get_cached_remote_metadata
 from admission.ddd.admission.doctorat.preparation import (
     commands as doctorate_education_commands,
 )
@@ -42,6 +50,12 @@ from admission.ddd.admission.formation_generale import (
     commands as general_education_commands,
 )
 from admission.ddd.admission.shared_kernel.dtos.resume import ResumePropositionDTO
+from admission.exports.admission_recap.attachments import Attachment
+from admission.exports.admission_recap.constants import (
+    RECAP_ATTACHMENT_FETCHING_TIMEOUT,
+    RECAP_ATTACHMENTS_FETCHING_WORKERS,
+    RECAP_MAX_MEMORY_SIZE,
+)
 from admission.exports.admission_recap.section import get_sections
 from admission.models import (
     ContinuingEducationAdmission,
@@ -51,6 +65,140 @@ from admission.models import (
 from admission.models.base import BaseAdmission
 from infrastructure.messages_bus import message_bus_instance
 
+logger = logging.getLogger(settings.DEFAULT_LOGGER)
+
+
+def fetch_attachments_raw_contents(
+    attachments: Iterable[Tuple[Attachment, Optional[str], Optional[Dict]]],
+    default_content: BytesIO,
+    max_workers: int = RECAP_ATTACHMENTS_FETCHING_WORKERS,
+    timeout: float = RECAP_ATTACHMENT_FETCHING_TIMEOUT,
+) -> Iterator[IO[bytes]]:
+    """
+    Yield the raw contents of the attachments, specified with their read token and metadata, in the same order. The
+    contents are fetched concurrently by a bounded number of threads, at most max_workers attachments being fetched
+    in advance. The timeout (in seconds) is a wait timeout and not a download timeout: it only starts when the
+    content of the attachment is requested, i.e. once the contents of the previous attachments have been consumed,
+    and the default content is returned for an attachment that is still not retrieved at its end. The download
+    itself is not interrupted.
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='admission-recap')
+    pending_fetches: Deque[Tuple[Attachment, Future]] = deque()
+
+    def get_fetched_content():
+        attachment, future = pending_fetches.popleft()
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            future.cancel()
+            logger.warning(f'[Admission recap] The attachment "{attachment.identifier}" has not been fetched in time.')
+            return default_content
+
+    try:
+        for attachment, token, metadata in attachments:
+            future = executor.submit(
+                attachment.get_raw,
+                token=token,
+                metadata=metadata,
+                default_content=default_content,
+            )
+            pending_fetches.append((attachment, future))
+            if len(pending_fetches) > max_workers:
+                yield get_fetched_content()
+
+        while pending_fetches:
+            yield get_fetched_content()
+    finally:
+        # Do not wait for the fetches that are timed out or no more needed
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+class SpooledPdfBuilder:
+    """
+    Assemble a pdf from several pdf contents while keeping a bounded memory usage: each content is spooled to a
+    temporary file as soon as it exceeds the memory ceiling, and the pdf being built is written to disk and reopened
+    from there each time the contents held since the last checkpoint exceed this ceiling.
+    """
+
+    def __init__(self, max_memory_size: int = RECAP_MAX_MEMORY_SIZE):
+        self.max_memory_size = max_memory_size
+        self.pdf = Pdf.new()
+        self.version = self.pdf.pdf_version
+        self.page_count = 0
+        self._directory = tempfile.TemporaryDirectory(prefix='admission-recap-')
+        self._checkpoint_path = ''
+        self._checkpoint_index = 0
+        self._sources: List[Tuple[Pdf, IO[bytes]]] = []
+        self._sources_size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def append(self, content: IO[bytes]):
+        """Append the pages of the pdf content. Raise a PdfError or a PasswordError if the content cannot be opened."""
+        spooled_content = tempfile.SpooledTemporaryFile(max_size=self.max_memory_size, dir=self._directory.name)
+        content.seek(0)
+        shutil.copyfileobj(content, spooled_content)
+        content_size = spooled_content.tell()
+        spooled_content.seek(0)
+
+        try:
+            source = Pdf.open(spooled_content)
+        except (PdfError, PasswordError):
+            spooled_content.close()
+            raise
+
+        # The source is kept open until the next checkpoint as the pages are lazily copied
+        self._sources.append((source, spooled_content))
+        self._sources_size += content_size
+
+        self.version = max(self.version, source.pdf_version)
+        self.pdf.pages.extend(source.pages)
+        self.page_count += len(source.pages)
+
+        if self._sources_size > self.max_memory_size:
+            self._checkpoint()
+
+    def _checkpoint(self):
+        """Write the pdf being built to disk and reopen it from there to release the memory used by its sources."""
+        self._checkpoint_index += 1
+        checkpoint_path = os.path.join(self._directory.name, f'checkpoint-{self._checkpoint_index}.pdf')
+        self.pdf.save(checkpoint_path, min_version=self.version)
+        self.pdf.close()
+        self._close_sources()
+
+        if self._checkpoint_path:
+            os.remove(self._checkpoint_path)
+
+        self._checkpoint_path = checkpoint_path
+        self.pdf = Pdf.open(checkpoint_path)
+
+    def save(self, outline_items: List[OutlineItem]) -> IO[bytes]:
+        """Add the outline items to the pdf and write it into a temporary file which is returned."""
+        with self.pdf.open_outline() as outline:
+            for outline_item in outline_items:
+                outline.root.append(outline_item)
+
+        final_pdf = tempfile.SpooledTemporaryFile(max_size=self.max_memory_size, dir=self._directory.name)
+        self.pdf.save(final_pdf, min_version=self.version)
+        final_pdf.seek(0)
+        return final_pdf
+
+    def _close_sources(self):
+        for source, spooled_content in self._sources:
+            source.close()
+            spooled_content.close()
+        self._sources = []
+        self._sources_size = 0
+
+    def close(self):
+        self.pdf.close()
+        self._close_sources()
+        self._directory.cleanup()
+
 
 def admission_pdf_recap(
     admission: Union[BaseAdmission, ContinuingEducationAdmission, GeneralEducationAdmission, DoctorateAdmission],
@@ -58,9 +206,13 @@ def admission_pdf_recap(
     admission_class: Optional[type] = None,
     with_annotated_documents=False,
     for_candidate=False,
+    max_memory_size: int = RECAP_MAX_MEMORY_SIZE,
 ):
-    """Generates the admission pdf and returns a token to access it."""
-    from osis_document_components.services import get_remote_tokens, get_several_remote_metadata
+    """
+    Generates the admission pdf and returns a token to access it. The contents larger than max_memory_size (in bytes)
+    are spooled to temporary files.
+    """
+    from osis_document_components.services import get_remote_tokens
 
     from admission.exports.utils import get_pdf_from_template
 
@@ -99,66 +251,70 @@ def admission_pdf_recap(
             for file_uuid in attachment.uuids
         ]
 
+        # The tokens used to download the attachments are not taken from the cache, so that they do not expire while
+        # the recap is generated
         file_tokens = get_remote_tokens(
             all_file_uuids,
             wanted_post_process=PostProcessingWanted.ORIGINAL.name,
             for_modified_upload=with_annotated_documents,
         )
-        file_metadata = get_several_remote_metadata(list(file_tokens.values()))
+        file_metadata_by_uuid = get_cached_remote_metadata(
+            all_file_uuids,
+            wanted_post_process=PostProcessingWanted.ORIGINAL.name,
+            for_modified_upload=with_annotated_documents,
+            tokens=file_tokens,
+        )
+        file_metadata = {
+            file_tokens[file_uuid]: metadata
+            for file_uuid, metadata in file_metadata_by_uuid.items()
+            if file_uuid in file_tokens
+        }
+
+        # Fetch the attachments concurrently, in the order in which they are added to the PDF
+        attachments_raw_contents = fetch_attachments_raw_contents(
+            attachments=(
+                (attachment, file_tokens.get(attachment_uuid), file_metadata.get(file_tokens.get(attachment_uuid)))
+                for section in pdf_sections
+                for attachment in section.attachments
+                for attachment_uuid in attachment.uuids
+            ),
+            default_content=default_content,
+        )
 
         # Generate the PDF
-        pdf = Pdf.new()
-        version = pdf.pdf_version
-        page_count = 0
+        outline_items = []
 
-        # If too much memory usage -> use temporary files or subprocess
-        with pdf.open_outline() as outline:
+        with SpooledPdfBuilder(max_memory_size=max_memory_size) as pdf_builder:
             for section in pdf_sections:
                 if section.content is not None:
                     # There is a content to display so we create an outline item to put it and the related attachments
-                    outline_item = OutlineItem(str(section.label), page_count)
+                    outline_item = OutlineItem(str(section.label), pdf_builder.page_count)
                     outline_item_children = outline_item.children
 
-                    content = BytesIO(section.content)
-
                     # Add section data
-                    with Pdf.open(content) as pdf_content:
-                        version = max(version, pdf_content.pdf_version)
-                        pdf.pages.extend(pdf_content.pages)
-                        page_count += len(pdf_content.pages)
+                    pdf_builder.append(BytesIO(section.content))
                 else:
                     # There is no content to display so the attachments will be directly added to the outline root
-                    outline_item_children = outline.root
+                    outline_item_children = outline_items
 
                 # Add section attachments
                 for attachment in section.attachments:
                     if attachment.uuids:
-                        outline_item_children.append(OutlineItem(str(attachment.label), page_count))
-                    for attachment_uuid in attachment.uuids:
-                        token = file_tokens.get(attachment_uuid)
-                        raw_content = attachment.get_raw(
-                            token=token,
-                            metadata=file_metadata.get(token),
-                            default_content=default_content,
-                        )
+                        outline_item_children.append(OutlineItem(str(attachment.label), pdf_builder.page_count))
+                    for _ in attachment.uuids:
+                        raw_content = next(attachments_raw_contents)
                         try:
-                            with Pdf.open(raw_content) as attachment_content:
-                                version = max(version, attachment_content.pdf_version)
-                                pdf.pages.extend(attachment_content.pages)
-                                page_count += len(attachment_content.pages)
+                            pdf_builder.append(raw_content)
                         except (PdfError, PasswordError):
                             # If an error occurs when opening the attachment, we add the default content
-                            with Pdf.open(default_content) as attachment_content:
-                                version = max(version, attachment_content.pdf_version)
-                                pdf.pages.extend(attachment_content.pages)
-                                page_count += len(attachment_content.pages)
+                            pdf_builder.append(default_content)
 
                 if section.content is not None:
-                    outline.root.append(outline_item)
+                    outline_items.append(outline_item)
 
-        # Finalize the PDF
-        final_pdf = BytesIO()
-        pdf.save(final_pdf, min_version=version)
+            # Finalize the PDF
+            with pdf_builder.save(outline_items) as final_pdf:
+                final_pdf_content = final_pdf.read()
 
         # Generate the filename
         def format_value_for_filename(value):
@@ -173,7 +329,7 @@ def admission_pdf_recap(
         filename = f'{last_name} - {first_name} - {reference}.pdf'
 
         # Save the pdf
-        token = save_raw_content_remotely(final_pdf.getvalue(), filename, 'application/pdf')
+        token = save_raw_content_remotely(final_pdf_content, filename, 'application/pdf')
 
         # Return the token
         return token
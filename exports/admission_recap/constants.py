@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2024 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -39,3 +39,31 @@ FORMATTED_RELATIONSHIPS = {
     'CONJOINT': _('your partner'),
     'COHABITANT_LEGAL': _('your legal cohabitant'),
 }
+# Above this size (in bytes), the contents used to assemble the recap pdf are spooled to temporary files
+RECAP_MAX_MEMORY_SIZE = 64 * 1024 * 1024
+# Number of attachments fetched concurrently when generating the recap pdf
+RECAP_ATTACHMENTS_FETCHING_WORKERS = 8
+# Maximum time (in seconds) to wait for an attachment, from the moment its content is needed to assemble the recap
+# pdf, before using the default content instead (the download is not interrupted)
+RECAP_ATTACHMENT_FETCHING_TIMEOUT = 60
+# Duration (in seconds) during which the rendered recap sections are cached
+RECAP_SECTION_CACHE_TIMEOUT = 7 * 24 * 60 * 60
+# To increment to invalidate the cached recap sections (e.g. when the stylesheets change)
+RECAP_SECTION_CACHE_VERSION = 1
+# Template tags and filters rendering data that are not in the context of the recap sections (database, permissions,
+# remote files...): the sections whose templates use them are not cached
+RECAP_SECTION_UNCACHEABLE_TEMPLATE_TAGS = {
+    'access_conditions_url',
+    'can_read_tab',
+    'can_update_tab',
+    'cotutelle_institute',
+    'country_name_from_iso_code',
+    'get_image_file_url',
+    'has_perm',
+    'input_field_data',
+    'map_fields_items',
+    'osis_language_name',
+    'superior_institute_name',
+}
+# Variable holding the name of the content template included by the base template of the recap sections
+RECAP_SECTION_CONTENT_TEMPLATE_VARIABLE = 'content_template_name'
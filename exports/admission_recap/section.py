@@ -23,8 +23,24 @@
 #    see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
-from typing import Dict, List, Optional
-
+import datetime
+import decimal
+import enum
+import hashlib
+import importlib
+import inspect
+import re
+import uuid
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import attr
+from django.core.cache import cache
+from django.template import engines
+from django.template.library import InclusionNode
+from django.template.loader_tags import ExtendsNode, IncludeNode
+from django.utils.functional import Promise
+from django.utils.translation import get_language
 from django.utils.translation import gettext as _
 from django.utils.translation import override
 
@@ -78,6 +94,10 @@ from admission.exports.admission_recap.attachments import (
 )
 from admission.exports.admission_recap.constants import (
     FORMATTED_RELATIONSHIPS,
+    RECAP_SECTION_CACHE_TIMEOUT,
+    RECAP_SECTION_CACHE_VERSION,
+    RECAP_SECTION_CONTENT_TEMPLATE_VARIABLE,
+    RECAP_SECTION_UNCACHEABLE_TEMPLATE_TAGS,
     TRAINING_TYPES_WITH_EQUIVALENCE,
 )
 from admission.infrastructure.admission.shared_kernel.domain.service.calendrier_inscription import (
@@ -97,7 +117,93 @@ from osis_profile.views.edit_experience_academique import (
 )
 
 
+def _get_fingerprint_value(value):
+    """
+    Convert a value into a structure of built-in types whose representation only depends on the data of the value.
+    Raise a TypeError if the value is not supported.
+    """
+    if value is None or isinstance(
+        value,
+        (str, int, float, decimal.Decimal, datetime.date, datetime.time, uuid.UUID),
+    ):
+        return value
+    if isinstance(value, Promise):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return f'{type(value).__qualname__}.{value.name}'
+    if attr.has(type(value)):
+        return (
+            type(value).__qualname__,
+            tuple(
+                (field.name, _get_fingerprint_value(getattr(value, field.name))) for field in attr.fields(type(value))
+            ),
+        )
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), _get_fingerprint_value(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_get_fingerprint_value(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(repr(_get_fingerprint_value(item)) for item in value))
+    raise TypeError(f'Unsupported value: {type(value)}')
+
+
+UNCACHEABLE_TEMPLATE_TAGS_REGEX = re.compile(
+    r'\b({})\b'.format('|'.join(map(re.escape, sorted(RECAP_SECTION_UNCACHEABLE_TEMPLATE_TAGS))))
+)
+TEMPLATE_LOAD_TAG_REGEX = re.compile(r'{%\s*load\s+(.+?)\s*%}')
+
+
+@lru_cache(maxsize=None)
+def _get_templates_fingerprint(template_names: Tuple[str, ...]) -> Optional[str]:
+    """
+    Return a hash of the sources of the templates and of all the templates they depend on (extended and included
+    templates, templates of the inclusion tags), and of the modules of the tag libraries they load. Return None if
+    the rendering of the templates does not only depend on their context: if they use a tag reading other data or
+    include a template whose name is not known.
+    """
+    engine = engines['django'].engine
+    digest = hashlib.sha256()
+    libraries_names = set()
+    visited_template_names = set()
+    pending_template_names = list(template_names)
+
+    while pending_template_names:
+        template_name = pending_template_names.pop()
+        if template_name in visited_template_names:
+            continue
+        visited_template_names.add(template_name)
+
+        template = engine.get_template(template_name)
+        if UNCACHEABLE_TEMPLATE_TAGS_REGEX.search(template.source):
+            return None
+
+        digest.update(f'{template_name}|{template.source}'.encode())
+        for libraries in TEMPLATE_LOAD_TAG_REGEX.findall(template.source):
+            libraries_names.update(libraries.split())
+
+        for node in template.nodelist.get_nodes_by_type(IncludeNode) + template.nodelist.get_nodes_by_type(ExtendsNode):
+            filter_expression = node.template if isinstance(node, IncludeNode) else node.parent_name
+            if isinstance(filter_expression.var, str):
+                pending_template_names.append(filter_expression.var)
+            elif str(filter_expression.var) != RECAP_SECTION_CONTENT_TEMPLATE_VARIABLE:
+                # The content template is explicitly part of the fingerprinted templates
+                return None
+
+        for node in template.nodelist.get_nodes_by_type(InclusionNode):
+            if isinstance(node.filename, str):
+                pending_template_names.append(node.filename)
+
+    for library_name in sorted(libraries_names):
+        library_path = engine.libraries.get(library_name)
+        if library_path:
+            digest.update(inspect.getsource(importlib.import_module(library_path)).encode())
+
+    return digest.hexdigest()
+
+
 class Section:
+    base_template = 'admission/exports/recap/base_pdf.html'
+
     def __init__(
         self,
         identifier,
@@ -125,11 +231,7 @@ class Section:
             )
 
         if load_content:
-            from admission.exports.utils import get_pdf_from_template
-
-            self.content = get_pdf_from_template(
-                'admission/exports/recap/base_pdf.html',
-                WeasyprintStylesheets.get_stylesheets(),
+            self.content = self._get_content(
                 {
                     'content_template_name': content_template,
                     'content_title': self.label,
@@ -156,6 +258,55 @@ class Section:
         else:
             self.content = None
 
+    @classmethod
+    def _get_content(cls, template_context: Dict) -> bytes:
+        """
+        Return the rendered pdf of the section. As the rendering is expensive, the result is cached under a key that
+        depends on the templates, the language and the context of the section, so that only the sections whose data
+        have changed are rendered again.
+        """
+        from admission.exports.utils import get_pdf_from_template
+
+        cache_key = cls._get_content_cache_key(template_context)
+
+        if cache_key:
+            content = cache.get(cache_key)
+            if content is not None:
+                return content
+
+        content = get_pdf_from_template(
+            cls.base_template,
+            WeasyprintStylesheets.get_stylesheets(),
+            template_context,
+        )
+
+        if cache_key:
+            cache.set(cache_key, content, timeout=RECAP_SECTION_CACHE_TIMEOUT)
+
+        return content
+
+    @classmethod
+    def _get_content_cache_key(cls, template_context: Dict) -> str:
+        """
+        Return the cache key of the section content or an empty string if the context or the templates cannot be
+        fingerprinted.
+        """
+        templates_fingerprint = _get_templates_fingerprint(
+            (cls.base_template, template_context[RECAP_SECTION_CONTENT_TEMPLATE_VARIABLE])
+        )
+        if templates_fingerprint is None:
+            return ''
+
+        try:
+            fingerprint = repr(_get_fingerprint_value(template_context))
+        except TypeError:
+            return ''
+
+        digest = hashlib.sha256()
+        digest.update(f'{RECAP_SECTION_CACHE_VERSION}|{get_language()}|{templates_fingerprint}|{fingerprint}'.encode())
+
+        return f'admission-recap-section-{digest.hexdigest()}'
+
     @staticmethod
     def _get_label(base_label: str, sub_label: str, sub_dates: str):
         label = base_label
@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2024 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -23,9 +23,14 @@
 #    see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
+from copy import copy
 
 from django.template.loader import render_to_string
 from django.utils import translation
+from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.workbook import Workbook
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+from openpyxl.worksheet.worksheet import Worksheet
 from weasyprint import HTML
 
 from osis_common.utils.url_fetcher import django_url_fetcher
@@ -67,3 +72,38 @@ def admission_generate_pdf(admission, template, filename, context=None, styleshe
     if author:
         change_remote_metadata(token=token, metadata={'author': author})
     return token
+
+
+def copy_worksheet_into_write_only_workbook(worksheet: Worksheet, workbook: Workbook) -> WriteOnlyWorksheet:
+    """
+    Copy the values, the styles, the column widths and the frozen panes of a worksheet into a new worksheet of a
+    write-only workbook. Other rows can then be appended to the returned worksheet.
+    """
+    new_worksheet = workbook.create_sheet(title=worksheet.title)
+
+    # The dimensions must be specified before any row is written
+    for column_letter, column_dimension in worksheet.column_dimensions.items():
+        if column_dimension.width:
+            new_worksheet.column_dimensions[column_letter].width = column_dimension.width
+
+    new_worksheet.freeze_panes = worksheet.freeze_panes
+
+    for row in worksheet.iter_rows():
+        new_worksheet.append([_copy_cell_into_write_only_worksheet(cell, new_worksheet) for cell in row])
+
+    return new_worksheet
+
+
+def _copy_cell_into_write_only_worksheet(cell: Cell, worksheet: WriteOnlyWorksheet) -> WriteOnlyCell:
+    new_cell = WriteOnlyCell(worksheet, value=cell.value)
+
+    # The styles are shared by the cells of a workbook so they are copied as objects and not as references
+    if cell.has_style:
+        new_cell.font = copy(cell.font)
+        new_cell.fill = copy(cell.fill)
+        new_cell.border = copy(cell.border)
+        new_cell.alignment = copy(cell.alignment)
+        new_cell.protection = copy(cell.protection)
+        new_cell.number_format = cell.number_format
+
+    return new_cell
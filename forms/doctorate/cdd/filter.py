@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -24,6 +24,7 @@
 #
 # ##############################################################################
 import json
+from typing import Dict, Optional
 
 from dal import forward
 from django import forms
@@ -85,6 +86,28 @@ from reference.models.enums.scholarship_type import ScholarshipType
 from reference.models.scholarship import Scholarship
 
 
+def get_dashboard_indicator_choices(indicators_counts: Optional[Dict[str, int]] = None):
+    """Return the grouped choices of the dashboard indicators, with their number of admissions if they are known."""
+    indicators_counts = indicators_counts or {}
+    return [EMPTY_CHOICE[0]] + [
+        [
+            category.libelle,
+            [
+                [
+                    indicator.id.name,
+                    (
+                        f'{indicator.libelle} ({indicators_counts[indicator.id.name]})'
+                        if indicator.id.name in indicators_counts
+                        else indicator.libelle
+                    ),
+                ]
+                for indicator in category.indicateurs
+            ],
+        ]
+        for category in TableauBordRepositoryAdmissionMixin.categories_admission
+    ]
+
+
 class DoctorateListFilterForm(BaseAdmissionFilterForm):
     statuses_choices = ChoixStatutPropositionDoctorale.choices()
 
@@ -195,11 +218,7 @@ class DoctorateListFilterForm(BaseAdmissionFilterForm):
     indicateur_tableau_bord = forms.ChoiceField(
         label=_('Dashboard indicator'),
         required=False,
-        choices=[EMPTY_CHOICE[0]]
-        + [
-            [category.libelle, [[indicator.id.name, indicator.libelle] for indicator in category.indicateurs]]
-            for category in TableauBordRepositoryAdmissionMixin.categories_admission
-        ],
+        choices=get_dashboard_indicator_choices(),
         widget=SelectWithDisabledOptions(
             enabled_options={*TableauBordRepositoryAdmissionMixin.ADMISSION_DJANGO_FILTER_BY_INDICATOR, ''},
         ),
@@ -300,6 +319,12 @@ class DoctorateListFilterForm(BaseAdmissionFilterForm):
         if len(self.cdd_acronyms) <= 1:
             self.fields['cdds'].widget = forms.MultipleHiddenInput()
 
+        # Display the number of admissions of each indicator for the CDDs of the user
+        indicators_counts = TableauBordRepositoryAdmissionMixin.get_admission_indicators_counts(
+            cdds=list(self.cdd_acronyms),
+        )
+        self.fields['indicateur_tableau_bord'].choices = get_dashboard_indicator_choices(indicators_counts)
+
         # Initialize the program field
         self.doctorates = self.get_doctorate_queryset()
         self.fields['sigles_formations'].choices = [
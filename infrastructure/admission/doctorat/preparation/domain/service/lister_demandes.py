@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -25,7 +25,6 @@
 # ##############################################################################
 import datetime
 import json
-from collections import defaultdict
 from decimal import Decimal
 from typing import Dict, List, Optional
 
@@ -37,6 +36,7 @@ from django.utils.translation import get_language
 from osis_signature.enums import SignatureState
 from osis_signature.models import Actor
 
+from admission.admission_utils.entity_closure import get_entities_with_descendants_ids
 from admission.ddd.admission.doctorat.preparation.domain.model.enums import (
     BourseRecherche,
     ChoixStatutPropositionDoctorale,
@@ -62,8 +62,8 @@ from admission.ddd.admission.shared_kernel.enums.checklist import ModeFiltrageCh
 from admission.infrastructure.admission.doctorat.preparation.read_view.repository.tableau_bord import (
     TableauBordRepositoryAdmissionMixin,
 )
-from admission.infrastructure.utils import get_entities_with_descendants_ids
 from admission.models import DoctorateAdmission
+from admission.models.checklist import AdmissionChecklistStatus
 from admission.models.enums.actor_type import ActorType
 from admission.views import PaginatedList
 from epc.models.enums.decision_resultat_cycle import DecisionResultatCycle
@@ -262,7 +262,7 @@ class ListerDemandesService(IListerDemandesService):
 
         if mode_filtres_etats_checklist and filtres_etats_checklist:
 
-            json_path_to_checks = defaultdict(set)
+            checked_tabs = set()
             all_checklist_filters = Q()
 
             for tab_name, status_values in filtres_etats_checklist.items():
@@ -283,31 +283,15 @@ class ListerDemandesService(IListerDemandesService):
                         continue
 
                     current_checklist_filters = Q()
-                    with_json_checklist_filter = False
-
-                    # Filter on the checklist tab status
-                    if current_status_filter.statut:
-                        current_checklist_filters = Q(
-                            **{
-                                f'checklist__current__{tab_name}__statut': current_status_filter.statut.name,
-                            }
-                        )
-                        json_path_to_checks[f'checklist__current__{tab_name}'].add('statut')
-                        with_json_checklist_filter = True
-
-                    # Filter on the checklist tab extra if necessary
-                    if current_status_filter.extra:
-                        current_checklist_filters &= Q(
-                            **{
-                                f'checklist__current__{tab_name}__extra__contains': current_status_filter.extra,
-                            }
-                        )
-                        json_path_to_checks[f'checklist__current__{tab_name}'].add('extra')
-                        with_json_checklist_filter = True
 
-                    if with_json_checklist_filter:
-                        json_path_to_checks['checklist__current'].add(tab_name)
-                        json_path_to_checks['checklist'].add('current')
+                    # Filter on the checklist tab status and extra, using the indexed checklist statuses
+                    if current_status_filter.statut or current_status_filter.extra:
+                        current_checklist_filters = AdmissionChecklistStatus.objects.get_filter(
+                            tab=tab_name,
+                            status=current_status_filter.statut.name if current_status_filter.statut else '',
+                            extra=current_status_filter.extra,
+                        )
+                        checked_tabs.add(tab_name)
 
                     all_checklist_filters |= current_checklist_filters
 
@@ -315,10 +299,10 @@ class ListerDemandesService(IListerDemandesService):
                 # We exclude the admissions whose the specific keys have the specified values
                 all_checklist_filters = ~all_checklist_filters
 
-                # We exclude the admissions whose the specific keys are missing (for unconfirmed admission,
+                # We exclude the admissions whose the specific tabs are missing (for unconfirmed admission,
                 # other admission contexts etc.)
-                for base_key, missing_keys in json_path_to_checks.items():
-                    all_checklist_filters |= ~Q(**{f'{base_key}__has_keys': missing_keys})
+                for tab_name in checked_tabs:
+                    all_checklist_filters |= ~AdmissionChecklistStatus.objects.get_presence_filter(tab=tab_name)
 
             qs = qs.filter(all_checklist_filters)
 
@@ -26,7 +26,6 @@
 from typing import List, Optional
 
 from django.conf import settings
-from django.contrib.postgres.search import SearchVector
 from django.db.models import Exists, F, OuterRef, Q
 from django.db.models.functions import Coalesce
 from django.utils.translation import get_language
@@ -44,6 +43,7 @@ from admission.ddd.admission.doctorat.preparation.domain.validator.exceptions im
 from admission.ddd.admission.doctorat.preparation.dtos import PromoteurDTO
 from admission.models import SupervisionActor
 from admission.models.enums.actor_type import ActorType
+from admission.models.person_search import get_person_search_filter
 from base.models.person import Person
 from base.models.student import Student
 
@@ -103,12 +103,14 @@ class PromoteurTranslator(IPromoteurTranslator):
             actors = actors.filter(uuid__in=promoteurs_ids)
 
         if terme_recherche is not None:
-            actors = actors.annotate(
-                name=SearchVector(
-                    'current_first_name',
-                    'current_last_name',
-                ),
-            ).filter(Q(name=terme_recherche) | Q(person__global_id__contains=terme_recherche))
+            # The internal actors are searched with the person search index, the external ones with their names
+            external_actors_filter = Q(person__isnull=True)
+            for term in terme_recherche.split():
+                external_actors_filter &= Q(first_name__icontains=term) | Q(last_name__icontains=term)
+            actors = actors.filter(
+                get_person_search_filter(terme_recherche, fields=['global_id'], prefix='person__')
+                | external_actors_filter
+            )
 
         actors = actors.order_by('current_last_name', 'current_first_name')
 
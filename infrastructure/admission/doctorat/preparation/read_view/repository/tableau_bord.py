@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -24,9 +24,11 @@
 #
 # ##############################################################################
 from abc import ABCMeta
+from typing import Dict, List, Optional, Set
 
 from django.db.models.query_utils import Q
 
+from admission.admission_utils.entity_closure import get_entities_with_descendants_ids
 from admission.ddd.admission.doctorat.preparation.domain.model.enums import (
     ChoixStatutPropositionDoctorale,
     ChoixTypeAdmission,
@@ -38,24 +40,51 @@ from admission.ddd.admission.doctorat.preparation.read_view.repository.i_tableau
 
 
 class TableauBordRepositoryAdmissionMixin(ITableauBordRepositoryAdmissionMixin, metaclass=ABCMeta):
+    # Values of the fields of the doctorate admissions that are counted by each indicator
+    ADMISSION_CONDITIONS_BY_INDICATOR: Dict[str, Dict[str, str]] = {
+        IndicateurTableauBordEnum.PRE_ADMISSION_DOSSIER_SOUMIS.name: {
+            'status': ChoixStatutPropositionDoctorale.CONFIRMEE.name,
+            'type': ChoixTypeAdmission.PRE_ADMISSION.name,
+        },
+        IndicateurTableauBordEnum.PRE_ADMISSION_AUTORISE_SIC.name: {
+            'status': ChoixStatutPropositionDoctorale.INSCRIPTION_AUTORISEE.name,
+            'type': ChoixTypeAdmission.PRE_ADMISSION.name,
+        },
+        # IndicateurTableauBordEnum.PRE_ADMISSION_PAS_EN_ORDRE_INSCRIPTION.name: {},
+        # IndicateurTableauBordEnum.PRE_ADMISSION_ECHEANCE_3_MOIS.name: {},
+        IndicateurTableauBordEnum.ADMISSION_DOSSIER_SOUMIS.name: {
+            'status': ChoixStatutPropositionDoctorale.CONFIRMEE.name,
+            'type': ChoixTypeAdmission.ADMISSION.name,
+        },
+        IndicateurTableauBordEnum.ADMISSION_AUTORISE_SIC.name: {
+            'status': ChoixStatutPropositionDoctorale.INSCRIPTION_AUTORISEE.name,
+            'type': ChoixTypeAdmission.ADMISSION.name,
+        },
+        # IndicateurTableauBordEnum.ADMISSION_PAS_EN_ORDRE_INSCRIPTION.name: {},
+    }
+
     ADMISSION_DJANGO_FILTER_BY_INDICATOR = {
-        IndicateurTableauBordEnum.PRE_ADMISSION_DOSSIER_SOUMIS.name: Q(
-            status=ChoixStatutPropositionDoctorale.CONFIRMEE.name,
-            type=ChoixTypeAdmission.PRE_ADMISSION.name,
-        ),
-        IndicateurTableauBordEnum.PRE_ADMISSION_AUTORISE_SIC.name: Q(
-            status=ChoixStatutPropositionDoctorale.INSCRIPTION_AUTORISEE.name,
-            type=ChoixTypeAdmission.PRE_ADMISSION.name,
-        ),
-        # IndicateurTableauBordEnum.PRE_ADMISSION_PAS_EN_ORDRE_INSCRIPTION.name: Q(),
-        # IndicateurTableauBordEnum.PRE_ADMISSION_ECHEANCE_3_MOIS.name: Q(),
-        IndicateurTableauBordEnum.ADMISSION_DOSSIER_SOUMIS.name: Q(
-            status=ChoixStatutPropositionDoctorale.CONFIRMEE.name,
-            type=ChoixTypeAdmission.ADMISSION.name,
-        ),
-        IndicateurTableauBordEnum.ADMISSION_AUTORISE_SIC.name: Q(
-            status=ChoixStatutPropositionDoctorale.INSCRIPTION_AUTORISEE.name,
-            type=ChoixTypeAdmission.ADMISSION.name,
-        ),
-        # IndicateurTableauBordEnum.ADMISSION_PAS_EN_ORDRE_INSCRIPTION.name: Q(),
+        indicator: Q(**conditions) for indicator, conditions in ADMISSION_CONDITIONS_BY_INDICATOR.items()
     }
+
+    @classmethod
+    def get_admission_indicators(cls, admission_values: Dict[str, str]) -> Set[str]:
+        """Return the names of the indicators counting an admission having the specified field values."""
+        return {
+            indicator
+            for indicator, conditions in cls.ADMISSION_CONDITIONS_BY_INDICATOR.items()
+            if all(admission_values.get(field) == value for field, value in conditions.items())
+        }
+
+    @classmethod
+    def get_admission_indicators_counts(cls, cdds: Optional[List[str]] = None) -> Dict[str, int]:
+        """
+        Return the number of doctorate admissions of each indicator, read from the materialized counts. If specified,
+        only the admissions managed by the CDDs (and their descendants) are counted.
+        """
+        from admission.models.dashboard_indicator import DoctorateDashboardIndicatorCount
+
+        return DoctorateDashboardIndicatorCount.objects.get_counts(
+            indicators=list(cls.ADMISSION_CONDITIONS_BY_INDICATOR),
+            entities_ids=get_entities_with_descendants_ids(cdds) if cdds is not None else None,
+        )
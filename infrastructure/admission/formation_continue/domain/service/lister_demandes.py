@@ -23,7 +23,6 @@
 #    see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
-from collections import defaultdict
 from typing import Dict, List, Optional
 
 from django.conf import settings
@@ -32,6 +31,7 @@ from django.db.models.fields import CharField
 from django.db.models.functions import Concat
 from django.utils.translation import get_language, gettext
 
+from admission.admission_utils.entity_closure import get_entities_with_descendants_ids
 from admission.ddd.admission.formation_continue.domain.model.enums import (
     ChoixEdition,
     ChoixStatutPropositionContinue,
@@ -46,8 +46,8 @@ from admission.ddd.admission.formation_continue.domain.service.i_lister_demandes
 )
 from admission.ddd.admission.formation_continue.dtos.liste import DemandeRechercheDTO
 from admission.ddd.admission.shared_kernel.enums.checklist import ModeFiltrageChecklist
-from admission.infrastructure.utils import get_entities_with_descendants_ids
 from admission.models import ContinuingEducationAdmission
+from admission.models.checklist import AdmissionChecklistStatus
 from admission.models.epc_injection import EPCInjectionStatus
 from admission.views import PaginatedList
 
@@ -158,7 +158,7 @@ class ListerDemandesService(IListerDemandesService):
             qs = qs.filter_according_to_roles(demandeur, permission='admission.view_continuing_enrolment_applications')
 
         if mode_filtres_etats_checklist and filtres_etats_checklist:
-            json_path_to_checks = defaultdict(set)
+            checked_tabs = set()
             all_checklist_filters = Q()
 
             for tab_name, status_values in filtres_etats_checklist.items():
@@ -179,7 +179,6 @@ class ListerDemandesService(IListerDemandesService):
                         continue
 
                     current_checklist_filters = Q()
-                    with_json_checklist_filter = False
 
                     # Specific cases
                     if tab_name == OngletsChecklist.donnees_personnelles.name:
@@ -187,29 +186,14 @@ class ListerDemandesService(IListerDemandesService):
                         current_checklist_filters = Q(candidate__personal_data_validation_status=status_value)
 
                     else:
-                        # Filter on the checklist tab status
-                        if current_status_filter.statut:
-                            current_checklist_filters = Q(
-                                **{
-                                    f'checklist__current__{tab_name}__statut': current_status_filter.statut.name,
-                                }
+                        # Filter on the checklist tab status and extra, using the indexed checklist statuses
+                        if current_status_filter.statut or current_status_filter.extra:
+                            current_checklist_filters = AdmissionChecklistStatus.objects.get_filter(
+                                tab=tab_name,
+                                status=current_status_filter.statut.name if current_status_filter.statut else '',
+                                extra=current_status_filter.extra,
                             )
-                            json_path_to_checks[f'checklist__current__{tab_name}'].add('statut')
-                            with_json_checklist_filter = True
-
-                        # Filter on the checklist tab extra if necessary
-                        if current_status_filter.extra:
-                            current_checklist_filters &= Q(
-                                **{
-                                    f'checklist__current__{tab_name}__extra__contains': current_status_filter.extra,
-                                }
-                            )
-                            json_path_to_checks[f'checklist__current__{tab_name}'].add('extra')
-                            with_json_checklist_filter = True
-
-                    if with_json_checklist_filter:
-                        json_path_to_checks['checklist__current'].add(tab_name)
-                        json_path_to_checks['checklist'].add('current')
+                            checked_tabs.add(tab_name)
 
                     all_checklist_filters |= current_checklist_filters
 
@@ -217,10 +201,10 @@ class ListerDemandesService(IListerDemandesService):
                 # We exclude the admissions whose the specific keys have the specified values
                 all_checklist_filters = ~all_checklist_filters
 
-                # We exclude the admissions whose the specific keys are missing (for unconfirmed admission,
+                # We exclude the admissions whose the specific tabs are missing (for unconfirmed admission,
                 # other admission contexts etc.)
-                for base_key, missing_keys in json_path_to_checks.items():
-                    all_checklist_filters |= ~Q(**{f'{base_key}__has_keys': missing_keys})
+                for tab_name in checked_tabs:
+                    all_checklist_filters |= ~AdmissionChecklistStatus.objects.get_presence_filter(tab=tab_name)
 
             qs = qs.filter(all_checklist_filters)
 
@@ -204,6 +204,13 @@ COMMAND_HANDLERS = {
         annee_inscription_formation_translator=AnneeInscriptionFormationTranslator(),
         inscriptions_translator=InscriptionsTranslatorService(),
     ),
+    ListerResumesPropositionsQuery: lambda msg_bus, cmd: lister_resumes_propositions(
+        cmd,
+        proposition_repository=PropositionRepository(),
+        i_profil_candidat_translator=ProfilCandidatTranslator(),
+        academic_year_repository=AcademicYearRepository(),
+        inscriptions_translator=InscriptionsTranslatorService(),
+    ),
     RecupererQuestionsSpecifiquesQuery: lambda msg_bus, cmd: recuperer_questions_specifiques_proposition(
         cmd,
         question_specifique_translator=QuestionSpecifiqueTranslator(),
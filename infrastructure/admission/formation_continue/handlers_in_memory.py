@@ -230,6 +230,13 @@ COMMAND_HANDLERS = {
         inscriptions_translator=_inscriptions_translator,
         annee_inscription_formation_translator=_annee_inscription_formation_translator,
     ),
+    ListerResumesPropositionsQuery: lambda msg_bus, cmd: lister_resumes_propositions(
+        cmd,
+        proposition_repository=_proposition_repository,
+        i_profil_candidat_translator=_profil_candidat_translator,
+        academic_year_repository=_academic_year_repository,
+        inscriptions_translator=_inscriptions_translator,
+    ),
     RecupererQuestionsSpecifiquesQuery: lambda msg_bus, cmd: recuperer_questions_specifiques_proposition(
         cmd,
         question_specifique_translator=_question_specific_translator,
@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -102,7 +102,18 @@ class PropositionInMemoryRepository(
         return proposition
 
     @classmethod
-    def search_dto(cls, matricule_candidat: Optional[str] = '') -> List['PropositionDTO']:
+    def search_dto(
+        cls,
+        matricule_candidat: Optional[str] = '',
+        entity_ids: Optional[List['PropositionIdentity']] = None,
+    ) -> List['PropositionDTO']:
+        if entity_ids is not None:
+            return [
+                cls._load_dto(proposition)
+                for proposition in cls.entities
+                if proposition.entity_id in entity_ids
+                and (not matricule_candidat or proposition.matricule_candidat == matricule_candidat)
+            ]
         propositions = [
             cls._load_dto(proposition)
             for proposition in cls.entities
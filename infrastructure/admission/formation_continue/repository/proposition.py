@@ -88,13 +88,19 @@ class PropositionRepository(GlobalPropositionRepository, IPropositionRepository)
         raise NotImplementedError
 
     @classmethod
-    def search_dto(cls, matricule_candidat: Optional[str] = '') -> List['PropositionDTO']:
+    def search_dto(
+        cls,
+        matricule_candidat: Optional[str] = '',
+        entity_ids: Optional[List['PropositionIdentity']] = None,
+    ) -> List['PropositionDTO']:
         # Default queryset
         qs = ContinuingEducationAdmissionProxy.objects.for_dto().all()
 
         # Add filters
         if matricule_candidat:
             qs = qs.filter(candidate__global_id=matricule_candidat)
+        if entity_ids is not None:
+            qs = qs.filter(uuid__in=[entity_id.uuid for entity_id in entity_ids])
 
         # Return dtos
         return [cls._load_dto(proposition) for proposition in qs]
@@ -306,6 +306,16 @@ COMMAND_HANDLERS = {
         deliberation_translator=DeliberationTranslator(),
         inscriptions_translator=InscriptionsTranslatorService(),
     ),
+    DeterminerAnneesAcademiquesEtPotsQuery: lambda msg_bus, cmd: determiner_annees_academiques_et_pots(
+        cmd,
+        proposition_repository=PropositionRepository(),
+        formation_translator=FormationGeneraleTranslator(),
+        titres_acces=TitresAcces(),
+        profil_candidat_translator=ProfilCandidatTranslator(),
+        calendrier_inscription=CalendrierInscription(),
+        deliberation_translator=DeliberationTranslator(),
+        inscriptions_translator=InscriptionsTranslatorService(),
+    ),
     RecupererElementsConfirmationQuery: lambda msg_bus, cmd: recuperer_elements_confirmation(
         cmd,
         proposition_repository=PropositionRepository(),
@@ -370,6 +370,16 @@ COMMAND_HANDLERS = {
         inscriptions_translator=_inscriptions_translator,
         deliberation_translator=_deliberation_translator,
     ),
+    DeterminerAnneesAcademiquesEtPotsQuery: lambda msg_bus, cmd: determiner_annees_academiques_et_pots(
+        cmd,
+        proposition_repository=_proposition_repository,
+        formation_translator=_formation_generale_translator,
+        titres_acces=_titres_acces,
+        profil_candidat_translator=_profil_candidat_translator,
+        calendrier_inscription=CalendrierInscriptionInMemory(),
+        inscriptions_translator=_inscriptions_translator,
+        deliberation_translator=_deliberation_translator,
+    ),
     RecupererElementsConfirmationQuery: lambda msg_bus, cmd: recuperer_elements_confirmation(
         cmd,
         proposition_repository=_proposition_repository,
@@ -30,12 +30,11 @@ from typing import List, Optional, Union
 import attrs
 from django.conf import settings
 from django.db import transaction
-from django.db.models import OuterRef, Prefetch, Subquery
+from django.db.models import Prefetch
 from django.utils import timezone
 from django.utils.safestring import mark_safe
 from django.utils.translation import get_language, pgettext
 from osis_document_components.utils import is_uuid
-from osis_history.models import HistoryEntry
 
 from admission.auth.roles.candidate import Candidate
 from admission.ddd.admission.formation_generale.domain.builder.proposition_identity_builder import (
@@ -1071,14 +1070,7 @@ class PropositionRepository(GlobalPropositionRepository, IPropositionRepository)
                 GeneralEducationAdmissionProxy.objects.for_manager_dto()
                 .annotate_several_admissions_in_progress()
                 .annotate_submitted_profile_countries_names()
-                .annotate(
-                    status_updated_at=Subquery(
-                        HistoryEntry.objects.filter(
-                            object_uuid=OuterRef('uuid'),
-                            tags__contains=['proposition', 'status-changed'],
-                        ).values('created')[:1]
-                    ),
-                )
+                .annotate_last_status_update()
                 .select_related(
                     'accounting',
                     'other_training_accepted_by_fac__academic_year',
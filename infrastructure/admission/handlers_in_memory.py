@@ -87,6 +87,10 @@ COMMAND_HANDLERS = {
         cmd,
         lister_toutes_demandes_service=ListerToutesDemandesInMemory(),
     ),
+    RecupererDemandesVoisinesQuery: lambda msg_bus, cmd: recuperer_demandes_voisines(
+        cmd,
+        lister_toutes_demandes_service=ListerToutesDemandesInMemory(),
+    ),
     RecupererInformationsDestinataireQuery: lambda msg_bus, query: recuperer_informations_destinataire(
         query,
         email_destinataire_repository=EmailDestinataireInMemoryRepository(),
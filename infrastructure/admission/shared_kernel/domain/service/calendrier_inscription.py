@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -26,8 +26,12 @@
 from datetime import date
 from typing import List, Optional, Tuple
 
+from django.core.cache import cache
 from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
+from admission.constants import OPEN_POOLS_CACHE_TIMEOUT
 from admission.ddd.admission.shared_kernel.domain.model.periode import Periode
 from admission.ddd.admission.shared_kernel.domain.service.i_calendrier_inscription import (
     ICalendrierInscription,
@@ -42,6 +46,8 @@ from base.models.enums.academic_calendar_type import AcademicCalendarTypes
 from base.models.enums.education_group_types import TrainingType
 from osis_profile import PLUS_5_ISO_CODES
 
+OPEN_POOLS_CACHE_KEY = 'admission_open_pools_{day}'
+
 
 class CalendrierInscription(ICalendrierInscription):
     @classmethod
@@ -51,11 +57,19 @@ class CalendrierInscription(ICalendrierInscription):
 
     @classmethod
     def get_pool_ouverts(cls) -> List[Tuple[str, int]]:
+        # Les pots ouverts du jour sont partagés entre les processus et invalidés à la modification d'un calendrier
         today = date.today()
-        return AcademicCalendar.objects.filter(
-            start_date__lte=today,
-            end_date__gte=today,
-        ).values_list('reference', 'data_year__year')
+        cache_key = OPEN_POOLS_CACHE_KEY.format(day=today.isoformat())
+        pool_ouverts = cache.get(cache_key)
+        if pool_ouverts is None:
+            pool_ouverts = list(
+                AcademicCalendar.objects.filter(
+                    start_date__lte=today,
+                    end_date__gte=today,
+                ).values_list('reference', 'data_year__year')
+            )
+            cache.set(cache_key, pool_ouverts, timeout=OPEN_POOLS_CACHE_TIMEOUT)
+        return pool_ouverts
 
     @classmethod
     def recuperer_periode_inscription_specifique_medecine_dentisterie(
@@ -101,3 +115,9 @@ class CalendrierInscription(ICalendrierInscription):
         identification: 'IdentificationDTO',
     ) -> bool:
         return identification.pays_nationalite_europeen or identification.pays_nationalite in PLUS_5_ISO_CODES
+
+
+@receiver(post_save, sender=AcademicCalendar)
+@receiver(post_delete, sender=AcademicCalendar)
+def _invalidate_open_pools(sender, instance, **kwargs):
+    cache.delete(OPEN_POOLS_CACHE_KEY.format(day=date.today().isoformat()))
@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -25,6 +25,7 @@
 # ##############################################################################
 from typing import Dict, List
 
+from admission.admission_utils.remote_documents import get_cached_remote_metadata
 from admission.ddd.admission.shared_kernel.domain.service.i_emplacements_documents_proposition import (
     IEmplacementsDocumentsPropositionTranslator,
 )
@@ -38,19 +39,13 @@ from osis_profile.models import ExamType
 class EmplacementsDocumentsPropositionTranslator(IEmplacementsDocumentsPropositionTranslator):
     @classmethod
     def recuperer_metadonnees_par_uuid_document(cls, uuids_documents: List[str]) -> Dict[str, Dict]:
-        from osis_document_components.services import get_remote_tokens, get_several_remote_metadata
-
-        tokens = get_remote_tokens(
+        metadata = get_cached_remote_metadata(
             uuids_documents,
             for_modified_upload=True,
             wanted_post_process=PostProcessingWanted.ORIGINAL.name,
         )
-        metadata = get_several_remote_metadata(list(tokens.values()))
 
-        return {
-            uuid: metadata[tokens[uuid]] if uuid in tokens and tokens[uuid] in metadata else {}
-            for uuid in uuids_documents
-        }
+        return {uuid: metadata.get(uuid, {}) for uuid in uuids_documents}
 
     @classmethod
     def get_sections(
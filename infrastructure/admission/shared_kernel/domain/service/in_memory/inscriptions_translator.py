@@ -78,6 +78,13 @@ class InscriptionsInMemoryTranslator(IInscriptionsTranslatorService):
     ) -> InscriptionDTO | None:
         return None
 
+    @classmethod
+    def recuperer_dernieres_inscriptions(
+        cls,
+        matricules_candidats: list[str],
+    ) -> dict[str, InscriptionDTO]:
+        return {}
+
     @classmethod
     def recuperer_assimilation_inscription_formation_annee_precedente(
         cls,
@@ -37,7 +37,10 @@ from admission.ddd.admission.formation_generale.dtos import (
 from admission.ddd.admission.shared_kernel.domain.service.i_filtrer_toutes_demandes import (
     IListerToutesDemandes,
 )
-from admission.ddd.admission.shared_kernel.dtos.liste import DemandeRechercheDTO
+from admission.ddd.admission.shared_kernel.dtos.liste import (
+    DemandeRechercheDTO,
+    DemandesVoisinesDTO,
+)
 from admission.infrastructure.admission.doctorat.preparation.repository.in_memory.proposition import (
     PropositionInMemoryRepository as PropositionDoctoraleInMemoryRepository,
 )
@@ -78,6 +81,7 @@ class ListerToutesDemandesInMemory(IListerToutesDemandes):
         filtres_etats_checklist: Optional[Dict[str, List[str]]] = '',
         tardif_modif_reorientation: Optional[str] = '',
         delai_depasse_complements: Optional[bool] = None,
+        curseur: Optional[str] = '',
     ) -> PaginatedList[DemandeRechercheDTO]:
         result = PaginatedList(id_attribute='uuid')
 
@@ -92,6 +96,14 @@ class ListerToutesDemandesInMemory(IListerToutesDemandes):
 
         return result
 
+    @classmethod
+    def recuperer_voisins(cls, uuid_demande: str, **filtres) -> DemandesVoisinesDTO:
+        voisins = cls.filtrer(**filtres).sorted_elements.get(uuid_demande, {})
+        return DemandesVoisinesDTO(
+            uuid_precedente=voisins.get('previous'),
+            uuid_suivante=voisins.get('next'),
+        )
+
     @classmethod
     def _load_from_general_proposition(cls, proposition: PropositionGeneraleDTO):
         return DemandeRechercheDTO(
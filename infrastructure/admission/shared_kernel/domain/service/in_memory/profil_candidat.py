@@ -26,7 +26,7 @@
 
 import datetime
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Set, Union
 
 import attr
 
@@ -1329,6 +1329,26 @@ class ProfilCandidatInMemoryTranslator(IProfilCandidatTranslator):
             examen_formation=cls.get_examen(uuid_proposition, matricule, formation.sigle, formation.annee),
         )
 
+    @classmethod
+    def recuperer_toutes_informations_candidats(
+        cls,
+        matricules_par_proposition: Dict[str, str],
+        annee_courante: int,
+        inscriptions_translator: IInscriptionsTranslatorService,
+        propositions_avec_toutes_experiences_cv: Optional[Set[str]] = None,
+    ) -> Dict[str, ResumeCandidatDTO]:
+        return {
+            uuid_proposition: ResumeCandidatDTO(
+                identification=cls.get_identification(matricule),
+                coordonnees=cls.get_coordonnees(matricule),
+                curriculum=cls.get_curriculum(matricule, annee_courante, uuid_proposition, inscriptions_translator),
+                etudes_secondaires=cls.get_etudes_secondaires(matricule),
+                connaissances_langues=None,
+                examen_formation=None,
+            )
+            for uuid_proposition, matricule in matricules_par_proposition.items()
+        }
+
     @classmethod
     def get_experience_academique(
         cls,
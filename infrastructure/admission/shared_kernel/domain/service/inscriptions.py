@@ -57,9 +57,10 @@ class InscriptionsTranslatorService(IInscriptionsTranslatorService):
     @classmethod
     def enrolment_qs(
         cls,
-        global_id: str,
+        global_id: str = '',
         years: list[int] | None = None,
         sigle_formation: str = '',
+        global_ids: list[str] | None = None,
     ) -> QuerySet[InscriptionProgrammeAnnuel]:
         qs = InscriptionProgrammeAnnuel.objects.filter(
             etat_inscription__in=[
@@ -74,9 +75,13 @@ class InscriptionsTranslatorService(IInscriptionsTranslatorService):
             statut__in=[
                 StatutInscriptionProgrammAnnuel.ETUDIANT_UCL.name,
             ],
-            programme_cycle__etudiant__person__global_id=global_id,
         )
 
+        if global_ids is not None:
+            qs = qs.filter(programme_cycle__etudiant__person__global_id__in=global_ids)
+        else:
+            qs = qs.filter(programme_cycle__etudiant__person__global_id=global_id)
+
         if years:
             qs = qs.filter(programme__offer__academic_year__year__in=years)
 
@@ -161,6 +166,40 @@ class InscriptionsTranslatorService(IInscriptionsTranslatorService):
 
         return None
 
+    @classmethod
+    def recuperer_dernieres_inscriptions(
+        cls,
+        matricules_candidats: list[str],
+    ) -> dict[str, InscriptionDTO]:
+        enrolment_qs = (
+            cls.enrolment_qs(global_ids=matricules_candidats)
+            .annotate(
+                sigle_formation=F('programme__offer__acronym'),
+                annee_formation=F('programme__offer__academic_year__year'),
+                noma=F('programme_cycle__etudiant__registration_id'),
+                matricule=F('programme_cycle__etudiant__person__global_id'),
+            )
+            .order_by('matricule', '-annee_formation')
+            .distinct('matricule')
+            .values(
+                'sigle_formation',
+                'annee_formation',
+                'noma',
+                'matricule',
+                'est_premiere_annee_bachelier',
+            )
+        )
+
+        return {
+            enrolment['matricule']: InscriptionDTO(
+                sigle=enrolment['sigle_formation'],
+                annee=enrolment['annee_formation'],
+                noma=enrolment['noma'],
+                est_premiere_annee_bachelier=enrolment['est_premiere_annee_bachelier'],
+            )
+            for enrolment in enrolment_qs
+        }
+
     @classmethod
     def est_en_poursuite(
         cls,
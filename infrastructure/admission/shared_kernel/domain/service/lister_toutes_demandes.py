@@ -25,9 +25,10 @@
 # ##############################################################################
 import datetime
 from collections import defaultdict
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 from django.conf import settings
+from django.core import signing
 from django.db.models import (
     BooleanField,
     Case,
@@ -38,12 +39,16 @@ from django.db.models import (
     OuterRef,
     Prefetch,
     Q,
+    QuerySet,
     Value,
     When,
 )
 from django.db.models.functions import Coalesce, NullIf
 from django.utils.translation import get_language
 
+from admission.admission_utils.candidate_trainings_summary import prefetch_candidate_trainings_summaries
+from admission.admission_utils.entity_closure import get_entities_with_descendants_ids
+from admission.constants import LIST_EXACT_COUNT_THRESHOLD
 from admission.ddd.admission.doctorat.preparation.domain.model.enums import (
     ChoixStatutPropositionDoctorale,
 )
@@ -64,6 +69,7 @@ from admission.ddd.admission.shared_kernel.domain.service.i_filtrer_toutes_deman
 )
 from admission.ddd.admission.shared_kernel.dtos.liste import (
     DemandeRechercheDTO,
+    DemandesVoisinesDTO,
     VisualiseurAdmissionDTO,
 )
 from admission.ddd.admission.shared_kernel.enums.checklist import ModeFiltrageChecklist
@@ -73,9 +79,13 @@ from admission.ddd.admission.shared_kernel.enums.liste import (
 from admission.ddd.admission.shared_kernel.enums.statut import (
     CHOIX_STATUT_TOUTE_PROPOSITION,
 )
-from admission.infrastructure.utils import get_entities_with_descendants_ids
+from admission.infrastructure.utils import (
+    get_estimated_or_exact_count,
+    get_keyset_filter,
+)
 from admission.models import AdmissionViewer
 from admission.models.base import BaseAdmission
+from admission.models.checklist import AdmissionChecklistStatus
 from admission.models.specific_question import SpecificQuestionAnswer
 from admission.views import PaginatedList
 from base.models.enums.education_group_types import TrainingType
@@ -88,6 +98,8 @@ from osis_profile.models.enums.experience_validation import ChoixStatutValidatio
 
 
 class ListerToutesDemandes(IListerToutesDemandes):
+    CURSOR_SALT = 'admission.lister_toutes_demandes.cursor'
+
     @classmethod
     def filtrer(
         cls,
@@ -115,9 +127,215 @@ class ListerToutesDemandes(IListerToutesDemandes):
         filtres_etats_checklist: Optional[Dict[str, List[str]]] = '',
         tardif_modif_reorientation: Optional[str] = '',
         delai_depasse_complements: Optional[bool] = None,
+        curseur: Optional[str] = '',
     ) -> PaginatedList[DemandeRechercheDTO]:
         language_is_french = get_language() == settings.LANGUAGE_CODE_FR
 
+        qs, ordering = cls.get_queryset(
+            annee_academique=annee_academique,
+            numero=numero,
+            noma=noma,
+            matricule_candidat=matricule_candidat,
+            etats=etats,
+            type=type,
+            site_inscription=site_inscription,
+            entites=entites,
+            types_formation=types_formation,
+            formation=formation,
+            bourse_internationale=bourse_internationale,
+            bourse_erasmus_mundus=bourse_erasmus_mundus,
+            bourse_double_diplomation=bourse_double_diplomation,
+            bourse_recherche=bourse_recherche,
+            quarantaine=quarantaine,
+            demandeur=demandeur,
+            tri_inverse=tri_inverse,
+            champ_tri=champ_tri,
+            mode_filtres_etats_checklist=mode_filtres_etats_checklist,
+            filtres_etats_checklist=filtres_etats_checklist,
+            tardif_modif_reorientation=tardif_modif_reorientation,
+            delai_depasse_complements=delai_depasse_complements,
+        )
+
+        # Paginate the queryset
+        if page and taille_page:
+            return cls.get_keyset_paginated_list(
+                qs=qs,
+                ordering=ordering,
+                page=page,
+                page_size=taille_page,
+                cursor=curseur,
+                language_is_french=language_is_french,
+            )
+
+        result = PaginatedList(id_attribute='uuid')
+
+        admissions = list(qs)
+        prefetch_candidate_trainings_summaries(admissions)
+
+        for admission in admissions:
+            result.append(cls.load_dto_from_model(admission, language_is_french))
+
+        return result
+
+    @classmethod
+    def recuperer_voisins(cls, uuid_demande: str, **filtres) -> DemandesVoisinesDTO:
+        qs, ordering = cls.get_queryset(**filtres)
+        qs = qs.prefetch_related(None)
+
+        current_values = qs.filter(uuid=uuid_demande).values_list(*cls._get_field_names(ordering)).first()
+
+        if current_values is None:
+            return DemandesVoisinesDTO(uuid_precedente=None, uuid_suivante=None)
+
+        return DemandesVoisinesDTO(
+            uuid_precedente=(
+                qs.filter(get_keyset_filter(ordering, current_values, backward=True))
+                .order_by(*cls._get_reversed_ordering(ordering))
+                .values_list('uuid', flat=True)
+                .first()
+            ),
+            uuid_suivante=(
+                qs.filter(get_keyset_filter(ordering, current_values)).values_list('uuid', flat=True).first()
+            ),
+        )
+
+    @classmethod
+    def get_keyset_paginated_list(
+        cls,
+        qs: QuerySet,
+        ordering: List[str],
+        page: int,
+        page_size: int,
+        cursor: str,
+        language_is_french: bool,
+    ) -> PaginatedList[DemandeRechercheDTO]:
+        """
+        Retrieve one page of the queryset. If a valid cursor is specified, the page is retrieved from the row
+        referenced by the cursor (keyset pagination), so that its cost does not depend on its number.
+        """
+        total_count, total_count_is_estimated = get_estimated_or_exact_count(
+            qs,
+            exact_count_threshold=LIST_EXACT_COUNT_THRESHOLD,
+        )
+
+        decoded_cursor = cls._decode_cursor(cursor=cursor, page=page)
+        cursor_values = (
+            qs.prefetch_related(None)
+            .filter(uuid=decoded_cursor['uuid'])
+            .values_list(*cls._get_field_names(ordering))
+            .first()
+            if decoded_cursor
+            else None
+        )
+
+        # Retrieve one more row to know if there is another page in the same direction
+        if cursor_values is not None:
+            backward = decoded_cursor['backward']
+            qs = qs.filter(get_keyset_filter(ordering, cursor_values, backward=backward))
+            if backward:
+                qs = qs.order_by(*cls._get_reversed_ordering(ordering))
+            admissions = list(qs[: page_size + 1])
+        else:
+            backward = False
+            offset = (page - 1) * page_size
+            limit = offset + page_size + 1
+            admissions = list(qs[offset:limit])
+
+        has_more = len(admissions) > page_size
+        admissions = admissions[:page_size]
+
+        if backward:
+            admissions.reverse()
+
+        has_previous = page > 1 and (has_more or not backward)
+        has_next = has_more or backward
+
+        existing_pages_count = None
+        if total_count_is_estimated:
+            # Only the pages up to the next one are known to exist, and the count is exact on the last page
+            existing_pages_count = page + 1 if has_next else page
+            if not has_next:
+                total_count = (page - 1) * page_size + len(admissions)
+                total_count_is_estimated = False
+
+        result = PaginatedList(
+            id_attribute='uuid',
+            total_count=total_count,
+            total_count_is_estimated=total_count_is_estimated,
+            existing_pages_count=existing_pages_count,
+            previous_cursor=(
+                cls._encode_cursor(uuid=admissions[0].uuid, page=page - 1, backward=True)
+                if admissions and has_previous
+                else ''
+            ),
+            next_cursor=(
+                cls._encode_cursor(uuid=admissions[-1].uuid, page=page + 1, backward=False)
+                if admissions and has_next
+                else ''
+            ),
+        )
+
+        prefetch_candidate_trainings_summaries(admissions)
+
+        for admission in admissions:
+            result.append(cls.load_dto_from_model(admission, language_is_french))
+
+        return result
+
+    @classmethod
+    def _encode_cursor(cls, uuid, page: int, backward: bool) -> str:
+        return signing.dumps({'uuid': str(uuid), 'page': page, 'backward': backward}, salt=cls.CURSOR_SALT)
+
+    @classmethod
+    def _decode_cursor(cls, cursor: str, page: int) -> Optional[Dict]:
+        """Return the decoded cursor if it is valid and related to the requested page, None otherwise."""
+        if not cursor:
+            return None
+        try:
+            decoded_cursor = signing.loads(cursor, salt=cls.CURSOR_SALT)
+        except signing.BadSignature:
+            return None
+        return decoded_cursor if decoded_cursor.get('page') == page else None
+
+    @classmethod
+    def _get_field_names(cls, ordering: List[str]) -> List[str]:
+        return [field.lstrip('-') for field in ordering]
+
+    @classmethod
+    def _get_reversed_ordering(cls, ordering: List[str]) -> List[str]:
+        return [field[1:] if field.startswith('-') else f'-{field}' for field in ordering]
+
+    @classmethod
+    def get_queryset(
+        cls,
+        annee_academique: Optional[int] = None,
+        numero: Optional[int] = None,
+        noma: Optional[str] = '',
+        matricule_candidat: Optional[str] = '',
+        etats: Optional[List[str]] = None,
+        type: Optional[str] = '',
+        site_inscription: Optional[str] = '',
+        entites: Optional[List[str]] = None,
+        types_formation: Optional[List[str]] = None,
+        formation: Optional[str] = '',
+        bourse_internationale: Optional[str] = '',
+        bourse_erasmus_mundus: Optional[str] = '',
+        bourse_double_diplomation: Optional[str] = '',
+        bourse_recherche: Optional[str] = '',
+        quarantaine: Optional[bool] = None,
+        demandeur: Optional[str] = '',
+        tri_inverse: bool = False,
+        champ_tri: Optional[str] = None,
+        mode_filtres_etats_checklist: Optional[str] = '',
+        filtres_etats_checklist: Optional[Dict[str, List[str]]] = '',
+        tardif_modif_reorientation: Optional[str] = '',
+        delai_depasse_complements: Optional[bool] = None,
+    ) -> Tuple[QuerySet, List[str]]:
+        """
+        Return the filtered queryset of the admissions and the fields used to order it (the last one being unique).
+        """
+        language_is_french = get_language() == settings.LANGUAGE_CODE_FR
+
         prefetch_viewers_queryset = (
             AdmissionViewer.objects.filter(viewed_at__gte=datetime.datetime.now() - datetime.timedelta(hours=1))
             .select_related('person')
@@ -134,7 +352,6 @@ class ListerToutesDemandes(IListerToutesDemandes):
 
         qs = (
             BaseAdmission.objects.with_training_management_and_reference()
-            .annotate_several_admissions_in_progress()
             .annotate(
                 status=Coalesce(
                     NullIf(F('continuingeducationadmission__status'), Value('')),
@@ -298,7 +515,7 @@ class ListerToutesDemandes(IListerToutesDemandes):
             )
 
         if mode_filtres_etats_checklist and filtres_etats_checklist:
-            json_path_to_checks = defaultdict(set)
+            checked_tabs = set()
             all_checklist_filters = Q()
             past_experiences_filters = Q()
 
@@ -381,7 +598,7 @@ class ListerToutesDemandes(IListerToutesDemandes):
 
                     else:
                         current_checklist_filters = Q()
-                        with_json_checklist_filter = False
+                        current_extra = {}
 
                         if (
                             current_status_filter.identifiant_parent
@@ -393,16 +610,6 @@ class ListerToutesDemandes(IListerToutesDemandes):
                                 current_tab[current_status_filter.identifiant_parent]
                             )
 
-                        # Filter on the checklist tab status
-                        if current_status_filter.statut:
-                            current_checklist_filters = Q(
-                                **{
-                                    f'checklist__current__{tab_name}__statut': current_status_filter.statut.name,
-                                }
-                            )
-                            json_path_to_checks[f'checklist__current__{tab_name}'].add('statut')
-                            with_json_checklist_filter = True
-
                         # Filter on the checklist tab extra if necessary
                         if current_status_filter.extra:
                             current_extra = {**current_status_filter.extra}
@@ -426,18 +633,14 @@ class ListerToutesDemandes(IListerToutesDemandes):
                                         ),
                                     )
 
-                            if current_extra:
-                                current_checklist_filters &= Q(
-                                    **{
-                                        f'checklist__current__{tab_name}__extra__contains': current_extra,
-                                    }
-                                )
-                                json_path_to_checks[f'checklist__current__{tab_name}'].add('extra')
-                                with_json_checklist_filter = True
-
-                        if with_json_checklist_filter:
-                            json_path_to_checks['checklist__current'].add(tab_name)
-                            json_path_to_checks['checklist'].add('current')
+                        # Filter on the checklist tab status and extra, using the indexed checklist statuses
+                        if current_status_filter.statut or current_extra:
+                            current_checklist_filters &= AdmissionChecklistStatus.objects.get_filter(
+                                tab=tab_name,
+                                status=current_status_filter.statut.name if current_status_filter.statut else '',
+                                extra=current_extra,
+                            )
+                            checked_tabs.add(tab_name)
 
                     all_checklist_filters |= current_checklist_filters
 
@@ -493,10 +696,10 @@ class ListerToutesDemandes(IListerToutesDemandes):
                 # We exclude the admissions whose the specific keys have the specified values
                 all_checklist_filters = ~all_checklist_filters
 
-                # We exclude the admissions whose the specific keys are missing (for unconfirmed admission,
+                # We exclude the admissions whose the specific tabs are missing (for unconfirmed admission,
                 # other admission contexts etc.)
-                for base_key, missing_keys in json_path_to_checks.items():
-                    all_checklist_filters |= ~Q(**{f'{base_key}__has_keys': missing_keys})
+                for tab_name in checked_tabs:
+                    all_checklist_filters |= ~AdmissionChecklistStatus.objects.get_presence_filter(tab=tab_name)
 
             qs = qs.filter(all_checklist_filters)
 
@@ -527,21 +730,9 @@ class ListerToutesDemandes(IListerToutesDemandes):
             if tri_inverse:
                 field_order = ['-' + field for field in field_order]
 
-        qs = qs.order_by(*field_order, 'id')
-
-        # Paginate the queryset
-        if page and taille_page:
-            result = PaginatedList(complete_list=qs.all().values_list('uuid', flat=True))
-            bottom = (page - 1) * taille_page
-            top = page * taille_page
-            qs = qs[bottom:top]
-        else:
-            result = PaginatedList(id_attribute='uuid')
-
-        for admission in qs:
-            result.append(cls.load_dto_from_model(admission, language_is_french))
+        ordering = [*field_order, 'id']
 
-        return result
+        return qs.order_by(*ordering), ordering
 
     @classmethod
     def load_dto_from_model(cls, admission: BaseAdmission, language_is_french: bool) -> DemandeRechercheDTO:
@@ -561,7 +752,7 @@ class ListerToutesDemandes(IListerToutesDemandes):
             nom_candidat=admission.candidate.last_name,
             prenom_candidat=admission.candidate.first_name,
             noma_candidat=noma_candidat,
-            plusieurs_demandes=admission.has_several_admissions_in_progress,  # From annotation
+            plusieurs_demandes=admission.has_several_admissions_in_progress,  # From the prefetched summary
             sigle_formation=admission.training.acronym,
             code_formation=admission.training.partial_acronym,
             intitule_formation=getattr(admission.training, 'title' if language_is_french else 'title_english'),
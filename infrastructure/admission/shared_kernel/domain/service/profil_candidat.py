@@ -25,8 +25,10 @@
 # ##############################################################################
 
 import datetime
+import itertools
 import uuid
-from typing import Dict, List, Optional, Union
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 from django.conf import settings
 from django.contrib.postgres.aggregates import ArrayAgg
@@ -68,9 +70,14 @@ from admission.infrastructure.admission.shared_kernel.domain.service.annee_inscr
     AnneeInscriptionFormationTranslator,
 )
 from admission.infrastructure.admission.shared_kernel.domain.service.inscriptions import InscriptionsTranslatorService
+from admission.infrastructure.admission.shared_kernel.domain.service.profil_candidat_cache import get_profile_snapshot
 from admission.models import EPCInjection as AdmissionEPCInjection
 from admission.models.epc_injection import EPCInjectionStatus as AdmissionEPCInjectionStatus, EPCInjectionType
 from admission.models.functions import ArrayLength
+from admission.models.valuated_epxeriences import (
+    AdmissionEducationalValuatedExperiences,
+    AdmissionProfessionalValuatedExperiences,
+)
 from base.models.enums.community import CommunityEnum
 from base.models.enums.person_address_type import PersonAddressType
 from base.models.person import Person
@@ -410,24 +417,7 @@ class ProfilCandidatTranslator(IProfilCandidatTranslator):
         elif matricule:
             filters = {'educational_experience__person__global_id': matricule}
         educational_experience_years: QuerySet[EducationalExperienceYear] = (
-            EducationalExperienceYear.objects.filter(**filters)
-            .select_related(
-                'academic_year',
-                'educational_experience__country',
-                'educational_experience__linguistic_regime',
-                'educational_experience__program',
-                'educational_experience__fwb_equivalent_program',
-                'educational_experience__institute',
-            )
-            .order_by('-academic_year__year')
-        )
-
-        educational_experience_years = educational_experience_years.annotate(
-            valuated_from_admissions=ArrayAgg(
-                'educational_experience__valuated_from_admission__uuid',
-                filter=Q(educational_experience__valuated_from_admission__isnull=False),
-                default=Value([]),
-            ),
+            cls._get_academic_experience_years_queryset().filter(**filters)
         )
 
         if experiences_cv_recuperees == ExperiencesCVRecuperees.SEULEMENT_VALORISEES:
@@ -442,6 +432,35 @@ class ProfilCandidatTranslator(IProfilCandidatTranslator):
             )
 
         educational_experience_years = educational_experience_years.annotate(
+            **cls._get_academic_experience_years_injection_annotations(),
+        )
+
+        return list(cls._build_academic_experiences_dtos(educational_experience_years, has_default_language).values())
+
+    @classmethod
+    def _get_academic_experience_years_queryset(cls) -> QuerySet[EducationalExperienceYear]:
+        return (
+            EducationalExperienceYear.objects.select_related(
+                'academic_year',
+                'educational_experience__country',
+                'educational_experience__linguistic_regime',
+                'educational_experience__program',
+                'educational_experience__fwb_equivalent_program',
+                'educational_experience__institute',
+            )
+            .order_by('-academic_year__year')
+            .annotate(
+                valuated_from_admissions=ArrayAgg(
+                    'educational_experience__valuated_from_admission__uuid',
+                    filter=Q(educational_experience__valuated_from_admission__isnull=False),
+                    default=Value([]),
+                ),
+            )
+        )
+
+    @classmethod
+    def _get_academic_experience_years_injection_annotations(cls):
+        return dict(
             injecte_par_admission=Exists(
                 AdmissionEPCInjection.objects.filter(
                     admission__admissioneducationalvaluatedexperiences__educationalexperience_id=OuterRef(
@@ -458,6 +477,14 @@ class ProfilCandidatTranslator(IProfilCandidatTranslator):
                 )
             ),
         )
+
+    @classmethod
+    def _build_academic_experiences_dtos(
+        cls,
+        educational_experience_years: QuerySet[EducationalExperienceYear],
+        has_default_language: bool,
+    ) -> Dict[int, ExperienceAcademiqueDTO]:
+        """Returns the DTOs of the academic experiences related to the given experience years, by experience id."""
         educational_experience_dtos: Dict[int, ExperienceAcademiqueDTO] = {}
         for experience_year in educational_experience_years:
             experience_year_dto = cls._get_academic_experience_year_dto(experience_year)
@@ -565,27 +592,31 @@ class ProfilCandidatTranslator(IProfilCandidatTranslator):
                 educational_experience_dtos[experience_year.educational_experience.pk].annees.append(
                     experience_year_dto
                 )
-        return list(educational_experience_dtos.values())
+        return educational_experience_dtos
 
     @classmethod
-    def get_identification(cls, matricule: str) -> 'IdentificationDTO':
-        person = (
-            Person.objects.select_related(
-                'country_of_citizenship',
-                'birth_country',
-                'last_registration_year',
-            )
-            .annotate(
-                residential_country_iso_code=Subquery(
-                    PersonAddress.objects.filter(
-                        label=PersonAddressType.RESIDENTIAL.name,
-                        person_id=OuterRef('pk'),
-                    ).values('country__iso_code')[:1]
-                )
+    def precharger(cls, matricules: List[str]) -> 'ProfilCandidatPrechargeTranslator':
+        return ProfilCandidatPrechargeTranslator(matricules)
+
+    @classmethod
+    def _get_identification_queryset(cls):
+        return Person.objects.select_related(
+            'country_of_citizenship',
+            'birth_country',
+            'last_registration_year',
+        ).annotate(
+            residential_country_iso_code=Subquery(
+                PersonAddress.objects.filter(
+                    label=PersonAddressType.RESIDENTIAL.name,
+                    person_id=OuterRef('pk'),
+                ).values('country__iso_code')[:1]
             )
-            .get(global_id=matricule)
         )
 
+    @classmethod
+    def get_identification(cls, matricule: str) -> 'IdentificationDTO':
+        person = cls._get_identification_queryset().get(global_id=matricule)
+
         return cls._get_identification_dto(
             candidate=person,
             residential_country=person.residential_country_iso_code or '',
@@ -593,19 +624,19 @@ class ProfilCandidatTranslator(IProfilCandidatTranslator):
         )
 
     @classmethod
-    def get_coordonnees(cls, matricule: str) -> 'CoordonneesDTO':
-        candidat = (
-            Person.objects.prefetch_related(
-                Prefetch(
-                    "personaddress_set",
-                    queryset=PersonAddress.objects.filter(
-                        label__in=[PersonAddressType.CONTACT.name, PersonAddressType.RESIDENTIAL.name]
-                    ).select_related("country"),
-                )
+    def _get_coordonnees_queryset(cls):
+        return Person.objects.prefetch_related(
+            Prefetch(
+                "personaddress_set",
+                queryset=PersonAddress.objects.filter(
+                    label__in=[PersonAddressType.CONTACT.name, PersonAddressType.RESIDENTIAL.name]
+                ).select_related("country"),
             )
-            .only('private_email', 'phone_mobile', 'emergency_contact_phone')
-            .get(global_id=matricule)
-        )
+        ).only('global_id', 'private_email', 'phone_mobile', 'emergency_contact_phone')
+
+    @classmethod
+    def get_coordonnees(cls, matricule: str) -> 'CoordonneesDTO':
+        candidat = cls._get_coordonnees_queryset().get(global_id=matricule)
 
         return cls._get_coordonnees_dto(candidate=candidat, has_default_language=cls.has_default_language())
 
@@ -779,30 +810,7 @@ class ProfilCandidatTranslator(IProfilCandidatTranslator):
         uuid_experience: str = '',
     ) -> List[ExperienceNonAcademiqueDTO]:
         non_academic_experiences: QuerySet[ProfessionalExperience] = (
-            ProfessionalExperience.objects.filter(
-                person__global_id=matricule,
-            )
-            .annotate(
-                valuated_from_admissions=ArrayAgg(
-                    'valuated_from_admission__uuid',
-                    filter=Q(valuated_from_admission__isnull=False),
-                    default=Value([]),
-                ),
-                injecte_par_admission=Exists(
-                    AdmissionEPCInjection.objects.filter(
-                        admission__admissionprofessionalvaluatedexperiences__professionalexperience_id=OuterRef('uuid'),
-                        type=EPCInjectionType.DEMANDE.name,
-                        status__in=AdmissionEPCInjectionStatus.blocking_statuses_for_experience(),
-                    )
-                ),
-                injecte_par_cv=Exists(
-                    CurriculumEPCInjection.objects.filter(
-                        experience_uuid=OuterRef('uuid'),
-                        status__in=CurriculumEPCInjectionStatus.blocking_statuses_for_experience(),
-                    )
-                ),
-            )
-            .order_by('-start_date', '-end_date')
+            cls._get_non_academic_experiences_queryset().filter(person__global_id=matricule)
         )
 
         if experiences_cv_recuperees == ExperiencesCVRecuperees.SEULEMENT_VALORISEES:
@@ -819,6 +827,29 @@ class ProfilCandidatTranslator(IProfilCandidatTranslator):
 
         return cls._get_non_academic_experiences_dtos(non_academic_experiences)
 
+    @classmethod
+    def _get_non_academic_experiences_queryset(cls) -> QuerySet[ProfessionalExperience]:
+        return ProfessionalExperience.objects.annotate(
+            valuated_from_admissions=ArrayAgg(
+                'valuated_from_admission__uuid',
+                filter=Q(valuated_from_admission__isnull=False),
+                default=Value([]),
+            ),
+            injecte_par_admission=Exists(
+                AdmissionEPCInjection.objects.filter(
+                    admission__admissionprofessionalvaluatedexperiences__professionalexperience_id=OuterRef('uuid'),
+                    type=EPCInjectionType.DEMANDE.name,
+                    status__in=AdmissionEPCInjectionStatus.blocking_statuses_for_experience(),
+                )
+            ),
+            injecte_par_cv=Exists(
+                CurriculumEPCInjection.objects.filter(
+                    experience_uuid=OuterRef('uuid'),
+                    status__in=CurriculumEPCInjectionStatus.blocking_statuses_for_experience(),
+                )
+            ),
+        ).order_by('-start_date', '-end_date')
+
     @classmethod
     def get_curriculum(
         cls,
@@ -1062,17 +1093,8 @@ class ProfilCandidatTranslator(IProfilCandidatTranslator):
         return nombre_mois >= NB_MOIS_MIN_VAE if nombre_mois else False
 
     @classmethod
-    def recuperer_toutes_informations_candidat(
-        cls,
-        matricule: str,
-        formation: Union['DoctoratFormationDTO', 'FormationDTO'],
-        annee_courante: int,
-        uuid_proposition: str,
-        inscriptions_translator: IInscriptionsTranslatorService,
-        experiences_cv_recuperees: ExperiencesCVRecuperees = ExperiencesCVRecuperees.TOUTES,
-    ) -> ResumeCandidatDTO:
-        has_default_language = cls.has_default_language()
-
+    def _get_candidates_queryset(cls, with_languages_knowledge: bool = False) -> QuerySet[Person]:
+        """Returns the queryset of the candidates with the data required to build their resume."""
         queryset = (
             Person.objects.prefetch_related(
                 Prefetch(
@@ -1117,8 +1139,7 @@ class ProfilCandidatTranslator(IProfilCandidatTranslator):
             )
         )
 
-        is_doctorate = formation.type in AnneeInscriptionFormationTranslator.DOCTORATE_EDUCATION_TYPES
-        if is_doctorate:
+        if with_languages_knowledge:
             queryset = queryset.prefetch_related(
                 Prefetch(
                     'languages_knowledge',
@@ -1137,6 +1158,53 @@ class ProfilCandidatTranslator(IProfilCandidatTranslator):
                 ),
             )
 
+        return queryset
+
+    @classmethod
+    def recuperer_toutes_informations_candidat(
+        cls,
+        matricule: str,
+        formation: Union['DoctoratFormationDTO', 'FormationDTO'],
+        annee_courante: int,
+        uuid_proposition: str,
+        inscriptions_translator: IInscriptionsTranslatorService,
+        experiences_cv_recuperees: ExperiencesCVRecuperees = ExperiencesCVRecuperees.TOUTES,
+    ) -> ResumeCandidatDTO:
+        return get_profile_snapshot(
+            matricule=matricule,
+            parameters=(
+                formation.sigle,
+                formation.annee,
+                formation.type,
+                annee_courante,
+                uuid_proposition,
+                experiences_cv_recuperees.name,
+            ),
+            build_snapshot=lambda: cls._recuperer_toutes_informations_candidat(
+                matricule=matricule,
+                formation=formation,
+                annee_courante=annee_courante,
+                uuid_proposition=uuid_proposition,
+                inscriptions_translator=inscriptions_translator,
+                experiences_cv_recuperees=experiences_cv_recuperees,
+            ),
+        )
+
+    @classmethod
+    def _recuperer_toutes_informations_candidat(
+        cls,
+        matricule: str,
+        formation: Union['DoctoratFormationDTO', 'FormationDTO'],
+        annee_courante: int,
+        uuid_proposition: str,
+        inscriptions_translator: IInscriptionsTranslatorService,
+        experiences_cv_recuperees: ExperiencesCVRecuperees,
+    ) -> ResumeCandidatDTO:
+        has_default_language = cls.has_default_language()
+
+        is_doctorate = formation.type in AnneeInscriptionFormationTranslator.DOCTORATE_EDUCATION_TYPES
+        queryset = cls._get_candidates_queryset(with_languages_knowledge=is_doctorate)
+
         candidate: Person = queryset.get(global_id=matricule)
 
         last_ucl_enrolment = inscriptions_translator.recuperer_derniere_inscription(matricule_candidat=matricule)
@@ -1195,6 +1263,148 @@ class ProfilCandidatTranslator(IProfilCandidatTranslator):
             examen_formation=cls.get_examen(uuid_proposition, matricule, formation.sigle, formation.annee),
         )
 
+    @classmethod
+    def recuperer_toutes_informations_candidats(
+        cls,
+        matricules_par_proposition: Dict[str, str],
+        annee_courante: int,
+        inscriptions_translator: IInscriptionsTranslatorService,
+        propositions_avec_toutes_experiences_cv: Optional[Set[str]] = None,
+    ) -> Dict[str, ResumeCandidatDTO]:
+        has_default_language = cls.has_default_language()
+        propositions_avec_toutes_experiences_cv = propositions_avec_toutes_experiences_cv or set()
+
+        matricules = set(matricules_par_proposition.values())
+        candidates: Dict[str, Person] = {
+            candidate.global_id: candidate
+            for candidate in cls._get_candidates_queryset().filter(global_id__in=matricules)
+        }
+        last_ucl_enrolments = inscriptions_translator.recuperer_dernieres_inscriptions(
+            matricules_candidats=list(matricules),
+        )
+
+        # Experiences valuated by the submitted propositions
+        submitted_propositions_uuids = [
+            uuid.UUID(str(uuid_proposition))
+            for uuid_proposition in matricules_par_proposition
+            if uuid_proposition not in propositions_avec_toutes_experiences_cv
+        ]
+        valuated_experiences_uuids_by_proposition: Dict[str, Set[uuid.UUID]] = defaultdict(set)
+        for proposition_uuid, experience_uuid in itertools.chain(
+            AdmissionEducationalValuatedExperiences.objects.filter(
+                baseadmission_id__in=submitted_propositions_uuids,
+            ).values_list('baseadmission_id', 'educationalexperience_id'),
+            AdmissionProfessionalValuatedExperiences.objects.filter(
+                baseadmission_id__in=submitted_propositions_uuids,
+            ).values_list('baseadmission_id', 'professionalexperience_id'),
+        ):
+            valuated_experiences_uuids_by_proposition[str(proposition_uuid)].add(experience_uuid)
+
+        valuated_experiences_uuids = set().union(*valuated_experiences_uuids_by_proposition.values())
+        candidates_with_all_experiences_ids = [
+            candidates[matricules_par_proposition[uuid_proposition]].pk
+            for uuid_proposition in propositions_avec_toutes_experiences_cv
+            if matricules_par_proposition.get(uuid_proposition) in candidates
+        ]
+
+        # Academic experiences, grouped by candidate
+        educational_experience_years = list(
+            cls._get_academic_experience_years_queryset()
+            .filter(
+                Q(educational_experience__uuid__in=valuated_experiences_uuids)
+                | Q(educational_experience__person_id__in=candidates_with_all_experiences_ids)
+            )
+            .annotate(**cls._get_academic_experience_years_injection_annotations())
+        )
+        academic_experiences_by_candidate_id: Dict[int, List[ExperienceAcademiqueDTO]] = defaultdict(list)
+        experience_candidate_ids = {
+            experience_year.educational_experience.pk: experience_year.educational_experience.person_id
+            for experience_year in educational_experience_years
+        }
+        for experience_id, experience_dto in cls._build_academic_experiences_dtos(
+            educational_experience_years,
+            has_default_language,
+        ).items():
+            academic_experiences_by_candidate_id[experience_candidate_ids[experience_id]].append(experience_dto)
+
+        # Non academic experiences, grouped by candidate
+        non_academic_experiences_by_candidate_id: Dict[int, List[ExperienceNonAcademiqueDTO]] = defaultdict(list)
+        non_academic_experiences = cls._get_non_academic_experiences_queryset().filter(
+            Q(uuid__in=valuated_experiences_uuids) | Q(person_id__in=candidates_with_all_experiences_ids)
+        )
+        for experience in non_academic_experiences:
+            non_academic_experiences_by_candidate_id[experience.person_id].extend(
+                cls._get_non_academic_experiences_dtos([experience])
+            )
+
+        resumes = {}
+
+        for uuid_proposition, matricule in matricules_par_proposition.items():
+            candidate = candidates.get(matricule)
+
+            if candidate is None:
+                continue
+
+            with_all_experiences = uuid_proposition in propositions_avec_toutes_experiences_cv
+            valuated_experiences = valuated_experiences_uuids_by_proposition.get(uuid_proposition, set())
+
+            last_ucl_enrolment = last_ucl_enrolments.get(matricule)
+            last_registration_year = (
+                last_ucl_enrolment.annee
+                if last_ucl_enrolment
+                else (candidate.last_registration_year.year if candidate.last_registration_year else None)
+            )
+            graduated_from_high_school_year = (
+                candidate.highschooldiploma.academic_graduation_year.year
+                if hasattr(candidate, 'highschooldiploma') and candidate.highschooldiploma.academic_graduation_year
+                else None
+            )
+            high_school_diploma_alternative_year = (
+                candidate.exam_high_school_diploma_alternative[0].year.year
+                if candidate.exam_high_school_diploma_alternative
+                and candidate.exam_high_school_diploma_alternative[0].year
+                else None
+            )
+            coordonnees_dto = cls._get_coordonnees_dto(candidate=candidate, has_default_language=has_default_language)
+
+            resumes[uuid_proposition] = ResumeCandidatDTO(
+                identification=cls._get_identification_dto(
+                    candidate=candidate,
+                    residential_country=coordonnees_dto.domicile_legal.pays if coordonnees_dto.domicile_legal else '',
+                    has_default_language=has_default_language,
+                ),
+                coordonnees=coordonnees_dto,
+                curriculum=CurriculumAdmissionDTO(
+                    annee_derniere_inscription_ucl=last_registration_year,
+                    annee_diplome_etudes_secondaires=graduated_from_high_school_year,
+                    annee_alternative_diplome_etudes_secondaires=high_school_diploma_alternative_year,
+                    experiences_academiques=[
+                        experience
+                        for experience in academic_experiences_by_candidate_id[candidate.pk]
+                        if with_all_experiences or experience.uuid in valuated_experiences
+                    ],
+                    experiences_non_academiques=[
+                        experience
+                        for experience in non_academic_experiences_by_candidate_id[candidate.pk]
+                        if with_all_experiences or experience.uuid in valuated_experiences
+                    ],
+                    annee_minimum_a_remplir=cls.get_annee_minimale_a_completer_cv(
+                        annee_courante=annee_courante,
+                        annee_diplome_etudes_secondaires=graduated_from_high_school_year,
+                        annee_derniere_inscription_ucl=last_registration_year,
+                        annee_alternative_diplome_etudes_secondaires=high_school_diploma_alternative_year,
+                    ),
+                ),
+                etudes_secondaires=cls._get_secondary_studies_dto(
+                    candidate=candidate,
+                    has_default_language=has_default_language,
+                ),
+                connaissances_langues=None,
+                examen_formation=None,
+            )
+
+        return resumes
+
     @classmethod
     def get_merge_proposal(cls, matricule: str) -> Optional['MergeProposalDTO']:
         try:
@@ -1205,3 +1415,89 @@ class ProfilCandidatTranslator(IProfilCandidatTranslator):
             )
         except PersonMergeProposal.DoesNotExist:
             return None
+
+
+class ProfilCandidatPrechargeTranslator(ProfilCandidatTranslator):
+    """
+    Profile translator whose data used to determine the pool of several candidates (identification, coordinates and
+    changes of institution) are loaded in bulk, the first time they are requested. The other candidates and data are
+    retrieved as usual.
+    """
+
+    def __init__(self, matricules: List[str]):
+        self.matricules = set(matricules)
+        self._identifications: Optional[Dict[str, IdentificationDTO]] = None
+        self._coordonnees: Optional[Dict[str, CoordonneesDTO]] = None
+        self._changements_etablissement: Dict[Tuple[int, ...], Tuple[Set[int], Set[Tuple[str, int]]]] = {}
+
+    def get_identification(self, matricule: str) -> 'IdentificationDTO':
+        if matricule not in self.matricules:
+            return super().get_identification(matricule)
+
+        if self._identifications is None:
+            has_default_language = self.has_default_language()
+            self._identifications = {
+                person.global_id: self._get_identification_dto(
+                    candidate=person,
+                    residential_country=person.residential_country_iso_code or '',
+                    has_default_language=has_default_language,
+                )
+                for person in self._get_identification_queryset().filter(global_id__in=self.matricules)
+            }
+
+        if matricule not in self._identifications:
+            return super().get_identification(matricule)
+
+        return self._identifications[matricule]
+
+    def get_coordonnees(self, matricule: str) -> 'CoordonneesDTO':
+        if matricule not in self.matricules:
+            return super().get_coordonnees(matricule)
+
+        if self._coordonnees is None:
+            has_default_language = self.has_default_language()
+            self._coordonnees = {
+                candidate.global_id: self._get_coordonnees_dto(
+                    candidate=candidate,
+                    has_default_language=has_default_language,
+                )
+                for candidate in self._get_coordonnees_queryset().filter(global_id__in=self.matricules)
+            }
+
+        if matricule not in self._coordonnees:
+            return super().get_coordonnees(matricule)
+
+        return self._coordonnees[matricule]
+
+    def get_changements_etablissement(self, matricule: str, annees: List[int]) -> Dict[int, bool]:
+        if matricule not in self.matricules:
+            return super().get_changements_etablissement(matricule, annees)
+
+        annees_precedentes = tuple(sorted({annee - 1 for annee in annees}))
+
+        if annees_precedentes not in self._changements_etablissement:
+            # Same semantics as the unitary method: no value for the years without any educational experience
+            annees_avec_experience = set(
+                EducationalExperienceYear.objects.filter(academic_year__year__in=annees_precedentes)
+                .order_by()
+                .values_list('academic_year__year', flat=True)
+                .distinct()
+            )
+            changements = set(
+                EducationalExperienceYear.objects.filter(
+                    educational_experience__person__global_id__in=self.matricules,
+                    educational_experience__country__iso_code=BE_ISO_CODE,
+                    academic_year__year__in=annees_precedentes,
+                )
+                .order_by()
+                .values_list('educational_experience__person__global_id', 'academic_year__year')
+                .distinct()
+            )
+            self._changements_etablissement[annees_precedentes] = (annees_avec_experience, changements)
+
+        annees_avec_experience, changements = self._changements_etablissement[annees_precedentes]
+
+        return {
+            annee: (matricule, annee - 1) in changements if annee - 1 in annees_avec_experience else None
+            for annee in annees
+        }
@@ -0,0 +1,166 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import hashlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Optional, Type
+
+from django.core.cache import cache
+from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.utils.translation import get_language
+
+from admission.admission_utils.cache_generation import bump_generation, get_generation
+from admission.constants import PROFILE_SNAPSHOT_CACHE_TIMEOUT
+from admission.infrastructure.message_bus_memoization import write_command_in_progress
+from admission.models import (
+    ContinuingEducationAdmission,
+    DoctorateAdmission,
+    EPCInjection as AdmissionEPCInjection,
+    GeneralEducationAdmission,
+)
+from admission.models.base import BaseAdmission
+from admission.models.exam import AdmissionExam
+from admission.models.valuated_epxeriences import (
+    AdmissionEducationalValuatedExperiences,
+    AdmissionProfessionalValuatedExperiences,
+)
+from base.models.person import Person
+from base.models.person_address import PersonAddress
+from osis_profile.models import EducationalExperience, EducationalExperienceYear, Exam, ProfessionalExperience
+from osis_profile.models.education import (
+    BelgianHighSchoolDiploma,
+    ForeignHighSchoolDiploma,
+    HighSchoolDiploma,
+    LanguageKnowledge,
+)
+from osis_profile.models.epc_injection import EPCInjection as CurriculumEPCInjection
+
+PROFILE_SNAPSHOT_CACHE_KEY = 'admission_profile_snapshot_{matricule}_{version}_{parameters}'
+PROFILE_VERSION_CACHE_KEY = 'admission_profile_version_{matricule}'
+
+_bypass_profile_snapshot_cache: ContextVar[bool] = ContextVar('admission_bypass_profile_snapshot_cache', default=False)
+
+
+@contextmanager
+def bypass_profile_snapshot_cache():
+    """Always build the profile of the candidates from the database inside this context (e.g. to validate a write)."""
+    token = _bypass_profile_snapshot_cache.set(True)
+    try:
+        yield
+    finally:
+        _bypass_profile_snapshot_cache.reset(token)
+
+
+def _get_profile_version(matricule: str) -> str:
+    return get_generation(PROFILE_VERSION_CACHE_KEY.format(matricule=matricule), timeout=PROFILE_SNAPSHOT_CACHE_TIMEOUT)
+
+
+def get_profile_snapshot(matricule: str, parameters: tuple, build_snapshot: Callable):
+    """
+    Return the snapshot of the profile of a candidate, built with the build_snapshot function if it is not cached yet.
+    The snapshots are keyed on the matricule, the version of the profile, the current language and the parameters
+    used to build them. The cache is bypassed while a write command is handled.
+    """
+    if not matricule or _bypass_profile_snapshot_cache.get() or write_command_in_progress():
+        return build_snapshot()
+
+    parameters_digest = hashlib.sha256(repr((get_language(), *parameters)).encode()).hexdigest()
+    cache_key = PROFILE_SNAPSHOT_CACHE_KEY.format(
+        matricule=matricule,
+        version=_get_profile_version(matricule),
+        parameters=parameters_digest,
+    )
+    snapshot = cache.get(cache_key)
+    if snapshot is None:
+        snapshot = build_snapshot()
+        cache.set(cache_key, snapshot, timeout=PROFILE_SNAPSHOT_CACHE_TIMEOUT)
+    return snapshot
+
+
+def invalidate_profile_snapshots(matricule: str):
+    """Invalidate the cached snapshots of the profile of a candidate."""
+    if matricule:
+        bump_generation(PROFILE_VERSION_CACHE_KEY.format(matricule=matricule), timeout=PROFILE_SNAPSHOT_CACHE_TIMEOUT)
+
+
+# Models whose data are used in the profile snapshots, with a function returning the id of the related person
+PROFILE_PERSON_ID_GETTERS: Dict[Type[models.Model], Callable[[models.Model], Optional[int]]] = {
+    PersonAddress: lambda instance: instance.person_id,
+    EducationalExperience: lambda instance: instance.person_id,
+    EducationalExperienceYear: lambda instance: (
+        EducationalExperience.objects.filter(pk=instance.educational_experience_id)
+        .values_list('person_id', flat=True)
+        .first()
+    ),
+    ProfessionalExperience: lambda instance: instance.person_id,
+    Exam: lambda instance: instance.person_id,
+    HighSchoolDiploma: lambda instance: instance.person_id,
+    BelgianHighSchoolDiploma: lambda instance: instance.person_id,
+    ForeignHighSchoolDiploma: lambda instance: instance.person_id,
+    LanguageKnowledge: lambda instance: instance.person_id,
+    CurriculumEPCInjection: lambda instance: instance.person_id,
+    AdmissionEducationalValuatedExperiences: lambda instance: (
+        BaseAdmission.objects.filter(pk=instance.baseadmission_id).values_list('candidate_id', flat=True).first()
+    ),
+    AdmissionProfessionalValuatedExperiences: lambda instance: (
+        BaseAdmission.objects.filter(pk=instance.baseadmission_id).values_list('candidate_id', flat=True).first()
+    ),
+    AdmissionExam: lambda instance: (
+        BaseAdmission.objects.filter(pk=instance.admission_id).values_list('candidate_id', flat=True).first()
+    ),
+    AdmissionEPCInjection: lambda instance: (
+        BaseAdmission.objects.filter(pk=instance.admission_id).values_list('candidate_id', flat=True).first()
+    ),
+}
+
+
+def _invalidate_person_profile_snapshots(sender, instance, **kwargs):
+    invalidate_profile_snapshots(instance.global_id)
+
+
+def _invalidate_related_profile_snapshots(sender, instance, **kwargs):
+    person_id = PROFILE_PERSON_ID_GETTERS[sender](instance)
+    if person_id:
+        invalidate_profile_snapshots(Person.objects.filter(pk=person_id).values_list('global_id', flat=True).first())
+
+
+def _invalidate_admission_profile_snapshots(sender, instance, **kwargs):
+    # The admissions of the candidate are used to know if the experiences can be updated
+    if instance.candidate_id:
+        invalidate_profile_snapshots(
+            Person.objects.filter(pk=instance.candidate_id).values_list('global_id', flat=True).first()
+        )
+
+
+post_save.connect(_invalidate_person_profile_snapshots, sender=Person)
+post_delete.connect(_invalidate_person_profile_snapshots, sender=Person)
+for profile_model in PROFILE_PERSON_ID_GETTERS:
+    post_save.connect(_invalidate_related_profile_snapshots, sender=profile_model)
+    post_delete.connect(_invalidate_related_profile_snapshots, sender=profile_model)
+for admission_model in [BaseAdmission, GeneralEducationAdmission, ContinuingEducationAdmission, DoctorateAdmission]:
+    post_save.connect(_invalidate_admission_profile_snapshots, sender=admission_model)
+    post_delete.connect(_invalidate_admission_profile_snapshots, sender=admission_model)
@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -34,6 +34,7 @@ from django.db import transaction
 from django.db.models import Case, F, OuterRef, Prefetch, Q, Subquery, UUIDField, When
 from django.utils.dateparse import parse_date, parse_datetime
 
+from admission.admission_utils.remote_documents import invalidate_remote_documents_cache
 from admission.ddd.admission.doctorat.preparation.domain.model.enums.checklist import (
     OngletsChecklist as OngletsChecklistDoctorat,
 )
@@ -73,7 +74,9 @@ from admission.ddd.admission.shared_kernel.repository.i_emplacement_document imp
 )
 from admission.infrastructure.utils import (
     AdmissionDocument,
+    AdmissionDocumentObjectsLoader,
     get_document_from_identifier,
+    get_documents_from_identifiers,
 )
 from admission.models import (
     AdmissionFormItem,
@@ -114,9 +117,13 @@ class BaseEmplacementDocumentRepository(IEmplacementDocumentRepository):
 
         admission = cls.get_admission(entity_id=entity_ids[0].proposition_id)
         entities = []
+        emplacements_documents = get_documents_from_identifiers(
+            admission,
+            [entity_id.identifiant for entity_id in entity_ids],
+        )
 
         for entity_id in entity_ids:
-            emplacement_document = get_document_from_identifier(admission, entity_id.identifiant)
+            emplacement_document = emplacements_documents[entity_id.identifiant]
 
             if not emplacement_document:
                 raise EmplacementDocumentNonTrouveException
@@ -144,6 +151,10 @@ class BaseEmplacementDocumentRepository(IEmplacementDocumentRepository):
             admission: ['requested_documents', 'modified_at', 'last_update_author'],
         }
 
+        # Load together the objects related to the documents
+        documents_objects_loader = AdmissionDocumentObjectsLoader(admission)
+        documents_objects_loader.preload([entity.entity_id.identifiant for entity in entities])
+
         with transaction.atomic():
             # In case we have several fields on the same object, we need to update them on a single instance.
             model_objects_cache = {}
@@ -179,7 +190,11 @@ class BaseEmplacementDocumentRepository(IEmplacementDocumentRepository):
                 admission.requested_documents[entity.entity_id.identifiant] = cls.entity_to_dict(entity)
 
                 # Update the related model if it's a new file
-                emplacement_document = get_document_from_identifier(admission, entity.entity_id.identifiant)
+                emplacement_document = get_document_from_identifier(
+                    admission,
+                    entity.entity_id.identifiant,
+                    documents_objects_loader,
+                )
 
                 if not emplacement_document:
                     raise EmplacementDocumentNonTrouveException
@@ -210,6 +225,9 @@ class BaseEmplacementDocumentRepository(IEmplacementDocumentRepository):
                             },
                         )
 
+                    # The previous and the new files have been replaced or updated
+                    invalidate_remote_documents_cache(chain(document_uuids, entity.uuids_documents))
+
             experiences_injectees_uuid_set = cls._retrieve_experiences_uuid_set(admission.candidate_id)
 
             for model_object, fields in updated_fields_by_object.items():
@@ -326,6 +344,7 @@ class BaseEmplacementDocumentRepository(IEmplacementDocumentRepository):
                 'author': emplacement_document.document_soumis_par,
             },
         )
+        invalidate_remote_documents_cache(emplacement_document.uuids_documents[:1])
 
         # Save the file into the admission
         field_name = {
@@ -337,6 +356,7 @@ class BaseEmplacementDocumentRepository(IEmplacementDocumentRepository):
         try:
             old_document_uuid = uuid.UUID(emplacement_document.entity_id.identifiant.split('.')[-1])
             document_uuids.remove(old_document_uuid)
+            invalidate_remote_documents_cache([old_document_uuid])
         except ValueError:
             pass
         document_uuids.append(emplacement_document.uuids_documents[0])
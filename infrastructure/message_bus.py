@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2023 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -29,16 +29,19 @@ from .admission.doctorat.preparation import handlers as preparation_handlers
 from .admission.doctorat.validation import handlers as validation_handlers
 from .admission.formation_continue import handlers as formation_continue_handlers
 from .admission.formation_generale import handlers as formation_generale_handlers
+from .message_bus_memoization import memoize_query_handlers
 
 
 class MessageBusCommands(AbstractMessageBusCommands):
-    command_handlers = {
-        **preparation_handlers.COMMAND_HANDLERS,
-        **validation_handlers.COMMAND_HANDLERS,
-        **formation_continue_handlers.COMMAND_HANDLERS,
-        **formation_generale_handlers.COMMAND_HANDLERS,
-        **admission_handlers.COMMAND_HANDLERS,
-    }
+    command_handlers = memoize_query_handlers(
+        {
+            **preparation_handlers.COMMAND_HANDLERS,
+            **validation_handlers.COMMAND_HANDLERS,
+            **formation_continue_handlers.COMMAND_HANDLERS,
+            **formation_generale_handlers.COMMAND_HANDLERS,
+            **admission_handlers.COMMAND_HANDLERS,
+        }
+    )
     event_handlers = [
         admission_handlers.EVENT_HANDLERS
     ]
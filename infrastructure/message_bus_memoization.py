@@ -0,0 +1,162 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Hashable, Optional
+
+import attr
+from django.conf import settings
+
+from admission.ddd.admission.doctorat.preparation import commands as doctorat_commands
+from admission.ddd.admission.formation_continue import commands as formation_continue_commands
+from admission.ddd.admission.formation_generale import commands as formation_generale_commands
+from admission.ddd.admission.shared_kernel import commands as shared_kernel_commands
+from osis_common.ddd.interface import QueryRequest
+
+logger = logging.getLogger(settings.DEFAULT_LOGGER)
+
+# Read-only queries whose results can be reused inside a memoization scope
+MEMOIZED_QUERIES = {
+    doctorat_commands.RecupererResumeEtEmplacementsDocumentsPropositionQuery,
+    doctorat_commands.VerifierCurriculumApresSoumissionQuery,
+    doctorat_commands.ListerPropositionsCandidatQuery,
+    formation_continue_commands.RecupererResumeEtEmplacementsDocumentsPropositionQuery,
+    formation_continue_commands.ListerPropositionsCandidatQuery,
+    formation_generale_commands.RecupererResumeEtEmplacementsDocumentsPropositionQuery,
+    formation_generale_commands.VerifierCurriculumApresSoumissionQuery,
+    formation_generale_commands.ListerPropositionsCandidatQuery,
+    shared_kernel_commands.RecupererInscriptionsCandidatQuery,
+    shared_kernel_commands.CandidatEstInscritRecemmentUCLQuery,
+}
+
+
+@attr.dataclass(slots=True)
+class QueryMemoizationScope:
+    results: Dict[Hashable, object] = attr.Factory(dict)
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+
+_current_scope: ContextVar[Optional[QueryMemoizationScope]] = ContextVar(
+    'admission_query_memoization_scope',
+    default=None,
+)
+
+_write_command_in_progress: ContextVar[bool] = ContextVar('admission_write_command_in_progress', default=False)
+
+
+def get_current_query_memoization_scope() -> Optional[QueryMemoizationScope]:
+    return _current_scope.get()
+
+
+@contextmanager
+def query_memoization_scope(name: str = ''):
+    """
+    Memoize the results of the memoized queries invoked inside this scope (typically a request or a task). The
+    memoized results are forgotten as soon as a write command is invoked. Nested scopes share the outermost one.
+    """
+    current_scope = _current_scope.get()
+    if current_scope is not None:
+        yield current_scope
+        return
+
+    scope = QueryMemoizationScope()
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+        if scope.hits or scope.misses:
+            logger.debug(
+                f"[QUERY MEMOIZATION] {name} - hits: {scope.hits} - misses: {scope.misses} "
+                f"- invalidations: {scope.invalidations}"
+            )
+
+
+def _get_memoization_key(cmd) -> Hashable:
+    try:
+        hash(cmd)
+        return cmd
+    except TypeError:
+        # Some queries contain unhashable values (lists...)
+        return cmd.__class__, repr(cmd)
+
+
+def _memoized_query_handler(handler: Callable) -> Callable:
+    def memoized_handler(msg_bus, cmd):
+        scope = _current_scope.get()
+        if scope is None:
+            return handler(msg_bus, cmd)
+
+        key = _get_memoization_key(cmd)
+        if key in scope.results:
+            scope.hits += 1
+            return scope.results[key]
+
+        scope.misses += 1
+        result = handler(msg_bus, cmd)
+        scope.results[key] = result
+        return result
+
+    return memoized_handler
+
+
+def write_command_in_progress() -> bool:
+    """Return True if a write command is being handled, in which case the data must not be read from a cache."""
+    return _write_command_in_progress.get()
+
+
+def _invalidating_command_handler(handler: Callable) -> Callable:
+    def invalidating_handler(msg_bus, cmd):
+        token = _write_command_in_progress.set(True)
+        try:
+            return handler(msg_bus, cmd)
+        finally:
+            _write_command_in_progress.reset(token)
+            scope = _current_scope.get()
+            if scope is not None and scope.results:
+                scope.results.clear()
+                scope.invalidations += 1
+
+    return invalidating_handler
+
+
+def memoize_query_handlers(command_handlers: Dict[type, Callable]) -> Dict[type, Callable]:
+    """
+    Wrap the handlers so that the results of the memoized queries are reused inside a memoization scope and
+    forgotten when a write command is handled.
+    """
+    wrapped_handlers = {}
+    for command_class, handler in command_handlers.items():
+        if command_class in MEMOIZED_QUERIES:
+            wrapped_handlers[command_class] = _memoized_query_handler(handler)
+        elif not issubclass(command_class, QueryRequest):
+            wrapped_handlers[command_class] = _invalidating_command_handler(handler)
+        else:
+            wrapped_handlers[command_class] = handler
+    return wrapped_handlers
@@ -26,16 +26,18 @@
 import datetime
 import uuid
 from email.message import EmailMessage
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 
 import attr
 from django.conf import settings
-from django.db.models import F, Func, Model, Q
+from django.db import connection
+from django.db.models import F, Model, Q, QuerySet
 from django.utils import translation
 from django.utils.translation import gettext_lazy as _
 from osis_document_components.enums import PostProcessingWanted
 
+from admission.admission_utils.remote_documents import get_cached_remote_metadata
 from admission.constants import SUPPORTED_MIME_TYPES
 from admission.ddd.admission.shared_kernel.domain.model.emplacement_document import (
     EmplacementDocument,
@@ -53,11 +55,6 @@ from admission.ddd.admission.shared_kernel.enums.emplacement_document import (
 from admission.models import AdmissionFormItem, SupervisionActor
 from admission.models.base import BaseAdmission
 from admission.models.specific_question import SpecificQuestionAnswer
-from base.models.entity_version import (
-    PEDAGOGICAL_ENTITY_ADDED_EXCEPTIONS,
-    EntityVersion,
-)
-from base.models.enums.entity_type import PEDAGOGICAL_ENTITY_TYPES
 from osis_profile.models import EducationalExperienceYear
 from osis_profile.models.exam import EXAM_TYPE_PREMIER_CYCLE_LABEL_FR
 
@@ -189,9 +186,224 @@ class AdmissionDocument:
     related_checklist_tab: str
 
 
+def _is_uuid(value: str) -> bool:
+    try:
+        uuid.UUID(value)
+    except ValueError:
+        return False
+    return True
+
+
+class AdmissionDocumentObjectsLoader:
+    """
+    Load the objects containing the documents of an admission. Each object is loaded from the database the first time
+    it is requested, except if it has been loaded before with the objects related to other document identifiers.
+    """
+
+    def __init__(self, admission: BaseAdmission):
+        self.admission = admission
+        self._objects = {}
+
+    def _get(self, key, load_object):
+        if key not in self._objects:
+            self._objects[key] = load_object()
+        return self._objects[key]
+
+    def get_specific_question_and_answer(self, form_item_uuid: str):
+        def load_specific_question_and_answer():
+            specific_question = AdmissionFormItem.objects.filter(uuid=form_item_uuid).first()
+            if not specific_question:
+                return None, None
+            answer, _ = SpecificQuestionAnswer.objects.get_or_create(
+                admission=self.admission,
+                form_item=specific_question,
+                defaults={
+                    'file': [],
+                },
+            )
+            return specific_question, answer
+
+        return self._get(('specific_question', form_item_uuid), load_specific_question_and_answer)
+
+    def get_first_cycle_exam(self):
+        return self._get(
+            ('first_cycle_exam',),
+            lambda: self.admission.candidate.exams.filter(type__label_fr=EXAM_TYPE_PREMIER_CYCLE_LABEL_FR).first(),
+        )
+
+    def get_training_exam(self):
+        return self._get(
+            ('training_exam',),
+            lambda: self.admission.candidate.exams.filter(type__education_group_years=self.admission.training).first(),
+        )
+
+    def get_language_knowledge(self, language_code: str):
+        return self._get(
+            ('language_knowledge', language_code),
+            lambda: self.admission.candidate.languages_knowledge.filter(language__code=language_code).first(),
+        )
+
+    def get_educational_experience(self, experience_uuid: str):
+        return self._get(
+            ('educational_experience', experience_uuid),
+            lambda: self.admission.candidate.educationalexperience_set.filter(uuid=experience_uuid).first(),
+        )
+
+    def get_educational_experience_year(self, experience_uuid: str, experience_year: str):
+        return self._get(
+            ('educational_experience_year', experience_uuid, experience_year),
+            lambda: (
+                EducationalExperienceYear.objects.filter(
+                    educational_experience__uuid=experience_uuid,
+                    academic_year__year=experience_year,
+                )
+                .annotate(educational_experience_uuid=F('educational_experience__uuid'))
+                .first()
+            ),
+        )
+
+    def get_professional_experience(self, experience_uuid: str):
+        return self._get(
+            ('professional_experience', experience_uuid),
+            lambda: self.admission.candidate.professionalexperience_set.filter(uuid=experience_uuid).first(),
+        )
+
+    def get_supervision_actor(self, actor_uuid: str):
+        return self._get(
+            ('supervision_actor', actor_uuid),
+            lambda: SupervisionActor.objects.filter(uuid=actor_uuid).first(),
+        )
+
+    def preload(self, document_identifiers: List[str]):
+        """Load the objects related to the document identifiers with one query by model."""
+        specific_question_uuids = set()
+        language_codes = set()
+        educational_experience_uuids = set()
+        educational_experience_years = set()
+        professional_experience_uuids = set()
+        supervision_actor_uuids = set()
+
+        for document_identifier in document_identifiers:
+            parts = document_identifier.split('.')
+            base_identifier = parts[0]
+            domain_identifier = parts[-1]
+
+            if len(parts) < 2:
+                continue
+
+            if base_identifier == IdentifiantBaseEmplacementDocument.LIBRE_CANDIDAT.name or (
+                parts[1] == IdentifiantBaseEmplacementDocument.QUESTION_SPECIFIQUE.name
+            ):
+                if _is_uuid(parts[-1]):
+                    specific_question_uuids.add(parts[-1])
+
+            elif base_identifier == OngletsDemande.LANGUES.name and len(parts) == 3:
+                language_codes.add(parts[1])
+
+            elif base_identifier == OngletsDemande.CURRICULUM.name and len(parts) > 2 and _is_uuid(parts[1]):
+                if domain_identifier in CORRESPONDANCE_CHAMPS_CURRICULUM_EXPERIENCE_ACADEMIQUE:
+                    educational_experience_uuids.add(parts[1])
+                elif domain_identifier in CORRESPONDANCE_CHAMPS_CURRICULUM_ANNEE_EXPERIENCE_ACADEMIQUE:
+                    if len(parts) == 4 and parts[2].isdigit():
+                        educational_experience_years.add((parts[1], parts[2]))
+                elif domain_identifier in CORRESPONDANCE_CHAMPS_CURRICULUM_EXPERIENCE_NON_ACADEMIQUE:
+                    professional_experience_uuids.add(parts[1])
+
+            elif base_identifier == OngletsDemande.SUPERVISION.name and len(parts) == 3 and _is_uuid(parts[1]):
+                supervision_actor_uuids.add(parts[1])
+
+        if specific_question_uuids:
+            self._preload_specific_questions_and_answers(specific_question_uuids)
+
+        self._preload_objects(
+            'language_knowledge',
+            language_codes,
+            self.admission.candidate.languages_knowledge.filter(language__code__in=language_codes).annotate(
+                document_key=F('language__code'),
+            ),
+        )
+        self._preload_objects(
+            'educational_experience',
+            educational_experience_uuids,
+            self.admission.candidate.educationalexperience_set.filter(uuid__in=educational_experience_uuids),
+        )
+        self._preload_objects(
+            'professional_experience',
+            professional_experience_uuids,
+            self.admission.candidate.professionalexperience_set.filter(uuid__in=professional_experience_uuids),
+        )
+        self._preload_objects(
+            'supervision_actor',
+            supervision_actor_uuids,
+            SupervisionActor.objects.filter(uuid__in=supervision_actor_uuids),
+        )
+
+        if educational_experience_years:
+            for experience_uuid, experience_year in educational_experience_years:
+                self._objects[('educational_experience_year', experience_uuid, experience_year)] = None
+            experience_years = EducationalExperienceYear.objects.filter(
+                educational_experience__uuid__in={key[0] for key in educational_experience_years},
+                academic_year__year__in={int(key[1]) for key in educational_experience_years},
+            ).annotate(
+                educational_experience_uuid=F('educational_experience__uuid'),
+                document_year=F('academic_year__year'),
+            )
+            for experience_year in experience_years.order_by('pk'):
+                key = (
+                    'educational_experience_year',
+                    str(experience_year.educational_experience_uuid),
+                    str(experience_year.document_year),
+                )
+                if self._objects.get(key, False) is None:
+                    self._objects[key] = experience_year
+
+    def _preload_objects(self, object_type: str, keys, queryset: QuerySet):
+        if not keys:
+            return
+        for key in keys:
+            self._objects[(object_type, key)] = None
+        for obj in queryset.order_by('pk'):
+            key = (object_type, str(getattr(obj, 'document_key', obj.uuid)))
+            if self._objects[key] is None:
+                self._objects[key] = obj
+
+    def _preload_specific_questions_and_answers(self, form_item_uuids):
+        specific_questions = {
+            str(specific_question.uuid): specific_question
+            for specific_question in AdmissionFormItem.objects.filter(uuid__in=form_item_uuids)
+        }
+        answers = {
+            answer.form_item_id: answer
+            for answer in SpecificQuestionAnswer.objects.filter(
+                admission=self.admission,
+                form_item__in=specific_questions.values(),
+            )
+        }
+
+        missing_answers = [
+            SpecificQuestionAnswer(admission=self.admission, form_item=specific_question, file=[])
+            for specific_question in specific_questions.values()
+            if specific_question.pk not in answers
+        ]
+        if missing_answers:
+            SpecificQuestionAnswer.objects.bulk_create(missing_answers, ignore_conflicts=True)
+            answers.update(
+                (answer.form_item_id, answer)
+                for answer in SpecificQuestionAnswer.objects.filter(
+                    admission=self.admission,
+                    form_item__in=[answer.form_item for answer in missing_answers],
+                )
+            )
+
+        # The specific questions not found are not cached as they can be created later (e.g. for free documents)
+        for form_item_uuid, specific_question in specific_questions.items():
+            self._objects[('specific_question', form_item_uuid)] = (specific_question, answers[specific_question.pk])
+
+
 def get_document_from_identifier(
     admission: BaseAdmission,
     document_identifier: str,
+    loader: Optional[AdmissionDocumentObjectsLoader] = None,
 ) -> Optional[AdmissionDocument]:
     """
     Get information about a document placement based on its identifier and the related admission.
@@ -203,6 +415,80 @@ def get_document_from_identifier(
     - LIBRE_CANDIDAT.[SPECIFIC_QUESTION_UUID] for a requested free document
     - SYSTEME.[DOMAIN_IDENTIFIER] for internal documents that are generated by the system
     """
+    document = _locate_document(admission, document_identifier, loader or AdmissionDocumentObjectsLoader(admission))
+
+    if document and document.uuids:
+        from osis_document_components.services import (
+            get_remote_metadata,
+            get_remote_token,
+        )
+
+        token = get_remote_token(
+            uuid=document.uuids[0],
+            for_modified_upload=True,
+            wanted_post_process=PostProcessingWanted.ORIGINAL.name,
+        )
+        document = _complete_document_with_metadata(document, get_remote_metadata(token=token))
+
+    return document
+
+
+def get_documents_from_identifiers(
+    admission: BaseAdmission,
+    document_identifiers: List[str],
+) -> Dict[str, Optional[AdmissionDocument]]:
+    """
+    Get information about several document placements of an admission, by identifier (see
+    get_document_from_identifier). The related objects are loaded with one query by model and the metadata of the
+    files are retrieved together.
+    """
+    loader = AdmissionDocumentObjectsLoader(admission)
+    loader.preload(document_identifiers)
+
+    documents = {
+        document_identifier: _locate_document(admission, document_identifier, loader)
+        for document_identifier in document_identifiers
+    }
+
+    metadata = get_cached_remote_metadata(
+        list({str(document.uuids[0]) for document in documents.values() if document and document.uuids}),
+        for_modified_upload=True,
+        wanted_post_process=PostProcessingWanted.ORIGINAL.name,
+    )
+
+    return {
+        document_identifier: (
+            _complete_document_with_metadata(document, metadata.get(str(document.uuids[0])))
+            if document and document.uuids
+            else document
+        )
+        for document_identifier, document in documents.items()
+    }
+
+
+def _complete_document_with_metadata(document: AdmissionDocument, metadata: Optional[dict]) -> AdmissionDocument:
+    metadata = metadata or {}
+
+    if document.type in MODEL_FIELD_BY_FREE_MANAGER_DOCUMENT_TYPE:
+        # The information about the free documents uploaded by the manager are stored in the metadata of the file
+        document_label = metadata.get('explicit_name', '')
+        document = attr.evolve(
+            document,
+            last_actor=metadata.get('author', ''),
+            label=document_label,
+            label_fr=document_label,
+            label_en=document_label,
+            mimetypes=[metadata.get('mimetype')],
+        )
+
+    return attr.evolve(document, document_submitted_by=metadata.get('author', ''))
+
+
+def _locate_document(
+    admission: BaseAdmission,
+    document_identifier: str,
+    loader: AdmissionDocumentObjectsLoader,
+) -> Optional[AdmissionDocument]:
     field: str = ''
     obj: Optional[Model] = None
     document_type: str = ''
@@ -217,8 +503,6 @@ def get_document_from_identifier(
     document_label: str = ''
     document_label_fr: str = ''
     document_label_en: str = ''
-    document_submitted_by: str = ''
-    metadata: dict = {}
     max_documents_number = None
 
     if identifiers_nb < 2:
@@ -250,21 +534,11 @@ def get_document_from_identifier(
 
         specific_question_uuid = document_identifier_parts[-1]
 
-        specific_question: AdmissionFormItem = AdmissionFormItem.objects.filter(
-            uuid=specific_question_uuid,
-        ).first()
+        specific_question, obj = loader.get_specific_question_and_answer(specific_question_uuid)
 
         if not specific_question:
             return
 
-        obj, _ = SpecificQuestionAnswer.objects.get_or_create(
-            admission=admission,
-            form_item=specific_question,
-            defaults={
-                'file': [],
-            },
-        )
-
         field = 'file'
         document_uuids = obj.file or []
         requestable_document = True
@@ -304,24 +578,6 @@ def get_document_from_identifier(
         document_type = FREE_MANAGER_DOCUMENT_TYPE_BY_MODEL_FIELD[field]
         max_documents_number = 1
 
-        if document_uuids:
-            from osis_document_components.services import (
-                get_remote_metadata,
-                get_remote_token,
-            )
-
-            token = get_remote_token(
-                uuid=document_uuids[0],
-                for_modified_upload=True,
-                wanted_post_process=PostProcessingWanted.ORIGINAL.name,
-            )
-            metadata = get_remote_metadata(token=token) or {}
-            document_author = metadata.get('author', '')
-            document_label = metadata.get('explicit_name', '')
-            document_label_fr = document_label
-            document_label_en = document_label
-            document_mimetypes = [metadata.get('mimetype')] or []
-
     elif base_identifier == IdentifiantBaseEmplacementDocument.SYSTEME.name:
         # System documents
         # SYSTEME.[DOMAIN_IDENTIFIER]
@@ -362,14 +618,12 @@ def get_document_from_identifier(
                 obj = getattr(admission.candidate, 'foreignhighschooldiploma', None)
                 field = CORRESPONDANCE_CHAMPS_ETUDES_SECONDAIRES_ETRANGERES[domain_identifier]
             elif domain_identifier in CORRESPONDANCE_CHAMPS_ETUDES_SECONDAIRES_ALTERNATIVES:
-                obj = admission.candidate.exams.filter(type__label_fr=EXAM_TYPE_PREMIER_CYCLE_LABEL_FR).first()
+                obj = loader.get_first_cycle_exam()
                 field = CORRESPONDANCE_CHAMPS_ETUDES_SECONDAIRES_ALTERNATIVES[domain_identifier]
 
         elif base_identifier == OngletsDemande.EXAMS.name:
             # EXAMS.[DOMAIN_IDENTIFIER]
-            obj = admission.candidate.exams.filter(
-                type__education_group_years=admission.training,
-            ).first()
+            obj = loader.get_training_exam()
             field = CORRESPONDANCE_CHAMPS_EXAMENS.get(domain_identifier)
 
         elif base_identifier == OngletsDemande.LANGUES.name:
@@ -377,7 +631,7 @@ def get_document_from_identifier(
             if not identifiers_nb == 3:
                 return
             language_code = document_identifier_parts[1]
-            obj = admission.candidate.languages_knowledge.filter(language__code=language_code).first()
+            obj = loader.get_language_knowledge(language_code)
             field = CORRESPONDANCE_CHAMPS_CONNAISSANCES_LANGUES.get(domain_identifier)
 
         elif base_identifier == OngletsDemande.CURRICULUM.name:
@@ -392,7 +646,7 @@ def get_document_from_identifier(
                     return
                 experience_uuid = document_identifier_parts[1]
                 field = CORRESPONDANCE_CHAMPS_CURRICULUM_EXPERIENCE_ACADEMIQUE[domain_identifier]
-                obj = admission.candidate.educationalexperience_set.filter(uuid=experience_uuid).first()
+                obj = loader.get_educational_experience(experience_uuid)
 
             elif domain_identifier in CORRESPONDANCE_CHAMPS_CURRICULUM_ANNEE_EXPERIENCE_ACADEMIQUE:
                 # CURRICULUM.[EXPERIENCE_UUID].[EXPERIENCE_YEAR].[DOMAIN_IDENTIFIER]
@@ -401,14 +655,7 @@ def get_document_from_identifier(
                 experience_uuid = document_identifier_parts[1]
                 experience_year = document_identifier_parts[2]
                 field = CORRESPONDANCE_CHAMPS_CURRICULUM_ANNEE_EXPERIENCE_ACADEMIQUE[domain_identifier]
-                obj = (
-                    EducationalExperienceYear.objects.filter(
-                        educational_experience__uuid=experience_uuid,
-                        academic_year__year=experience_year,
-                    )
-                    .annotate(educational_experience_uuid=F('educational_experience__uuid'))
-                    .first()
-                )
+                obj = loader.get_educational_experience_year(experience_uuid, experience_year)
 
             elif domain_identifier in CORRESPONDANCE_CHAMPS_CURRICULUM_EXPERIENCE_NON_ACADEMIQUE:
                 # CURRICULUM.[EXPERIENCE_UUID].[DOMAIN_IDENTIFIER]
@@ -416,7 +663,7 @@ def get_document_from_identifier(
                     return
                 experience_uuid = document_identifier_parts[1]
                 field = CORRESPONDANCE_CHAMPS_CURRICULUM_EXPERIENCE_NON_ACADEMIQUE[domain_identifier]
-                obj = admission.candidate.professionalexperience_set.filter(uuid=experience_uuid).first()
+                obj = loader.get_professional_experience(experience_uuid)
 
         elif base_identifier == OngletsDemande.INFORMATIONS_ADDITIONNELLES.name:
             # INFORMATIONS_ADDITIONNELLES.[DOMAIN_IDENTIFIER]
@@ -443,7 +690,7 @@ def get_document_from_identifier(
             if not identifiers_nb == 3:
                 return
             actor_uuid = document_identifier_parts[1]
-            obj = SupervisionActor.objects.filter(uuid=actor_uuid).first()
+            obj = loader.get_supervision_actor(actor_uuid)
             field = CORRESPONDANCE_CHAMPS_SUPERVISION.get(domain_identifier)
 
         elif base_identifier == OngletsDemande.SUITE_AUTORISATION.name:
@@ -458,22 +705,6 @@ def get_document_from_identifier(
             max_documents_number = model_attribute.max_files
 
     if obj and field and document_type:
-        if document_uuids:
-            if not metadata:
-                from osis_document_components.services import (
-                    get_remote_metadata,
-                    get_remote_token,
-                )
-
-                token = get_remote_token(
-                    uuid=document_uuids[0],
-                    for_modified_upload=True,
-                    wanted_post_process=PostProcessingWanted.ORIGINAL.name,
-                )
-                metadata = get_remote_metadata(token=token)
-            if metadata:
-                document_submitted_by = metadata.get('author', '')
-
         return AdmissionDocument(
             obj=obj,
             field=field,
@@ -496,7 +727,7 @@ def get_document_from_identifier(
             label=document_label,
             label_fr=document_label_fr,
             label_en=document_label_en,
-            document_submitted_by=document_submitted_by,
+            document_submitted_by='',
             max_documents_number=max_documents_number,
             request_status=requested_document.get('request_status') or '',
             related_checklist_tab=requested_document.get('related_checklist_tab') or '',
@@ -652,18 +883,53 @@ CORRESPONDANCE_CHAMPS_SYSTEME = {
 }
 
 
-def get_entities_with_descendants_ids(entities_acronyms):
+def get_keyset_filter(ordering: Sequence[str], values: Sequence, backward=False) -> Q:
     """
-    From a list of pedagogical entities acronyms, get a set of ids of the entities and their descendants.
-    :param entities_acronyms: A list of acronyms of pedagogical entities
-    :return: A set of entities ids
+    Build the filter to apply to a queryset to retrieve the rows located after (or before) a row in a specific order.
+    The database is expected to sort the null values last in ascending order and first in descending order (PostgreSQL
+    default behaviour).
+    :param ordering: The fields used to order the queryset (prefixed by '-' for a descending order). The last field
+    must be unique.
+    :param values: The values of the ordering fields for the reference row.
+    :param backward: If True, the filter retrieves the rows located before the reference row.
+    :return: The Q object to apply to the queryset.
     """
-    if entities_acronyms:
-        cte = (
-            EntityVersion.objects.filter(acronym__in=entities_acronyms)
-            .filter(Q(entity_type__in=PEDAGOGICAL_ENTITY_TYPES) | Q(acronym__in=PEDAGOGICAL_ENTITY_ADDED_EXCEPTIONS))
-            .with_parents()
-        )
-        qs = cte.queryset().with_cte(cte).annotate(level=Func('parents', function='cardinality'))
-        return set(qs.values_list('entity_id', flat=True))
-    return set()
+    keyset_filter = Q(pk__in=[])
+    previous_fields_filter = Q()
+
+    for field, value in zip(ordering, values):
+        descending = field.startswith('-')
+        field = field.lstrip('-')
+
+        if descending != backward:
+            # Values before the reference value (and null values first)
+            next_filter = Q(**{f'{field}__isnull': False}) if value is None else Q(**{f'{field}__lt': value})
+        else:
+            # Values after the reference value (and null values last)
+            next_filter = (
+                Q(pk__in=[]) if value is None else Q(**{f'{field}__gt': value}) | Q(**{f'{field}__isnull': True})
+            )
+
+        keyset_filter |= previous_fields_filter & next_filter
+        previous_fields_filter &= Q(**{f'{field}__isnull': True} if value is None else {field: value})
+
+    return keyset_filter
+
+
+def get_estimated_or_exact_count(queryset: QuerySet, exact_count_threshold: int) -> Tuple[int, bool]:
+    """
+    Count the rows of a queryset. The planner estimation is used if it exceeds the specified threshold, otherwise the
+    rows are really counted.
+    :param queryset: The queryset whose the rows must be counted.
+    :param exact_count_threshold: The number of rows from which the estimation of the planner is used.
+    :return: The number of rows and whether it is estimated.
+    """
+    if connection.vendor == 'postgresql':
+        sql, params = queryset.order_by().values('pk').query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            explain_result = cursor.fetchone()[0]
+        estimated_count = explain_result[0]['Plan']['Plan Rows']
+        if estimated_count > exact_count_threshold:
+            return estimated_count, True
+    return queryset.order_by().count(), False
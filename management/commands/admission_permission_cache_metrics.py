@@ -0,0 +1,47 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+
+from django.core.management import BaseCommand
+
+from admission.admission_utils.permission_cache import (
+    HITS,
+    MISSES,
+    get_permission_cache_metrics,
+    reset_permission_cache_metrics,
+)
+
+
+class Command(BaseCommand):
+    help = "Display the hits and misses of the admission permission cache"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help="Reset the metrics after displaying them")
+
+    def handle(self, *args, **options):
+        metrics = get_permission_cache_metrics()
+        self.stdout.write(f"Hits: {metrics[HITS]} - Misses: {metrics[MISSES]} - Hit ratio: {metrics['hit_ratio']:.2%}")
+        if options['reset']:
+            reset_permission_cache_metrics()
@@ -0,0 +1,81 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+
+from django.core.management import BaseCommand
+from django.db.models import Max
+from osis_history.models import HistoryEntry
+
+from admission.models.base import STATUS_CHANGE_HISTORY_TAGS, BaseAdmission
+
+
+class Command(BaseCommand):
+    help = "Compute the date of the last status change of the admissions from their history"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help="Number of admissions updated together")
+        parser.add_argument(
+            '--only-missing',
+            action='store_true',
+            help="Only compute the date of the admissions without a status change date",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        admissions = BaseAdmission.objects.order_by('pk')
+        if options['only_missing']:
+            admissions = admissions.filter(status_changed_at__isnull=True)
+
+        updated_admissions_nb = 0
+        last_pk = 0
+
+        while True:
+            batch = list(admissions.filter(pk__gt=last_pk).only('pk', 'uuid', 'status_changed_at')[:batch_size])
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+
+            status_change_dates = dict(
+                HistoryEntry.objects.filter(
+                    object_uuid__in=[admission.uuid for admission in batch],
+                    tags__contains=STATUS_CHANGE_HISTORY_TAGS,
+                )
+                .order_by()
+                .values('object_uuid')
+                .annotate(last_status_change_date=Max('created'))
+                .values_list('object_uuid', 'last_status_change_date')
+            )
+
+            admissions_to_update = []
+            for admission in batch:
+                status_change_date = status_change_dates.get(admission.uuid)
+                if status_change_date != admission.status_changed_at:
+                    admission.status_changed_at = status_change_date
+                    admissions_to_update.append(admission)
+
+            BaseAdmission.objects.bulk_update(admissions_to_update, ['status_changed_at'])
+            updated_admissions_nb += len(admissions_to_update)
+
+        self.stdout.write(f"{updated_admissions_nb} admission(s) updated")
@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2024 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -29,6 +29,7 @@ from django.utils.timezone import now
 from osis_async.models.enums import TaskState
 from osis_async.utils import update_task
 
+from admission.infrastructure.message_bus_memoization import query_memoization_scope
 from admission.models import AdmissionTask
 from admission.exports.admission_archive import admission_pdf_archive
 from admission.exports.admission_recap.admission_async_recap import (
@@ -66,19 +67,44 @@ class Command(BaseCommand):
         AdmissionTask.TaskType.DOCTORATE_FOLDER.name: doctorate_education_admission_analysis_folder_from_task,
     }
 
-    def handle(self, *args, **options):
-        # Get all unprocessed admission tasks
-        task_list = (
-            AdmissionTask.objects.filter(task__state=TaskState.PENDING.name)
-            .order_by('-task__created_at')
-            .values_list('task__uuid', 'type')
+    # Maximum number of tasks of a type that can be processed at the same time (lower than the number of workers so
+    # that a burst of tasks of one type cannot hold up the other ones)
+    concurrency_limit_by_type = {
+        AdmissionTask.TaskType.GENERAL_RECAP.name: 3,
+        AdmissionTask.TaskType.CONTINUING_RECAP.name: 3,
+        AdmissionTask.TaskType.DOCTORATE_RECAP.name: 3,
+        AdmissionTask.TaskType.GENERAL_MERGE.name: 2,
+        AdmissionTask.TaskType.CONTINUING_MERGE.name: 2,
+        AdmissionTask.TaskType.DOCTORATE_MERGE.name: 2,
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-tasks',
+            type=int,
+            default=None,
+            help='Maximum number of tasks to process before stopping (by default, until there is no pending task)',
         )
+
+    def handle(self, *args, **options):
+        max_tasks = options.get('max_tasks')
+        processed_tasks_count = 0
         errors = []
-        for task_uuid, task_type in task_list:
-            update_task(task_uuid, progression=0, state=TaskState.PROCESSING, started_at=now())
+
+        # Claim the unprocessed admission tasks one by one so that several processes can run concurrently
+        while max_tasks is None or processed_tasks_count < max_tasks:
+            admission_task = AdmissionTask.objects.claim_pending_task(self.concurrency_limit_by_type)
+
+            if admission_task is None:
+                break
+
+            processed_tasks_count += 1
+            task_uuid = admission_task.task.uuid
+
             try:
-                if task_type in self.task_operation_by_type:
-                    self.task_operation_by_type[task_type](task_uuid)
+                if admission_task.type in self.task_operation_by_type:
+                    with query_memoization_scope(name=admission_task.type):
+                        self.task_operation_by_type[admission_task.type](task_uuid)
                 update_task(task_uuid, progression=100, state=TaskState.DONE, completed_at=now())
             except Exception as e:
                 update_task(task_uuid, state=TaskState.ERROR, exception=e)
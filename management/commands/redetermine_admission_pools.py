@@ -0,0 +1,242 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from django.core.management import BaseCommand
+from django.db import connections
+from osis_history.utilities import add_history_entry
+
+from admission.admission_utils.candidate_trainings_summary import invalidate_candidate_trainings_summaries
+from admission.admission_utils.permission_cache import invalidate_admission_permission_cache
+from admission.constants import (
+    CONTEXT_CONTINUING,
+    CONTEXT_DOCTORATE,
+    CONTEXT_GENERAL,
+    POOLS_REDETERMINATION_BATCH_SIZE,
+    POOLS_REDETERMINATION_WORKERS,
+)
+from admission.ddd.admission.doctorat.preparation.commands import (
+    DeterminerAnneeAcademiqueEtPotQuery as DeterminerAnneeAcademiqueEtPotDoctoratQuery,
+)
+from admission.ddd.admission.doctorat.preparation.domain.model.enums import ChoixStatutPropositionDoctorale
+from admission.ddd.admission.formation_continue.commands import (
+    DeterminerAnneeAcademiqueEtPotQuery as DeterminerAnneeAcademiqueEtPotContinueQuery,
+)
+from admission.ddd.admission.formation_continue.domain.model.enums import ChoixStatutPropositionContinue
+from admission.ddd.admission.formation_generale.commands import DeterminerAnneesAcademiquesEtPotsQuery
+from admission.ddd.admission.formation_generale.domain.model.enums import ChoixStatutPropositionGenerale
+from admission.ddd.admission.shared_kernel.dtos.conditions import InfosDetermineesDTO
+from admission.models import ContinuingEducationAdmission, DoctorateAdmission, GeneralEducationAdmission
+from base.models.academic_year import AcademicYear
+from osis_common.ddd.interface import BusinessException
+
+
+class Command(BaseCommand):
+    help = (
+        "Determine again the academic year and the pool of the admissions in draft, typically after a change of the "
+        "academic calendars. The differences are reported and only applied with --apply."
+    )
+
+    # Model and draft status of the admissions of each context
+    admissions_by_context = {
+        CONTEXT_GENERAL: (GeneralEducationAdmission, ChoixStatutPropositionGenerale.EN_BROUILLON.name),
+        CONTEXT_CONTINUING: (ContinuingEducationAdmission, ChoixStatutPropositionContinue.EN_BROUILLON.name),
+        CONTEXT_DOCTORATE: (DoctorateAdmission, ChoixStatutPropositionDoctorale.EN_BROUILLON.name),
+    }
+
+    # Queries of the contexts whose pools can only be determined admission by admission
+    single_determination_query_by_context = {
+        CONTEXT_CONTINUING: DeterminerAnneeAcademiqueEtPotContinueQuery,
+        CONTEXT_DOCTORATE: DeterminerAnneeAcademiqueEtPotDoctoratQuery,
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=POOLS_REDETERMINATION_BATCH_SIZE,
+            help="Number of admissions whose pool is determined together",
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=POOLS_REDETERMINATION_WORKERS,
+            help="Number of batches processed concurrently",
+        )
+        parser.add_argument(
+            '--context',
+            action='append',
+            choices=list(self.admissions_by_context),
+            help="Only consider the admissions of this context (by default, the admissions of every context)",
+        )
+        parser.add_argument('--training', help="Only consider the admissions to the training with this acronym")
+        parser.add_argument('--apply', action='store_true', help="Save the differences once they are reported")
+
+    def handle(self, *args, **options):
+        checked_nb = 0
+        changes_nb = 0
+        errors_nb = 0
+        updated_nb = 0
+
+        for context in options['context'] or self.admissions_by_context:
+            context_checked_nb, context_changes, context_errors_nb = self._determine_context(context, options)
+            checked_nb += context_checked_nb
+            changes_nb += len(context_changes)
+            errors_nb += context_errors_nb
+
+            if context_changes and options['apply']:
+                updated_nb += self._apply_changes(context, context_changes, options['batch_size'])
+
+        self.stdout.write(
+            f"{checked_nb} admission(s) checked, {changes_nb} change(s), {errors_nb} admission(s) not determined"
+        )
+
+        if not changes_nb:
+            return
+
+        if not options['apply']:
+            self.stdout.write("Run the command again with --apply to save the changes")
+            return
+
+        self.stdout.write(f"{updated_nb} admission(s) updated")
+
+    def _determine_context(self, context, options):
+        """Determine the pools of the draft admissions of a context and return the changes with their current values."""
+        batch_size = options['batch_size']
+        model, draft_status = self.admissions_by_context[context]
+        admissions = model.objects.filter(status=draft_status).order_by('pk')
+        if options['training']:
+            admissions = admissions.filter(training__acronym=options['training'])
+
+        # Only the general education admissions store whether the candidate pursues a previous training
+        has_pursuit = context == CONTEXT_GENERAL
+        fields = ['pk', 'uuid', 'candidate_id', 'determined_academic_year__year', 'determined_pool']
+        if has_pursuit:
+            fields.append('is_in_pursuit')
+
+        current_values = {str(admission['uuid']): admission for admission in admissions.values(*fields)}
+        uuids = list(current_values)
+        batches = []
+        for start in range(0, len(uuids), batch_size):
+            end = start + batch_size
+            batches.append(uuids[start:end])
+
+        # The batches are processed concurrently, each one preloading the data of its candidates
+        if options['workers'] > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(options['workers'], len(batches)),
+                thread_name_prefix='admission-pools-redetermination',
+            ) as executor:
+                batches_results = list(executor.map(partial(self._determine_batch_in_thread, context), batches))
+        else:
+            batches_results = [self._determine_batch(context, batch) for batch in batches]
+
+        changes = {}
+        errors_nb = 0
+        for batch_results in batches_results:
+            for uuid, result in batch_results.items():
+                if not isinstance(result, InfosDetermineesDTO):
+                    errors_nb += 1
+                    if options['verbosity'] > 1:
+                        self.stdout.write(f"{uuid}: {result}")
+                    continue
+
+                current = current_values[uuid]
+                if (
+                    result.annee != current['determined_academic_year__year']
+                    or result.pool.name != current['determined_pool']
+                    or (has_pursuit and result.est_en_poursuite != current['is_in_pursuit'])
+                ):
+                    changes[uuid] = (result, current)
+                    self.stdout.write(
+                        f"{uuid}: {current['determined_academic_year__year']} {current['determined_pool']} "
+                        f"-> {result.annee} {result.pool.name}"
+                    )
+
+        return len(uuids), changes, errors_nb
+
+    def _apply_changes(self, context, changes, batch_size):
+        model, _ = self.admissions_by_context[context]
+        updated_fields = ['determined_academic_year', 'determined_pool']
+        if context == CONTEXT_GENERAL:
+            updated_fields.append('is_in_pursuit')
+
+        academic_years_ids = dict(
+            AcademicYear.objects.filter(year__in={result.annee for result, _ in changes.values()}).values_list(
+                'year',
+                'pk',
+            )
+        )
+        updated_admissions = []
+        for result, current in changes.values():
+            admission = model(
+                pk=current['pk'],
+                determined_academic_year_id=academic_years_ids.get(result.annee),
+                determined_pool=result.pool.name,
+            )
+            if context == CONTEXT_GENERAL:
+                admission.is_in_pursuit = result.est_en_poursuite
+            updated_admissions.append(admission)
+        model.objects.bulk_update(updated_admissions, updated_fields, batch_size=batch_size)
+
+        # The bulk update does not send the signals that usually invalidate the cached data of the admissions
+        invalidate_candidate_trainings_summaries({current['candidate_id'] for _, current in changes.values()})
+        for uuid, (result, _) in changes.items():
+            invalidate_admission_permission_cache(uuid)
+            add_history_entry(
+                uuid,
+                f"L'année académique et le pot de la proposition ont été recalculés : {result.annee} "
+                f"{result.pool.name}.",
+                f"The academic year and the pool of the proposition have been determined again: {result.annee} "
+                f"{result.pool.name}.",
+                'system',
+                tags=['proposition', 'pool', 'modification'],
+            )
+
+        return len(changes)
+
+    def _determine_batch(self, context, uuids):
+        from infrastructure.messages_bus import message_bus_instance
+
+        if context not in self.single_determination_query_by_context:
+            return message_bus_instance.invoke(DeterminerAnneesAcademiquesEtPotsQuery(uuids_propositions=uuids))
+
+        query_class = self.single_determination_query_by_context[context]
+        results = {}
+        for uuid in uuids:
+            try:
+                results[uuid] = message_bus_instance.invoke(query_class(uuid_proposition=uuid))
+            except BusinessException as exception:
+                results[uuid] = exception
+        return results
+
+    def _determine_batch_in_thread(self, context, uuids):
+        try:
+            return self._determine_batch(context, uuids)
+        finally:
+            # Each thread uses its own database connections
+            connections.close_all()
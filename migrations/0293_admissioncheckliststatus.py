@@ -0,0 +1,64 @@
+# Generated by Django 5.2.13 on 2026-10-17 09:12
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+from admission.migrations.utils.initialize_checklist_statuses import initialize_checklist_statuses
+
+
+def initialize_checklist_statuses_migration(apps, schema_editor):
+    if settings.TESTING:
+        return
+
+    initialize_checklist_statuses(
+        base_admission_model=apps.get_model('admission', 'BaseAdmission'),
+        checklist_status_model=apps.get_model('admission', 'AdmissionChecklistStatus'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admission', '0292_alter_doctorateadmission_admission_requirement_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AdmissionChecklistStatus',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tab', models.CharField(max_length=64, verbose_name='Tab')),
+                ('status', models.CharField(blank=True, default='', max_length=64, verbose_name='Status')),
+                ('extra_key', models.CharField(blank=True, default='', max_length=64, verbose_name='Extra key')),
+                ('extra_value', models.CharField(blank=True, default='', max_length=255, verbose_name='Extra value')),
+                (
+                    'admission',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='checklist_statuses',
+                        to='admission.baseadmission',
+                        verbose_name='Admission',
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name': 'Admission checklist status',
+                'verbose_name_plural': 'Admission checklist statuses',
+                'indexes': [
+                    models.Index(
+                        fields=['tab', 'status', 'extra_key', 'extra_value', 'admission'],
+                        name='admission_checklist_status',
+                    ),
+                    models.Index(
+                        fields=['tab', 'extra_key', 'extra_value', 'admission'],
+                        name='admission_checklist_extra',
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(
+            code=initialize_checklist_statuses_migration,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
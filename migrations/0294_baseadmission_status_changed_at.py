@@ -0,0 +1,18 @@
+# Generated by Django 5.2.13 on 2026-10-17 10:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admission', '0293_admissioncheckliststatus'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='baseadmission',
+            name='status_changed_at',
+            field=models.DateTimeField(db_index=True, editable=False, null=True, verbose_name='Status change date'),
+        ),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 5.2.13 on 2026-10-17 14:02
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+from admission.migrations.utils.initialize_person_search_index import initialize_person_search_index
+
+
+def initialize_person_search_index_migration(apps, schema_editor):
+    if settings.TESTING:
+        return
+
+    initialize_person_search_index(
+        person_model=apps.get_model('base', 'Person'),
+        student_model=apps.get_model('base', 'Student'),
+        person_search_index_model=apps.get_model('admission', 'PersonSearchIndex'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admission', '0294_baseadmission_status_changed_at'),
+        ('base', '0724_person_personal_data_validation'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.CreateModel(
+            name='PersonSearchIndex',
+            fields=[
+                (
+                    'person',
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name='admission_search_index',
+                        serialize=False,
+                        to='base.person',
+                        verbose_name='Person',
+                    ),
+                ),
+                ('names', models.TextField(blank=True, default='', verbose_name='Names')),
+                ('emails', models.TextField(blank=True, default='', verbose_name='Emails')),
+                ('global_id', models.TextField(blank=True, default='', verbose_name='Global ID')),
+                ('registration_ids', models.TextField(blank=True, default='', verbose_name='Registration IDs')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+            ],
+            options={
+                'verbose_name': 'Person search index',
+                'verbose_name_plural': 'Person search indexes',
+                'indexes': [
+                    django.contrib.postgres.indexes.GinIndex(
+                        fields=['search_vector'],
+                        name='admission_person_search_vector',
+                    ),
+                    django.contrib.postgres.indexes.GinIndex(
+                        fields=['names'],
+                        name='admission_person_search_names',
+                        opclasses=['gin_trgm_ops'],
+                    ),
+                    django.contrib.postgres.indexes.GinIndex(
+                        fields=['emails'],
+                        name='admission_person_search_emails',
+                        opclasses=['gin_trgm_ops'],
+                    ),
+                    django.contrib.postgres.indexes.GinIndex(
+                        fields=['global_id'],
+                        name='admission_person_search_gid',
+                        opclasses=['gin_trgm_ops'],
+                    ),
+                    django.contrib.postgres.indexes.GinIndex(
+                        fields=['registration_ids'],
+                        name='admission_person_search_noma',
+                        opclasses=['gin_trgm_ops'],
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(
+            code=initialize_person_search_index_migration,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
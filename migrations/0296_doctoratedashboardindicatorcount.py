@@ -0,0 +1,59 @@
+# Generated by Django 5.2.13 on 2026-10-17 16:41
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+from admission.migrations.utils.initialize_dashboard_indicator_counts import initialize_dashboard_indicator_counts
+
+
+def initialize_dashboard_indicator_counts_migration(apps, schema_editor):
+    if settings.TESTING:
+        return
+
+    initialize_dashboard_indicator_counts(
+        doctorate_admission_model=apps.get_model('admission', 'DoctorateAdmission'),
+        dashboard_indicator_count_model=apps.get_model('admission', 'DoctorateDashboardIndicatorCount'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admission', '0295_personsearchindex'),
+        ('base', '0724_person_personal_data_validation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DoctorateDashboardIndicatorCount',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('indicator', models.CharField(max_length=64, verbose_name='Indicator')),
+                ('count', models.PositiveIntegerField(default=0, verbose_name='Count')),
+                (
+                    'cdd',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='+',
+                        to='base.entity',
+                        verbose_name='Doctoral commission',
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name': 'Doctorate dashboard indicator count',
+                'verbose_name_plural': 'Doctorate dashboard indicator counts',
+                'constraints': [
+                    models.UniqueConstraint(
+                        fields=('indicator', 'cdd'),
+                        name='admission_dashboard_indicator_unique',
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(
+            code=initialize_dashboard_indicator_counts_migration,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,50 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from admission.models.checklist import get_checklist_status_rows
+
+BATCH_SIZE = 1000
+
+
+def initialize_checklist_statuses(base_admission_model, checklist_status_model):
+    """Fill the indexed checklist statuses from the current checklist of the existing admissions."""
+    admissions = base_admission_model.objects.exclude(checklist={}).values_list('pk', 'checklist')
+    statuses = []
+    for admission_id, checklist in admissions.iterator(chunk_size=BATCH_SIZE):
+        statuses.extend(
+            checklist_status_model(
+                admission_id=admission_id,
+                tab=tab,
+                status=status,
+                extra_key=extra_key,
+                extra_value=extra_value,
+            )
+            for tab, status, extra_key, extra_value in get_checklist_status_rows(checklist)
+        )
+        if len(statuses) >= BATCH_SIZE:
+            checklist_status_model.objects.bulk_create(statuses)
+            statuses = []
+    if statuses:
+        checklist_status_model.objects.bulk_create(statuses)
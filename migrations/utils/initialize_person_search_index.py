@@ -0,0 +1,72 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from collections import defaultdict
+
+from django.contrib.postgres.search import SearchVector
+
+from admission.models.person_search import PERSON_SEARCH_CONFIG, get_person_search_index_values
+
+BATCH_SIZE = 1000
+
+
+def initialize_person_search_index(person_model, student_model, person_search_index_model):
+    """Fill the search index from the current data of the existing persons."""
+    registration_ids = defaultdict(list)
+    for person_id, registration_id in student_model.objects.values_list('person_id', 'registration_id').iterator(
+        chunk_size=BATCH_SIZE,
+    ):
+        registration_ids[person_id].append(registration_id)
+
+    persons = person_model.objects.values_list(
+        'pk',
+        'first_name',
+        'last_name',
+        'email',
+        'private_email',
+        'global_id',
+    )
+    index_rows = []
+    for person_id, first_name, last_name, email, private_email, global_id in persons.iterator(chunk_size=BATCH_SIZE):
+        index_rows.append(
+            person_search_index_model(
+                person_id=person_id,
+                **get_person_search_index_values(
+                    first_name=first_name,
+                    last_name=last_name,
+                    email=email,
+                    private_email=private_email,
+                    global_id=global_id,
+                    registration_ids=registration_ids[person_id],
+                ),
+            )
+        )
+        if len(index_rows) >= BATCH_SIZE:
+            person_search_index_model.objects.bulk_create(index_rows, ignore_conflicts=True)
+            index_rows = []
+    if index_rows:
+        person_search_index_model.objects.bulk_create(index_rows, ignore_conflicts=True)
+
+    person_search_index_model.objects.update(search_vector=SearchVector('names', config=PERSON_SEARCH_CONFIG))
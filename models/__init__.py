@@ -34,6 +34,7 @@ try:
         ContinuingEducationAdmission,
         ContinuingEducationAdmissionProxy,
     )
+    from .dashboard_indicator import DoctorateDashboardIndicatorCount
     from .doctorate import DoctorateAdmission
     from .entity_proxy import EntityProxy
     from .epc_injection import EPCInjection
@@ -42,6 +43,7 @@ try:
         GeneralEducationAdmission,
         GeneralEducationAdmissionProxy,
     )
+    from .person_search import PersonSearchIndex
     from .task import AdmissionTask
     from .visa import DiplomaticPost
 
@@ -60,6 +62,8 @@ try:
         "AdmissionFormItemInstantiation",
         "AdmissionViewer",
         "DiplomaticPost",
+        "PersonSearchIndex",
+        "DoctorateDashboardIndicatorCount",
     ]
 
 except RuntimeError as e:  # pragma: no cover
@@ -23,14 +23,12 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
-import itertools
 import uuid
 from typing import Dict, List, Set, Union
 
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.contrib.postgres.aggregates import StringAgg
-from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import IntegrityError, models
@@ -67,6 +65,16 @@ from osis_comment.models import CommentDeleteMixin
 from osis_document_components.fields import FileField
 from osis_history.models import HistoryEntry
 
+from admission.admission_utils.candidate_trainings_summary import (
+    CandidateTrainingsSummary,
+    get_candidate_trainings_summary,
+)
+from admission.admission_utils.permission_cache import (
+    invalidate_admission_permission_cache,
+    invalidate_candidate_permission_cache,
+    invalidate_training_permission_cache,
+)
+from admission.auth.role_cache import get_role_snapshot
 from admission.constants import (
     ADMISSION_POOL_ACADEMIC_CALENDAR_TYPES,
     CONTEXT_CONTINUING,
@@ -91,9 +99,9 @@ from admission.ddd.admission.shared_kernel.repository.i_proposition import (
     CAMPUS_LETTRE_DOSSIER,
 )
 from admission.infrastructure.admission.shared_kernel.domain.service.annee_inscription_formation import (
-    ADMISSION_CONTEXT_BY_ALL_OSIS_EDUCATION_TYPE,
     AnneeInscriptionFormationTranslator,
 )
+from admission.models.checklist import AdmissionChecklistStatus
 from admission.models.epc_injection import (
     EPCInjection,
     EPCInjectionStatus,
@@ -115,14 +123,13 @@ from base.models.person_merge_proposal import PersonMergeStatus
 from base.models.student import Student
 from base.utils.cte import CTESubquery
 from education_group.contrib.models import EducationGroupRoleModel
-from epc.models.enums.etat_inscription import EtatInscriptionFormation
-from epc.models.inscription_programme_annuel import InscriptionProgrammeAnnuel
 from osis_role.contrib.models import EntityRoleModel
 from osis_role.contrib.permissions import _get_relevant_roles
 from program_management.models.education_group_version import EducationGroupVersion
 from reference.models.country import Country
 
 REFERENCE_SEQ_NAME = 'admission_baseadmission_reference_seq'
+STATUS_CHANGE_HISTORY_TAGS = ['proposition', 'status-changed']
 
 
 def admission_directory_path(admission: 'BaseAdmission', filename: str):
@@ -222,14 +229,7 @@ class BaseAdmissionQuerySet(models.QuerySet):
         )
 
     def annotate_last_status_update(self):
-        return self.annotate(
-            status_updated_at=Subquery(
-                HistoryEntry.objects.filter(
-                    object_uuid=OuterRef('uuid'),
-                    tags__contains=['proposition', 'status-changed'],
-                ).values('created')[:1]
-            ),
-        )
+        return self.annotate(status_updated_at=F('status_changed_at'))
 
     def annotate_with_student_registration_id(self):
         return self.annotate(
@@ -365,17 +365,10 @@ class BaseAdmissionQuerySet(models.QuerySet):
         )
 
     def annotate_with_status_update_date(self):
-        return self.annotate(
-            status_updated_at=Subquery(
-                HistoryEntry.objects.filter(
-                    object_uuid=OuterRef('uuid'),
-                    tags__contains=['proposition', 'status-changed'],
-                ).values('created')[:1]
-            )
-        )
+        return self.annotate(status_updated_at=F('status_changed_at'))
 
     def filter_according_to_roles(self, demandeur_uuid, permission='admission.view_enrolment_application'):
-        demandeur_user = User.objects.filter(person__uuid=demandeur_uuid).first()
+        demandeur_user = User.objects.filter(person__uuid=demandeur_uuid).select_related('person').first()
 
         roles = _get_relevant_roles(demandeur_user, permission)
 
@@ -383,18 +376,29 @@ class BaseAdmissionQuerySet(models.QuerySet):
         entities_conditions = Q()
         for entity_aware_role in [r for r in roles if issubclass(r, EntityRoleModel)]:
             entities_conditions |= Q(
-                training__management_entity_id__in=entity_aware_role.objects.filter(
-                    person__uuid=demandeur_uuid
-                ).get_entities_ids()
+                training__management_entity_id__in=get_role_snapshot(
+                    demandeur_user,
+                    entity_aware_role,
+                    'entities_ids',
+                    lambda: set(entity_aware_role.objects.filter(person__uuid=demandeur_uuid).get_entities_ids()),
+                )
             )
 
         # Filter managed education groups
         education_group_conditions = Q()
         for education_aware_role in [r for r in roles if issubclass(r, EducationGroupRoleModel)]:
             education_group_conditions |= Q(
-                training__education_group_id__in=education_aware_role.objects.filter(
-                    person__uuid=demandeur_uuid
-                ).values_list('education_group_id')
+                training__education_group_id__in=get_role_snapshot(
+                    demandeur_user,
+                    education_aware_role,
+                    'education_groups_ids',
+                    lambda: set(
+                        education_aware_role.objects.filter(person__uuid=demandeur_uuid).values_list(
+                            'education_group_id',
+                            flat=True,
+                        )
+                    ),
+                )
             )
 
         return self.filter(entities_conditions | education_group_conditions)
@@ -591,6 +595,12 @@ class BaseAdmission(CommentDeleteMixin, models.Model):
         verbose_name=_("Submission date"),
         null=True,
     )
+    status_changed_at = models.DateTimeField(
+        verbose_name=_("Status change date"),
+        null=True,
+        editable=False,
+        db_index=True,
+    )
 
     submitted_profile = models.JSONField(
         verbose_name=_("Submitted profile"),
@@ -668,7 +678,10 @@ class BaseAdmission(CommentDeleteMixin, models.Model):
 
     def save(self, *args, **kwargs) -> None:
         super().save(*args, **kwargs)
-        cache.delete('admission_permission_{}'.format(self.uuid))
+        invalidate_admission_permission_cache(self.uuid)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'checklist' in update_fields:
+            AdmissionChecklistStatus.objects.synchronize([self])
 
     @property
     def reference_str(self):
@@ -709,54 +722,21 @@ class BaseAdmission(CommentDeleteMixin, models.Model):
     def is_in_quarantine(self):
         return BaseAdmission.objects.filter(pk=self.pk).filter_in_quarantine().exists()
 
+    def get_candidate_trainings_summary(self) -> CandidateTrainingsSummary:
+        # The summary can be loaded with the ones of other admissions (see prefetch_candidate_trainings_summaries)
+        return getattr(self, '_candidate_trainings_summary', None) or get_candidate_trainings_summary(self.candidate_id)
+
     @cached_property
     def other_candidate_trainings(self) -> Dict[str, Set[str]]:
-        # Retrieve the education group types from the admissions
-        admission_training_types = (
-            BaseAdmission.objects.filter(
-                candidate_id=self.candidate_id,
-            )
-            .exclude(
-                Q(pk=self.pk)
-                | Q(generaleducationadmission__status__in=STATUTS_PROPOSITION_GENERALE_NON_SOUMISE)
-                | Q(continuingeducationadmission__status__in=STATUTS_PROPOSITION_CONTINUE_NON_SOUMISE)
-                | Q(doctorateadmission__status__in=STATUTS_PROPOSITION_DOCTORALE_PEU_AVANCEE),
-            )
-            .values_list(
-                'training__education_group_type__name',
-                flat=True,
-            )
-        )
+        return self.get_candidate_trainings_summary().get_other_trainings(self.pk)
 
-        # Retrieve the education group types from the internal trainings
-        internal_training_types = (
-            InscriptionProgrammeAnnuel.objects.filter(
-                programme_cycle__etudiant__person_id=self.candidate_id,
-                programme__isnull=False,
-            )
-            .exclude(
-                etat_inscription__in=[
-                    EtatInscriptionFormation.ERREUR.name,
-                    EtatInscriptionFormation.ERREUR_PROCEDURE.name,
-                ]
-            )
-            .values_list(
-                'programme__root_group__education_group_type__name',
-                flat=True,
-            )
+    @cached_property
+    def has_several_admissions_in_progress(self) -> bool:
+        # Replaced by the annotation of the BaseAdmissionQuerySet.annotate_several_admissions_in_progress method
+        return self.get_candidate_trainings_summary().has_several_admissions_in_progress(
+            self.determined_academic_year_id
         )
 
-        other_admissions = {
-            CONTEXT_GENERAL: set(),
-            CONTEXT_DOCTORATE: set(),
-            CONTEXT_CONTINUING: set(),
-        }
-
-        for training in itertools.chain(internal_training_types, admission_training_types):
-            other_admissions[ADMISSION_CONTEXT_BY_ALL_OSIS_EDUCATION_TYPE[training]].add(training)
-
-        return other_admissions
-
     def get_specific_question_answers_dict(self) -> Dict[str, Union[str, List[str]]]:
         """Return a dict of form item uuid to answers, as the old format was."""
         return {
@@ -776,22 +756,21 @@ def _invalidate_doctorate_cache(sender, instance, **kwargs):
         instance.education_group_type.category == Categories.TRAINING.name
         and instance.education_group_type.name in admission_types
     ):  # pragma: no branch
-        keys = [
-            f'admission_permission_{a_uuid}'
-            for a_uuid in BaseAdmission.objects.filter(training_id=instance.pk).values_list('uuid', flat=True)
-        ]
-        if keys:
-            cache.delete_many(keys)
+        invalidate_training_permission_cache(instance.pk)
 
 
 @receiver(post_save, sender=Person)
 def _invalidate_candidate_cache(sender, instance, **kwargs):
-    keys = [
-        f'admission_permission_{a_uuid}'
-        for a_uuid in BaseAdmission.objects.filter(candidate_id=instance.pk).values_list('uuid', flat=True)
-    ]
-    if keys:
-        cache.delete_many(keys)
+    invalidate_candidate_permission_cache(instance.pk)
+
+
+@receiver(post_save, sender=HistoryEntry)
+def _update_status_change_date(sender, instance, created, **kwargs):
+    if created and set(STATUS_CHANGE_HISTORY_TAGS).issubset(instance.tags or []):
+        BaseAdmission.objects.filter(
+            Q(status_changed_at__isnull=True) | Q(status_changed_at__lt=instance.created),
+            uuid=instance.object_uuid,
+        ).update(status_changed_at=instance.created)
 
 
 class AdmissionViewer(models.Model):
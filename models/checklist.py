@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -24,11 +24,14 @@
 #
 # ##############################################################################
 
+import json
 import uuid
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from ckeditor.fields import RichTextField
 from django.conf import settings
 from django.db import models
+from django.db.models import Exists, OuterRef, Q
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 from ordered_model.models import OrderedModel
@@ -226,3 +229,121 @@ class FreeAdditionalApprovalCondition(BaseFreeAdditionalApprovalCondition):
     class Meta:
         verbose_name = _('Free additional approval condition')
         verbose_name_plural = _('Free additional approval conditions')
+
+
+CHECKLIST_STATUS_EXTRA_VALUE_MAX_LENGTH = 255
+
+
+def get_checklist_status_extra_value(value) -> Optional[str]:
+    """Return the indexed representation of a checklist extra value, or None if the value cannot be indexed."""
+    if value is not None and not isinstance(value, (str, int, float, bool)):
+        return None
+    serialized_value = json.dumps(value)
+    return serialized_value if len(serialized_value) <= CHECKLIST_STATUS_EXTRA_VALUE_MAX_LENGTH else None
+
+
+def get_checklist_status_rows(checklist: Dict) -> List[Tuple[str, str, str, str]]:
+    """
+    Flatten the current checklist of an admission into (tab, status, extra key, extra value) rows: one row without
+    extra key per tab and one row per indexable extra value of the tab.
+    """
+    rows = []
+    for tab_name, tab in ((checklist or {}).get('current') or {}).items():
+        if not isinstance(tab, dict) or 'statut' not in tab:
+            continue
+        status = tab['statut'] or ''
+        rows.append((tab_name, status, '', ''))
+        for extra_key, extra_value in (tab.get('extra') or {}).items():
+            indexed_value = get_checklist_status_extra_value(extra_value)
+            if indexed_value is not None:
+                rows.append((tab_name, status, extra_key, indexed_value))
+    return rows
+
+
+class AdmissionChecklistStatusManager(models.Manager):
+    def synchronize(self, admissions: Iterable['BaseAdmission']):
+        """Replace the indexed checklist statuses of the admissions by the ones of their current checklist."""
+        admissions = list(admissions)
+        self.filter(admission__in=admissions).delete()
+        self.bulk_create(
+            self.model(admission=admission, tab=tab, status=status, extra_key=extra_key, extra_value=extra_value)
+            for admission in admissions
+            for tab, status, extra_key, extra_value in get_checklist_status_rows(admission.checklist)
+        )
+
+    def get_filter(self, tab: str, status: str = '', extra: Optional[Dict] = None, admission_ref='pk') -> Q:
+        """
+        Return a filter on the admissions whose checklist tab has the specified status (if any) and contains the
+        specified extra values.
+        """
+        base_filters = {'admission_id': OuterRef(admission_ref), 'tab': tab}
+        if status:
+            base_filters['status'] = status
+
+        if not extra:
+            return Q(Exists(self.filter(extra_key='', **base_filters)))
+
+        conditions = Q()
+        for extra_key, extra_value in extra.items():
+            indexed_value = get_checklist_status_extra_value(extra_value)
+            if indexed_value is None:
+                # Not indexed value, use the json field instead
+                conditions &= Q(Exists(self.filter(extra_key='', **base_filters))) & Q(
+                    **{f'checklist__current__{tab}__extra__contains': {extra_key: extra_value}}
+                )
+            else:
+                conditions &= Q(Exists(self.filter(extra_key=extra_key, extra_value=indexed_value, **base_filters)))
+        return conditions
+
+    def get_presence_filter(self, tab: str, admission_ref='pk') -> Q:
+        """Return a filter on the admissions whose current checklist contains the tab."""
+        return Q(Exists(self.filter(admission_id=OuterRef(admission_ref), tab=tab, extra_key='')))
+
+
+class AdmissionChecklistStatus(models.Model):
+    """Denormalized and indexed copy of the statuses of the current checklist of an admission, used to filter."""
+
+    admission = models.ForeignKey(
+        on_delete=models.CASCADE,
+        to='BaseAdmission',
+        related_name='checklist_statuses',
+        verbose_name=_('Admission'),
+    )
+    tab = models.CharField(
+        max_length=64,
+        verbose_name=_('Tab'),
+    )
+    status = models.CharField(
+        max_length=64,
+        blank=True,
+        default='',
+        verbose_name=_('Status'),
+    )
+    extra_key = models.CharField(
+        max_length=64,
+        blank=True,
+        default='',
+        verbose_name=_('Extra key'),
+    )
+    extra_value = models.CharField(
+        max_length=CHECKLIST_STATUS_EXTRA_VALUE_MAX_LENGTH,
+        blank=True,
+        default='',
+        verbose_name=_('Extra value'),
+    )
+
+    objects = AdmissionChecklistStatusManager()
+
+    class Meta:
+        verbose_name = _('Admission checklist status')
+        verbose_name_plural = _('Admission checklist statuses')
+        indexes = [
+            models.Index(
+                fields=['tab', 'status', 'extra_key', 'extra_value', 'admission'],
+                name='admission_checklist_status',
+            ),
+            models.Index(
+                fields=['tab', 'extra_key', 'extra_value', 'admission'],
+                name='admission_checklist_extra',
+            ),
+        ]
@@ -0,0 +1,183 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from collections import Counter
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from django.db import models, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from django.utils.translation import gettext_lazy as _
+
+from admission.infrastructure.admission.doctorat.preparation.read_view.repository.tableau_bord import (
+    TableauBordRepositoryAdmissionMixin,
+)
+from base.models.education_group_year import EducationGroupYear
+
+# Fields of the doctorate admissions on which the dashboard indicators depend
+DASHBOARD_INDICATOR_FIELDS = {'status': 'status', 'type': 'type', 'training': 'training_id'}
+DASHBOARD_INDICATOR_UPDATE_FIELDS = {*DASHBOARD_INDICATOR_FIELDS, *DASHBOARD_INDICATOR_FIELDS.values()}
+
+
+def get_dashboard_indicator_values(admission) -> Optional[Dict[str, object]]:
+    """Return the values of the fields of the admission on which the indicators depend, if they are all loaded."""
+    if any(attname not in admission.__dict__ for attname in DASHBOARD_INDICATOR_FIELDS.values()):
+        return None
+    return {attname: admission.__dict__[attname] for attname in DASHBOARD_INDICATOR_FIELDS.values()}
+
+
+def compute_dashboard_indicator_counts(doctorate_admission_model) -> Dict[Tuple[str, int], int]:
+    """Count the doctorate admissions of each dashboard indicator, by management entity of their training."""
+    counts = {}
+    for indicator, admission_filter in TableauBordRepositoryAdmissionMixin.ADMISSION_DJANGO_FILTER_BY_INDICATOR.items():
+        counts_by_entity = (
+            doctorate_admission_model.objects.filter(admission_filter, training__management_entity__isnull=False)
+            .values_list('training__management_entity_id')
+            .annotate(admissions_count=Count('pk'))
+            .order_by()
+        )
+        for cdd_id, admissions_count in counts_by_entity:
+            counts[indicator, cdd_id] = admissions_count
+    return counts
+
+
+class DoctorateDashboardIndicatorCountManager(models.Manager):
+    def get_counts(self, indicators: Iterable[str], entities_ids: Optional[Set[int]] = None) -> Dict[str, int]:
+        """Return the number of admissions of each indicator, optionally restricted to some management entities."""
+        indicators = list(indicators)
+        qs = self.filter(indicator__in=indicators)
+        if entities_ids is not None:
+            qs = qs.filter(cdd_id__in=entities_ids)
+        counts = dict.fromkeys(indicators, 0)
+        counts.update(qs.values('indicator').annotate(total=Sum('count')).order_by().values_list('indicator', 'total'))
+        return counts
+
+    def update_for_admission(self, previous_values: Optional[Dict], current_values: Optional[Dict]):
+        """
+        Update the counts after a change of the fields of an admission on which the indicators depend.
+        :param previous_values: The previous values of the fields (None if the admission has just been created)
+        :param current_values: The current values of the fields (None if the admission has just been deleted)
+        """
+        get_indicators = TableauBordRepositoryAdmissionMixin.get_admission_indicators
+        previous_indicators = get_indicators(previous_values) if previous_values else set()
+        current_indicators = get_indicators(current_values) if current_values else set()
+        previous_training_id = previous_values and previous_values['training_id']
+        current_training_id = current_values and current_values['training_id']
+
+        if previous_indicators == current_indicators and (
+            not current_indicators or previous_training_id == current_training_id
+        ):
+            return
+
+        cdd_id_by_training_id = dict(
+            EducationGroupYear.objects.filter(pk__in=[previous_training_id, current_training_id]).values_list(
+                'pk',
+                'management_entity_id',
+            )
+        )
+
+        changes = Counter()
+        for indicator in previous_indicators:
+            changes[indicator, cdd_id_by_training_id.get(previous_training_id)] -= 1
+        for indicator in current_indicators:
+            changes[indicator, cdd_id_by_training_id.get(current_training_id)] += 1
+
+        self.apply_changes({key: variation for key, variation in changes.items() if variation and key[1] is not None})
+
+    def apply_changes(self, changes: Dict[Tuple[str, int], int]):
+        """Add the variations of the numbers of admissions to the counts of the (indicator, management entity)."""
+        for (indicator, cdd_id), variation in changes.items():
+            if variation > 0:
+                self.get_or_create(indicator=indicator, cdd_id=cdd_id)
+                self.filter(indicator=indicator, cdd_id=cdd_id).update(count=F('count') + variation)
+            elif variation < 0:
+                # A count can't be negative, the periodic rebuild will fix an inconsistent count
+                self.filter(indicator=indicator, cdd_id=cdd_id, count__gte=-variation).update(
+                    count=F('count') + variation
+                )
+
+    @transaction.atomic
+    def rebuild(self):
+        """Compute again all the counts from the doctorate admissions."""
+        from admission.models import DoctorateAdmission
+
+        counts = compute_dashboard_indicator_counts(DoctorateAdmission)
+        self.bulk_create(
+            [
+                self.model(indicator=indicator, cdd_id=cdd_id, count=count)
+                for (indicator, cdd_id), count in counts.items()
+            ],
+            update_conflicts=True,
+            unique_fields=['indicator', 'cdd'],
+            update_fields=['count'],
+        )
+        outdated_counts_ids = [
+            count_id
+            for count_id, indicator, cdd_id in self.exclude(count=0).values_list('pk', 'indicator', 'cdd_id')
+            if (indicator, cdd_id) not in counts
+        ]
+        self.filter(pk__in=outdated_counts_ids).update(count=0)
+
+
+class DoctorateDashboardIndicatorCount(models.Model):
+    """
+    Materialized number of doctorate admissions of a dashboard indicator whose training is managed by an entity. The
+    counts are updated when the admissions are saved and rebuilt periodically.
+    """
+
+    indicator = models.CharField(
+        max_length=64,
+        verbose_name=_('Indicator'),
+    )
+    cdd = models.ForeignKey(
+        on_delete=models.CASCADE,
+        to='base.Entity',
+        related_name='+',
+        verbose_name=_('Doctoral commission'),
+    )
+    count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_('Count'),
+    )
+
+    objects = DoctorateDashboardIndicatorCountManager()
+
+    class Meta:
+        verbose_name = _('Doctorate dashboard indicator count')
+        verbose_name_plural = _('Doctorate dashboard indicator counts')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['indicator', 'cdd'],
+                name='admission_dashboard_indicator_unique',
+            ),
+        ]
+
+
+@receiver(post_delete, sender='admission.DoctorateAdmission')
+def _update_dashboard_indicator_counts_on_delete(sender, instance, **kwargs):
+    previous_values = get_dashboard_indicator_values(instance)
+    if previous_values is not None:
+        DoctorateDashboardIndicatorCount.objects.update_for_admission(previous_values, None)
@@ -28,7 +28,6 @@ from contextlib import suppress
 from datetime import date
 
 from django.contrib.postgres.fields import ArrayField
-from django.core.cache import cache
 from django.db import models
 from django.db.models import OuterRef, Prefetch
 from django.utils.translation import gettext_lazy as _
@@ -36,6 +35,7 @@ from osis_document_components.fields import FileField
 from osis_signature.contrib.fields import SignatureProcessField
 from rest_framework.settings import api_settings
 
+from admission.admission_utils.permission_cache import invalidate_admission_permission_cache
 from admission.constants import CONTEXT_DOCTORATE
 from admission.ddd.admission.doctorat.preparation.domain.model.enums import (
     ChoixCommissionProximiteCDEouCLSM,
@@ -72,6 +72,11 @@ from osis_common.ddd.interface import BusinessException
 
 from .base import BaseAdmission, BaseAdmissionQuerySet, admission_directory_path
 from .checklist import DoctorateRefusalReason
+from .dashboard_indicator import (
+    DASHBOARD_INDICATOR_UPDATE_FIELDS,
+    DoctorateDashboardIndicatorCount,
+    get_dashboard_indicator_values,
+)
 from .mixins import DocumentCopyModelMixin
 from .specific_question import SpecificQuestionAnswer
 
@@ -727,9 +732,28 @@ class DoctorateAdmission(DocumentCopyModelMixin, BaseAdmission):
             ('submit_doctorateadmission', _("Can submit a doctorate admission proposition")),
         ]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Keep the loaded values to update the counts of the dashboard indicators when saving the admission
+        instance._dashboard_indicator_values = get_dashboard_indicator_values(instance)
+        return instance
+
     def save(self, *args, **kwargs) -> None:
+        adding = self._state.adding
+        previous_indicator_values = getattr(self, '_dashboard_indicator_values', None)
         super().save(*args, **kwargs)
-        cache.delete('admission_permission_{}'.format(self.uuid))
+        invalidate_admission_permission_cache(self.uuid)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or DASHBOARD_INDICATOR_UPDATE_FIELDS.intersection(update_fields):
+            current_indicator_values = get_dashboard_indicator_values(self)
+            # The counts of the admissions whose previous values are unknown are fixed by the periodic rebuild
+            if current_indicator_values is not None and (adding or previous_indicator_values is not None):
+                DoctorateDashboardIndicatorCount.objects.update_for_admission(
+                    previous_values=None if adding else previous_indicator_values,
+                    current_values=current_indicator_values,
+                )
+            self._dashboard_indicator_values = current_indicator_values
 
     def update_detailed_status(self, author: 'Person' = None):
         from admission.ddd.admission.doctorat.preparation.commands import (
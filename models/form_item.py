@@ -25,16 +25,22 @@
 # ##############################################################################
 import uuid as uuid
 from collections import defaultdict
-from typing import List
+from typing import List, Optional, Tuple
 
+import attr
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q, QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import ngettext_lazy, pgettext_lazy
 
+from admission.admission_utils.cache_generation import bump_generation, get_generation
+from admission.constants import FORM_ITEMS_RESOLUTION_CACHE_TIMEOUT
 from admission.ddd import EN_ISO_CODE
 from admission.ddd.admission.shared_kernel.enums.question_specifique import (
     CleConfigurationItemFormulaire,
@@ -59,6 +65,37 @@ from osis_profile.models import EducationalExperience
 
 TRANSLATION_LANGUAGES = [settings.LANGUAGE_CODE_EN, settings.LANGUAGE_CODE_FR]
 DEFAULT_MAX_NB_DOCUMENTS = 1
+FORM_ITEMS_RESOLUTION_CACHE_KEY = 'admission_form_items_{generation}_{criteria}'
+FORM_ITEMS_RESOLUTION_GENERATION_CACHE_KEY = 'admission_form_items_generation'
+
+
+def _get_form_items_resolution_generation() -> Optional[str]:
+    return get_generation(FORM_ITEMS_RESOLUTION_GENERATION_CACHE_KEY, timeout=None)
+
+
+def invalidate_form_items_resolution():
+    """Invalidate the cached applicable form items."""
+    bump_generation(FORM_ITEMS_RESOLUTION_GENERATION_CACHE_KEY, timeout=None)
+
+
+@attr.dataclass(frozen=True, slots=True)
+class FormItemsResolutionCriteria:
+    """Data of an admission that determine its applicable form items, except the ones specific to the admission."""
+
+    academic_year_id: int
+    education_group_id: int
+    education_group_type_id: int
+    is_in_pursuit: bool
+    candidate_nationality: Tuple[str, ...]
+    study_language: Tuple[str, ...]
+    vip_candidate: Tuple[str, ...]
+    diploma_nationality: Tuple[str, ...]
+
+    @property
+    def cache_key(self) -> str:
+        return '_'.join(
+            '-'.join(value) if isinstance(value, tuple) else str(value) for value in attr.astuple(self, recurse=False)
+        )
 
 
 def is_valid_translated_json_field(value):
@@ -390,17 +427,75 @@ class AdmissionFormItemInstantiationManager(models.Manager):
 
         return criteria
 
-    def form_items_by_admission(
+    def get_resolution_criteria(
         self,
         admission,
-        tabs: List[str] = None,
-        form_item_type: str = '',
-        required: bool = None,
-        candidate: Person = None,
-    ):
+        candidate: Person,
+        educational_experiences,
+    ) -> FormItemsResolutionCriteria:
+        return FormItemsResolutionCriteria(
+            academic_year_id=admission.determined_academic_year_id or admission.training.academic_year_id,
+            education_group_id=admission.training.education_group_id,
+            education_group_type_id=admission.training.education_group_type_id,
+            is_in_pursuit=bool(getattr(admission, 'is_in_pursuit', None)),
+            candidate_nationality=tuple(self.get_nationality_criteria_by_candidate(candidate)),
+            study_language=tuple(self.get_study_language_criteria_by_candidate(candidate, educational_experiences)),
+            vip_candidate=tuple(self.get_vip_criteria(admission)),
+            diploma_nationality=tuple(
+                self.get_diploma_nationality_criteria_by_educational_experiences(educational_experiences)
+            ),
+        )
+
+    @staticmethod
+    def _get_criteria_filter(criteria: FormItemsResolutionCriteria) -> Q:
+        criteria_filter = Q(
+            form_item__active=True,
+            academic_year_id=criteria.academic_year_id,
+            candidate_nationality__in=criteria.candidate_nationality,
+            study_language__in=criteria.study_language,
+            vip_candidate__in=criteria.vip_candidate,
+            diploma_nationality__in=criteria.diploma_nationality,
+        )
+
+        # Don't retrieve the questions related to a specific training if the candidate already started the training
+        if criteria.is_in_pursuit:
+            criteria_filter &= ~Q(display_according_education=CritereItemFormulaireFormation.UNE_FORMATION.name)
+
+        return criteria_filter
+
+    def _compute_applicable_form_items_ids(self, criteria: FormItemsResolutionCriteria) -> List[int]:
+        qs = (
+            super()
+            .get_queryset()
+            .filter(self._get_criteria_filter(criteria))
+            .filter(
+                Q(display_according_education=CritereItemFormulaireFormation.TOUTE_FORMATION.name)
+                | Q(education_group__pk=criteria.education_group_id)
+                | Q(education_group_type__pk=criteria.education_group_type_id)
+            )
+        )
+        return list(qs.values_list('pk', flat=True))
+
+    def get_applicable_form_items_ids(self, criteria: FormItemsResolutionCriteria) -> List[int]:
+        """
+        Return the ids of the form items instantiations applicable to the admissions sharing the resolution criteria,
+        except the ones specific to an admission. They are cached until a form item or an instantiation changes.
+        """
+        generation = _get_form_items_resolution_generation()
+
+        if generation is None:
+            # The cache is not available so the resolution can't be invalidated between the processes
+            return self._compute_applicable_form_items_ids(criteria)
+
+        cache_key = FORM_ITEMS_RESOLUTION_CACHE_KEY.format(generation=generation, criteria=criteria.cache_key)
+        form_items_ids = cache.get(cache_key)
+        if form_items_ids is None:
+            form_items_ids = self._compute_applicable_form_items_ids(criteria)
+            cache.set(cache_key, form_items_ids, timeout=FORM_ITEMS_RESOLUTION_CACHE_TIMEOUT)
+        return form_items_ids
+
+    def _filter_queryset(self, tabs: List[str] = None, form_item_type: str = '', required: bool = None):
         qs: models.QuerySet['AdmissionFormItemInstantiation'] = super().get_queryset()
-        if not candidate:
-            candidate = admission.candidate
 
         if tabs:
             qs = qs.filter(tab__in=tabs)
@@ -411,34 +506,30 @@ class AdmissionFormItemInstantiationManager(models.Manager):
         if required is not None:
             qs = qs.filter(required=required)
 
+        return qs
+
+    def form_items_by_admission(
+        self,
+        admission,
+        tabs: List[str] = None,
+        form_item_type: str = '',
+        required: bool = None,
+        candidate: Person = None,
+    ):
+        qs = self._filter_queryset(tabs=tabs, form_item_type=form_item_type, required=required)
+        if not candidate:
+            candidate = admission.candidate
+
         educational_experiences = EducationalExperience.objects.filter(person=candidate).select_related(
             'linguistic_regime',
             'country',
         )
+        resolution_criteria = self.get_resolution_criteria(admission, candidate, educational_experiences)
 
-        # Don't retrieve the questions related to a specific training if the candidate already started the training
-        if getattr(admission, 'is_in_pursuit', None):
-            qs = qs.exclude(display_according_education=CritereItemFormulaireFormation.UNE_FORMATION.name)
-
-        return (
-            qs.filter(
-                form_item__active=True,
-                academic_year_id=admission.determined_academic_year_id or admission.training.academic_year_id,
-                candidate_nationality__in=self.get_nationality_criteria_by_candidate(candidate),
-                study_language__in=self.get_study_language_criteria_by_candidate(candidate, educational_experiences),
-                vip_candidate__in=self.get_vip_criteria(admission),
-                diploma_nationality__in=self.get_diploma_nationality_criteria_by_educational_experiences(
-                    educational_experiences,
-                ),
-            )
-            .filter(
-                Q(display_according_education=CritereItemFormulaireFormation.TOUTE_FORMATION.name)
-                | Q(education_group__pk=admission.training.education_group_id)
-                | Q(education_group_type__pk=admission.training.education_group_type_id)
-                | Q(admission_id=admission.pk)
-            )
-            .select_related('form_item')
-        )
+        return qs.filter(
+            Q(pk__in=self.get_applicable_form_items_ids(resolution_criteria))
+            | Q(admission_id=admission.pk) & self._get_criteria_filter(resolution_criteria)
+        ).select_related('form_item')
 
 
 class AdmissionFormItemInstantiation(models.Model):
@@ -568,3 +659,12 @@ class AdmissionFormItemInstantiation(models.Model):
 
         if errors:
             raise ValidationError(errors)
+
+
+@receiver(post_save, sender=AdmissionFormItem)
+@receiver(post_delete, sender=AdmissionFormItem)
+@receiver(post_save, sender=AdmissionFormItemInstantiation)
+@receiver(post_delete, sender=AdmissionFormItemInstantiation)
+def _invalidate_form_items_resolution(sender, instance, **kwargs):
+    # The generation is bumped once the change is committed so that no process caches the previous form items again
+    transaction.on_commit(invalidate_form_items_resolution)
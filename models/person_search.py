@@ -0,0 +1,240 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, SearchVectorField
+from django.db import models, transaction
+from django.db.models import F, Q, Value
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.translation import gettext_lazy as _
+
+from admission.constants import PERSON_SEARCH_SYNCHRONIZATION_BATCH_SIZE
+from base.models.person import Person
+from base.models.student import Student
+
+PERSON_SEARCH_CONFIG = 'simple'
+PERSON_SEARCH_TRIGRAM_MIN_LENGTH = 3  # Shorter terms cannot use the trigram indexes, only the full-text one
+PERSON_INDEXED_FIELDS = {'first_name', 'last_name', 'email', 'private_email', 'global_id'}
+
+
+def normalize_search_text(value: Optional[str]) -> str:
+    """Return the lowercase and unaccented version of a text, as stored in the search index."""
+    decomposed_value = unicodedata.normalize('NFKD', value or '')
+    return ''.join(char for char in decomposed_value if not unicodedata.combining(char)).lower().strip()
+
+
+def get_person_search_index_values(
+    first_name: str,
+    last_name: str,
+    email: str,
+    private_email: str,
+    global_id: str,
+    registration_ids: Iterable[str],
+) -> Dict[str, str]:
+    """Return the values of the search index of a person."""
+    return {
+        'names': normalize_search_text(f'{first_name or ""} {last_name or ""}'),
+        'emails': normalize_search_text(f'{email or ""} {private_email or ""}'),
+        'global_id': global_id or '',
+        'registration_ids': ' '.join(sorted(filter(None, registration_ids))),
+    }
+
+
+def _get_prefix_search_query(term: str) -> Optional[SearchQuery]:
+    """Return the full-text query matching the names starting with each word of the term."""
+    words = re.findall(r'\w+', term)
+    if not words:
+        return None
+    return SearchQuery(' & '.join(f'{word}:*' for word in words), search_type='raw', config=PERSON_SEARCH_CONFIG)
+
+
+def get_person_search_filter(terms: str, fields: Iterable[str] = (), prefix: str = '') -> Q:
+    """
+    Return a filter on the persons matching each of the search terms: one of their names starts with the term
+    (full-text index) or, for the terms long enough, their names or one of the specified indexed fields (emails,
+    global_id, registration_ids) contain it (trigram indexes). The prefix is the path to the person from the
+    filtered model (e.g. 'person__').
+    """
+    index_path = f'{prefix}admission_search_index'
+    conditions = Q()
+    for term in normalize_search_text(terms).split():
+        term_condition = Q()
+        query = _get_prefix_search_query(term)
+        if query is not None:
+            term_condition |= Q(**{f'{index_path}__search_vector': query})
+        if len(term) >= PERSON_SEARCH_TRIGRAM_MIN_LENGTH:
+            for field in ['names', *fields]:
+                term_condition |= Q(**{f'{index_path}__{field}__contains': term})
+        conditions &= term_condition or Q(pk__in=[])
+    return conditions
+
+
+def get_person_search_rank(terms: str, prefix: str = ''):
+    """
+    Return the expression ranking the persons by the relevance of their names for the search terms. The persons
+    without search index row yet are ranked last instead of first.
+    """
+    words = re.findall(r'\w+', normalize_search_text(terms))
+    return Coalesce(
+        SearchRank(
+            F(f'{prefix}admission_search_index__search_vector'),
+            (
+                SearchQuery(' | '.join(f'{word}:*' for word in words), search_type='raw', config=PERSON_SEARCH_CONFIG)
+                if words
+                else SearchQuery('', config=PERSON_SEARCH_CONFIG)
+            ),
+        ),
+        Value(0.0),
+    )
+
+
+class PersonSearchIndexManager(models.Manager):
+    def synchronize(self, persons_ids: Iterable[int]):
+        """Update the search index of the persons from their current data."""
+        persons_ids = list(persons_ids)
+        registration_ids: Dict[int, List[str]] = defaultdict(list)
+        for person_id, registration_id in Student.objects.filter(person_id__in=persons_ids).values_list(
+            'person_id',
+            'registration_id',
+        ):
+            registration_ids[person_id].append(registration_id)
+
+        persons = Person.objects.filter(pk__in=persons_ids).values_list(
+            'pk',
+            'first_name',
+            'last_name',
+            'email',
+            'private_email',
+            'global_id',
+        )
+        self.bulk_create(
+            [
+                self.model(
+                    person_id=person_id,
+                    **get_person_search_index_values(
+                        first_name=first_name,
+                        last_name=last_name,
+                        email=email,
+                        private_email=private_email,
+                        global_id=global_id,
+                        registration_ids=registration_ids[person_id],
+                    ),
+                )
+                for person_id, first_name, last_name, email, private_email, global_id in persons
+            ],
+            update_conflicts=True,
+            unique_fields=['person'],
+            update_fields=['names', 'emails', 'global_id', 'registration_ids'],
+        )
+        self.filter(person_id__in=persons_ids).update(
+            search_vector=SearchVector('names', config=PERSON_SEARCH_CONFIG),
+        )
+
+    def synchronize_missing(self) -> int:
+        """
+        Create the search index rows of the persons created without sending the post_save signal (e.g. by a bulk
+        import), and return their number.
+        """
+        missing_persons_ids = Person.objects.filter(admission_search_index__isnull=True).values_list('pk', flat=True)
+        synchronized_count = 0
+        while persons_ids := list(missing_persons_ids[:PERSON_SEARCH_SYNCHRONIZATION_BATCH_SIZE]):
+            self.synchronize(persons_ids)
+            synchronized_count += len(persons_ids)
+        return synchronized_count
+
+
+class PersonSearchIndex(models.Model):
+    """Denormalized and indexed copy of the data of a person, used by the autocompletes to search the persons."""
+
+    person = models.OneToOneField(
+        Person,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='admission_search_index',
+        verbose_name=_('Person'),
+    )
+    names = models.TextField(
+        blank=True,
+        default='',
+        verbose_name=_('Names'),
+    )
+    emails = models.TextField(
+        blank=True,
+        default='',
+        verbose_name=_('Emails'),
+    )
+    global_id = models.TextField(
+        blank=True,
+        default='',
+        verbose_name=_('Global ID'),
+    )
+    registration_ids = models.TextField(
+        blank=True,
+        default='',
+        verbose_name=_('Registration IDs'),
+    )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+    )
+
+    objects = PersonSearchIndexManager()
+
+    class Meta:
+        verbose_name = _('Person search index')
+        verbose_name_plural = _('Person search indexes')
+        indexes = [
+            GinIndex(fields=['search_vector'], name='admission_person_search_vector'),
+            GinIndex(fields=['names'], opclasses=['gin_trgm_ops'], name='admission_person_search_names'),
+            GinIndex(fields=['emails'], opclasses=['gin_trgm_ops'], name='admission_person_search_emails'),
+            GinIndex(fields=['global_id'], opclasses=['gin_trgm_ops'], name='admission_person_search_gid'),
+            GinIndex(fields=['registration_ids'], opclasses=['gin_trgm_ops'], name='admission_person_search_noma'),
+        ]
+
+
+@receiver(post_save, sender=Person)
+def _update_person_search_index(sender, instance, raw=False, update_fields=None, **kwargs):
+    if not raw and (update_fields is None or PERSON_INDEXED_FIELDS.intersection(update_fields)):
+        PersonSearchIndex.objects.synchronize([instance.pk])
+
+
+@receiver(post_save, sender=Student)
+def _update_student_search_index(sender, instance, raw=False, **kwargs):
+    if not raw and instance.person_id:
+        PersonSearchIndex.objects.synchronize([instance.person_id])
+
+
+@receiver(post_delete, sender=Student)
+def _update_deleted_student_search_index(sender, instance, **kwargs):
+    # The person may be deleted in the same transaction
+    if instance.person_id:
+        transaction.on_commit(lambda: PersonSearchIndex.objects.synchronize([instance.person_id]))
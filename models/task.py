@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2024 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -23,9 +23,16 @@
 #    see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
-from django.db import models
+import datetime
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
 
+from django.db import connection, models, transaction
+from django.db.models import Count
+from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
+from osis_async.models.enums import TaskState
+from osis_async.utils import update_task
 
 from admission.models.base import BaseAdmissionQuerySet
 
@@ -44,7 +51,92 @@ class AdmissionTaskQuerySet(BaseAdmissionQuerySet):
 
 
 class AdmissionTaskManager(models.Manager.from_queryset(AdmissionTaskQuerySet)):
-    pass
+    # Delay after which a task still in processing is considered as interrupted for the concurrency limits
+    PROCESSING_TIMEOUT = datetime.timedelta(hours=1)
+    # Keys of the postgres advisory locks serializing the claims and limiting the number of workers
+    CLAIM_LOCK_KEY = 4270
+    WORKER_SLOT_LOCK_KEY = 4271
+
+    @contextmanager
+    def worker_slot(self, workers_count: int) -> Iterator[Optional[int]]:
+        """
+        Reserve one of the workers_count slots allowed to process the tasks until the end of the context and yield
+        its number, or None if all the slots are already reserved by other processes.
+        """
+        slot = None
+        with connection.cursor() as cursor:
+            for current_slot in range(workers_count):
+                cursor.execute('SELECT pg_try_advisory_lock(%s, %s)', [self.WORKER_SLOT_LOCK_KEY, current_slot])
+                if cursor.fetchone()[0]:
+                    slot = current_slot
+                    break
+        try:
+            yield slot
+        finally:
+            if slot is not None:
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT pg_advisory_unlock(%s, %s)', [self.WORKER_SLOT_LOCK_KEY, slot])
+
+    def get_reserved_worker_slots_count(self) -> int:
+        """Return the number of worker slots that are currently reserved."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT COUNT(*) FROM pg_locks "
+                "WHERE locktype = 'advisory' AND granted AND classid = %s AND objsubid = 2",
+                [self.WORKER_SLOT_LOCK_KEY],
+            )
+            return cursor.fetchone()[0]
+
+    def claim_pending_task(
+        self,
+        concurrency_limit_by_type: Optional[Dict[str, int]] = None,
+    ) -> Optional['AdmissionTask']:
+        """
+        Claim the oldest pending task, by marking it as being processed, and return it. The claim is atomic: the
+        tasks that are being claimed by other processes are skipped so that a task can only be claimed once. The
+        task types whose number of tasks being processed has reached their concurrency limit are skipped too.
+        Return None if there is no task to claim.
+        """
+        concurrency_limit_by_type = concurrency_limit_by_type or {}
+
+        with transaction.atomic():
+            saturated_types = []
+
+            if concurrency_limit_by_type:
+                # Serialize the claims until the end of the transaction so that the limits can't be exceeded by
+                # concurrent claims counting the same tasks being processed
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT pg_advisory_xact_lock(%s)', [self.CLAIM_LOCK_KEY])
+
+                processing_tasks_count_by_type = dict(
+                    self.filter(
+                        type__in=concurrency_limit_by_type,
+                        task__state=TaskState.PROCESSING.name,
+                        task__started_at__gte=now() - self.PROCESSING_TIMEOUT,
+                    )
+                    .values('type')
+                    .annotate(count=Count('pk'))
+                    .values_list('type', 'count')
+                )
+                saturated_types = [
+                    task_type
+                    for task_type, limit in concurrency_limit_by_type.items()
+                    if processing_tasks_count_by_type.get(task_type, 0) >= limit
+                ]
+
+            admission_task = (
+                self.select_related('task')
+                .select_for_update(skip_locked=True, of=('self', 'task'))
+                .filter(task__state=TaskState.PENDING.name)
+                .exclude(type__in=saturated_types)
+                .order_by('task__created_at', 'pk')
+                .first()
+            )
+
+            if admission_task is not None:
+                update_task(admission_task.task.uuid, progression=0, state=TaskState.PROCESSING, started_at=now())
+
+        return admission_task
 
 
 class AdmissionTask(models.Model):
@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -26,20 +26,29 @@
 
 import json
 import re
+import time
 import traceback
 import uuid
+from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import pika
 from django.conf import settings
 from django.db import transaction
-from django.db.models import Exists, Max, OuterRef, QuerySet
+from django.db.models import Exists, Max, OuterRef, Prefetch, QuerySet, prefetch_related_objects
 from django.db.models.query_utils import Q
 from osis_history.models.history_entry import HistoryEntry
 from unidecode import unidecode
 
-from admission.constants import CONTEXT_CONTINUING, CONTEXT_DOCTORATE, CONTEXT_GENERAL
+from admission.admission_utils.candidate_trainings_summary import invalidate_candidate_trainings_summaries
+from admission.constants import (
+    CONTEXT_CONTINUING,
+    CONTEXT_DOCTORATE,
+    CONTEXT_GENERAL,
+    EPC_INJECTION_BATCH_SIZE,
+)
 from admission.ddd.admission.doctorat.preparation.commands import (
     RecalculerEmplacementsDocumentsNonLibresPropositionCommand as RecalculerEmplacementsDocumentsNonLibresDoctoratCommand,
 )
@@ -100,7 +109,11 @@ from education_group.models.enums.cohort_name import CohortName
 from infrastructure.messages_bus import message_bus_instance
 from osis_common.queue.queue_sender import logger, send_message
 from osis_common.queue.queue_utils import get_pika_connexion_parameters
-from osis_profile.models import EducationalExperienceYear, ProfessionalExperience
+from osis_profile.models import (
+    EducationalExperience,
+    EducationalExperienceYear,
+    ProfessionalExperience,
+)
 from osis_profile.services.injection_epc import InjectionEPCCurriculum
 
 DOCUMENT_MAPPING = {
@@ -226,6 +239,199 @@ SPORT_TOUT_CAMPUS = [
 ]
 
 
+class ChargeurDonneesInjection:
+    """Récupère, pour une admission, les données liées nécessaires à la construction de son injection."""
+
+    def get_adresses(self, candidat: Person) -> List[PersonAddress]:
+        return list(candidat.personaddress_set.select_related("country").order_by('pk'))
+
+    def get_auteur_autorisation_sic(self, admission: BaseAdmission) -> str:
+        return (
+            HistoryEntry.objects.filter(
+                Q(tags__contains=TAGS_AUTORISATION_SIC) | Q(tags__contains=TAGS_APPROBATION_PROPOSITION),
+                object_uuid=admission.uuid,
+            )
+            .order_by('-created')
+            .first()
+            .author
+        )
+
+    def get_fusion(self, candidat: Person) -> Optional[PersonMergeProposal]:
+        return PersonMergeProposal.objects.filter(original_person=candidat).first()
+
+    def get_client_sap(self, candidat: Person):
+        return candidat.sapclient_set.filter(creation_source=SAPClientCreationSource.OSIS.name).first()
+
+    def get_experiences_educatives_valorisees(
+        self,
+        candidat: Person,
+        admission: BaseAdmission,
+    ) -> List[Tuple[EducationalExperience, List[EducationalExperienceYear]]]:
+        experiences_educatives = (
+            candidat.educationalexperience_set.annotate(
+                valorisee_par_dossier=Exists(
+                    AdmissionEducationalValuatedExperiences.objects.filter(
+                        baseadmission_id=admission.uuid, educationalexperience_id=OuterRef('uuid')
+                    )
+                )
+            )
+            .filter(valorisee_par_dossier=True)
+            .select_related('institute', 'country', 'program')
+        )
+        return [
+            (
+                experience_educative,
+                list(
+                    experience_educative.educationalexperienceyear_set.all()
+                    .select_related("academic_year")
+                    .order_by("academic_year")
+                ),
+            )
+            for experience_educative in experiences_educatives
+        ]
+
+    def get_experiences_professionnelles_valorisees(
+        self,
+        candidat: Person,
+        admission: BaseAdmission,
+    ) -> List[ProfessionalExperience]:
+        return list(
+            candidat.professionalexperience_set.annotate(
+                valorisee_par_dossier=Exists(
+                    AdmissionProfessionalValuatedExperiences.objects.filter(
+                        baseadmission_id=admission.uuid, professionalexperience_id=OuterRef('uuid')
+                    )
+                )
+            )
+            .filter(valorisee_par_dossier=True)
+            .order_by('start_date')
+        )
+
+    def get_questions_documents(self, uuids_questions: Iterable[str]) -> List[AdmissionFormItem]:
+        return list(
+            AdmissionFormItem.objects.filter(
+                uuid__in=uuids_questions,
+                type=TypeItemFormulaire.DOCUMENT.name,
+            )
+        )
+
+
+class ChargeurDonneesInjectionParLot(ChargeurDonneesInjection):
+    """Précharge en un nombre fixe de requêtes les données liées d'un lot d'admissions."""
+
+    def __init__(self, admissions: List[BaseAdmission]):
+        uuids_admissions = [admission.uuid for admission in admissions]
+        candidats = [admission.candidate for admission in admissions]
+
+        prefetch_related_objects(
+            candidats,
+            Prefetch(
+                'personaddress_set',
+                queryset=PersonAddress.objects.select_related('country').order_by('pk'),
+                to_attr='adresses_prechargees',
+            ),
+            Prefetch('sapclient_set', to_attr='clients_sap_precharges'),
+        )
+
+        self.fusions_par_candidat = {
+            fusion.original_person_id: fusion
+            for fusion in PersonMergeProposal.objects.filter(original_person__in=candidats)
+        }
+
+        self.auteurs_autorisation_sic_par_admission = dict(
+            HistoryEntry.objects.filter(
+                Q(tags__contains=TAGS_AUTORISATION_SIC) | Q(tags__contains=TAGS_APPROBATION_PROPOSITION),
+                object_uuid__in=uuids_admissions,
+            )
+            .order_by('object_uuid', '-created')
+            .distinct('object_uuid')
+            .values_list('object_uuid', 'author')
+        )
+
+        self.experiences_educatives_par_admission = defaultdict(list)
+        for valorisation in (
+            AdmissionEducationalValuatedExperiences.objects.filter(baseadmission_id__in=uuids_admissions)
+            .select_related(
+                'educationalexperience__institute',
+                'educationalexperience__country',
+                'educationalexperience__program',
+            )
+            .prefetch_related(
+                Prefetch(
+                    'educationalexperience__educationalexperienceyear_set',
+                    queryset=EducationalExperienceYear.objects.select_related('academic_year').order_by(
+                        'academic_year'
+                    ),
+                    to_attr='annees_prechargees',
+                )
+            )
+        ):
+            self.experiences_educatives_par_admission[valorisation.baseadmission_id].append(
+                (valorisation.educationalexperience, valorisation.educationalexperience.annees_prechargees)
+            )
+
+        self.experiences_professionnelles_par_admission = defaultdict(list)
+        for valorisation in (
+            AdmissionProfessionalValuatedExperiences.objects.filter(baseadmission_id__in=uuids_admissions)
+            .select_related('professionalexperience')
+            .order_by('professionalexperience__start_date')
+        ):
+            self.experiences_professionnelles_par_admission[valorisation.baseadmission_id].append(
+                valorisation.professionalexperience
+            )
+
+        self.questions_documents = {
+            str(question.uuid): question
+            for question in super().get_questions_documents(
+                {
+                    uuid_question
+                    for admission in admissions
+                    for uuid_question in admission.get_specific_question_answers_dict()
+                }
+            )
+        }
+
+    def get_adresses(self, candidat: Person) -> List[PersonAddress]:
+        return candidat.adresses_prechargees
+
+    def get_auteur_autorisation_sic(self, admission: BaseAdmission) -> str:
+        return self.auteurs_autorisation_sic_par_admission[admission.uuid]
+
+    def get_fusion(self, candidat: Person) -> Optional[PersonMergeProposal]:
+        return self.fusions_par_candidat.get(candidat.pk)
+
+    def get_client_sap(self, candidat: Person):
+        return next(
+            (
+                client_sap
+                for client_sap in sorted(candidat.clients_sap_precharges, key=lambda client_sap: client_sap.pk)
+                if client_sap.creation_source == SAPClientCreationSource.OSIS.name
+            ),
+            None,
+        )
+
+    def get_experiences_educatives_valorisees(
+        self,
+        candidat: Person,
+        admission: BaseAdmission,
+    ) -> List[Tuple[EducationalExperience, List[EducationalExperienceYear]]]:
+        return self.experiences_educatives_par_admission[admission.uuid]
+
+    def get_experiences_professionnelles_valorisees(
+        self,
+        candidat: Person,
+        admission: BaseAdmission,
+    ) -> List[ProfessionalExperience]:
+        return self.experiences_professionnelles_par_admission[admission.uuid]
+
+    def get_questions_documents(self, uuids_questions: Iterable[str]) -> List[AdmissionFormItem]:
+        return [
+            self.questions_documents[uuid_question]
+            for uuid_question in uuids_questions
+            if uuid_question in self.questions_documents
+        ]
+
+
 class InjectionEPCAdmission:
     def injecter(self, admission: BaseAdmission):
         logger.info(f"[INJECTION EPC] Recuperation des donnees de l admission avec reference {str(admission)}")
@@ -261,6 +467,117 @@ class InjectionEPCAdmission:
         )
         return donnees
 
+    def injecter_par_lots(self, admissions: Iterable[BaseAdmission], taille_lot: int = EPC_INJECTION_BATCH_SIZE):
+        """Injecte les admissions par lots en chargeant les données de chaque lot en une fois.
+
+        Chaque dossier reste isolé : une erreur lors de la construction ou de l'envoi d'un dossier n'empêche pas
+        l'injection des autres dossiers du lot.
+        """
+        durees = defaultdict(float)
+        lot = []
+        for admission in admissions:
+            lot.append(admission)
+            if len(lot) >= taille_lot:
+                self._injecter_lot(lot, durees)
+                lot = []
+        if lot:
+            self._injecter_lot(lot, durees)
+        durees_etapes = " - ".join(f"{etape} : {duree:.2f}s" for etape, duree in durees.items())
+        logger.info(f"[INJECTION EPC] Injection terminee - {durees_etapes}")
+
+    @staticmethod
+    @contextmanager
+    def _chronometrer(etape: str, durees: Dict[str, float], durees_lot: Dict[str, float]):
+        debut = time.perf_counter()
+        try:
+            yield
+        finally:
+            duree = time.perf_counter() - debut
+            durees[etape] += duree
+            durees_lot[etape] += duree
+
+    def _injecter_lot(self, admissions: List[BaseAdmission], durees: Dict[str, float]):
+        logger.info(f"[INJECTION EPC] Traitement d un lot de {len(admissions)} admissions")
+        durees_lot = defaultdict(float)
+        erreurs = {}  # type: Dict[int, str]
+        donnees_par_admission = {}  # type: Dict[int, Dict]
+
+        with self._chronometrer('nettoyage', durees, durees_lot):
+            for admission in admissions:
+                try:
+                    self._nettoyer_documents_reclames(admission)
+                except Exception as e:
+                    logger.exception(f"[INJECTION EPC] Erreur lors de l'injection : {repr(e)}")
+                    erreurs[admission.pk] = traceback.format_exc()
+
+        with self._chronometrer('prechargement', durees, durees_lot):
+            admissions_a_traiter = [admission for admission in admissions if admission.pk not in erreurs]
+            try:
+                chargeur = ChargeurDonneesInjectionParLot(admissions_a_traiter)
+            except Exception as e:
+                # Le lot ne peut pas être préchargé, les données sont récupérées dossier par dossier
+                logger.exception(f"[INJECTION EPC] Erreur lors du prechargement du lot : {repr(e)}")
+                chargeur = ChargeurDonneesInjection()
+
+        with self._chronometrer('construction', durees, durees_lot):
+            for admission in admissions_a_traiter:
+                try:
+                    donnees_par_admission[admission.pk] = self.recuperer_donnees(admission=admission, chargeur=chargeur)
+                except Exception as e:
+                    logger.exception(f"[INJECTION EPC] Erreur lors de l'injection : {repr(e)}")
+                    erreurs[admission.pk] = traceback.format_exc()
+
+        # Les injections sont enregistrées avant l'envoi pour que le retour d'EPC trouve toujours l'injection
+        with self._chronometrer('enregistrement', durees, durees_lot):
+            for admission in admissions:
+                EPCInjection.objects.update_or_create(
+                    admission=admission,
+                    type=EPCInjectionType.DEMANDE.name,
+                    defaults={
+                        "payload": donnees_par_admission.get(admission.pk, {}),
+                        "status": (
+                            EPCInjectionStatus.OSIS_ERROR.name
+                            if admission.pk in erreurs
+                            else EPCInjectionStatus.PENDING.name
+                        ),
+                        'last_attempt_date': datetime.now(),
+                        "osis_stacktrace": erreurs.get(admission.pk, ""),
+                    },
+                )
+
+        # Comme pour une injection unitaire, les données ne sont envoyées qu'une fois les injections enregistrées
+        transaction.on_commit(
+            lambda: self._envoyer_lot(admissions, donnees_par_admission, len(erreurs), durees, durees_lot)
+        )
+
+    def _envoyer_lot(
+        self,
+        admissions: List[BaseAdmission],
+        donnees_par_admission: Dict[int, Dict],
+        nombre_erreurs: int,
+        durees: Dict[str, float],
+        durees_lot: Dict[str, float],
+    ):
+        with self._chronometrer('envoi', durees, durees_lot):
+            admissions_par_pk = {admission.pk: admission for admission in admissions}
+            erreurs_envoi = self.envoyer_admissions_dans_queue(
+                [
+                    (donnees, str(admissions_par_pk[pk].uuid), str(admissions_par_pk[pk]))
+                    for pk, donnees in donnees_par_admission.items()
+                ]
+            )
+            for admission_uuid, stacktrace in erreurs_envoi.items():
+                EPCInjection.objects.filter(
+                    admission__uuid=admission_uuid,
+                    type=EPCInjectionType.DEMANDE.name,
+                ).update(status=EPCInjectionStatus.OSIS_ERROR.name, osis_stacktrace=stacktrace)
+
+        durees_etapes = " - ".join(f"{etape} : {duree:.2f}s" for etape, duree in durees_lot.items())
+        logger.info(
+            f"[INJECTION EPC] Lot de {len(admissions)} admissions traite ({nombre_erreurs + len(erreurs_envoi)} "
+            f"erreurs) - {durees_etapes}"
+        )
+
     @staticmethod
     def _nettoyer_documents_reclames(admission):
         logger.info("[INJECTION EPC] Nettoyage des documents reclames plus necessaires")
@@ -274,21 +591,22 @@ class InjectionEPCAdmission:
         admission.refresh_from_db(fields=['requested_documents'])
 
     @classmethod
-    def recuperer_donnees(cls, admission: BaseAdmission):
+    def recuperer_donnees(cls, admission: BaseAdmission, chargeur: Optional[ChargeurDonneesInjection] = None):
+        chargeur = chargeur or ChargeurDonneesInjection()
         candidat = admission.candidate  # Person
         comptabilite = getattr(admission, "accounting", None)  # type: Accounting
-        adresses = candidat.personaddress_set.select_related("country")
-        adresse_domicile = adresses.filter(label=PersonAddressType.RESIDENTIAL.name).first()  # type: PersonAddress
+        adresses = chargeur.get_adresses(candidat)
+        adresse_domicile = next(
+            (adresse for adresse in adresses if adresse.label == PersonAddressType.RESIDENTIAL.name),
+            None,
+        )  # type: PersonAddress
         etudes_secondaires, alternative = cls._get_etudes_secondaires(candidat=candidat)
         examens = cls._get_examens(candidat=candidat)
         admission_generale = getattr(admission, 'generaleducationadmission', None)
         admission_iufc = getattr(admission, 'continuingeducationadmission', None)
         admission_doctorat = getattr(admission, 'doctorateadmission', None)
-        documents_specifiques = cls._recuperer_documents_specifiques(admission)
-        auteur_autorisation_sic = HistoryEntry.objects.filter(
-            Q(tags__contains=TAGS_AUTORISATION_SIC) | Q(tags__contains=TAGS_APPROBATION_PROPOSITION),
-            object_uuid=admission.uuid
-        ).order_by('-created').first().author
+        documents_specifiques = cls._recuperer_documents_specifiques(admission, chargeur=chargeur)
+        auteur_autorisation_sic = chargeur.get_auteur_autorisation_sic(admission)
         equivalence_pertinente = (
             admission_generale
             and admission_generale.foreign_access_title_equivalency_type in TypeEquivalenceTitreAcces.types_concernes()
@@ -299,13 +617,24 @@ class InjectionEPCAdmission:
             "signaletique": cls._get_signaletique(
                 candidat=candidat,
                 adresse_domicile=adresse_domicile,
+                fusion=chargeur.get_fusion(candidat),
+            ),
+            "comptabilite": cls._get_comptabilite(
+                comptabilite=comptabilite,
+                client_sap=chargeur.get_client_sap(candidat) if comptabilite else None,
             ),
-            "comptabilite": cls._get_comptabilite(candidat=candidat, comptabilite=comptabilite),
             "etudes_secondaires": etudes_secondaires,
             "examens": examens,
-            "curriculum_academique": cls._get_curriculum_academique(candidat=candidat, admission=admission),
+            "curriculum_academique": cls._get_curriculum_academique(
+                experiences_educatives=chargeur.get_experiences_educatives_valorisees(candidat, admission),
+            ),
             "curriculum_autres": (
-                cls._get_curriculum_autres_activites(candidat=candidat, admission=admission)
+                cls._get_curriculum_autres_activites(
+                    experiences_professionnelles=chargeur.get_experiences_professionnelles_valorisees(
+                        candidat,
+                        admission,
+                    ),
+                )
                 + ([alternative] if alternative else [])
             ),
             "inscription_annee_academique": cls._get_inscription_annee_academique(
@@ -368,13 +697,10 @@ class InjectionEPCAdmission:
         }
 
     @classmethod
-    def _recuperer_documents_specifiques(cls, admission):
+    def _recuperer_documents_specifiques(cls, admission, chargeur: ChargeurDonneesInjection):
         documents_specifiques = []
         specific_question_answers = admission.get_specific_question_answers_dict()
-        form_items = AdmissionFormItem.objects.filter(
-            uuid__in=specific_question_answers.keys(),
-            type=TypeItemFormulaire.DOCUMENT.name,
-        )
+        form_items = chargeur.get_questions_documents(specific_question_answers.keys())
         for form_item in form_items:
             label = form_item.internal_label
             if cls.__contient_uuid_valide(label):
@@ -467,9 +793,13 @@ class InjectionEPCAdmission:
         return False
 
     @classmethod
-    def _get_signaletique(cls, candidat: Person, adresse_domicile: PersonAddress) -> Dict:
+    def _get_signaletique(
+        cls,
+        candidat: Person,
+        adresse_domicile: PersonAddress,
+        fusion: Optional[PersonMergeProposal],
+    ) -> Dict:
         documents = InjectionEPCCurriculum._recuperer_documents(candidat)
-        fusion = PersonMergeProposal.objects.filter(original_person=candidat).first()
         return {
             'noma': fusion.registration_id_sent_to_digit if fusion else '',
             'email': candidat.private_email,
@@ -576,10 +906,9 @@ class InjectionEPCAdmission:
         }
 
     @classmethod
-    def _get_comptabilite(cls, candidat: Person, comptabilite: Accounting) -> Dict:
+    def _get_comptabilite(cls, comptabilite: Accounting, client_sap) -> Dict:
         if comptabilite:
             documents = InjectionEPCCurriculum._recuperer_documents(comptabilite)
-            client_sap = candidat.sapclient_set.filter(creation_source=SAPClientCreationSource.OSIS.name).first()
             return {
                 "client_sap": client_sap.client_number if client_sap else "",
                 "iban": comptabilite.iban_account_number,
@@ -601,26 +930,13 @@ class InjectionEPCAdmission:
         return InjectionEPCCurriculum._get_examens(personne=candidat)
 
     @classmethod
-    def _get_curriculum_academique(cls, candidat: Person, admission: BaseAdmission) -> List[Dict]:
-        experiences_educatives = (
-            candidat.educationalexperience_set.annotate(
-                valorisee_par_dossier=Exists(
-                    AdmissionEducationalValuatedExperiences.objects.filter(
-                        baseadmission_id=admission.uuid, educationalexperience_id=OuterRef('uuid')
-                    )
-                )
-            )
-            .filter(valorisee_par_dossier=True)
-            .select_related('institute', 'country', 'program')
-        )
+    def _get_curriculum_academique(
+        cls,
+        experiences_educatives: List[Tuple[EducationalExperience, List[EducationalExperienceYear]]],
+    ) -> List[Dict]:
         experiences = []
 
-        for experience_educative in experiences_educatives:
-            experiences_educatives_annualisees = (
-                experience_educative.educationalexperienceyear_set.all()
-                .select_related("academic_year")
-                .order_by("academic_year")
-            )
+        for experience_educative, experiences_educatives_annualisees in experiences_educatives:
             exp = []
             for experience_educative_annualisee in experiences_educatives_annualisees:
                 data_annuelle = InjectionEPCCurriculum._build_data_annuelle(
@@ -633,18 +949,10 @@ class InjectionEPCAdmission:
         return experiences
 
     @classmethod
-    def _get_curriculum_autres_activites(cls, candidat: Person, admission: BaseAdmission) -> List[Dict]:
-        experiences_professionnelles = (
-            candidat.professionalexperience_set.annotate(
-                valorisee_par_dossier=Exists(
-                    AdmissionProfessionalValuatedExperiences.objects.filter(
-                        baseadmission_id=admission.uuid, professionalexperience_id=OuterRef('uuid')
-                    )
-                )
-            )
-            .filter(valorisee_par_dossier=True)
-            .order_by('start_date')
-        )
+    def _get_curriculum_autres_activites(
+        cls,
+        experiences_professionnelles: List[ProfessionalExperience],
+    ) -> List[Dict]:
         return [
             InjectionEPCCurriculum._build_curriculum_autre_activite(experience_pro)
             for experience_pro in experiences_professionnelles
@@ -789,6 +1097,41 @@ class InjectionEPCAdmission:
             )
             raise InjectionDemandeVersEPCException(reference=admission_reference) from e
 
+    @staticmethod
+    def envoyer_admissions_dans_queue(admissions: List[Tuple[Dict, str, str]]) -> Dict[str, str]:
+        """
+        Envoie les données de plusieurs admissions (données, uuid, référence) en réutilisant la même connexion.
+        Retourne les traces des erreurs rencontrées, par uuid d'admission.
+        """
+        erreurs = {}
+        if not admissions:
+            return erreurs
+        queue_name = settings.QUEUES.get("QUEUES_NAME").get("ADMISSION_TO_EPC")
+        connect = None
+        channel = None
+        for donnees, admission_uuid, admission_reference in admissions:
+            try:
+                if connect is None or connect.is_closed:
+                    connect = pika.BlockingConnection(get_pika_connexion_parameters(queue_name))
+                    channel = connect.channel()
+                send_message(queue_name, donnees, connect, channel)
+            except (
+                RuntimeError,
+                pika.exceptions.ConnectionClosed,
+                pika.exceptions.ChannelClosed,
+                pika.exceptions.AMQPError,
+            ):
+                logger.exception(
+                    f"[INJECTION EPC] Une erreur est survenue lors de l injection vers EPC de l admission avec uuid "
+                    f"{admission_uuid} et reference {admission_reference}"
+                )
+                erreurs[admission_uuid] = traceback.format_exc()
+                # La connexion est recréée pour l'admission suivante
+                connect = None
+        if connect is not None and connect.is_open:
+            connect.close()
+        return erreurs
+
 
 class InjectionDemandeVersEPCException(Exception):
     def __init__(self, reference: str, **kwargs):
@@ -812,6 +1155,8 @@ def admission_response_from_epc_callback(donnees):
 
     if statut == EPCInjectionStatus.OK.name:
         logger.info("[INJECTION EPC - RETOUR] L injection a ete effectuee avec succes")
+        # Les inscriptions créées par EPC sont importées en masse, sans passer par la sauvegarde des modèles
+        invalidate_candidate_trainings_summaries([epc_injection.admission.candidate_id])
     else:
         erreurs = [f"\t- {erreur['message']}" for erreur in donnees["errors"]]
         logger.error(f"[INJECTION EPC - RETOUR] L injection a echouee pour ce/ces raison(s) : \n" + "\n".join(erreurs))
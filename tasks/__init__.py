@@ -31,6 +31,8 @@ from backoffice.celery import app as celery_app
 from . import check_academic_calendar
 from . import injecter_dossier_a_epc
 from . import process_admission_tasks
+from . import rebuild_doctorate_dashboard_indicators
+from . import synchronize_person_search_index
 from . import verifier_paiements_faits
 
 tasks = {
@@ -50,6 +52,14 @@ tasks = {
         'task': 'admission.tasks.verifier_paiements_faits.run',
         'schedule': crontab(minute=0, hour=1),
     },
+    '|Admission| Rebuild doctorate dashboard indicators': {
+        'task': 'admission.tasks.rebuild_doctorate_dashboard_indicators.run',
+        'schedule': crontab(minute=30, hour=2),  # Every day at 2:30 am
+    },
+    '|Admission| Synchronize person search index': {
+        'task': 'admission.tasks.synchronize_person_search_index.run',
+        'schedule': crontab(minute=15),  # Every hour
+    },
 }
 
 celery_app.conf.beat_schedule.update(tasks)
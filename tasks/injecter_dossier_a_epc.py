@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -57,6 +57,11 @@ def run():  # pragma: no cover
         'doctorateadmission',
         'candidate__personmergeproposal',
         'determined_academic_year',
+        'accounting',
+        'training__academic_year',
+        'training__education_group_type',
+        'candidate__country_of_citizenship',
+        'candidate__birth_country',
     ).filter(
         # Dossier doit être en INSCRIPTION AUTORISEE
         Q(generaleducationadmission__status=ChoixStatutPropositionGenerale.INSCRIPTION_AUTORISEE.name)
@@ -132,7 +137,6 @@ def run():  # pragma: no cover
     logger.info(f"[TASK - INJECTION EPC] {admissions.count()} dossiers a traiter")
     from admission.services.injection_epc.injection_dossier import InjectionEPCAdmission
 
-    for admission in admissions:
-        InjectionEPCAdmission().injecter(admission)
+    InjectionEPCAdmission().injecter_par_lots(admissions)
 
     logger.info(f"[TASK - INJECTION EPC] Traitement termine")
@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -27,12 +27,15 @@
 import os.path
 import uuid
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 from django.db import transaction
 from django.utils.text import slugify
 from osis_document_components.enums import PostProcessingType
 
+from admission.admission_utils.remote_documents import invalidate_remote_documents_cache
+from admission.constants import DOCUMENTS_POST_PROCESSING_WORKERS
 from admission.ddd.admission.doctorat.preparation.commands import (
     RecupererDocumentsPropositionQuery as RecupererDocumentsPropositionDoctoraleQuery,
 )
@@ -56,7 +59,7 @@ from admission.exceptions import (
     InvalidMimeTypeException,
     MergeDocumentsException,
 )
-from admission.infrastructure.utils import get_document_from_identifier
+from admission.infrastructure.utils import get_documents_from_identifiers
 from admission.models import (
     AdmissionFormItem,
     AdmissionTask,
@@ -82,7 +85,7 @@ def base_education_admission_document_merging(admission):
     # Load all documents related to the admission
     documents: List[EmplacementDocumentDTO] = message_bus_instance.invoke(command(uuid_proposition=admission.uuid))
 
-    results = {}
+    post_processings = {}
 
     # If necessary, merge each document field of the proposition into one PDF
     for updated_document in documents:
@@ -115,17 +118,40 @@ def base_education_admission_document_merging(admission):
             post_processing_params[PostProcessingType.CONVERT.name]['output_filename'] = f'{filename}.pdf'
 
         if post_processing_types:
-            results[updated_document.identifiant] = launch_post_processing(
-                uuid_list=updated_document.document_uuids,
-                post_processing_types=post_processing_types,
-                post_process_params=post_processing_params,
-                async_post_processing=False,
-            )
+            post_processings[updated_document.identifiant] = {
+                'uuid_list': updated_document.document_uuids,
+                'post_processing_types': post_processing_types,
+                'post_process_params': post_processing_params,
+                'async_post_processing': False,
+            }
+
+    # The post processings are launched concurrently so that the merging lasts as long as the slowest one
+    results = {}
+    if post_processings:
+        with ThreadPoolExecutor(
+            max_workers=min(DOCUMENTS_POST_PROCESSING_WORKERS, len(post_processings)),
+            thread_name_prefix='admission-documents-merging',
+        ) as executor:
+            futures = {
+                identifier: executor.submit(launch_post_processing, **params)
+                for identifier, params in post_processings.items()
+            }
+            results = {identifier: future.result() for identifier, future in futures.items()}
+
+        # The tokens and metadata of the post-processed files are outdated
+        invalidate_remote_documents_cache(
+            document_uuid for params in post_processings.values() for document_uuid in params['uuid_list']
+        )
 
     updated_fields_by_object = defaultdict(list)
     document_exceptions = {}
 
     # Update the models whose some document fields have been merged
+    updated_documents = get_documents_from_identifiers(
+        admission,
+        [identifier for identifier, result in results.items() if not result.get('error')],
+    )
+
     with transaction.atomic():
         for identifier, result in results.items():
             # An error occurred during the post processing
@@ -133,7 +159,7 @@ def base_education_admission_document_merging(admission):
                 document_exceptions[identifier] = DocumentPostProcessingException(result['error'])
                 continue
 
-            updated_document = get_document_from_identifier(admission, identifier)
+            updated_document = updated_documents[identifier]
 
             # The related field has not been found
             if not updated_document:
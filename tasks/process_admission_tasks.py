@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -27,11 +27,28 @@
 from datetime import datetime
 
 from django.core.management import call_command
+from osis_async.models.enums import TaskState
 
+from admission.constants import ADMISSION_TASKS_WORKERS
+from admission.models import AdmissionTask
 from backoffice.celery import app
 
 
 @app.task
 def run():
-    call_command('process_admission_tasks')
+    # The tasks are claimed atomically by the workers so that they can run concurrently, only the missing workers
+    # are queued
+    missing_workers_count = ADMISSION_TASKS_WORKERS - AdmissionTask.objects.get_reserved_worker_slots_count()
+    if missing_workers_count > 0:
+        pending_tasks_count = AdmissionTask.objects.filter(task__state=TaskState.PENDING.name).count()
+        for _ in range(min(missing_workers_count, pending_tasks_count)):
+            process_tasks.delay()
     return {"Génération des fichiers pour les admissions": datetime.now()}
+
+
+@app.task
+def process_tasks():
+    # The worker stops immediately if the maximum number of workers are already processing the tasks
+    with AdmissionTask.objects.worker_slot(ADMISSION_TASKS_WORKERS) as slot:
+        if slot is not None:
+            call_command('process_admission_tasks')
@@ -26,10 +26,12 @@
 from unittest import mock
 
 from django.contrib.auth.models import User
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 
 from admission.auth.predicates import common
 from admission.auth.predicates.common import is_scoped_entity_manager
+from admission.auth.role_cache import get_role_snapshot
 from admission.auth.roles.central_manager import CentralManager
 from admission.auth.scope import Scope
 from admission.tests.factories import DoctorateAdmissionFactory
@@ -210,3 +212,32 @@ class TestIsEntityManager(TestCase):
         entity_manager.save(update_fields=['scopes'])
         entity_manager_user = User.objects.get(pk=entity_manager_user.pk)
         self.assertTrue(is_scoped_entity_manager(entity_manager_user, admission))
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class RoleSnapshotTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.entity_manager = CentralManagerRoleFactory(scopes=[Scope.GENERAL.name])
+        self.compute = mock.MagicMock(side_effect=lambda: set(self.entity_manager.scopes))
+
+    def get_scopes(self):
+        # A new user instance is used for each call, as for each request
+        user = User.objects.select_related('person').get(pk=self.entity_manager.person.user.pk)
+        return get_role_snapshot(user, CentralManager, 'admission_scopes', self.compute)
+
+    def test_snapshot_is_shared_between_requests(self):
+        self.assertEqual(self.get_scopes(), {Scope.GENERAL.name})
+        self.assertEqual(self.get_scopes(), {Scope.GENERAL.name})
+        self.assertEqual(self.compute.call_count, 1)
+
+    def test_snapshot_is_invalidated_when_a_role_changes(self):
+        self.assertEqual(self.get_scopes(), {Scope.GENERAL.name})
+
+        self.entity_manager.scopes = [Scope.IUFC.name]
+        self.entity_manager.save(update_fields=['scopes'])
+        self.assertEqual(self.get_scopes(), {Scope.IUFC.name})
+
+        CentralManagerRoleFactory(person=self.entity_manager.person, scopes=[Scope.DOCTORAT.name])
+        self.get_scopes()
+        self.assertEqual(self.compute.call_count, 3)
@@ -0,0 +1,241 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import uuid
+from unittest import skipUnless
+
+from django.conf import settings
+from django.core.cache import cache
+from django.shortcuts import resolve_url
+from django.test import RequestFactory, TestCase, tag
+
+from admission.ddd.admission.doctorat.preparation.domain.model.enums import ChoixStatutPropositionDoctorale
+from admission.ddd.admission.formation_continue.domain.model.enums import ChoixStatutPropositionContinue
+from admission.ddd.admission.formation_generale.domain.model.enums import ChoixStatutPropositionGenerale
+from admission.exports.admission_recap.admission_recap import admission_pdf_recap
+from admission.tests.benchmarks.utils import (
+    BENCHMARK_ADMISSIONS_PER_CONTEXT,
+    BENCHMARK_CANDIDATES_COUNT,
+    BENCHMARK_ENABLED,
+    BenchmarkBudget,
+    BenchmarkMixin,
+    DocumentServiceStubMixin,
+)
+from admission.tests.factories.calendar import AdmissionAcademicCalendarFactory
+from admission.tests.factories.continuing_education import (
+    ContinuingEducationAdmissionFactory,
+    ContinuingEducationTrainingFactory,
+)
+from admission.tests.factories.curriculum import (
+    AdmissionEducationalValuatedExperiencesFactory,
+    AdmissionProfessionalValuatedExperiencesFactory,
+    EducationalExperienceFactory,
+    EducationalExperienceYearFactory,
+    ProfessionalExperienceFactory,
+)
+from admission.tests.factories.doctorate import DoctorateAdmissionFactory, DoctorateFactory
+from admission.tests.factories.general_education import (
+    GeneralEducationAdmissionFactory,
+    GeneralEducationTrainingFactory,
+)
+from admission.tests.factories.person import CompletePersonFactory
+from admission.tests.factories.roles import SicManagementRoleFactory
+from admission.views.excel_exports import (
+    AdmissionListExcelExportView,
+    ContinuingAdmissionListExcelExportView,
+    DoctorateAdmissionListExcelExportView,
+)
+from base.models.academic_year import AcademicYear
+from base.models.enums.entity_type import EntityType
+from base.tests.factories.academic_year import AcademicYearFactory
+from base.tests.factories.entity_version import EntityVersionFactory, MainEntityVersionFactory
+from osis_profile.models.enums.curriculum import Result
+
+MB = 1024 * 1024
+
+
+@tag('benchmark')
+@skipUnless(BENCHMARK_ENABLED, 'Set the ADMISSION_BENCHMARK environment variable to run the benchmarks')
+class BackOfficeBenchmarkTestCase(BenchmarkMixin, DocumentServiceStubMixin, TestCase):
+    """
+    Measure the hot paths of the back-office on a synthetic dataset. The size of the dataset, the tolerance of the
+    budgets and the report file can be specified through environment variables (see benchmarks/utils.py). Run it with:
+    ADMISSION_BENCHMARK=1 ./manage.py test admission.tests.benchmarks --tag=benchmark
+    """
+
+    budgets = {
+        'admission_list': BenchmarkBudget(max_queries=50, max_duration=2, max_peak_memory=20 * MB),
+        'general_checklist': BenchmarkBudget(max_queries=250, max_duration=5, max_peak_memory=50 * MB),
+        'general_documents': BenchmarkBudget(max_queries=150, max_duration=3, max_peak_memory=30 * MB),
+        'general_excel_export': BenchmarkBudget(max_queries=30, max_duration=10, max_peak_memory=50 * MB),
+        'continuing_excel_export': BenchmarkBudget(max_queries=40, max_duration=10, max_peak_memory=50 * MB),
+        'doctorate_excel_export': BenchmarkBudget(max_queries=40, max_duration=10, max_peak_memory=50 * MB),
+        'general_pdf_recap': BenchmarkBudget(max_queries=200, max_duration=20, max_peak_memory=100 * MB),
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        AdmissionAcademicCalendarFactory.produce_all_required(current_year=2022)
+        cls.academic_year = AcademicYear.objects.get(year=2022)
+
+        root_entity = MainEntityVersionFactory(acronym='UCL', parent=None, entity_type='').entity
+        faculty_entity = EntityVersionFactory(
+            acronym='FAC',
+            entity_type=EntityType.FACULTY.name,
+            parent=root_entity,
+        ).entity
+        doctoral_commission = EntityVersionFactory(
+            acronym='CDD',
+            entity_type=EntityType.DOCTORAL_COMMISSION.name,
+            parent=root_entity,
+        ).entity
+
+        cls.sic_manager_user = SicManagementRoleFactory(entity=root_entity).person.user
+
+        general_training = GeneralEducationTrainingFactory(
+            management_entity=faculty_entity,
+            academic_year=cls.academic_year,
+        )
+        continuing_training = ContinuingEducationTrainingFactory(
+            management_entity=faculty_entity,
+            academic_year=cls.academic_year,
+        )
+        doctorate_training = DoctorateFactory(
+            management_entity=doctoral_commission,
+            academic_year=cls.academic_year,
+        )
+
+        curriculum_academic_years = [AcademicYearFactory(year=year) for year in [2019, 2020, 2021]]
+        cls.general_admissions = []
+
+        for _ in range(BENCHMARK_CANDIDATES_COUNT):
+            candidate = CompletePersonFactory(language=settings.LANGUAGE_CODE_FR)
+
+            # Curriculum of the candidate
+            educational_experience = EducationalExperienceFactory(person=candidate)
+            for academic_year in curriculum_academic_years:
+                EducationalExperienceYearFactory(
+                    educational_experience=educational_experience,
+                    academic_year=academic_year,
+                    result=Result.SUCCESS.name,
+                )
+            professional_experience = ProfessionalExperienceFactory(person=candidate)
+
+            for _ in range(BENCHMARK_ADMISSIONS_PER_CONTEXT):
+                general_admission = GeneralEducationAdmissionFactory(
+                    candidate=candidate,
+                    training=general_training,
+                    determined_academic_year=cls.academic_year,
+                    status=ChoixStatutPropositionGenerale.CONFIRMEE.name,
+                    curriculum=[uuid.uuid4()],
+                    pdf_recap=[uuid.uuid4()],
+                )
+                AdmissionEducationalValuatedExperiencesFactory(
+                    baseadmission=general_admission,
+                    educationalexperience=educational_experience,
+                )
+                AdmissionProfessionalValuatedExperiencesFactory(
+                    baseadmission=general_admission,
+                    professionalexperience=professional_experience,
+                )
+                cls.general_admissions.append(general_admission)
+
+                ContinuingEducationAdmissionFactory(
+                    candidate=candidate,
+                    training=continuing_training,
+                    determined_academic_year=cls.academic_year,
+                    status=ChoixStatutPropositionContinue.CONFIRMEE.name,
+                    curriculum=[uuid.uuid4()],
+                )
+                DoctorateAdmissionFactory(
+                    candidate=candidate,
+                    training=doctorate_training,
+                    determined_academic_year=cls.academic_year,
+                    status=ChoixStatutPropositionDoctorale.CONFIRMEE.name,
+                    curriculum=[uuid.uuid4()],
+                )
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.client.force_login(user=self.sic_manager_user)
+
+    def _generate_export_rows(self, view_class, filters):
+        request = RequestFactory().get('/', data=filters)
+        request.user = self.sic_manager_user
+
+        view = view_class()
+        view.request = request
+        view.initialize_specific_questions()
+
+        export_filters = view.get_filters()
+        self.assertTrue(export_filters)
+
+        return [view.get_row_data(row) for row in view.get_export_objects(filters=str(export_filters))]
+
+    def test_admission_list(self):
+        response = self.assertWithinBudget(
+            'admission_list',
+            lambda: self.client.get(resolve_url('admission:all-list'), data={'annee_academique': 2022}),
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_general_checklist(self):
+        url = resolve_url('admission:general-education:checklist', uuid=self.general_admissions[0].uuid)
+        response = self.assertWithinBudget('general_checklist', lambda: self.client.get(url))
+        self.assertEqual(response.status_code, 200)
+
+    def test_general_documents(self):
+        url = resolve_url('admission:general-education:documents', uuid=self.general_admissions[0].uuid)
+        response = self.assertWithinBudget('general_documents', lambda: self.client.get(url))
+        self.assertEqual(response.status_code, 200)
+
+    def test_general_excel_export(self):
+        rows = self.assertWithinBudget(
+            'general_excel_export',
+            lambda: self._generate_export_rows(AdmissionListExcelExportView, {'annee_academique': 2022}),
+        )
+        self.assertTrue(rows)
+
+    def test_continuing_excel_export(self):
+        rows = self.assertWithinBudget(
+            'continuing_excel_export',
+            lambda: self._generate_export_rows(ContinuingAdmissionListExcelExportView, {'annee_academique': 2022}),
+        )
+        self.assertTrue(rows)
+
+    def test_doctorate_excel_export(self):
+        rows = self.assertWithinBudget(
+            'doctorate_excel_export',
+            lambda: self._generate_export_rows(DoctorateAdmissionListExcelExportView, {'annee_academique': 2022}),
+        )
+        self.assertTrue(rows)
+
+    def test_general_pdf_recap(self):
+        token = self.assertWithinBudget(
+            'general_pdf_recap',
+            lambda: admission_pdf_recap(self.general_admissions[0], settings.LANGUAGE_CODE),
+        )
+        self.assertEqual(token, 'pdf-token')
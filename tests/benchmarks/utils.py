@@ -0,0 +1,207 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import json
+import os
+import time
+import tracemalloc
+import uuid
+from io import BytesIO
+from typing import Any, Callable, Dict, List, Tuple
+from unittest import mock
+
+import attr
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from pikepdf import Pdf
+
+from base.forms.utils.file_field import PDF_MIME_TYPE
+
+# The benchmarks are only run when explicitly requested, as they are too slow for the usual test runs
+BENCHMARK_ENABLED = bool(os.environ.get('ADMISSION_BENCHMARK'))
+
+# Size of the synthetic dataset
+BENCHMARK_CANDIDATES_COUNT = int(os.environ.get('ADMISSION_BENCHMARK_CANDIDATES', 10))
+BENCHMARK_ADMISSIONS_PER_CONTEXT = int(os.environ.get('ADMISSION_BENCHMARK_ADMISSIONS_PER_CONTEXT', 1))
+
+# Multiplier applied to the durations and memory budgets (e.g. on slow CI runners)
+BENCHMARK_BUDGET_FACTOR = float(os.environ.get('ADMISSION_BENCHMARK_BUDGET_FACTOR', 1))
+
+# Path of the file to which the measures are appended, as JSON lines
+BENCHMARK_REPORT_PATH = os.environ.get('ADMISSION_BENCHMARK_REPORT', '')
+
+
+@attr.dataclass(frozen=True, slots=True)
+class BenchmarkBudget:
+    max_queries: int
+    # In seconds
+    max_duration: float
+    # In bytes
+    max_peak_memory: int
+
+
+@attr.dataclass(frozen=True, slots=True)
+class BenchmarkMeasure:
+    name: str
+    queries_count: int
+    # In seconds
+    duration: float
+    # In bytes
+    peak_memory: int
+
+
+def measure_hot_path(name: str, func: Callable) -> Tuple[BenchmarkMeasure, Any]:
+    """
+    Call the function and measure the number of executed queries, the wall time and the peak of the memory allocated
+    by python during the call. The wall time includes the overhead of the memory tracing.
+    """
+    tracemalloc.start()
+    try:
+        with CaptureQueriesContext(connection) as context:
+            start = time.perf_counter()
+            result = func()
+            duration = time.perf_counter() - start
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return (
+        BenchmarkMeasure(
+            name=name,
+            queries_count=len(context.captured_queries),
+            duration=duration,
+            peak_memory=peak_memory,
+        ),
+        result,
+    )
+
+
+class BenchmarkMixin:
+    """Measure the hot paths of a test case and fail as soon as one of them exceeds its budget."""
+
+    budgets: Dict[str, BenchmarkBudget] = {}
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.measures: List[BenchmarkMeasure] = []
+
+    @classmethod
+    def tearDownClass(cls):
+        if BENCHMARK_REPORT_PATH and cls.measures:
+            with open(BENCHMARK_REPORT_PATH, 'a') as report:
+                for benchmark_measure in cls.measures:
+                    report.write(
+                        json.dumps(
+                            {
+                                **attr.asdict(benchmark_measure),
+                                'candidates': BENCHMARK_CANDIDATES_COUNT,
+                                'admissions_per_context': BENCHMARK_ADMISSIONS_PER_CONTEXT,
+                            }
+                        )
+                        + '\n'
+                    )
+        super().tearDownClass()
+
+    def assertWithinBudget(self, name: str, func: Callable):
+        benchmark_measure, result = measure_hot_path(name, func)
+        self.measures.append(benchmark_measure)
+
+        budget = self.budgets[name]
+        exceeded_budgets = []
+
+        if benchmark_measure.queries_count > budget.max_queries:
+            exceeded_budgets.append(f'{benchmark_measure.queries_count} queries > {budget.max_queries}')
+
+        if benchmark_measure.duration > budget.max_duration * BENCHMARK_BUDGET_FACTOR:
+            exceeded_budgets.append(
+                f'{benchmark_measure.duration:.3f} s > {budget.max_duration * BENCHMARK_BUDGET_FACTOR:.3f} s'
+            )
+
+        if benchmark_measure.peak_memory > budget.max_peak_memory * BENCHMARK_BUDGET_FACTOR:
+            exceeded_budgets.append(
+                f'{benchmark_measure.peak_memory} bytes > {int(budget.max_peak_memory * BENCHMARK_BUDGET_FACTOR)} bytes'
+            )
+
+        if exceeded_budgets:
+            self.fail(f'The budget of "{name}" is exceeded: {", ".join(exceeded_budgets)}')
+
+        return result
+
+
+def get_blank_pdf_content() -> bytes:
+    pdf = Pdf.new()
+    pdf.add_blank_page()
+    content = BytesIO()
+    pdf.save(content)
+    return content.getvalue()
+
+
+class DocumentServiceStubMixin:
+    """Replace the calls to the document service by a local stub returning consistent tokens, metadata and files."""
+
+    document_metadata = {
+        'name': 'myfile.pdf',
+        'mimetype': PDF_MIME_TYPE,
+        'explicit_name': 'My file name',
+        'author': '',
+        'size': 1,
+    }
+
+    def setUp(self):
+        super().setUp()
+
+        pdf_content = get_blank_pdf_content()
+
+        patches = {
+            'osis_document_components.services.get_remote_token': dict(return_value='token'),
+            'osis_document_components.services.get_remote_tokens': dict(
+                side_effect=lambda uuids, **kwargs: {document_uuid: f'token-{document_uuid}' for document_uuid in uuids}
+            ),
+            'osis_document_components.services.get_remote_metadata': dict(return_value=self.document_metadata),
+            'osis_document_components.services.get_several_remote_metadata': dict(
+                side_effect=lambda tokens: {token: self.document_metadata for token in tokens}
+            ),
+            'osis_document_components.services.confirm_remote_upload': dict(
+                side_effect=lambda **kwargs: uuid.uuid4(),
+            ),
+            'osis_document_components.services.change_remote_metadata': dict(return_value='token'),
+            'osis_document_components.fields.FileField._confirm_multiple_upload': dict(
+                side_effect=lambda _, values, __: [
+                    value if isinstance(value, uuid.UUID) else uuid.uuid4() for value in values
+                ],
+            ),
+            'admission.templatetags.admission.get_remote_token': dict(return_value='token'),
+            'admission.templatetags.admission.get_remote_metadata': dict(return_value=self.document_metadata),
+            'admission.exports.admission_recap.attachments.get_raw_content_remotely': dict(return_value=pdf_content),
+            'admission.exports.admission_recap.admission_recap.save_raw_content_remotely': dict(
+                return_value='pdf-token',
+            ),
+        }
+
+        for target, kwargs in patches.items():
+            patcher = mock.patch(target, **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
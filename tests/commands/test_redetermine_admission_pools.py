@@ -0,0 +1,167 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+from osis_history.models import HistoryEntry
+
+from admission.ddd.admission.doctorat.preparation.commands import (
+    DeterminerAnneeAcademiqueEtPotQuery as DeterminerAnneeAcademiqueEtPotDoctoratQuery,
+)
+from admission.ddd.admission.doctorat.preparation.domain.validator.exceptions import IdentificationNonCompleteeException
+from admission.ddd.admission.formation_continue.commands import (
+    DeterminerAnneeAcademiqueEtPotQuery as DeterminerAnneeAcademiqueEtPotContinueQuery,
+)
+from admission.ddd.admission.formation_generale.domain.model.enums import ChoixStatutPropositionGenerale
+from admission.ddd.admission.shared_kernel.dtos.conditions import InfosDetermineesDTO
+from admission.tests.factories.continuing_education import ContinuingEducationAdmissionFactory
+from admission.tests.factories.doctorate import DoctorateAdmissionFactory
+from admission.tests.factories.general_education import GeneralEducationAdmissionFactory
+from base.models.enums.academic_calendar_type import AcademicCalendarTypes
+from base.tests.factories.academic_year import AcademicYearFactory
+
+
+class RedetermineAdmissionPoolsCommandTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.academic_years = AcademicYearFactory.produce(2022, number_past=0, number_future=1)
+        cls.unchanged_admission = GeneralEducationAdmissionFactory(
+            determined_academic_year=cls.academic_years[0],
+            determined_pool=AcademicCalendarTypes.ADMISSION_POOL_UE5_BELGIAN.name,
+            is_in_pursuit=False,
+        )
+        cls.changed_admission = GeneralEducationAdmissionFactory(
+            determined_academic_year=cls.academic_years[0],
+            determined_pool=AcademicCalendarTypes.ADMISSION_POOL_UE5_BELGIAN.name,
+            is_in_pursuit=False,
+        )
+        cls.undetermined_admission = GeneralEducationAdmissionFactory(
+            determined_academic_year=cls.academic_years[0],
+            determined_pool=AcademicCalendarTypes.ADMISSION_POOL_UE5_BELGIAN.name,
+        )
+        cls.submitted_admission = GeneralEducationAdmissionFactory(
+            status=ChoixStatutPropositionGenerale.CONFIRMEE.name,
+            determined_academic_year=cls.academic_years[0],
+        )
+        cls.continuing_admission = ContinuingEducationAdmissionFactory(
+            determined_academic_year=cls.academic_years[0],
+            determined_pool=AcademicCalendarTypes.CONTINUING_EDUCATION_ENROLLMENT.name,
+        )
+        cls.doctorate_admission = DoctorateAdmissionFactory(
+            determined_academic_year=cls.academic_years[0],
+            determined_pool=AcademicCalendarTypes.DOCTORATE_EDUCATION_ENROLLMENT.name,
+        )
+
+    def setUp(self):
+        patcher = patch('infrastructure.messages_bus.message_bus_instance.invoke', side_effect=self.determine_pools)
+        self.invoke_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def determine_pools(self, query):
+        if isinstance(query, DeterminerAnneeAcademiqueEtPotContinueQuery):
+            return InfosDetermineesDTO(annee=2022, pool=AcademicCalendarTypes.CONTINUING_EDUCATION_ENROLLMENT)
+        if isinstance(query, DeterminerAnneeAcademiqueEtPotDoctoratQuery):
+            return InfosDetermineesDTO(annee=2023, pool=AcademicCalendarTypes.DOCTORATE_EDUCATION_ENROLLMENT)
+
+        results = {
+            str(self.unchanged_admission.uuid): InfosDetermineesDTO(
+                annee=2022,
+                pool=AcademicCalendarTypes.ADMISSION_POOL_UE5_BELGIAN,
+                est_en_poursuite=False,
+            ),
+            str(self.changed_admission.uuid): InfosDetermineesDTO(
+                annee=2023,
+                pool=AcademicCalendarTypes.ADMISSION_POOL_HUE5_BELGIUM_RESIDENCY,
+                est_en_poursuite=False,
+            ),
+            str(self.undetermined_admission.uuid): IdentificationNonCompleteeException(),
+        }
+        return {uuid: results[uuid] for uuid in query.uuids_propositions}
+
+    def test_changes_are_only_reported_by_default(self):
+        stdout = StringIO()
+        call_command('redetermine_admission_pools', batch_size=1, workers=1, stdout=stdout)
+
+        output = stdout.getvalue()
+        self.assertIn(f'{self.changed_admission.uuid}: 2022 ADMISSION_POOL_UE5_BELGIAN', output)
+        self.assertIn('-> 2023 ADMISSION_POOL_HUE5_BELGIUM_RESIDENCY', output)
+        self.assertIn(f'{self.doctorate_admission.uuid}: 2022 DOCTORATE_EDUCATION_ENROLLMENT', output)
+        self.assertNotIn(str(self.unchanged_admission.uuid), output)
+        self.assertNotIn(str(self.continuing_admission.uuid), output)
+        self.assertIn('5 admission(s) checked, 2 change(s), 1 admission(s) not determined', output)
+        self.assertEqual(self.invoke_mock.call_count, 5)
+
+        self.changed_admission.refresh_from_db()
+        self.assertEqual(self.changed_admission.determined_academic_year, self.academic_years[0])
+
+    def test_admissions_of_a_context(self):
+        stdout = StringIO()
+        call_command('redetermine_admission_pools', context=['continuing-education'], stdout=stdout)
+
+        self.assertEqual(self.invoke_mock.call_count, 1)
+        self.assertIn('1 admission(s) checked, 0 change(s), 0 admission(s) not determined', stdout.getvalue())
+
+    def test_changes_are_saved_with_apply(self):
+        stdout = StringIO()
+        with (
+            patch(
+                'admission.management.commands.redetermine_admission_pools.invalidate_candidate_trainings_summaries'
+            ) as invalidate_summaries_mock,
+            patch(
+                'admission.management.commands.redetermine_admission_pools.invalidate_admission_permission_cache'
+            ) as invalidate_permission_mock,
+        ):
+            call_command('redetermine_admission_pools', workers=1, apply=True, stdout=stdout)
+
+        self.assertEqual(self.invoke_mock.call_count, 3)
+        self.assertIn('2 admission(s) updated', stdout.getvalue())
+
+        self.changed_admission.refresh_from_db()
+        self.assertEqual(self.changed_admission.determined_academic_year, self.academic_years[1])
+        self.assertEqual(
+            self.changed_admission.determined_pool,
+            AcademicCalendarTypes.ADMISSION_POOL_HUE5_BELGIUM_RESIDENCY.name,
+        )
+
+        self.doctorate_admission.refresh_from_db()
+        self.assertEqual(self.doctorate_admission.determined_academic_year, self.academic_years[1])
+
+        self.undetermined_admission.refresh_from_db()
+        self.assertEqual(self.undetermined_admission.determined_academic_year, self.academic_years[0])
+
+        # The cached data of the updated admissions are invalidated and the changes are historized
+        invalidate_summaries_mock.assert_any_call({self.changed_admission.candidate_id})
+        invalidate_summaries_mock.assert_any_call({self.doctorate_admission.candidate_id})
+        self.assertCountEqual(
+            [call.args[0] for call in invalidate_permission_mock.call_args_list],
+            [str(self.changed_admission.uuid), str(self.doctorate_admission.uuid)],
+        )
+        self.assertCountEqual(
+            HistoryEntry.objects.filter(tags__contains=['pool']).values_list('object_uuid', flat=True),
+            [self.changed_admission.uuid, self.doctorate_admission.uuid],
+        )
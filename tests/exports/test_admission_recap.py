@@ -25,6 +25,7 @@
 # ##############################################################################
 
 import datetime
+import time
 import uuid
 from io import BytesIO
 from typing import Dict, List
@@ -36,9 +37,10 @@ import img2pdf
 import mock
 from django.conf import settings
 from django.shortcuts import resolve_url
-from django.test import override_settings
+from django.test import SimpleTestCase, override_settings
 from osis_async.models import AsyncTask
 from PIL import Image
+from pikepdf import OutlineItem, Pdf, PdfError
 from rest_framework import status
 
 from admission.calendar.admission_calendar import (
@@ -131,6 +133,7 @@ from admission.exports.admission_recap.attachments import Attachment
 from admission.exports.admission_recap.section import (
     get_accounting_section,
     get_authorization_section,
+    get_coordinates_section,
     get_cotutelle_section,
     get_curriculum_section,
     get_dynamic_questions_by_tab,
@@ -413,7 +416,7 @@ class AdmissionRecapTestCase(TestCaseWithQueriesAssertions, QueriesAssertionsMix
         patched = patcher.start()
         patched.new.return_value = mock.MagicMock(pdf_version=1)
         self.outline_root = patched.new.return_value.open_outline.return_value.__enter__.return_value.root = MagicMock()
-        patched.open.return_value.__enter__.return_value = mock.Mock(pdf_version=1, pages=[None])
+        patched.open.return_value = mock.MagicMock(pdf_version=1, pages=[None])
         self.addCleanup(patcher.stop)
 
     def test_attachment_equality(self):
@@ -969,6 +972,101 @@ class AdmissionRecapTestCase(TestCaseWithQueriesAssertions, QueriesAssertionsMix
         self.assertRedirects(response, 'http://dummyurl/file/pdf-token', fetch_redirect_response=False)
 
 
+class FetchAttachmentsRawContentsTestCase(SimpleTestCase):
+    def setUp(self):
+        self.default_content = BytesIO(b'default content')
+
+    @classmethod
+    def get_attachment(cls, identifier, delay=0):
+        def get_raw(token, metadata, default_content):
+            time.sleep(delay)
+            return BytesIO(token.encode())
+
+        return mock.Mock(identifier=identifier, get_raw=mock.Mock(side_effect=get_raw))
+
+    def test_contents_are_returned_in_the_attachments_order(self):
+        from admission.exports.admission_recap.admission_recap import fetch_attachments_raw_contents
+
+        attachments = [self.get_attachment(f'A{index}', delay=(5 - index) / 100) for index in range(5)]
+
+        raw_contents = fetch_attachments_raw_contents(
+            attachments=[(attachment, f'token-{attachment.identifier}', {}) for attachment in attachments],
+            default_content=self.default_content,
+            max_workers=2,
+        )
+
+        self.assertEqual(
+            [raw_content.getvalue() for raw_content in raw_contents],
+            [b'token-A0', b'token-A1', b'token-A2', b'token-A3', b'token-A4'],
+        )
+
+    def test_default_content_is_returned_if_the_attachment_is_not_fetched_in_time(self):
+        from admission.exports.admission_recap.admission_recap import fetch_attachments_raw_contents
+
+        raw_contents = list(
+            fetch_attachments_raw_contents(
+                attachments=[
+                    (self.get_attachment('A0', delay=1), 'token-A0', {}),
+                    (self.get_attachment('A1'), 'token-A1', {}),
+                ],
+                default_content=self.default_content,
+                timeout=0.1,
+            )
+        )
+
+        self.assertEqual(raw_contents[0], self.default_content)
+        self.assertEqual(raw_contents[1].getvalue(), b'token-A1')
+
+
+class SpooledPdfBuilderTestCase(SimpleTestCase):
+    @classmethod
+    def get_pdf_content(cls, page_count):
+        pdf = Pdf.new()
+        for _ in range(page_count):
+            pdf.add_blank_page()
+        content = BytesIO()
+        pdf.save(content)
+        return content
+
+    def test_build_pdf_without_checkpoint(self):
+        from admission.exports.admission_recap.admission_recap import SpooledPdfBuilder
+
+        with SpooledPdfBuilder() as pdf_builder:
+            pdf_builder.append(self.get_pdf_content(2))
+            pdf_builder.append(self.get_pdf_content(1))
+
+            self.assertEqual(pdf_builder.page_count, 3)
+            self.assertEqual(pdf_builder._checkpoint_index, 0)
+
+            with pdf_builder.save([OutlineItem('Section', 2)]) as final_pdf:
+                with Pdf.open(final_pdf) as pdf, pdf.open_outline() as outline:
+                    self.assertEqual(len(pdf.pages), 3)
+                    self.assertEqual([item.title for item in outline.root], ['Section'])
+
+    def test_build_pdf_with_checkpoints(self):
+        from admission.exports.admission_recap.admission_recap import SpooledPdfBuilder
+
+        with SpooledPdfBuilder(max_memory_size=1) as pdf_builder:
+            for page_count in range(1, 4):
+                pdf_builder.append(self.get_pdf_content(page_count))
+
+            self.assertEqual(pdf_builder.page_count, 6)
+            self.assertEqual(pdf_builder._checkpoint_index, 3)
+
+            with pdf_builder.save([]) as final_pdf:
+                with Pdf.open(final_pdf) as pdf:
+                    self.assertEqual(len(pdf.pages), 6)
+
+    def test_append_invalid_content(self):
+        from admission.exports.admission_recap.admission_recap import SpooledPdfBuilder
+
+        with SpooledPdfBuilder() as pdf_builder:
+            with self.assertRaises(PdfError):
+                pdf_builder.append(BytesIO(b'some content'))
+
+            self.assertEqual(pdf_builder.page_count, 0)
+
+
 @freezegun.freeze_time('2023-01-01')
 @override_settings(OSIS_DOCUMENT_BASE_URL='http://dummyurl/')
 class SectionsAttachmentsTestCase(TestCaseWithQueriesAssertions):
@@ -1808,6 +1906,30 @@ class SectionsAttachmentsTestCase(TestCaseWithQueriesAssertions):
         patcher.start()
         self.addCleanup(patcher.stop)
 
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_section_content_is_only_rendered_when_its_data_change(self):
+        with mock.patch('admission.exports.utils.get_pdf_from_template', return_value=b'content') as rendering_mock:
+            first_section = get_coordinates_section(self.continuing_context, True)
+            second_section = get_coordinates_section(self.continuing_context, True)
+
+            rendering_mock.assert_called_once()
+            self.assertEqual(first_section.content, b'content')
+            self.assertEqual(second_section.content, b'content')
+
+            with mock.patch.multiple(self.continuing_context.identification, nom='Other name'):
+                get_coordinates_section(self.continuing_context, True)
+
+            self.assertEqual(rendering_mock.call_count, 2)
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_section_content_is_not_cached_if_its_templates_read_other_data(self):
+        # The identification template checks the permissions of the user
+        with mock.patch('admission.exports.utils.get_pdf_from_template', return_value=b'content') as rendering_mock:
+            get_identification_section(self.continuing_context, True)
+            get_identification_section(self.continuing_context, True)
+
+            self.assertEqual(rendering_mock.call_count, 2)
+
     # Identification attachments
     def test_identification_attachments_without_id_number(self):
         with mock.patch.multiple(
@@ -26,15 +26,24 @@
 from django.test import TestCase
 
 from admission.infrastructure.admission.shared_kernel.domain.service.profil_candidat import (
+    ProfilCandidatPrechargeTranslator,
     ProfilCandidatTranslator,
 )
+from admission.tests.factories.curriculum import (
+    EducationalExperienceFactory,
+    EducationalExperienceYearFactory,
+)
 from admission.tests.factories.general_education import GeneralEducationAdmissionFactory
+from admission.tests.factories.person import CompletePersonFactory
 from admission.tests.factories.secondary_studies import (
     BelgianHighSchoolDiplomaFactory,
     ForeignHighSchoolDiplomaFactory,
     HighSchoolDiplomaAlternativeFactory,
 )
+from base.tests.factories.academic_year import AcademicYearFactory
 from base.tests.factories.person import PersonFactory
+from osis_profile import BE_ISO_CODE
+from reference.tests.factories.country import CountryFactory
 
 
 class ValorisationEtudesSecondairesTestCase(TestCase):
@@ -258,3 +267,66 @@ class ValorisationEtudesSecondairesTestCase(TestCase):
         self.assertTrue(valuation.est_valorise_par_epc)
         self.assertEqual(valuation.types_formations_admissions_valorisees, [])
         self.assertTrue(valuation.est_valorise)
+
+
+class ProfilCandidatPrechargeTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.academic_years = AcademicYearFactory.produce(2020, number_past=1, number_future=1)
+        cls.belgian_candidate = CompletePersonFactory()
+        cls.other_candidate = CompletePersonFactory()
+        cls.candidate_without_address = PersonFactory()
+        cls.matricules = [
+            cls.belgian_candidate.global_id,
+            cls.other_candidate.global_id,
+            cls.candidate_without_address.global_id,
+        ]
+        be_country = CountryFactory(iso_code=BE_ISO_CODE)
+        EducationalExperienceYearFactory(
+            educational_experience=EducationalExperienceFactory(person=cls.belgian_candidate, country=be_country),
+            academic_year=cls.academic_years[0],
+        )
+        EducationalExperienceYearFactory(
+            educational_experience=EducationalExperienceFactory(person=cls.other_candidate),
+            academic_year=cls.academic_years[1],
+        )
+
+    def test_precharger_returns_a_preloading_translator(self):
+        translator = ProfilCandidatTranslator.precharger(self.matricules)
+        self.assertIsInstance(translator, ProfilCandidatPrechargeTranslator)
+
+    def test_preloaded_data_are_the_same_as_the_unitary_ones(self):
+        translator = ProfilCandidatTranslator.precharger(self.matricules)
+        years = [2020, 2021, 2022]
+
+        for matricule in self.matricules:
+            self.assertEqual(
+                translator.get_identification(matricule),
+                ProfilCandidatTranslator.get_identification(matricule),
+            )
+            self.assertEqual(
+                translator.get_coordonnees(matricule),
+                ProfilCandidatTranslator.get_coordonnees(matricule),
+            )
+            self.assertEqual(
+                translator.get_changements_etablissement(matricule, years),
+                ProfilCandidatTranslator.get_changements_etablissement(matricule, years),
+            )
+
+        self.assertEqual(
+            translator.get_changements_etablissement(self.belgian_candidate.global_id, years),
+            {2020: True, 2021: False, 2022: None},
+        )
+
+    def test_data_are_loaded_once_for_all_the_candidates(self):
+        translator = ProfilCandidatTranslator.precharger(self.matricules)
+        years = [2020, 2021]
+
+        translator.get_identification(self.belgian_candidate.global_id)
+        translator.get_coordonnees(self.belgian_candidate.global_id)
+        translator.get_changements_etablissement(self.belgian_candidate.global_id, years)
+
+        with self.assertNumQueries(0):
+            translator.get_identification(self.other_candidate.global_id)
+            translator.get_coordonnees(self.other_candidate.global_id)
+            translator.get_changements_etablissement(self.other_candidate.global_id, years)
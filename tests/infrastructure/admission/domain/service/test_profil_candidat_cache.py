@@ -0,0 +1,88 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from admission.infrastructure.admission.shared_kernel.domain.service.profil_candidat_cache import (
+    bypass_profile_snapshot_cache,
+    get_profile_snapshot,
+)
+from admission.tests.factories.curriculum import ProfessionalExperienceFactory
+from admission.tests.factories.general_education import GeneralEducationAdmissionFactory
+from base.tests.factories.person import PersonFactory
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ProfileSnapshotCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.person = PersonFactory()
+        self.build_snapshot = mock.Mock(side_effect=lambda: {'matricule': self.person.global_id})
+
+    def get_snapshot(self, parameters=('ABC', 2025)):
+        return get_profile_snapshot(self.person.global_id, parameters, self.build_snapshot)
+
+    def test_snapshot_is_built_once_by_parameters(self):
+        snapshot = self.get_snapshot()
+        self.assertEqual(self.get_snapshot(), snapshot)
+        self.assertEqual(self.build_snapshot.call_count, 1)
+
+        self.get_snapshot(parameters=('DEF', 2025))
+        self.assertEqual(self.build_snapshot.call_count, 2)
+
+    def test_snapshot_is_invalidated_when_the_profile_changes(self):
+        self.get_snapshot()
+
+        self.person.first_name = 'John'
+        self.person.save()
+        self.get_snapshot()
+        self.assertEqual(self.build_snapshot.call_count, 2)
+
+        ProfessionalExperienceFactory(person=self.person)
+        self.get_snapshot()
+        self.assertEqual(self.build_snapshot.call_count, 3)
+
+        GeneralEducationAdmissionFactory(candidate=self.person)
+        self.get_snapshot()
+        self.assertEqual(self.build_snapshot.call_count, 4)
+
+    def test_snapshot_is_not_invalidated_when_other_data_change(self):
+        self.get_snapshot()
+
+        PersonFactory()
+        GeneralEducationAdmissionFactory()
+        self.get_snapshot()
+        self.assertEqual(self.build_snapshot.call_count, 1)
+
+    def test_snapshot_cache_can_be_bypassed(self):
+        self.get_snapshot()
+
+        with bypass_profile_snapshot_cache():
+            self.get_snapshot()
+
+        self.assertEqual(self.build_snapshot.call_count, 2)
@@ -0,0 +1,91 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from unittest import mock
+
+import attr
+from django.test import SimpleTestCase
+
+from admission.ddd.admission.formation_generale.commands import (
+    RecupererPropositionGestionnaireQuery,
+    VerifierCurriculumApresSoumissionQuery,
+)
+from admission.infrastructure.message_bus_memoization import memoize_query_handlers, query_memoization_scope
+from osis_common.ddd import interface
+
+
+@attr.dataclass(frozen=True, slots=True)
+class _WriteCommand(interface.CommandRequest):
+    uuid_proposition: str
+
+
+class MessageBusMemoizationTestCase(SimpleTestCase):
+    def setUp(self):
+        self.query_handler = mock.Mock(side_effect=lambda msg_bus, cmd: object())
+        self.not_memoized_query_handler = mock.Mock(side_effect=lambda msg_bus, cmd: object())
+        self.command_handler = mock.Mock()
+        self.handlers = memoize_query_handlers(
+            {
+                VerifierCurriculumApresSoumissionQuery: self.query_handler,
+                RecupererPropositionGestionnaireQuery: self.not_memoized_query_handler,
+                _WriteCommand: self.command_handler,
+            }
+        )
+
+    def invoke(self, cmd):
+        return self.handlers[cmd.__class__](None, cmd)
+
+    def test_queries_are_not_memoized_outside_a_scope(self):
+        self.invoke(VerifierCurriculumApresSoumissionQuery(uuid_proposition='uuid'))
+        self.invoke(VerifierCurriculumApresSoumissionQuery(uuid_proposition='uuid'))
+        self.assertEqual(self.query_handler.call_count, 2)
+
+    def test_memoized_queries_are_handled_once_inside_a_scope(self):
+        with query_memoization_scope() as scope:
+            first_result = self.invoke(VerifierCurriculumApresSoumissionQuery(uuid_proposition='uuid'))
+            self.assertIs(self.invoke(VerifierCurriculumApresSoumissionQuery(uuid_proposition='uuid')), first_result)
+            self.invoke(VerifierCurriculumApresSoumissionQuery(uuid_proposition='other-uuid'))
+            self.invoke(RecupererPropositionGestionnaireQuery(uuid_proposition='uuid'))
+            self.invoke(RecupererPropositionGestionnaireQuery(uuid_proposition='uuid'))
+
+        self.assertEqual(self.query_handler.call_count, 2)
+        self.assertEqual(self.not_memoized_query_handler.call_count, 2)
+        self.assertEqual(scope.hits, 1)
+        self.assertEqual(scope.misses, 2)
+
+        # The results are not kept after the scope
+        with query_memoization_scope():
+            self.invoke(VerifierCurriculumApresSoumissionQuery(uuid_proposition='uuid'))
+        self.assertEqual(self.query_handler.call_count, 3)
+
+    def test_memoized_results_are_forgotten_when_a_write_command_is_handled(self):
+        with query_memoization_scope() as scope:
+            self.invoke(VerifierCurriculumApresSoumissionQuery(uuid_proposition='uuid'))
+            self.invoke(_WriteCommand(uuid_proposition='uuid'))
+            self.invoke(VerifierCurriculumApresSoumissionQuery(uuid_proposition='uuid'))
+
+        self.assertEqual(self.command_handler.call_count, 1)
+        self.assertEqual(self.query_handler.call_count, 2)
+        self.assertEqual(scope.invalidations, 1)
@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2024 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -24,8 +24,10 @@
 #
 # ##############################################################################
 import datetime
+from io import StringIO
 
 import freezegun
+from django.core.management import call_command
 from django.db import IntegrityError
 from django.test import TestCase
 
@@ -39,6 +41,7 @@ from admission.infrastructure.admission.shared_kernel.domain.service.annee_inscr
 )
 from admission.models import AdmissionViewer, ContinuingEducationAdmissionProxy
 from admission.models.base import admission_directory_path, BaseAdmission
+from admission.models.checklist import AdmissionChecklistStatus
 from admission.tests.factories import DoctorateAdmissionFactory
 from admission.tests.factories.admission_viewer import AdmissionViewerFactory
 from admission.tests.factories.continuing_education import ContinuingEducationAdmissionFactory
@@ -52,6 +55,7 @@ from base.tests.factories.education_group_type import EducationGroupTypeFactory
 from base.tests.factories.entity_version import MainEntityVersionFactory, EntityVersionFactory
 from base.tests.factories.person import PersonFactory
 from epc.tests.factories.inscription_programme_annuel import InscriptionProgrammeAnnuelFactory
+from osis_history.models import HistoryEntry
 
 
 class BaseTestCase(TestCase):
@@ -423,3 +427,100 @@ class OtherCandidateTrainingsTestCase(TestCase):
                 self.assertEqual(other_contexts[CONTEXT_DOCTORATE], set())
 
             delattr(self.admission, 'other_candidate_trainings')
+
+
+class AdmissionChecklistStatusTestCase(TestCase):
+    def test_checklist_statuses_are_synchronized_when_the_checklist_is_saved(self):
+        admission = GeneralEducationAdmissionFactory(
+            status=ChoixStatutPropositionGenerale.CONFIRMEE.name,
+            checklist={
+                'current': {
+                    'assimilation': {'statut': 'INITIAL_CANDIDAT', 'libelle': '', 'extra': {}},
+                    'decision_sic': {'statut': 'GEST_EN_COURS', 'libelle': '', 'extra': {'en_cours': 'approval'}},
+                },
+            },
+        )
+
+        self.assertCountEqual(
+            admission.checklist_statuses.values_list('tab', 'status', 'extra_key', 'extra_value'),
+            [
+                ('assimilation', 'INITIAL_CANDIDAT', '', ''),
+                ('decision_sic', 'GEST_EN_COURS', '', ''),
+                ('decision_sic', 'GEST_EN_COURS', 'en_cours', '"approval"'),
+            ],
+        )
+
+        admission.checklist['current']['decision_sic'] = {'statut': 'GEST_REUSSITE', 'libelle': '', 'extra': {}}
+        admission.save(update_fields=['checklist'])
+
+        self.assertCountEqual(
+            admission.checklist_statuses.values_list('tab', 'status', 'extra_key', 'extra_value'),
+            [
+                ('assimilation', 'INITIAL_CANDIDAT', '', ''),
+                ('decision_sic', 'GEST_REUSSITE', '', ''),
+            ],
+        )
+
+    def test_filter_admissions_on_checklist_statuses(self):
+        admission = GeneralEducationAdmissionFactory(
+            status=ChoixStatutPropositionGenerale.CONFIRMEE.name,
+            checklist={
+                'current': {
+                    'decision_sic': {'statut': 'GEST_EN_COURS', 'libelle': '', 'extra': {'en_cours': 'approval'}},
+                },
+            },
+        )
+
+        def filtered_admissions(**kwargs):
+            return list(
+                BaseAdmission.objects.filter(AdmissionChecklistStatus.objects.get_filter(**kwargs)).values_list(
+                    'pk',
+                    flat=True,
+                )
+            )
+
+        self.assertEqual(filtered_admissions(tab='decision_sic', status='GEST_EN_COURS'), [admission.pk])
+        self.assertEqual(filtered_admissions(tab='decision_sic', extra={'en_cours': 'approval'}), [admission.pk])
+        self.assertEqual(
+            filtered_admissions(tab='decision_sic', status='GEST_EN_COURS', extra={'en_cours': 'approval'}),
+            [admission.pk],
+        )
+        self.assertEqual(filtered_admissions(tab='decision_sic', status='GEST_REUSSITE'), [])
+        self.assertEqual(filtered_admissions(tab='decision_sic', extra={'en_cours': 'refusal'}), [])
+        self.assertEqual(filtered_admissions(tab='assimilation'), [])
+
+
+class AdmissionStatusChangeDateTestCase(TestCase):
+    def setUp(self):
+        self.admission = GeneralEducationAdmissionFactory()
+
+    def _create_history_entry(self, tags, created):
+        with freezegun.freeze_time(created):
+            return HistoryEntry.objects.create(object_uuid=self.admission.uuid, tags=tags)
+
+    def test_status_change_date_is_updated_with_the_status_changes_history_entries(self):
+        self._create_history_entry(['proposition', 'message'], datetime.datetime(2024, 1, 1))
+        self.admission.refresh_from_db()
+        self.assertIsNone(self.admission.status_changed_at)
+
+        entry = self._create_history_entry(['proposition', 'status-changed'], datetime.datetime(2024, 1, 2))
+        self.admission.refresh_from_db()
+        self.assertEqual(self.admission.status_changed_at, entry.created)
+
+        queryset = BaseAdmission.objects.annotate_last_status_update()
+        self.assertEqual(queryset.get(pk=self.admission.pk).status_updated_at, entry.created)
+
+    def test_backfill_command(self):
+        first_entry = self._create_history_entry(['proposition', 'status-changed'], datetime.datetime(2024, 1, 2))
+        last_entry = self._create_history_entry(['proposition', 'status-changed'], datetime.datetime(2024, 1, 3))
+        other_admission = GeneralEducationAdmissionFactory()
+        BaseAdmission.objects.update(status_changed_at=first_entry.created)
+
+        stdout = StringIO()
+        call_command('backfill_admission_status_change_dates', batch_size=1, stdout=stdout)
+
+        self.admission.refresh_from_db()
+        other_admission.refresh_from_db()
+        self.assertEqual(self.admission.status_changed_at, last_entry.created)
+        self.assertIsNone(other_admission.status_changed_at)
+        self.assertIn('2 admission(s) updated', stdout.getvalue())
@@ -0,0 +1,128 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from django.test import TestCase
+
+from admission.ddd.admission.doctorat.preparation.domain.model.enums import (
+    ChoixStatutPropositionDoctorale,
+    ChoixTypeAdmission,
+)
+from admission.ddd.admission.doctorat.preparation.read_view.domain.enums.tableau_bord import IndicateurTableauBordEnum
+from admission.models import DoctorateAdmission, DoctorateDashboardIndicatorCount
+from admission.tests.factories import DoctorateAdmissionFactory
+from admission.tests.factories.doctorate import DoctorateFactory
+
+
+class DoctorateDashboardIndicatorCountTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.training = DoctorateFactory()
+        cls.other_training = DoctorateFactory()
+        cls.cdd_id = cls.training.management_entity_id
+        cls.other_cdd_id = cls.other_training.management_entity_id
+        cls.indicators = [
+            IndicateurTableauBordEnum.PRE_ADMISSION_DOSSIER_SOUMIS.name,
+            IndicateurTableauBordEnum.ADMISSION_DOSSIER_SOUMIS.name,
+            IndicateurTableauBordEnum.ADMISSION_AUTORISE_SIC.name,
+        ]
+
+    def get_counts(self, entities_ids=None):
+        return DoctorateDashboardIndicatorCount.objects.get_counts(self.indicators, entities_ids=entities_ids)
+
+    def test_counts_are_updated_when_the_admissions_are_saved_and_deleted(self):
+        admission = DoctorateAdmissionFactory(
+            training=self.training,
+            type=ChoixTypeAdmission.ADMISSION.name,
+            status=ChoixStatutPropositionDoctorale.EN_BROUILLON.name,
+        )
+        DoctorateAdmissionFactory(
+            training=self.other_training,
+            type=ChoixTypeAdmission.PRE_ADMISSION.name,
+            status=ChoixStatutPropositionDoctorale.CONFIRMEE.name,
+        )
+        self.assertEqual(
+            self.get_counts(),
+            {
+                IndicateurTableauBordEnum.PRE_ADMISSION_DOSSIER_SOUMIS.name: 1,
+                IndicateurTableauBordEnum.ADMISSION_DOSSIER_SOUMIS.name: 0,
+                IndicateurTableauBordEnum.ADMISSION_AUTORISE_SIC.name: 0,
+            },
+        )
+
+        # Status change of an admission loaded from the database
+        admission = DoctorateAdmission.objects.get(pk=admission.pk)
+        admission.status = ChoixStatutPropositionDoctorale.CONFIRMEE.name
+        admission.save(update_fields=['status'])
+        admission.save()
+        self.assertEqual(self.get_counts({self.cdd_id})[IndicateurTableauBordEnum.ADMISSION_DOSSIER_SOUMIS.name], 1)
+
+        # Status change made by the repository of the propositions
+        admission, _ = DoctorateAdmission.objects.update_or_create(
+            pk=admission.pk,
+            defaults={'status': ChoixStatutPropositionDoctorale.INSCRIPTION_AUTORISEE.name},
+        )
+        self.assertEqual(
+            self.get_counts({self.cdd_id}),
+            {
+                IndicateurTableauBordEnum.PRE_ADMISSION_DOSSIER_SOUMIS.name: 0,
+                IndicateurTableauBordEnum.ADMISSION_DOSSIER_SOUMIS.name: 0,
+                IndicateurTableauBordEnum.ADMISSION_AUTORISE_SIC.name: 1,
+            },
+        )
+
+        # Change of the management entity through the training
+        admission.training = self.other_training
+        admission.save()
+        self.assertEqual(self.get_counts({self.cdd_id})[IndicateurTableauBordEnum.ADMISSION_AUTORISE_SIC.name], 0)
+        self.assertEqual(
+            self.get_counts({self.other_cdd_id})[IndicateurTableauBordEnum.ADMISSION_AUTORISE_SIC.name],
+            1,
+        )
+
+        admission.delete()
+        self.assertEqual(self.get_counts()[IndicateurTableauBordEnum.ADMISSION_AUTORISE_SIC.name], 0)
+
+    def test_rebuild_fixes_the_changes_made_without_saving_the_admissions(self):
+        admission = DoctorateAdmissionFactory(
+            training=self.training,
+            type=ChoixTypeAdmission.ADMISSION.name,
+            status=ChoixStatutPropositionDoctorale.CONFIRMEE.name,
+        )
+        DoctorateAdmission.objects.filter(pk=admission.pk).update(
+            status=ChoixStatutPropositionDoctorale.INSCRIPTION_AUTORISEE.name,
+        )
+        self.assertEqual(self.get_counts()[IndicateurTableauBordEnum.ADMISSION_DOSSIER_SOUMIS.name], 1)
+        self.assertEqual(self.get_counts()[IndicateurTableauBordEnum.ADMISSION_AUTORISE_SIC.name], 0)
+
+        DoctorateDashboardIndicatorCount.objects.rebuild()
+
+        self.assertEqual(
+            self.get_counts(),
+            {
+                IndicateurTableauBordEnum.PRE_ADMISSION_DOSSIER_SOUMIS.name: 0,
+                IndicateurTableauBordEnum.ADMISSION_DOSSIER_SOUMIS.name: 0,
+                IndicateurTableauBordEnum.ADMISSION_AUTORISE_SIC.name: 1,
+            },
+        )
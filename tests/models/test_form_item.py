@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2024 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -23,8 +23,9 @@
 #    see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.utils.translation import gettext as _
 
 from admission.ddd.admission.shared_kernel.enums.question_specifique import (
@@ -42,6 +43,8 @@ from admission.models.form_item import (
     TRANSLATION_LANGUAGES,
     AdmissionFormItem,
 )
+from admission.tests.factories.form_item import AdmissionFormItemInstantiationFactory
+from admission.tests.factories.general_education import GeneralEducationAdmissionFactory
 from base.forms.utils import FIELD_REQUIRED_MESSAGE
 from base.tests.factories.academic_year import AcademicYearFactory
 from base.tests.factories.education_group import EducationGroupFactory
@@ -512,3 +515,74 @@ class AdmissionFormItemInstantiationTestCase(TestCase):
         with self.assertRaises(ValidationError) as error:
             admission_form_item_instantiation.clean()
             self.assertIn(ValidationError(FIELD_REQUIRED_MESSAGE), error.error_dict.get('education_group', []))
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class AdmissionFormItemsResolutionTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admission = GeneralEducationAdmissionFactory()
+        cls.academic_year = cls.admission.training.academic_year
+        cls.admission.determined_academic_year = cls.academic_year
+        cls.admission.save(update_fields=['determined_academic_year'])
+        cls.other_admission = GeneralEducationAdmissionFactory(
+            training=cls.admission.training,
+            determined_academic_year=cls.academic_year,
+        )
+
+        cls.form_item_for_all_trainings = AdmissionFormItemInstantiationFactory(
+            academic_year=cls.academic_year,
+            weight=1,
+        )
+        cls.form_item_for_the_training = AdmissionFormItemInstantiationFactory(
+            academic_year=cls.academic_year,
+            display_according_education=CritereItemFormulaireFormation.UNE_FORMATION.name,
+            education_group=cls.admission.training.education_group,
+            weight=2,
+        )
+        cls.form_item_for_the_admission = AdmissionFormItemInstantiationFactory(
+            academic_year=cls.academic_year,
+            display_according_education=CritereItemFormulaireFormation.UNE_SEULE_ADMISSION.name,
+            admission=cls.admission,
+            weight=3,
+        )
+        AdmissionFormItemInstantiationFactory(academic_year=AcademicYearFactory(year=cls.academic_year.year + 1))
+
+    def setUp(self):
+        cache.clear()
+
+    def get_form_items(self, admission):
+        return list(
+            AdmissionFormItemInstantiation.objects.form_items_by_admission(admission=admission).order_by(
+                'display_according_education',
+                'weight',
+            )
+        )
+
+    def test_form_items_by_admission(self):
+        self.assertEqual(
+            self.get_form_items(self.admission),
+            [
+                self.form_item_for_all_trainings,
+                self.form_item_for_the_training,
+                self.form_item_for_the_admission,
+            ],
+        )
+        self.assertEqual(
+            self.get_form_items(self.other_admission),
+            [self.form_item_for_all_trainings, self.form_item_for_the_training],
+        )
+
+    def test_form_items_by_admission_are_invalidated_when_an_instantiation_changes(self):
+        self.get_form_items(self.other_admission)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            new_form_item = AdmissionFormItemInstantiationFactory(academic_year=self.academic_year, weight=2)
+        self.assertIn(new_form_item, self.get_form_items(self.other_admission))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.form_item_for_the_training.delete()
+        self.assertEqual(
+            self.get_form_items(self.other_admission),
+            [self.form_item_for_all_trainings, new_form_item],
+        )
@@ -0,0 +1,99 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from django.test import TestCase
+
+from admission.models import PersonSearchIndex
+from admission.models.person_search import get_person_search_filter
+from base.models.person import Person
+from base.tests.factories.person import PersonFactory
+from base.tests.factories.student import StudentFactory
+
+
+class PersonSearchIndexTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.person = PersonFactory(
+            first_name='Éloïse',
+            last_name='Dupont',
+            email='eloise.dupont@example.be',
+            private_email='',
+            global_id='00012345',
+        )
+        cls.other_person = PersonFactory(
+            first_name='Jean',
+            last_name='Martin',
+            email='jean.martin@example.be',
+            private_email='',
+            global_id='00067890',
+        )
+        StudentFactory(person=cls.person, registration_id='98765432')
+
+    def search(self, terms, fields=()):
+        return list(
+            Person.objects.filter(get_person_search_filter(terms, fields=fields))
+            .order_by('last_name')
+            .values_list('last_name', flat=True)
+        )
+
+    def test_index_is_synchronized_with_the_person_and_its_students(self):
+        index = PersonSearchIndex.objects.get(person=self.person)
+        self.assertEqual(index.names, 'eloise dupont')
+        self.assertEqual(index.emails, 'eloise.dupont@example.be')
+        self.assertEqual(index.global_id, '00012345')
+        self.assertEqual(index.registration_ids, '98765432')
+
+        self.person.last_name = 'Durand'
+        self.person.save()
+        StudentFactory(person=self.person, registration_id='12345678')
+
+        index.refresh_from_db()
+        self.assertEqual(index.names, 'eloise durand')
+        self.assertEqual(index.registration_ids, '12345678 98765432')
+
+    def test_search_names_by_prefix_without_accents(self):
+        self.assertEqual(self.search('elo'), ['Dupont'])
+        self.assertEqual(self.search('ÉLO dup'), ['Dupont'])
+        self.assertEqual(self.search('j'), ['Martin'])
+        self.assertEqual(self.search('jean dupont'), [])
+
+    def test_search_names_by_substring(self):
+        self.assertEqual(self.search('pon'), ['Dupont'])
+        self.assertEqual(self.search('on'), [])
+
+    def test_search_other_fields_only_if_specified(self):
+        self.assertEqual(self.search('example.be'), [])
+        self.assertEqual(self.search('example.be', fields=['emails']), ['Dupont', 'Martin'])
+        self.assertEqual(self.search('67890', fields=['global_id']), ['Martin'])
+        self.assertEqual(self.search('8765', fields=['registration_ids']), ['Dupont'])
+
+    def test_missing_index_rows_are_synchronized(self):
+        PersonSearchIndex.objects.filter(person=self.other_person).delete()
+        self.assertEqual(self.search('jean'), [])
+
+        self.assertEqual(PersonSearchIndex.objects.synchronize_missing(), 1)
+        self.assertEqual(PersonSearchIndex.objects.synchronize_missing(), 0)
+
+        self.assertEqual(self.search('jean'), ['Martin'])
@@ -0,0 +1,91 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import datetime
+
+import freezegun
+from django.test import TestCase
+from osis_async.models import AsyncTask
+from osis_async.models.enums import TaskState
+
+from admission.models import AdmissionTask
+from admission.tests.factories import DoctorateAdmissionFactory
+
+
+class AdmissionTaskClaimTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admission = DoctorateAdmissionFactory()
+
+    def create_task(self, task_type, created_at, state=TaskState.PENDING.name):
+        with freezegun.freeze_time(created_at):
+            return AdmissionTask.objects.create(
+                admission=self.admission,
+                type=task_type,
+                task=AsyncTask.objects.create(name='Task', state=state),
+            )
+
+    def test_claim_the_oldest_pending_task(self):
+        newest_task = self.create_task(AdmissionTask.TaskType.ARCHIVE.name, datetime.datetime(2024, 1, 2))
+        oldest_task = self.create_task(AdmissionTask.TaskType.ARCHIVE.name, datetime.datetime(2024, 1, 1))
+        self.create_task(AdmissionTask.TaskType.ARCHIVE.name, datetime.datetime(2023, 1, 1), TaskState.DONE.name)
+
+        claimed_task = AdmissionTask.objects.claim_pending_task()
+        self.assertEqual(claimed_task, oldest_task)
+
+        oldest_task.task.refresh_from_db()
+        self.assertEqual(oldest_task.task.state, TaskState.PROCESSING.name)
+
+        # A claimed task cannot be claimed again
+        self.assertEqual(AdmissionTask.objects.claim_pending_task(), newest_task)
+        self.assertIsNone(AdmissionTask.objects.claim_pending_task())
+
+    def test_claim_a_task_whose_type_has_not_reached_its_concurrency_limit(self):
+        merge_task = self.create_task(AdmissionTask.TaskType.DOCTORATE_MERGE.name, datetime.datetime(2024, 1, 1))
+        recap_task = self.create_task(AdmissionTask.TaskType.DOCTORATE_RECAP.name, datetime.datetime(2024, 1, 2))
+        other_merge_task = self.create_task(AdmissionTask.TaskType.DOCTORATE_MERGE.name, datetime.datetime(2024, 1, 3))
+
+        concurrency_limit_by_type = {AdmissionTask.TaskType.DOCTORATE_MERGE.name: 1}
+
+        self.assertEqual(AdmissionTask.objects.claim_pending_task(concurrency_limit_by_type), merge_task)
+        self.assertEqual(AdmissionTask.objects.claim_pending_task(concurrency_limit_by_type), recap_task)
+        self.assertIsNone(AdmissionTask.objects.claim_pending_task(concurrency_limit_by_type))
+
+        # The limit is released when the processing task is done
+        AsyncTask.objects.filter(pk=merge_task.task.pk).update(state=TaskState.DONE.name)
+        self.assertEqual(AdmissionTask.objects.claim_pending_task(concurrency_limit_by_type), other_merge_task)
+
+    def test_reserve_a_worker_slot(self):
+        self.assertEqual(AdmissionTask.objects.get_reserved_worker_slots_count(), 0)
+
+        with AdmissionTask.objects.worker_slot(workers_count=2) as slot:
+            self.assertEqual(slot, 0)
+            self.assertEqual(AdmissionTask.objects.get_reserved_worker_slots_count(), 1)
+
+        # The slot is released at the end of the context
+        self.assertEqual(AdmissionTask.objects.get_reserved_worker_slots_count(), 0)
+
+        with AdmissionTask.objects.worker_slot(workers_count=0) as slot:
+            self.assertIsNone(slot)
@@ -0,0 +1,315 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import datetime
+import uuid
+from unittest import mock
+
+import pika
+from django.test import TestCase
+
+from admission.infrastructure.admission.formation_generale.domain.service.historique import TAGS_AUTORISATION_SIC
+from admission.models.epc_injection import EPCInjection, EPCInjectionStatus, EPCInjectionType
+from admission.services.injection_epc.injection_dossier import (
+    ChargeurDonneesInjection,
+    ChargeurDonneesInjectionParLot,
+    InjectionEPCAdmission,
+)
+from admission.tests.factories.curriculum import (
+    AdmissionEducationalValuatedExperiencesFactory,
+    AdmissionProfessionalValuatedExperiencesFactory,
+    EducationalExperienceFactory,
+    EducationalExperienceYearFactory,
+    ProfessionalExperienceFactory,
+)
+from admission.tests.factories.form_item import DocumentAdmissionFormItemFactory
+from admission.tests.factories.general_education import GeneralEducationAdmissionFactory
+from admission.tests.factories.history import HistoryEntryFactory
+from base.models.enums.person_address_type import PersonAddressType
+from base.tests.factories.academic_year import AcademicYearFactory
+from base.tests.factories.person_address import PersonAddressFactory
+
+# Constructeurs de l'injection qui ne dépendent pas du chargeur de données : ils renvoient leurs arguments pour que
+# les données fournies par le chargeur puissent être comparées
+CONSTRUCTEURS_DONNEES = [
+    '_get_signaletique',
+    '_get_comptabilite',
+    '_get_examens',
+    '_get_curriculum_academique',
+    '_get_inscription_annee_academique',
+    '_get_inscription_offre',
+    '_get_donnees_comptables',
+    '_get_adresses',
+    '_get_equivalence',
+    '_recuperer_documents_manquants',
+]
+
+
+class ChargeurDonneesInjectionParLotTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.question_document = DocumentAdmissionFormItemFactory(internal_label='DOCUMENT_SPECIFIQUE')
+        cls.annees_academiques = [AcademicYearFactory(year=annee) for annee in [2001, 2000]]
+        cls.admissions = [cls._creer_admission(index) for index in range(3)]
+
+    @classmethod
+    def _creer_admission(cls, index):
+        admission = GeneralEducationAdmissionFactory(
+            specific_question_answers={str(cls.question_document.uuid): [str(uuid.uuid4())]} if index else None,
+        )
+        candidat = admission.candidate
+        PersonAddressFactory(person=candidat, label=PersonAddressType.CONTACT.name)
+        PersonAddressFactory(person=candidat, label=PersonAddressType.RESIDENTIAL.name)
+        HistoryEntryFactory(object_uuid=admission.uuid, tags=TAGS_AUTORISATION_SIC, author=f'Auteur {index}')
+
+        experience_educative = EducationalExperienceFactory(person=candidat)
+        for annee_academique in cls.annees_academiques:
+            EducationalExperienceYearFactory(
+                educational_experience=experience_educative,
+                academic_year=annee_academique,
+            )
+        AdmissionEducationalValuatedExperiencesFactory(
+            baseadmission=admission,
+            educationalexperience=experience_educative,
+        )
+        # Expérience non valorisée par le dossier
+        EducationalExperienceFactory(person=candidat)
+
+        for mois in [6, 1]:
+            AdmissionProfessionalValuatedExperiencesFactory(
+                baseadmission=admission,
+                professionalexperience=ProfessionalExperienceFactory(
+                    person=candidat,
+                    start_date=datetime.date(2020 + index, mois, 1),
+                    end_date=datetime.date(2020 + index, mois, 28),
+                ),
+            )
+        ProfessionalExperienceFactory(person=candidat)
+        return admission
+
+    def setUp(self):
+        for constructeur in CONSTRUCTEURS_DONNEES:
+            patcher = mock.patch.object(InjectionEPCAdmission, constructeur, side_effect=lambda **kwargs: kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(InjectionEPCAdmission, '_get_etudes_secondaires', return_value=({}, None))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(
+            InjectionEPCAdmission,
+            '_get_curriculum_autres_activites',
+            side_effect=lambda **kwargs: [kwargs],
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch(
+            'admission.services.injection_epc.injection_dossier.InjectionEPCCurriculum._recuperer_documents',
+            return_value=[],
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_chargeur_par_lot_renvoie_les_memes_donnees_que_le_chargeur_par_dossier(self):
+        chargeur = ChargeurDonneesInjection()
+        chargeur_par_lot = ChargeurDonneesInjectionParLot(self.admissions)
+
+        for admission in self.admissions:
+            candidat = admission.candidate
+            with self.subTest(admission=admission):
+                self.assertEqual(chargeur_par_lot.get_adresses(candidat), chargeur.get_adresses(candidat))
+                self.assertEqual(
+                    chargeur_par_lot.get_auteur_autorisation_sic(admission),
+                    chargeur.get_auteur_autorisation_sic(admission),
+                )
+                self.assertEqual(chargeur_par_lot.get_fusion(candidat), chargeur.get_fusion(candidat))
+                self.assertEqual(chargeur_par_lot.get_client_sap(candidat), chargeur.get_client_sap(candidat))
+                self.assertEqual(
+                    chargeur_par_lot.get_experiences_educatives_valorisees(candidat, admission),
+                    chargeur.get_experiences_educatives_valorisees(candidat, admission),
+                )
+                self.assertEqual(
+                    chargeur_par_lot.get_experiences_professionnelles_valorisees(candidat, admission),
+                    chargeur.get_experiences_professionnelles_valorisees(candidat, admission),
+                )
+                uuids_questions = admission.get_specific_question_answers_dict().keys()
+                self.assertEqual(
+                    chargeur_par_lot.get_questions_documents(uuids_questions),
+                    chargeur.get_questions_documents(uuids_questions),
+                )
+
+    def test_donnees_par_lot_identiques_aux_donnees_par_dossier(self):
+        chargeur_par_lot = ChargeurDonneesInjectionParLot(self.admissions)
+
+        for admission in self.admissions:
+            with self.subTest(admission=admission):
+                donnees = InjectionEPCAdmission.recuperer_donnees(admission=admission)
+                self.assertEqual(
+                    InjectionEPCAdmission.recuperer_donnees(admission=admission, chargeur=chargeur_par_lot),
+                    donnees,
+                )
+                self.assertEqual(len(donnees['curriculum_academique']['experiences_educatives']), 1)
+                self.assertEqual(len(donnees['curriculum_autres'][0]['experiences_professionnelles']), 2)
+
+
+class InjectionDossierParLotTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admissions = GeneralEducationAdmissionFactory.create_batch(3)
+        cls.admission_en_erreur = cls.admissions[1]
+
+    def setUp(self):
+        patcher = mock.patch.object(InjectionEPCAdmission, '_nettoyer_documents_reclames')
+        self.nettoyer_documents_reclames = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(InjectionEPCAdmission, 'recuperer_donnees', side_effect=self._recuperer_donnees)
+        self.recuperer_donnees = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(InjectionEPCAdmission, 'envoyer_admissions_dans_queue', return_value={})
+        self.envoyer_admissions_dans_queue = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _recuperer_donnees(self, admission, chargeur=None):
+        if admission == self.admission_en_erreur:
+            raise ValueError('Donnees invalides')
+        return {'dossier_uuid': str(admission.uuid)}
+
+    def _get_injection(self, admission):
+        return EPCInjection.objects.get(admission=admission, type=EPCInjectionType.DEMANDE.name)
+
+    def test_injection_par_lots(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            InjectionEPCAdmission().injecter_par_lots(self.admissions, taille_lot=2)
+
+        # Les admissions ne sont envoyées qu'après l'enregistrement des injections
+        self.envoyer_admissions_dans_queue.assert_not_called()
+        self.assertEqual(len(callbacks), 2)
+        for callback in callbacks:
+            callback()
+
+        # Un chargeur de données est créé par lot et partagé par les admissions du lot
+        self.assertEqual(self.recuperer_donnees.call_count, 3)
+        chargeurs = [appel.kwargs['chargeur'] for appel in self.recuperer_donnees.call_args_list]
+        self.assertIsInstance(chargeurs[0], ChargeurDonneesInjectionParLot)
+        self.assertIs(chargeurs[0], chargeurs[1])
+        self.assertIsNot(chargeurs[1], chargeurs[2])
+
+        # Seules les admissions dont les données ont pu être construites sont envoyées
+        self.assertEqual(self.envoyer_admissions_dans_queue.call_count, 2)
+        self.assertEqual(
+            self.envoyer_admissions_dans_queue.call_args_list[0].args[0],
+            [({'dossier_uuid': str(self.admissions[0].uuid)}, str(self.admissions[0].uuid), str(self.admissions[0]))],
+        )
+        self.assertEqual(
+            self.envoyer_admissions_dans_queue.call_args_list[1].args[0],
+            [({'dossier_uuid': str(self.admissions[2].uuid)}, str(self.admissions[2].uuid), str(self.admissions[2]))],
+        )
+
+    def test_erreur_d_une_admission_isolee_du_reste_du_lot(self):
+        InjectionEPCAdmission().injecter_par_lots(self.admissions)
+
+        for admission in [self.admissions[0], self.admissions[2]]:
+            injection = self._get_injection(admission)
+            self.assertEqual(injection.status, EPCInjectionStatus.PENDING.name)
+            self.assertEqual(injection.payload, {'dossier_uuid': str(admission.uuid)})
+            self.assertEqual(injection.osis_stacktrace, '')
+
+        injection = self._get_injection(self.admission_en_erreur)
+        self.assertEqual(injection.status, EPCInjectionStatus.OSIS_ERROR.name)
+        self.assertEqual(injection.payload, {})
+        self.assertIn('Donnees invalides', injection.osis_stacktrace)
+
+    def test_erreur_lors_du_nettoyage_des_documents_isolee_du_reste_du_lot(self):
+        self.admission_en_erreur = None
+        self.nettoyer_documents_reclames.side_effect = [ValueError('Nettoyage impossible'), None, None]
+
+        InjectionEPCAdmission().injecter_par_lots(self.admissions)
+
+        self.assertEqual(self.recuperer_donnees.call_count, 2)
+        injection = self._get_injection(self.admissions[0])
+        self.assertEqual(injection.status, EPCInjectionStatus.OSIS_ERROR.name)
+        self.assertIn('Nettoyage impossible', injection.osis_stacktrace)
+        self.assertEqual(self._get_injection(self.admissions[1]).status, EPCInjectionStatus.PENDING.name)
+        self.assertEqual(self._get_injection(self.admissions[2]).status, EPCInjectionStatus.PENDING.name)
+
+    def test_erreur_lors_de_l_envoi_mise_a_jour_du_statut(self):
+        self.admission_en_erreur = None
+        self.envoyer_admissions_dans_queue.return_value = {str(self.admissions[2].uuid): 'Erreur envoi'}
+
+        with self.captureOnCommitCallbacks(execute=True):
+            InjectionEPCAdmission().injecter_par_lots(self.admissions)
+
+        self.assertEqual(self._get_injection(self.admissions[0]).status, EPCInjectionStatus.PENDING.name)
+        self.assertEqual(self._get_injection(self.admissions[1]).status, EPCInjectionStatus.PENDING.name)
+        injection = self._get_injection(self.admissions[2])
+        self.assertEqual(injection.status, EPCInjectionStatus.OSIS_ERROR.name)
+        self.assertEqual(injection.osis_stacktrace, 'Erreur envoi')
+        # Les données construites restent enregistrées pour une nouvelle tentative
+        self.assertEqual(injection.payload, {'dossier_uuid': str(self.admissions[2].uuid)})
+
+
+@mock.patch('admission.services.injection_epc.injection_dossier.get_pika_connexion_parameters')
+@mock.patch('admission.services.injection_epc.injection_dossier.send_message')
+@mock.patch('admission.services.injection_epc.injection_dossier.pika.BlockingConnection')
+class EnvoiAdmissionsDansQueueTestCase(TestCase):
+    def test_envoi_avec_une_seule_connexion(self, blocking_connection, send_message, _):
+        blocking_connection.return_value.is_closed = False
+        blocking_connection.return_value.is_open = True
+
+        erreurs = InjectionEPCAdmission.envoyer_admissions_dans_queue(
+            [({'dossier': 1}, 'uuid-1', 'ref-1'), ({'dossier': 2}, 'uuid-2', 'ref-2')]
+        )
+
+        self.assertEqual(erreurs, {})
+        blocking_connection.assert_called_once()
+        self.assertEqual(send_message.call_count, 2)
+        blocking_connection.return_value.close.assert_called_once()
+
+    def test_erreur_d_envoi_isolee_et_connexion_recreee(self, blocking_connection, send_message, _):
+        blocking_connection.return_value.is_closed = False
+        blocking_connection.return_value.is_open = True
+        send_message.side_effect = [None, pika.exceptions.AMQPError('Erreur'), None]
+
+        erreurs = InjectionEPCAdmission.envoyer_admissions_dans_queue(
+            [
+                ({'dossier': 1}, 'uuid-1', 'ref-1'),
+                ({'dossier': 2}, 'uuid-2', 'ref-2'),
+                ({'dossier': 3}, 'uuid-3', 'ref-3'),
+            ]
+        )
+
+        self.assertEqual(list(erreurs), ['uuid-2'])
+        self.assertIn('AMQPError', erreurs['uuid-2'])
+        self.assertEqual(send_message.call_count, 3)
+        self.assertEqual(blocking_connection.call_count, 2)
+
+    def test_aucune_connexion_sans_admission(self, blocking_connection, send_message, _):
+        self.assertEqual(InjectionEPCAdmission.envoyer_admissions_dans_queue([]), {})
+        blocking_connection.assert_not_called()
+        send_message.assert_not_called()
@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -24,6 +24,7 @@
 #
 # ##############################################################################
 
+import threading
 import uuid
 from unittest.mock import patch
 
@@ -333,6 +334,32 @@ class MergeAdmissionDocumentsTestCase(APITestCase):
         self.admission.candidate.refresh_from_db()
         self.assertEqual(self.admission.candidate.passport, [self.PDF_MERGE_UUID])
 
+    def test_when_several_documents_must_be_processed_concurrently(self):
+        self.admission.candidate.passport = [
+            self.uuid_documents_by_token['token-passport'],
+            self.uuid_documents_by_token['token-passport-2'],
+        ]
+        self.admission.candidate.save(update_fields=['passport'])
+        self.metadata_by_token['curriculum_file_token']['mimetype'] = PNG_MIME_TYPE
+
+        # Each post processing waits for the other one to be launched
+        barrier = threading.Barrier(2, timeout=5)
+
+        def simulate_concurrent_post_processing(**kwargs):
+            barrier.wait()
+            return self._simulate_post_processing(**kwargs)
+
+        self.launch_post_processing_patcher.side_effect = simulate_concurrent_post_processing
+
+        base_education_admission_document_merging(self.admission)
+
+        self.assertEqual(self.launch_post_processing_patcher.call_count, 2)
+
+        self.admission.refresh_from_db()
+        self.admission.candidate.refresh_from_db()
+        self.assertEqual(self.admission.candidate.passport, [self.PDF_MERGE_UUID])
+        self.assertEqual(self.admission.curriculum, [self.PDF_CONVERT_UUID])
+
     def test_when_several_pdf_and_image_files_must_be_merged(self):
         uuids = [
             self.uuid_documents_by_token['token-passport'],
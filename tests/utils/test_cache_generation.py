@@ -0,0 +1,58 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from admission.admission_utils.cache_generation import bump_generation, get_generation, get_generations
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class CacheGenerationTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_generation_is_initialized_once(self):
+        generation = get_generation('generation')
+        self.assertTrue(generation)
+        self.assertEqual(get_generation('generation'), generation)
+        self.assertEqual(get_generations(['generation']), {'generation': generation})
+
+    def test_generations_are_initialized_together(self):
+        first_generation = get_generation('first')
+        generations = get_generations(['first', 'second'])
+
+        self.assertEqual(generations['first'], first_generation)
+        self.assertEqual(generations['second'], get_generation('second'))
+        self.assertNotEqual(generations['first'], generations['second'])
+
+    def test_bumped_generation_is_replaced(self):
+        generation = get_generation('generation', timeout=None)
+        other_generation = get_generation('other', timeout=None)
+
+        bump_generation('generation', timeout=None)
+
+        self.assertNotEqual(get_generation('generation'), generation)
+        self.assertEqual(get_generation('other'), other_generation)
@@ -0,0 +1,130 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import json
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from admission.admission_utils.candidate_trainings_summary import (
+    get_candidate_trainings_summary,
+    prefetch_candidate_trainings_summaries,
+)
+from admission.constants import CONTEXT_GENERAL
+from admission.ddd.admission.formation_generale.domain.model.enums import ChoixStatutPropositionGenerale
+from admission.models import EPCInjection
+from admission.models.base import BaseAdmission
+from admission.models.epc_injection import EPCInjectionStatus, EPCInjectionType
+from admission.services.injection_epc.injection_dossier import admission_response_from_epc_callback
+from admission.tests.factories.general_education import GeneralEducationAdmissionFactory
+from base.models.enums.education_group_types import TrainingType
+from base.tests.factories.academic_year import AcademicYearFactory
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class CandidateTrainingsSummaryTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.academic_year = AcademicYearFactory(year=2020)
+        cls.admission = GeneralEducationAdmissionFactory(
+            determined_academic_year=cls.academic_year,
+            status=ChoixStatutPropositionGenerale.CONFIRMEE.name,
+        )
+        cls.other_admission = GeneralEducationAdmissionFactory(
+            candidate=cls.admission.candidate,
+            determined_academic_year=cls.academic_year,
+            status=ChoixStatutPropositionGenerale.EN_BROUILLON.name,
+            training__education_group_type__name=TrainingType.MASTER_MC.name,
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_summary_is_cached(self):
+        with self.assertNumQueries(2):
+            get_candidate_trainings_summary(self.admission.candidate_id)
+
+        with self.assertNumQueries(0):
+            summary = get_candidate_trainings_summary(self.admission.candidate_id)
+
+        self.assertEqual(summary.get_other_trainings(self.admission.pk)[CONTEXT_GENERAL], set())
+        self.assertFalse(summary.has_several_admissions_in_progress(self.academic_year.pk))
+
+    def test_summary_is_invalidated_when_an_admission_of_the_candidate_is_saved(self):
+        get_candidate_trainings_summary(self.admission.candidate_id)
+
+        self.other_admission.status = ChoixStatutPropositionGenerale.CONFIRMEE.name
+        self.other_admission.save(update_fields=['status'])
+
+        summary = get_candidate_trainings_summary(self.admission.candidate_id)
+        self.assertEqual(summary.get_other_trainings(self.admission.pk)[CONTEXT_GENERAL], {TrainingType.MASTER_MC.name})
+        self.assertTrue(summary.has_several_admissions_in_progress(self.academic_year.pk))
+        self.assertFalse(summary.has_several_admissions_in_progress(None))
+
+    def test_summary_is_invalidated_when_an_admission_of_the_candidate_is_deleted(self):
+        get_candidate_trainings_summary(self.admission.candidate_id)
+
+        self.other_admission.delete()
+
+        summary = get_candidate_trainings_summary(self.admission.candidate_id)
+        self.assertEqual(summary.get_other_trainings(self.admission.pk)[CONTEXT_GENERAL], set())
+        self.assertEqual(len(summary.admissions), 1)
+
+    def test_summary_is_invalidated_when_the_enrolment_of_an_admission_is_created_by_epc(self):
+        EPCInjection.objects.create(
+            admission=self.admission,
+            type=EPCInjectionType.DEMANDE.name,
+            status=EPCInjectionStatus.PENDING.name,
+        )
+        get_candidate_trainings_summary(self.admission.candidate_id)
+
+        admission_response_from_epc_callback(
+            json.dumps({'dossier_uuid': str(self.admission.uuid), 'status': EPCInjectionStatus.OK.name}).encode()
+        )
+
+        with self.assertNumQueries(2):
+            get_candidate_trainings_summary(self.admission.candidate_id)
+
+    def test_prefetch_summaries_of_several_candidates(self):
+        other_candidate_admission = GeneralEducationAdmissionFactory(
+            determined_academic_year=self.academic_year,
+            status=ChoixStatutPropositionGenerale.CONFIRMEE.name,
+        )
+        admissions = list(
+            BaseAdmission.objects.filter(
+                pk__in=[self.admission.pk, self.other_admission.pk, other_candidate_admission.pk],
+            ).annotate_several_admissions_in_progress()
+        )
+        annotations = {admission.pk: admission.has_several_admissions_in_progress for admission in admissions}
+
+        admissions = list(BaseAdmission.objects.filter(pk__in=annotations))
+
+        with self.assertNumQueries(2):
+            prefetch_candidate_trainings_summaries(admissions)
+
+        with self.assertNumQueries(0):
+            for admission in admissions:
+                self.assertEqual(admission.has_several_admissions_in_progress, annotations[admission.pk])
+                self.assertIsNotNone(admission.other_candidate_trainings)
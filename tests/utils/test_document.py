@@ -27,7 +27,9 @@ import datetime
 import uuid
 from unittest.mock import patch
 
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 from admission.constants import SUPPORTED_MIME_TYPES
 from admission.ddd.admission.formation_generale.domain.model.enums import (
@@ -43,6 +45,7 @@ from admission.ddd.admission.shared_kernel.enums.emplacement_document import (
 from admission.infrastructure.utils import (
     CORRESPONDANCE_CHAMPS_COMPTABILITE,
     get_document_from_identifier,
+    get_documents_from_identifiers,
 )
 from admission.models import (
     ContinuingEducationAdmission,
@@ -1233,3 +1236,81 @@ class TestGetDocumentFromIdentifier(TestCaseWithQueriesAssertions):
         self.assertEqual(document.obj, promoter)
         self.assertEqual(document.field, 'pdf_from_candidate')
         self.assertEqual(document.uuids, promoter.pdf_from_candidate)
+
+
+@override_settings(OSIS_DOCUMENT_BASE_URL='http://dummyurl/')
+class TestGetDocumentsFromIdentifiers(TestCaseWithQueriesAssertions):
+    def setUp(self) -> None:
+        patcher = patch("osis_document_components.services.get_remote_tokens")
+        patched = patcher.start()
+        patched.side_effect = lambda uuids, **kwargs: {uuid: f'token-{uuid}' for uuid in uuids}
+        self.addCleanup(patcher.stop)
+
+        patcher = patch("osis_document_components.services.get_several_remote_metadata")
+        self.get_several_remote_metadata = patcher.start()
+        self.get_several_remote_metadata.side_effect = lambda tokens: {
+            token: {'name': 'myfile', 'author': '0123456', 'mimetype': PDF_MIME_TYPE} for token in tokens
+        }
+        self.addCleanup(patcher.stop)
+
+        patcher = patch(
+            "osis_document_components.fields.FileField._confirm_multiple_upload",
+            side_effect=lambda _, tokens, __: tokens,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.general_admission: GeneralEducationAdmission = GeneralEducationAdmissionFactory()
+
+    def _create_documents_identifiers(self, experiences_nb):
+        identifiers = [f'{OngletsDemande.IDENTIFICATION.name}.PASSEPORT', 'UNKNOWN']
+        for _ in range(experiences_nb):
+            academic_experience = EducationalExperienceFactory(person=self.general_admission.candidate)
+            academic_experience_year = EducationalExperienceYearFactory(educational_experience=academic_experience)
+            non_academic_experience = ProfessionalExperienceFactory(person=self.general_admission.candidate)
+            specific_question = DocumentAdmissionFormItemFactory()
+            identifiers += [
+                f'{OngletsDemande.CURRICULUM.name}.{academic_experience.uuid}.RELEVE_NOTES',
+                f'{OngletsDemande.CURRICULUM.name}.{academic_experience.uuid}.'
+                f'{academic_experience_year.academic_year.year}.RELEVE_NOTES_ANNUEL',
+                f'{OngletsDemande.CURRICULUM.name}.{non_academic_experience.uuid}.CERTIFICAT_EXPERIENCE',
+                f'{OngletsDemande.CURRICULUM.name}.{IdentifiantBaseEmplacementDocument.QUESTION_SPECIFIQUE.name}.'
+                f'{specific_question.uuid}',
+            ]
+        return identifiers
+
+    def test_documents_are_the_same_as_the_ones_retrieved_one_by_one(self):
+        identifiers = self._create_documents_identifiers(experiences_nb=2)
+
+        documents = get_documents_from_identifiers(self.general_admission, identifiers)
+
+        self.assertEqual(list(documents), identifiers)
+        self.assertIsNone(documents['UNKNOWN'])
+
+        with (
+            patch("osis_document_components.services.get_remote_token", return_value='token'),
+            patch(
+                "osis_document_components.services.get_remote_metadata",
+                return_value={'name': 'myfile', 'author': '0123456', 'mimetype': PDF_MIME_TYPE},
+            ),
+        ):
+            for identifier in identifiers:
+                document = get_document_from_identifier(self.general_admission, identifier)
+                self.assertEqual(documents[identifier], document, identifier)
+
+        # The specific question answers have been created once
+        self.assertEqual(SpecificQuestionAnswer.objects.filter(admission=self.general_admission).count(), 2)
+
+    def test_queries_number_does_not_depend_on_the_documents_number(self):
+        queries_numbers = []
+
+        for experiences_nb in [1, 4]:
+            identifiers = self._create_documents_identifiers(experiences_nb=experiences_nb)
+            admission = GeneralEducationAdmission.objects.get(pk=self.general_admission.pk)
+
+            with CaptureQueriesContext(connection) as context:
+                get_documents_from_identifiers(admission, identifiers)
+
+            queries_numbers.append(len(context.captured_queries))
+
+        self.assertEqual(queries_numbers[0], queries_numbers[1])
@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2024 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -23,10 +23,11 @@
 #  see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 
+from admission.admission_utils.entity_closure import get_entities_with_descendants_ids
 from admission.infrastructure.admission.formation_generale.domain.service.pdf_generation import ENTITY_UCL
-from admission.infrastructure.utils import get_entities_with_descendants_ids
 from base.models.enums.entity_type import EntityType
 from base.tests.factories.entity_version import EntityVersionFactory, MainEntityVersionFactory
 
@@ -96,3 +97,52 @@ class EntitiesComputationTestCase(TestCase):
         )
 
         self.assertCountEqual(entities, [self.first_school_b_entity.entity.id, self.faculty_b_entity.entity.id])
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class CachedEntitiesComputationTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.ucl_entity = MainEntityVersionFactory(acronym=ENTITY_UCL, entity_type='')
+        cls.faculty_entity = EntityVersionFactory(parent=cls.ucl_entity.entity, entity_type=EntityType.FACULTY.name)
+        cls.school_entity = EntityVersionFactory(
+            parent=cls.faculty_entity.entity,
+            entity_type=EntityType.SCHOOL.name,
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_get_entities_with_descendants_ids_uses_the_cached_closure(self):
+        with self.assertNumQueries(1):
+            entities = get_entities_with_descendants_ids(entities_acronyms=[self.faculty_entity.acronym])
+
+        self.assertCountEqual(entities, [self.faculty_entity.entity.id, self.school_entity.entity.id])
+
+        with self.assertNumQueries(0):
+            entities = get_entities_with_descendants_ids(entities_acronyms=[self.faculty_entity.acronym])
+
+        self.assertCountEqual(entities, [self.faculty_entity.entity.id, self.school_entity.entity.id])
+
+    def test_get_entities_with_descendants_ids_after_an_entity_version_change(self):
+        get_entities_with_descendants_ids(entities_acronyms=[self.faculty_entity.acronym])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            new_school_entity = EntityVersionFactory(
+                parent=self.faculty_entity.entity,
+                entity_type=EntityType.SCHOOL.name,
+            )
+
+        entities = get_entities_with_descendants_ids(entities_acronyms=[self.faculty_entity.acronym])
+
+        self.assertCountEqual(
+            entities,
+            [self.faculty_entity.entity.id, self.school_entity.entity.id, new_school_entity.entity.id],
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            new_school_entity.delete()
+
+        entities = get_entities_with_descendants_ids(entities_acronyms=[self.faculty_entity.acronym])
+
+        self.assertCountEqual(entities, [self.faculty_entity.entity.id, self.school_entity.entity.id])
@@ -0,0 +1,113 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from admission.admission_utils.permission_cache import (
+    HITS,
+    MISSES,
+    get_cached_permission_object,
+    get_permission_cache_metrics,
+    invalidate_admission_permission_cache,
+    invalidate_candidate_permission_cache,
+    invalidate_training_permission_cache,
+    reset_permission_cache_metrics,
+)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class PermissionCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        reset_permission_cache_metrics()
+        self.load_object = MagicMock(side_effect=lambda: SimpleNamespace(training_id=1, candidate_id=2))
+        self.load_ids = MagicMock(return_value=(1, 2))
+
+    def get_cached_permission_object(self, admission_uuid='uuid'):
+        return get_cached_permission_object(admission_uuid, self.load_object, self.load_ids)
+
+    def test_object_is_loaded_once(self):
+        first_object = self.get_cached_permission_object()
+        self.assertEqual(self.get_cached_permission_object(), first_object)
+        self.assertEqual(self.load_object.call_count, 1)
+
+        metrics = get_permission_cache_metrics()
+        self.assertEqual(metrics[HITS], 1)
+        self.assertEqual(metrics[MISSES], 1)
+        self.assertEqual(metrics['hit_ratio'], 0.5)
+
+    def test_object_is_reloaded_after_invalidation(self):
+        for invalidate in [
+            lambda: invalidate_admission_permission_cache('uuid'),
+            lambda: invalidate_training_permission_cache(1),
+            lambda: invalidate_candidate_permission_cache(2),
+        ]:
+            self.get_cached_permission_object()
+            self.load_object.reset_mock()
+
+            invalidate()
+
+            self.get_cached_permission_object()
+            self.assertEqual(self.load_object.call_count, 1)
+
+    def test_object_is_not_reloaded_after_invalidation_of_other_training_or_candidate(self):
+        self.get_cached_permission_object()
+
+        invalidate_training_permission_cache(3)
+        invalidate_candidate_permission_cache(3)
+        invalidate_admission_permission_cache('other-uuid')
+
+        self.get_cached_permission_object()
+        self.assertEqual(self.load_object.call_count, 1)
+
+    def test_object_is_reloaded_after_invalidation_during_its_loading(self):
+        def load_object():
+            invalidate_training_permission_cache(1)
+            return SimpleNamespace(training_id=1, candidate_id=2)
+
+        self.load_object.side_effect = load_object
+        self.get_cached_permission_object()
+
+        self.load_object.side_effect = None
+        self.load_object.return_value = SimpleNamespace(training_id=1, candidate_id=2)
+        self.get_cached_permission_object()
+        self.get_cached_permission_object()
+        self.assertEqual(self.load_object.call_count, 2)
+
+    def test_object_is_not_cached_if_its_training_has_changed_during_its_loading(self):
+        self.load_object.side_effect = lambda: SimpleNamespace(training_id=3, candidate_id=2)
+
+        self.get_cached_permission_object()
+        self.get_cached_permission_object()
+        self.assertEqual(self.load_object.call_count, 2)
+
+        self.load_ids.return_value = (3, 2)
+        self.get_cached_permission_object()
+        self.get_cached_permission_object()
+        self.assertEqual(self.load_object.call_count, 3)
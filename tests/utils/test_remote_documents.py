@@ -0,0 +1,92 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from admission.admission_utils.remote_documents import (
+    get_cached_remote_metadata,
+    get_cached_remote_tokens,
+    invalidate_remote_documents_cache,
+)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class RemoteDocumentsCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+        patcher = mock.patch('osis_document_components.services.get_remote_tokens')
+        self.get_remote_tokens = patcher.start()
+        self.get_remote_tokens.side_effect = lambda uuids, **kwargs: {uuid: f'token-{uuid}' for uuid in uuids}
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch('osis_document_components.services.get_several_remote_metadata')
+        self.get_several_remote_metadata = patcher.start()
+        self.get_several_remote_metadata.side_effect = lambda tokens: {token: {'name': token} for token in tokens}
+        self.addCleanup(patcher.stop)
+
+    def test_tokens_are_generated_once(self):
+        self.assertEqual(get_cached_remote_tokens(['a']), {'a': 'token-a'})
+        self.assertEqual(get_cached_remote_tokens(['a', 'b']), {'a': 'token-a', 'b': 'token-b'})
+
+        self.assertEqual(self.get_remote_tokens.call_count, 2)
+        self.assertEqual(self.get_remote_tokens.call_args[0][0], ['b'])
+
+        # The tokens depend on the requested version of the file
+        get_cached_remote_tokens(['a'], for_modified_upload=True)
+        self.assertEqual(self.get_remote_tokens.call_count, 3)
+
+    def test_metadata_are_retrieved_once(self):
+        self.assertEqual(get_cached_remote_metadata(['a', 'b']), {'a': {'name': 'token-a'}, 'b': {'name': 'token-b'}})
+        self.assertEqual(get_cached_remote_metadata(['a', 'b']), {'a': {'name': 'token-a'}, 'b': {'name': 'token-b'}})
+
+        self.assertEqual(self.get_remote_tokens.call_count, 1)
+        self.assertEqual(self.get_several_remote_metadata.call_count, 1)
+
+    def test_missing_metadata_are_not_cached(self):
+        self.get_several_remote_metadata.side_effect = lambda tokens: {}
+
+        self.assertEqual(get_cached_remote_metadata(['a']), {})
+        self.assertEqual(get_cached_remote_metadata(['a']), {})
+
+        self.assertEqual(self.get_several_remote_metadata.call_count, 2)
+
+    def test_metadata_are_retrieved_with_the_specified_tokens(self):
+        self.assertEqual(get_cached_remote_metadata(['a'], tokens={'a': 'other-token'}), {'a': {'name': 'other-token'}})
+        self.get_remote_tokens.assert_not_called()
+
+    def test_invalidation(self):
+        get_cached_remote_metadata(['a', 'b'], for_modified_upload=True, wanted_post_process='ORIGINAL')
+
+        invalidate_remote_documents_cache(['a'])
+
+        get_cached_remote_metadata(['a', 'b'], for_modified_upload=True, wanted_post_process='ORIGINAL')
+
+        self.assertEqual(self.get_remote_tokens.call_count, 2)
+        self.assertEqual(self.get_remote_tokens.call_args[0][0], ['a'])
+        self.assertEqual(self.get_several_remote_metadata.call_args[0][0], ['token-a'])
@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -512,6 +512,15 @@ class DoctorateAdmissionListTestCase(QueriesAssertionsMixin, TestCase):
         hidden_fields_names = [field.name for field in form.hidden_fields()]
         self.assertIn('cdds', hidden_fields_names)
 
+        # Check that the number of admissions of the CDD is displayed for each indicator
+        indicators_labels = dict(
+            indicator
+            for _, category_indicators in form.fields['indicateur_tableau_bord'].choices[1:]
+            for indicator in category_indicators
+        )
+        self.assertTrue(indicators_labels[IndicateurTableauBordEnum.ADMISSION_DOSSIER_SOUMIS.name].endswith(' (1)'))
+        self.assertTrue(indicators_labels[IndicateurTableauBordEnum.ADMISSION_AUTORISE_SIC.name].endswith(' (0)'))
+
     def test_form_initialization_for_a_central_manager_having_several_cdds(self):
         self.client.force_login(user=self.user_with_several_cdds)
 
@@ -27,6 +27,8 @@
 import ast
 import datetime
 import json
+import uuid
+from io import BytesIO
 from typing import List
 from unittest import mock
 
@@ -36,6 +38,7 @@ from django.contrib.auth.models import User
 from django.test import RequestFactory, TestCase, override_settings
 from django.urls import reverse
 from django.utils.translation import gettext as _, pgettext, pgettext_lazy
+from openpyxl import load_workbook
 from openpyxl.workbook import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
 from osis_async.models import AsyncTask
@@ -85,6 +88,7 @@ from admission.ddd.admission.shared_kernel.tests.factory.profil import (
     ExperienceAcademiqueDTOFactory,
     ExperienceNonAcademiqueDTOFactory,
 )
+from admission.exports.utils import copy_worksheet_into_write_only_workbook
 from admission.models.specific_question import SpecificQuestionAnswer
 from admission.tests.factories import DoctorateAdmissionFactory
 from admission.tests.factories.admission_viewer import AdmissionViewerFactory
@@ -119,7 +123,9 @@ from admission.tests.factories.supervision import (
     ExternalPromoterFactory,
     PromoterFactory,
 )
+from admission.views import PaginatedList
 from admission.views.excel_exports import (
+    EXPORT_TASK_UUID_FILTER,
     SPECIFIC_QUESTION_SEPARATOR,
     SPECIFIC_QUESTION_SEPARATOR_REPLACEMENT,
     AdmissionListExcelExportView,
@@ -429,6 +435,7 @@ class AdmissionListExcelExportViewTestCase(QueriesAssertionsMixin, TestCase):
         filters = ast.literal_eval(export.filters)
         self.assertEqual(filters.get('annee_academique'), self.default_params.get('annee_academique'))
         self.assertEqual(filters.get('demandeur'), self.default_params.get('demandeur'))
+        self.assertEqual(filters.get(EXPORT_TASK_UUID_FILTER), str(task.uuid))
 
     def test_export_with_sic_management_user_with_filters_and_asc_ordering(self):
         self.client.force_login(user=self.sic_management_user)
@@ -994,7 +1001,7 @@ class ContinuingAdmissionListExcelExportViewTestCase(QueriesAssertionsMixin, Tes
         view.initialize_specific_questions()
         header = view.get_header()
 
-        row_data = view.get_row_data(self.admission.uuid)
+        row_data = view.get_row_data(next(view.get_rows([self.admission.uuid])))
 
         self.assertEqual(len(header), len(row_data))
 
@@ -1089,7 +1096,7 @@ class ContinuingAdmissionListExcelExportViewTestCase(QueriesAssertionsMixin, Tes
             educationalexperience=new_experience,
         )
 
-        row_data = view.get_row_data(self.admission.uuid)
+        row_data = view.get_row_data(next(view.get_rows([self.admission.uuid])))
 
         # Last UCL registration
         self.assertStrEqual(row_data[13], 'non')
@@ -1105,6 +1112,25 @@ class ContinuingAdmissionListExcelExportViewTestCase(QueriesAssertionsMixin, Tes
         # Billing address
         self.assertStrEqual(row_data[39], f'University street 2 - 1348 Louvain-la-Neuve - {self.address_country_name}')
 
+    def test_export_rows_are_loaded_by_batches(self):
+        other_admission = ContinuingEducationAdmissionFactory(
+            training__management_entity=self.first_entity,
+            status=ChoixStatutPropositionContinue.CONFIRMEE.name,
+        )
+
+        view = ContinuingAdmissionListExcelExportView()
+        view.batch_size = 1
+
+        rows = list(view.get_rows([other_admission.uuid, uuid.uuid4(), self.admission.uuid]))
+
+        self.assertEqual(len(rows), 2)
+
+        self.assertEqual(rows[0][0].proposition.uuid, str(other_admission.uuid))
+        self.assertIsNone(rows[0][1])
+
+        self.assertEqual(rows[1][0].proposition.uuid, str(self.admission.uuid))
+        self.assertEqual(rows[1][1].content, 'TEST')
+
     def test_last_experience_with_diploma(self):
         # No experience
         experiences = []
@@ -1916,3 +1942,101 @@ class DoctorateAdmissionListExcelExportViewTestCase(QueriesAssertionsMixin, Test
         self.assertStrEqual(values[20], '')
         self.assertStrEqual(values[21], '{}')
         self.assertStrEqual(values[22], '')
+
+
+class StreamingExcelExportTestCase(TestCase):
+    def test_write_export_rows_by_chunks_and_update_the_task_progression(self):
+        view = AdmissionListExcelExportView()
+        task_uuid = uuid.uuid4()
+
+        template_workbook = Workbook()
+        template_workbook.active.append(['Header 1', 'Header 2'])
+        template_workbook.active.column_dimensions['A'].width = 30
+
+        workbook = Workbook(write_only=True)
+        worksheet = copy_worksheet_into_write_only_workbook(template_workbook.active, workbook)
+
+        with (
+            mock.patch.object(view, 'get_row_data', side_effect=lambda row: [row, row * 2]),
+            mock.patch(
+                'admission.views.excel_exports.EXPORT_STREAMING_CHUNK_SIZE',
+                2,
+            ),
+            mock.patch('admission.views.excel_exports.update_task') as update_task_mock,
+        ):
+            view.write_export_rows(worksheet=worksheet, export_objects=[1, 2, 3, 4, 5], task_uuid=task_uuid)
+
+        self.assertEqual(
+            update_task_mock.call_args_list,
+            [
+                mock.call(task_uuid, progression=40),
+                mock.call(task_uuid, progression=80),
+                mock.call(task_uuid, progression=99),
+            ],
+        )
+
+        file = BytesIO()
+        workbook.save(file)
+        saved_worksheet = load_workbook(file).active
+
+        self.assertEqual(
+            list(saved_worksheet.iter_rows(values_only=True)),
+            [('Header 1', 'Header 2'), (1, 2), (2, 4), (3, 6), (4, 8), (5, 10)],
+        )
+        self.assertEqual(saved_worksheet.column_dimensions['A'].width, 30)
+
+    def test_write_export_rows_of_unsized_export_objects(self):
+        view = ContinuingAdmissionListExcelExportView()
+        view.export_objects_count = 4
+        task_uuid = uuid.uuid4()
+
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet()
+
+        with (
+            mock.patch.object(view, 'get_row_data', side_effect=lambda row: [row]),
+            mock.patch(
+                'admission.views.excel_exports.EXPORT_STREAMING_CHUNK_SIZE',
+                3,
+            ),
+            mock.patch('admission.views.excel_exports.update_task') as update_task_mock,
+        ):
+            view.write_export_rows(worksheet=worksheet, export_objects=iter(range(4)), task_uuid=task_uuid)
+
+        self.assertEqual(
+            update_task_mock.call_args_list,
+            [
+                mock.call(task_uuid, progression=75),
+                mock.call(task_uuid, progression=99),
+            ],
+        )
+
+    def test_export_objects_are_loaded_page_by_page(self):
+        view = AdmissionListExcelExportView()
+        view.export_page_size = 2
+        pages = []
+        for objects, next_cursor in [(['a', 'b'], 'cursor-2'), (['c', 'd'], 'cursor-3'), (['e'], '')]:
+            page = PaginatedList(id_attribute='uuid', total_count=5, next_cursor=next_cursor)
+            page.extend(objects)
+            pages.append(page)
+
+        with mock.patch('admission.views.excel_exports.message_bus_instance.invoke', side_effect=pages) as invoke:
+            export_objects = view.get_export_objects(
+                filters=str({'annee_academique': 2022, EXPORT_TASK_UUID_FILTER: str(uuid.uuid4())}),
+            )
+
+            # The objects are loaded lazily
+            invoke.assert_not_called()
+            self.assertEqual(next(export_objects), 'a')
+            self.assertEqual(view.export_objects_count, 5)
+            self.assertEqual(invoke.call_count, 1)
+
+            self.assertEqual(list(export_objects), ['b', 'c', 'd', 'e'])
+
+        self.assertEqual(
+            [
+                (query.annee_academique, query.page, query.taille_page, query.curseur)
+                for (query,), _ in invoke.call_args_list
+            ],
+            [(2022, 1, 2, ''), (2022, 2, 2, 'cursor-2'), (2022, 3, 2, 'cursor-3')],
+        )
@@ -25,7 +25,7 @@
 # ##############################################################################
 import datetime
 from typing import List, Union
-from unittest.mock import ANY
+from unittest.mock import ANY, patch
 
 import freezegun
 from django.contrib.auth.models import User
@@ -44,6 +44,7 @@ from admission.ddd.admission.formation_generale.domain.model.enums import (
     OngletsChecklist,
     PoursuiteDeCycle,
 )
+from admission.ddd.admission.shared_kernel.commands import RecupererDemandesVoisinesQuery
 from admission.ddd.admission.shared_kernel.dtos.liste import (
     DemandeRechercheDTO,
     VisualiseurAdmissionDTO,
@@ -52,6 +53,9 @@ from admission.ddd.admission.shared_kernel.enums.checklist import ModeFiltrageCh
 from admission.ddd.admission.shared_kernel.enums.liste import (
     TardiveModificationReorientationFiltre,
 )
+from admission.infrastructure.admission.shared_kernel.domain.service.lister_toutes_demandes import (
+    ListerToutesDemandes,
+)
 from admission.models import (
     ContinuingEducationAdmission,
     DoctorateAdmission,
@@ -776,19 +780,12 @@ class AdmissionListTestCase(QueriesAssertionsMixin, TestCase):
         self.assertEqual(result[1].uuid, second_admission.uuid)
         self.assertEqual(result[2].uuid, third_admission.uuid)
 
-        cached_admissions = cache.get(BaseAdmissionList.cache_key_for_result(user_id=self.sic_management_user.id))
-
-        self.assertIsNotNone(cached_admissions)
+        cached_navigation = cache.get(BaseAdmissionList.cache_key_for_result(user_id=self.sic_management_user.id))
 
-        self.assertEqual(len(cached_admissions), 3)
-        self.assertEqual(
-            cached_admissions,
-            {
-                result[0].uuid: {'previous': None, 'next': result[1].uuid},
-                result[1].uuid: {'previous': result[0].uuid, 'next': result[2].uuid},
-                result[2].uuid: {'previous': result[1].uuid, 'next': None},
-            },
-        )
+        # Only the filters are cached, the neighbours are computed when an admission is opened
+        self.assertIsInstance(cached_navigation, RecupererDemandesVoisinesQuery)
+        self.assertEqual(cached_navigation.annee_academique, self.default_params['annee_academique'])
+        self.assertEqual(cached_navigation.demandeur, str(self.sic_management_user.person.uuid))
 
         response = self.client.get(resolve_url('admission:general-education:person', uuid=result[0].uuid))
 
@@ -812,6 +809,91 @@ class AdmissionListTestCase(QueriesAssertionsMixin, TestCase):
         self.assertEqual(context.get('previous_admission_url'), resolve_url('admission:base', uuid=result[1].uuid))
         self.assertEqual(context.get('next_admission_url'), None)
 
+    def test_keyset_pagination(self):
+        other_admissions = [
+            GeneralEducationAdmissionFactory(
+                training__management_entity=self.first_entity,
+                training=self.admissions[0].training,
+                status=ChoixStatutPropositionGenerale.CONFIRMEE.name,
+            )
+            for _ in range(2)
+        ]
+
+        filters = {
+            'annee_academique': self.default_params['annee_academique'],
+            'demandeur': str(self.sic_management_user.person.uuid),
+            'taille_page': 2,
+        }
+
+        # First page
+        result = ListerToutesDemandes.filtrer(page=1, **filters)
+
+        self.assertEqual(result.total_count, 3)
+        self.assertEqual([admission.uuid for admission in result], [self.admissions[0].uuid, other_admissions[0].uuid])
+        self.assertEqual(result.previous_cursor, '')
+        self.assertNotEqual(result.next_cursor, '')
+
+        # Second page, retrieved from the cursor
+        with self.assertNumQueriesLessThan(self.NB_MAX_QUERIES):
+            result = ListerToutesDemandes.filtrer(page=2, curseur=result.next_cursor, **filters)
+
+        self.assertEqual(result.total_count, 3)
+        self.assertEqual([admission.uuid for admission in result], [other_admissions[1].uuid])
+        self.assertNotEqual(result.previous_cursor, '')
+        self.assertEqual(result.next_cursor, '')
+
+        # First page, retrieved from the cursor
+        result = ListerToutesDemandes.filtrer(page=1, curseur=result.previous_cursor, **filters)
+
+        self.assertEqual([admission.uuid for admission in result], [self.admissions[0].uuid, other_admissions[0].uuid])
+        self.assertEqual(result.previous_cursor, '')
+        self.assertNotEqual(result.next_cursor, '')
+
+        # Invalid cursor -> offset pagination
+        result = ListerToutesDemandes.filtrer(page=2, curseur='invalid', **filters)
+
+        self.assertEqual([admission.uuid for admission in result], [other_admissions[1].uuid])
+
+        # Neighbours
+        neighbours = ListerToutesDemandes.recuperer_voisins(
+            uuid_demande=other_admissions[0].uuid,
+            annee_academique=filters['annee_academique'],
+            demandeur=filters['demandeur'],
+        )
+
+        self.assertEqual(neighbours.uuid_precedente, self.admissions[0].uuid)
+        self.assertEqual(neighbours.uuid_suivante, other_admissions[1].uuid)
+
+    def test_keyset_pagination_with_an_estimated_count(self):
+        GeneralEducationAdmissionFactory(
+            training__management_entity=self.first_entity,
+            training=self.admissions[0].training,
+            status=ChoixStatutPropositionGenerale.CONFIRMEE.name,
+        )
+        filters = {
+            'annee_academique': self.default_params['annee_academique'],
+            'demandeur': str(self.sic_management_user.person.uuid),
+            'taille_page': 1,
+        }
+
+        with patch(
+            'admission.infrastructure.admission.shared_kernel.domain.service.lister_toutes_demandes'
+            '.get_estimated_or_exact_count',
+            return_value=(100, True),
+        ):
+            first_page = ListerToutesDemandes.filtrer(page=1, **filters)
+            last_page = ListerToutesDemandes.filtrer(page=2, curseur=first_page.next_cursor, **filters)
+
+        # Only the next page is known to exist
+        self.assertEqual(first_page.total_count, 100)
+        self.assertTrue(first_page.total_count_is_estimated)
+        self.assertEqual(first_page.existing_pages_count, 2)
+
+        # The count is exact on the last page
+        self.assertEqual(last_page.total_count, 2)
+        self.assertFalse(last_page.total_count_is_estimated)
+        self.assertEqual(last_page.existing_pages_count, 2)
+
     def test_list_sort_by_candidate_name(self):
         self.client.force_login(user=self.sic_management_user)
 
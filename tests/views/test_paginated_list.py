@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2024 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -27,7 +27,7 @@
 from unittest import TestCase
 from unittest.mock import MagicMock
 
-from admission.views import PaginatedList
+from admission.views import ListPaginator, PaginatedList
 
 
 class PaginatedListTestCase(TestCase):
@@ -39,20 +39,23 @@ class PaginatedListTestCase(TestCase):
 
         self.assertEqual(paginated_list.total_count, len(elts))
 
-        self.assertEqual(paginated_list.sorted_elements, {
-            1: {
-                'previous': None,
-                'next': 2,
+        self.assertEqual(
+            paginated_list.sorted_elements,
+            {
+                1: {
+                    'previous': None,
+                    'next': 2,
+                },
+                2: {
+                    'previous': 1,
+                    'next': 3,
+                },
+                3: {
+                    'previous': 2,
+                    'next': None,
+                },
             },
-            2: {
-                'previous': 1,
-                'next': 3,
-            },
-            3: {
-                'previous': 2,
-                'next': None,
-            },
-        })
+        )
 
     def test_paginated_list_with_dynamic_ids(self):
         paginated_list = PaginatedList()
@@ -67,20 +70,23 @@ class PaginatedListTestCase(TestCase):
 
         self.assertEqual(paginated_list.total_count, 3)
 
-        self.assertEqual(paginated_list.sorted_elements, {
-            1: {
-                'previous': None,
-                'next': 2,
+        self.assertEqual(
+            paginated_list.sorted_elements,
+            {
+                1: {
+                    'previous': None,
+                    'next': 2,
+                },
+                2: {
+                    'previous': 1,
+                    'next': 3,
+                },
+                3: {
+                    'previous': 2,
+                    'next': None,
+                },
             },
-            2: {
-                'previous': 1,
-                'next': 3,
-            },
-            3: {
-                'previous': 2,
-                'next': None,
-            },
-        })
+        )
 
     def test_paginated_list_with_dynamic_ids_and_a_specified_id_attribute(self):
         paginated_list = PaginatedList(id_attribute='id')
@@ -95,17 +101,70 @@ class PaginatedListTestCase(TestCase):
 
         self.assertEqual(paginated_list.total_count, 3)
 
-        self.assertEqual(paginated_list.sorted_elements, {
-            1: {
-                'previous': None,
-                'next': 2,
+        self.assertEqual(
+            paginated_list.sorted_elements,
+            {
+                1: {
+                    'previous': None,
+                    'next': 2,
+                },
+                2: {
+                    'previous': 1,
+                    'next': 3,
+                },
+                3: {
+                    'previous': 2,
+                    'next': None,
+                },
             },
-            2: {
-                'previous': 1,
-                'next': 3,
-            },
-            3: {
-                'previous': 2,
-                'next': None,
+        )
+
+    def test_paginated_list_with_a_specified_total_count(self):
+        paginated_list = PaginatedList(id_attribute='id', total_count=10, next_cursor='next')
+
+        paginated_list.append(MagicMock(id=1))
+        paginated_list.append(MagicMock(id=2))
+
+        self.assertTrue(paginated_list.is_keyset_paginated)
+        self.assertEqual(paginated_list.total_count, 10)
+        self.assertEqual(paginated_list.next_cursor, 'next')
+        self.assertEqual(paginated_list.previous_cursor, '')
+
+        self.assertEqual(
+            paginated_list.sorted_elements,
+            {
+                1: {
+                    'previous': None,
+                    'next': 2,
+                },
+                2: {
+                    'previous': 1,
+                    'next': None,
+                },
             },
-        })
\ No newline at end of file
+        )
+
+    def test_paginator_with_an_estimated_total_count(self):
+        paginated_list = PaginatedList(
+            id_attribute='id',
+            total_count=100,
+            total_count_is_estimated=True,
+            existing_pages_count=2,
+        )
+        paginated_list.append(MagicMock(id=1))
+
+        paginator = ListPaginator(paginated_list, per_page=1)
+
+        self.assertEqual(paginator.count, 100)
+        self.assertTrue(paginator.count_is_estimated)
+        self.assertEqual(paginator.num_pages, 2)
+        self.assertEqual(list(paginator.page_range), [1, 2])
+
+    def test_paginator_with_an_exact_total_count(self):
+        paginated_list = PaginatedList(id_attribute='id', total_count=3, existing_pages_count=1)
+        paginated_list.append(MagicMock(id=1))
+
+        paginator = ListPaginator(paginated_list, per_page=1)
+
+        self.assertFalse(paginator.count_is_estimated)
+        self.assertEqual(paginator.num_pages, 3)
@@ -32,7 +32,6 @@ from typing import Dict, Iterable, List, Optional, Union
 import weasyprint
 from django.conf import settings
 from django.contrib.auth.models import User
-from django.core.cache import cache
 from django.db import models
 from django.db.models import QuerySet
 from django.shortcuts import resolve_url
@@ -40,6 +39,7 @@ from django.utils import timezone
 from django.utils.translation import get_language, override, pgettext
 from rest_framework.generics import get_object_or_404
 
+from admission.admission_utils.permission_cache import get_cached_permission_object
 from admission.auth.roles.central_manager import CentralManager
 from admission.auth.roles.program_manager import ProgramManager as AdmissionProgramManager
 from admission.auth.roles.sic_management import SicManagement
@@ -83,6 +83,14 @@ from reference.models.language import Language
 from reference.models.scholarship import Scholarship
 
 
+def _get_cached_perm_obj(qs: QuerySet, admission_uuid):
+    return get_cached_permission_object(
+        admission_uuid,
+        load_object=lambda: get_object_or_404(qs, uuid=admission_uuid),
+        load_ids=lambda: qs.filter(uuid=admission_uuid).values_list('training_id', 'candidate_id').first(),
+    )
+
+
 def get_cached_admission_perm_obj(admission_uuid):
     qs = DoctorateAdmission.objects.select_related(
         'supervision_group',
@@ -91,10 +99,7 @@ def get_cached_admission_perm_obj(admission_uuid):
         'training__education_group_type',
         'determined_academic_year',
     )
-    return cache.get_or_set(
-        'admission_permission_{}'.format(admission_uuid),
-        lambda: get_object_or_404(qs, uuid=admission_uuid),
-    )
+    return _get_cached_perm_obj(qs, admission_uuid)
 
 
 def get_cached_general_education_admission_perm_obj(admission_uuid):
@@ -104,10 +109,7 @@ def get_cached_general_education_admission_perm_obj(admission_uuid):
         'training__education_group_type',
         'determined_academic_year',
     )
-    return cache.get_or_set(
-        'admission_permission_{}'.format(admission_uuid),
-        lambda: get_object_or_404(qs, uuid=admission_uuid),
-    )
+    return _get_cached_perm_obj(qs, admission_uuid)
 
 
 def get_cached_continuing_education_admission_perm_obj(admission_uuid):
@@ -117,10 +119,7 @@ def get_cached_continuing_education_admission_perm_obj(admission_uuid):
         'training__specificiufcinformations',
         'determined_academic_year',
     )
-    return cache.get_or_set(
-        'admission_permission_{}'.format(admission_uuid),
-        lambda: get_object_or_404(qs, uuid=admission_uuid),
-    )
+    return _get_cached_perm_obj(qs, admission_uuid)
 
 
 def sort_business_exceptions(exception: BusinessException):
@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2023 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -34,17 +34,43 @@ T = TypeVar('T')
 
 
 class PaginatedList(List[T]):
-    def __init__(self, complete_list: Optional[List] = None, id_attribute: str = '', *args, **kwargs):
+    def __init__(
+        self,
+        complete_list: Optional[List] = None,
+        id_attribute: str = '',
+        *args,
+        total_count: Optional[int] = None,
+        total_count_is_estimated: bool = False,
+        existing_pages_count: Optional[int] = None,
+        previous_cursor: str = '',
+        next_cursor: str = '',
+        **kwargs,
+    ):
         """
         Create a paginated list containing a list of objects.
         :param complete_list: The list of ids of the objects.
         :param id_attribute: The attribute of the object that contains the id.
+        :param total_count: The total number of objects, if it is computed separately (keyset pagination).
+        :param total_count_is_estimated: True if the total number of objects is only an estimation.
+        :param existing_pages_count: The number of pages known to exist, if the total number of objects is estimated.
+        :param previous_cursor: The cursor to use to retrieve the previous page (keyset pagination).
+        :param next_cursor: The cursor to use to retrieve the next page (keyset pagination).
         """
         self.complete_ids_list = complete_list
         self._id_attribute = id_attribute
         self._sorted_elements = None
+        self._total_count = total_count
+        self.total_count_is_estimated = total_count_is_estimated
+        self.existing_pages_count = existing_pages_count
+        self.previous_cursor = previous_cursor
+        self.next_cursor = next_cursor
         super().__init__(*args, **kwargs)
 
+    @property
+    def is_keyset_paginated(self) -> bool:
+        """Return True if the list only contains the current page and the total count has been computed apart."""
+        return self._total_count is not None
+
     @property
     def sorted_elements(self):
         # Computed only once and based on the initial list
@@ -61,6 +87,8 @@ class PaginatedList(List[T]):
 
     @property
     def total_count(self) -> int:
+        if self._total_count is not None:
+            return self._total_count
         return len(self.sorted_elements)
 
 
@@ -77,3 +105,15 @@ class ListPaginator(paginator.Paginator):
     @cached_property
     def count(self):
         return getattr(self.object_list, 'total_count', len(self.object_list))
+
+    @cached_property
+    def count_is_estimated(self) -> bool:
+        return getattr(self.object_list, 'total_count_is_estimated', False)
+
+    @cached_property
+    def num_pages(self):
+        # An estimated count can be too high so the pages are limited to the ones known to exist
+        existing_pages_count = getattr(self.object_list, 'existing_pages_count', None)
+        if self.count_is_estimated and existing_pages_count:
+            return min(super().num_pages, existing_pages_count)
+        return super().num_pages
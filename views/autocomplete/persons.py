@@ -27,15 +27,16 @@ import json
 
 from dal import autocomplete
 from django.conf import settings
-from django.contrib.postgres.search import SearchVector
 from django.db.models import Exists, F, OuterRef, Q
 
 from admission.admission_utils.get_actor_option_text import get_actor_option_text
 from admission.auth.roles.candidate import Candidate
+from admission.constants import PERSON_SEARCH_RESULTS_LIMIT
 from admission.ddd.admission.doctorat.preparation.commands import (
     RechercherPromoteursQuery,
 )
 from admission.ddd.admission.doctorat.preparation.dtos import PromoteurDTO
+from admission.models.person_search import get_person_search_filter, get_person_search_rank
 from base.auth.roles.tutor import Tutor
 from base.models.person import Person
 from base.models.student import Student
@@ -70,25 +71,16 @@ class CandidatesAutocomplete(PersonsAutocomplete, autocomplete.Select2QuerySetVi
         q = self.request.GET.get('q', '')
 
         return (
-            Candidate.objects.annotate(
-                name=SearchVector(
-                    'person__first_name',
-                    'person__last_name',
-                ),
+            Candidate.objects.filter(
+                get_person_search_filter(q, fields=['emails', 'registration_ids'], prefix='person__'),
             )
-            .filter(
-                Q(name=q)
-                | Q(person__email__icontains=q)
-                | Q(person__private_email__icontains=q)
-                | Q(person__student__registration_id__icontains=q)
-            )
-            .order_by('person__last_name', 'person__first_name')
+            .annotate(rank=get_person_search_rank(q, prefix='person__'))
+            .order_by('-rank', 'person__last_name', 'person__first_name')
             .values(
                 first_name=F('person__first_name'),
                 last_name=F('person__last_name'),
                 global_id=F('person__global_id'),
-            )
-            .distinct()
+            )[:PERSON_SEARCH_RESULTS_LIMIT]
             if q
             else []
         )
@@ -101,14 +93,15 @@ class JuryMembersAutocomplete(PersonsAutocomplete, autocomplete.Select2QuerySetV
         q = self.request.GET.get('q', '')
 
         qs = (
-            Person.objects.filter(Q(first_name__icontains=q) | Q(last_name__icontains=q) | Q(global_id__icontains=q))
+            Person.objects.filter(get_person_search_filter(q, fields=['global_id']))
             .exclude(Exists(Student.objects.filter(person=OuterRef('pk'), person__tutor__isnull=True)))
-            .order_by('last_name', 'first_name')
+            .annotate(rank=get_person_search_rank(q))
+            .order_by('-rank', 'last_name', 'first_name')
             .values(
                 'first_name',
                 'last_name',
                 'global_id',
-            )
+            )[:PERSON_SEARCH_RESULTS_LIMIT]
         )
         return qs if q else []
 
@@ -128,13 +121,10 @@ class PersonAutocomplete(PersonsAutocomplete, autocomplete.Select2QuerySetView):
     def get_queryset(self):
         q = self.request.GET.get('q', '')
         qs = Person.objects
+        ordering = ['last_name', 'first_name']
         if q:
-            qs = qs.filter(
-                *[
-                    Q(first_name__icontains=term) | Q(last_name__icontains=term) | Q(global_id__icontains=term)
-                    for term in q.split()
-                ],
-            )
+            qs = qs.filter(get_person_search_filter(q, fields=['global_id'])).annotate(rank=get_person_search_rank(q))
+            ordering.insert(0, '-rank')
         qs = (
             qs.exclude(Q(first_name='') | Q(last_name=''))
             .filter(
@@ -144,13 +134,13 @@ class PersonAutocomplete(PersonsAutocomplete, autocomplete.Select2QuerySetView):
                 email__endswith=settings.INTERNAL_EMAIL_SUFFIX,
             )
             .exclude(Exists(Student.objects.filter(person=OuterRef('pk'), person__tutor__isnull=True)))
-            .order_by('last_name', 'first_name')
+            .order_by(*ordering)
             .values(
                 'first_name',
                 'last_name',
                 'email',
                 'global_id',
-            )
+            )[:PERSON_SEARCH_RESULTS_LIMIT]
         )
         return qs
 
@@ -26,6 +26,7 @@
 import logging
 from typing import Dict, Optional, Union
 
+import attr
 from django.core.cache import cache
 from django.shortcuts import resolve_url
 from django.template.loader import render_to_string
@@ -71,12 +72,14 @@ from admission.ddd.admission.formation_generale.domain.model.statut_checklist im
     ORGANISATION_ONGLETS_CHECKLIST_PAR_STATUT as ORGANISATION_ONGLETS_CHECKLIST_GENERALE_PAR_STATUT,
 )
 from admission.ddd.admission.formation_generale.dtos.proposition import PropositionGestionnaireDTO
+from admission.ddd.admission.shared_kernel.commands import RecupererDemandesVoisinesQuery
 from admission.ddd.admission.shared_kernel.domain.model.enums.type_gestionnaire import TypeGestionnaire
 from admission.ddd.admission.shared_kernel.dtos.titre_acces_selectionnable import TitreAccesSelectionnableDTO
 from admission.ddd.admission.shared_kernel.enums import Onglets
 from admission.models import ContinuingEducationAdmission, DoctorateAdmission, EPCInjection, GeneralEducationAdmission
 from admission.models.base import AdmissionViewer, BaseAdmission
 from admission.models.epc_injection import EPCInjectionStatus, EPCInjectionType
+from admission.infrastructure.message_bus_memoization import query_memoization_scope
 from admission.utils import (
     access_title_country,
     get_cached_admission_perm_obj,
@@ -319,6 +322,18 @@ class LoadDossierViewMixin(AdmissionViewMixin):
         # Get the next and previous admissions from the last computed listing
         cached_admissions_list = cache.get(BaseAdmissionList.cache_key_for_result(user_id=self.request.user.id))
 
+        if isinstance(cached_admissions_list, RecupererDemandesVoisinesQuery):
+            # Only the filters of the list have been cached, so the neighbours are computed for this admission only
+            neighbours = message_bus_instance.invoke(
+                attr.evolve(cached_admissions_list, uuid_demande=self.admission_uuid)
+            )
+            cached_admissions_list = {
+                self.admission_uuid: {
+                    'previous': neighbours.uuid_precedente,
+                    'next': neighbours.uuid_suivante,
+                },
+            }
+
         if cached_admissions_list and self.admission_uuid in cached_admissions_list:
             current_admission = cached_admissions_list[self.admission_uuid]
             for key in ['previous', 'next']:
@@ -365,7 +380,9 @@ class LoadDossierViewMixin(AdmissionViewMixin):
         if request.method == 'GET' and self.admission_uuid and getattr(request.user, 'person', None) and self.is_sic:
             AdmissionViewer.add_viewer(person=request.user.person, admission=self.admission)
 
-        return super().dispatch(request, *args, **kwargs)
+        # The same queries are often invoked by several parts of the page
+        with query_memoization_scope(name=request.path):
+            return super().dispatch(request, *args, **kwargs)
 
     def get_tab_label_suffixes(self):
         """
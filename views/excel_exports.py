@@ -26,28 +26,38 @@
 
 import ast
 import datetime
+import itertools
 import json
 import uuid
-from typing import Dict
+from io import BytesIO
+from tempfile import NamedTemporaryFile
+from typing import Dict, Iterable, Iterator, List, Optional, Sized, Tuple
 
+import attr
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import PermissionRequiredMixin
 from django.http import HttpResponse, HttpResponseRedirect
 from django.template.defaultfilters import yesno
 from django.urls import reverse
+from django.utils import translation
 from django.utils.functional import cached_property
 from django.utils.html import format_html
 from django.utils.text import slugify
 from django.utils.translation import get_language, gettext as _, gettext_lazy, pgettext
 from django.views import View
+from openpyxl import load_workbook
+from openpyxl.workbook import Workbook
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
 from osis_async.models import AsyncTask
+from osis_async.utils import update_task
 from osis_comment.models import CommentEntry
 from osis_export.contrib.export_mixins import ExcelFileExportMixin, ExportMixin
 from osis_export.models import Export
 from osis_export.models.enums.types import ExportTypes
 
 from admission.admission_utils.get_actor_option_text import get_actor_option_text
+from admission.constants import EXPORT_STREAMING_CHUNK_SIZE
 from admission.ddd.admission.doctorat.preparation.commands import ListerDemandesQuery as ListerDemandesDoctoralesQuery
 from admission.ddd.admission.doctorat.preparation.domain.model.enums import (
     TOUS_CHOIX_COMMISSION_PROXIMITE,
@@ -67,7 +77,7 @@ from admission.ddd.admission.doctorat.preparation.read_view.repository.i_tableau
 )
 from admission.ddd.admission.formation_continue.commands import (
     ListerDemandesQuery as ListerDemandesContinuesQuery,
-    RecupererResumePropositionQuery as RecupererResumePropositionContinueQuery,
+    ListerResumesPropositionsQuery as ListerResumesPropositionsContinuesQuery,
 )
 from admission.ddd.admission.formation_continue.domain.model.enums import (
     ChoixEdition,
@@ -94,6 +104,7 @@ from admission.ddd.admission.shared_kernel.enums.checklist import ModeFiltrageCh
 from admission.ddd.admission.shared_kernel.enums.liste import TardiveModificationReorientationFiltre
 from admission.ddd.admission.shared_kernel.enums.statut import CHOIX_STATUT_TOUTE_PROPOSITION_DICT
 from admission.ddd.admission.shared_kernel.enums.type_demande import TypeDemande
+from admission.exports.utils import copy_worksheet_into_write_only_workbook
 from admission.forms.admission.filter import AllAdmissionsFilterForm, ContinuingAdmissionsFilterForm
 from admission.forms.doctorate.cdd.filter import DoctorateListFilterForm
 from admission.models import AdmissionFormItem
@@ -124,6 +135,8 @@ FULL_DATE_FORMAT = '%Y/%m/%d, %H:%M:%S'
 SHORT_DATE_FORMAT = '%Y/%m/%d'
 SPECIFIC_QUESTION_SEPARATOR = '|'
 SPECIFIC_QUESTION_SEPARATOR_REPLACEMENT = '#'
+# Filter saved with the export to know the task whose progression is updated during the generation of the file
+EXPORT_TASK_UUID_FILTER = 'uuid_tache'
 
 
 class BaseAdmissionExcelExportView(
@@ -144,11 +157,17 @@ class BaseAdmissionExcelExportView(
     with_parameters_worksheet = True
     description = gettext_lazy('Admissions')
     with_specific_questions = False
+    # Write the rows directly into a write-only workbook instead of building the whole workbook in memory
+    streaming_export = True
+    # Number of export objects loaded together by the streamed exports (None to load all of them at once)
+    export_page_size: Optional[int] = EXPORT_STREAMING_CHUNK_SIZE
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.specific_questions: Dict[str, AdmissionFormItem] = {}
         self.language = settings.LANGUAGE_CODE
+        # Number of exported objects, to be specified by the views whose export objects are not sized
+        self.export_objects_count: Optional[int] = None
 
     def generate_file(self, person, filters, **kwargs):
         # Get the person language
@@ -159,8 +178,74 @@ class BaseAdmissionExcelExportView(
         if self.with_specific_questions:
             self.initialize_specific_questions()
 
+        if self.streaming_export:
+            return self.generate_streamed_file(person, filters, **kwargs)
+
         return super().generate_file(person, filters, **kwargs)
 
+    def generate_streamed_file(self, person, filters, **kwargs) -> bytes:
+        """
+        Generate the excel file by writing the rows, chunk by chunk, into a write-only workbook saved in a temporary
+        file so that the memory used does not depend on the number of rows. The other worksheets and the header are
+        built by the export mixin and copied into the final workbook.
+        """
+        export_objects_kwargs = {}
+
+        def get_no_export_objects(**kwargs):
+            export_objects_kwargs.update(kwargs)
+            return []
+
+        # Let the export mixin build a workbook without any row, and keep the parameters of the export objects
+        self.get_export_objects = get_no_export_objects
+        try:
+            template_workbook = load_workbook(BytesIO(super().generate_file(person, filters, **kwargs)))
+        finally:
+            del self.get_export_objects
+
+        workbook = Workbook(write_only=True)
+        data_worksheet, *other_worksheets = template_workbook.worksheets
+
+        with translation.override(self.language):
+            self.write_export_rows(
+                worksheet=copy_worksheet_into_write_only_workbook(data_worksheet, workbook),
+                export_objects=self.get_export_objects(**export_objects_kwargs),
+                task_uuid=ast.literal_eval(filters).get(EXPORT_TASK_UUID_FILTER),
+            )
+
+        for worksheet in other_worksheets:
+            copy_worksheet_into_write_only_workbook(worksheet, workbook)
+
+        with NamedTemporaryFile(suffix='.xlsx') as file:
+            workbook.save(file)
+            file.seek(0)
+            return file.read()
+
+    def write_export_rows(
+        self,
+        worksheet: WriteOnlyWorksheet,
+        export_objects: Iterable,
+        task_uuid: Optional[uuid.UUID] = None,
+    ):
+        """
+        Append the rows of the export objects to the worksheet, by chunks, and update the progression of the task after
+        each chunk.
+        """
+        objects_count = len(export_objects) if isinstance(export_objects, Sized) else None
+        export_objects = iter(export_objects)
+        written_objects_count = 0
+
+        for chunk in iter(lambda: list(itertools.islice(export_objects, EXPORT_STREAMING_CHUNK_SIZE)), []):
+            for row in chunk:
+                worksheet.append(self.get_row_data(row))
+
+            written_objects_count += len(chunk)
+            # The number of lazily loaded objects is known once the first ones have been loaded
+            objects_count = objects_count or self.export_objects_count
+
+            if task_uuid and objects_count:
+                # The task is completed by the export mixin once the file is saved
+                update_task(task_uuid, progression=min(99, 100 * written_objects_count // objects_count))
+
     def initialize_specific_questions(self):
         """Initialize the specific questions."""
         self.specific_questions = {
@@ -179,12 +264,47 @@ class BaseAdmissionExcelExportView(
         """Process filters before sending them to the command"""
         return filters
 
+    def get_formatted_filters_parameters_worksheet(self, filters: str) -> Dict:
+        formatted_filters = super().get_formatted_filters_parameters_worksheet(filters)
+        formatted_filters.pop(EXPORT_TASK_UUID_FILTER, None)
+        return formatted_filters
+
     def get_export_objects(self, **kwargs):
         # The filters are saved as dict string so we convert it here to a dict
         filters = ast.literal_eval(kwargs.get('filters'))
+        filters.pop(EXPORT_TASK_UUID_FILTER, None)
         self.process_filters_before_command(filters)
+        if self.streaming_export and self.export_page_size:
+            return self.get_export_objects_by_page(filters)
         return message_bus_instance.invoke(self.command(**filters))
 
+    def get_export_objects_by_page(self, filters: Dict) -> Iterator:
+        """
+        Yield the export objects by loading them page by page, so that only one page of objects is kept in memory. The
+        pages are retrieved from the cursor of the previous page if the command supports the keyset pagination.
+        """
+        with_cursor = 'curseur' in attr.fields_dict(self.command)
+        page = 1
+        cursor = ''
+
+        while True:
+            page_filters = {**filters, 'page': page, 'taille_page': self.export_page_size}
+            if with_cursor:
+                page_filters['curseur'] = cursor
+
+            export_objects: PaginatedList = message_bus_instance.invoke(self.command(**page_filters))
+
+            if page == 1:
+                self.export_objects_count = export_objects.total_count
+
+            yield from export_objects
+
+            if len(export_objects) < self.export_page_size:
+                return
+
+            page += 1
+            cursor = export_objects.next_cursor
+
     def get_row_data_specific_questions_answers(
         self,
         initial_specific_questions_answers: Dict,
@@ -253,7 +373,7 @@ class BaseAdmissionExcelExportView(
             # Create export
             export = Export.objects.create(
                 called_from_class=f'{self.__module__}.{self.__class__.__name__}',
-                filters=self.get_filters(),
+                filters={**self.get_filters(), EXPORT_TASK_UUID_FILTER: str(task.uuid)},
                 person=self.request.user.person,
                 job_uuid=task.uuid,
                 file_name=slugify(self.export_name),
@@ -466,6 +586,9 @@ class ContinuingAdmissionListExcelExportView(BaseAdmissionExcelExportView):
     redirect_url_name = 'admission:continuing-education:list'
     urlpatterns = 'continuing-admissions-list'
     with_specific_questions = True
+    batch_size = 500
+    # The propositions are already loaded by batches from the list of their uuids
+    export_page_size = None
 
     def get_formatted_filters_parameters_worksheet(self, filters: str) -> Dict:
         formatted_filters = super().get_formatted_filters_parameters_worksheet(filters)
@@ -613,15 +736,8 @@ class ContinuingAdmissionListExcelExportView(BaseAdmissionExcelExportView):
             return str(_('no'))
         return ''
 
-    def get_row_data(self, row: uuid.UUID):
-        resume_proposition: ResumePropositionDTO = message_bus_instance.invoke(
-            RecupererResumePropositionContinueQuery(uuid_proposition=str(row))
-        )
-
-        student_form_comment = CommentEntry.objects.filter(
-            object_uuid=row,
-            tags=[OngletsChecklistContinue.fiche_etudiant.name],
-        ).first()
+    def get_row_data(self, row: Tuple[ResumePropositionDTO, Optional[CommentEntry]]):
+        resume_proposition, student_form_comment = row
 
         proposition: PropositionDTO = resume_proposition.proposition
         identification = resume_proposition.identification
@@ -814,7 +930,35 @@ class ContinuingAdmissionListExcelExportView(BaseAdmissionExcelExportView):
 
     def get_export_objects(self, **kwargs):
         paginated_list_of_objects: PaginatedList[DemandeContinueRechercheDTO] = super().get_export_objects(**kwargs)
-        return paginated_list_of_objects.complete_ids_list
+        self.export_objects_count = len(paginated_list_of_objects.complete_ids_list)
+        return self.get_rows(paginated_list_of_objects.complete_ids_list)
+
+    def get_rows(
+        self,
+        propositions_uuids: List[uuid.UUID],
+    ) -> Iterator[Tuple[ResumePropositionDTO, Optional[CommentEntry]]]:
+        """
+        Yield, in the order of the specified uuids, the data of each proposition. The data are loaded by batches to
+        keep a fixed number of queries per batch.
+        """
+        for start in range(0, len(propositions_uuids), self.batch_size):
+            end = start + self.batch_size
+            batch_uuids = [str(proposition_uuid) for proposition_uuid in propositions_uuids[start:end]]
+
+            resumes: Dict[str, ResumePropositionDTO] = message_bus_instance.invoke(
+                ListerResumesPropositionsContinuesQuery(uuids_propositions=batch_uuids)
+            )
+
+            student_form_comments: Dict[str, CommentEntry] = {}
+            for comment in CommentEntry.objects.filter(
+                object_uuid__in=batch_uuids,
+                tags=[OngletsChecklistContinue.fiche_etudiant.name],
+            ):
+                student_form_comments.setdefault(str(comment.object_uuid), comment)
+
+            for proposition_uuid in batch_uuids:
+                if proposition_uuid in resumes:
+                    yield resumes[proposition_uuid], student_form_comments.get(proposition_uuid)
 
     def get_filters(self):
         form = ContinuingAdmissionsFilterForm(user=self.request.user, data=self.request.GET)
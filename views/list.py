@@ -34,7 +34,10 @@ from django.views.generic import ListView
 from django.views.generic.edit import FormMixin
 
 from admission.constants import DEFAULT_PAGINATOR_SIZE
-from admission.ddd.admission.shared_kernel.commands import ListerToutesDemandesQuery
+from admission.ddd.admission.shared_kernel.commands import (
+    ListerToutesDemandesQuery,
+    RecupererDemandesVoisinesQuery,
+)
 from admission.forms.admission.filter import AllAdmissionsFilterForm
 from admission.models.working_list import UNCHANGED_KEY
 from admission.views import ListPaginator
@@ -144,12 +147,19 @@ class BaseAdmissionList(PermissionRequiredMixin, HtmxMixin, FormMixin, ListView)
         if self.query_params:
             cache.set(
                 self.cache_key_for_result(user_id=self.request.user.id),
-                self.object_list.sorted_elements,
+                self.get_navigation_cache_value(),
                 timeout=self.result_cache_timeout,
             )
 
         return response
 
+    def get_navigation_cache_value(self):
+        """
+        Return the value to cache to allow the navigation between the admissions of the list: by default, the previous
+        and the next elements of each admission.
+        """
+        return self.object_list.sorted_elements
+
     def get_queryset(self):
         return message_bus_instance.invoke(
             self.filtering_query_class(
@@ -171,4 +181,28 @@ class AdmissionList(BaseAdmissionList):
     def additional_command_kwargs(self):
         return {
             'demandeur': self.request.user.person.uuid,
+            'curseur': self.query_params.get('curseur', '') if self.query_params else '',
         }
+
+    def get_navigation_cache_value(self):
+        # As only the current page is loaded, the neighbours of an admission are lazily computed when it is opened
+        return RecupererDemandesVoisinesQuery(
+            **self.filters,
+            demandeur=str(self.request.user.person.uuid),
+        )
+
+    def get_page_url(self, page: int, cursor: str) -> str:
+        query_params = self.query_params.copy()
+        query_params['page'] = page
+        query_params['curseur'] = cursor
+        return f'?{query_params.urlencode()}'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        if getattr(self.object_list, 'is_keyset_paginated', False):
+            page = self.filters.get('page') or 1
+            if self.object_list.previous_cursor:
+                context['previous_page_url'] = self.get_page_url(page - 1, self.object_list.previous_cursor)
+            if self.object_list.next_cursor:
+                context['next_page_url'] = self.get_page_url(page + 1, self.object_list.next_cursor)
+        return context